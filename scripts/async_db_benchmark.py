@@ -0,0 +1,152 @@
+"""
+동기/비동기 DB 경로 처리량 비교 스크립트
+
+같은 조회를 두 가지 방식으로 제공하는 API 서버를 띄우고, 같은 동시성으로 부하를 주어
+초당 요청 수(req/s)와 지연 시간(p50/p99)을 비교합니다.
+
+- sync:  기존 방식. def 핸들러 + 동기 SessionLocal (스레드 풀에서 실행)
+- async: 이번에 옮긴 라우트. async 핸들러 + get_async_db(asyncpg) + run_sync
+
+실제 PostgreSQL이 필요합니다. (DB_USER/DB_PASSWORD/DB_HOST/DB_PORT/DB_NAME 환경 변수 사용)
+종목 마스터에 데이터가 있어야 의미 있는 결과가 나옵니다.
+
+사용 예:
+    python scripts/async_db_benchmark.py --concurrency 50 --duration 10
+    python scripts/async_db_benchmark.py --concurrency 200 --duration 10 --symbol 005930 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy.orm import Session
+
+from src.api.routers import stock_master
+from src.common.database.db_connector import dispose_async_engine, get_db
+from src.common.services.stock_master_service import StockMasterService
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(stock_master.router)  # async: /symbols/, /symbols/{symbol_code}
+
+    @app.get("/sync/symbols/")
+    def sync_symbols(limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0), db: Session = Depends(get_db)):
+        return stock_master._get_symbols_page(db, limit, offset)
+
+    @app.get("/sync/symbols/{symbol_code}")
+    def sync_symbol(symbol_code: str, db: Session = Depends(get_db)):
+        stock = StockMasterService().get_stock_by_symbol(symbol_code, db)
+        return {"symbol": stock.symbol, "name": stock.name, "market": stock.market} if stock else {}
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        await dispose_async_engine()
+
+    return app
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(base_url: str, path: str, concurrency: int, duration: float) -> Dict:
+    """duration초 동안 concurrency개의 요청을 계속 보내고 결과를 집계합니다."""
+    latencies_ms: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    return {
+        "path": path,
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies_ms) / elapsed, 1),
+        "latency_p50_ms": round(_percentile(latencies_ms, 50), 1),
+        "latency_p99_ms": round(_percentile(latencies_ms, 99), 1),
+    }
+
+
+async def main(args) -> Dict:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(build_app(), host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    base_url = f"http://127.0.0.1:{port}"
+    pairs = {
+        "symbols_list": ("/sync/symbols/?limit=20", "/symbols/?limit=20"),
+        "symbol_by_code": (f"/sync/symbols/{args.symbol}", f"/symbols/{args.symbol}"),
+    }
+    report = {"concurrency": args.concurrency, "duration_sec": args.duration, "results": {}}
+    try:
+        for name, (sync_path, async_path) in pairs.items():
+            # 커넥션 풀 예열
+            await run_load(base_url, sync_path, min(args.concurrency, 5), 1)
+            await run_load(base_url, async_path, min(args.concurrency, 5), 1)
+            report["results"][name] = {
+                "sync": await run_load(base_url, sync_path, args.concurrency, args.duration),
+                "async": await run_load(base_url, async_path, args.concurrency, args.duration),
+            }
+    finally:
+        server.should_exit = True
+        await server_task
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 경로 처리량 비교")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--duration", type=float, default=10, help="경로별 측정 시간 (초)")
+    parser.add_argument("--symbol", default="005930", help="종목 조회에 사용할 종목 코드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 60)
+        print(f"📊 동기/비동기 DB 경로 비교 (동시성 {report['concurrency']}, 경로별 {report['duration_sec']}초)")
+        print("=" * 60)
+        for name, result in report["results"].items():
+            print(f"[{name}]")
+            for mode in ("sync", "async"):
+                r = result[mode]
+                print(f"   {mode:<5} {r['requests_per_sec']:>8} req/s  p50 {r['latency_p50_ms']}ms / p99 {r['latency_p99_ms']}ms  (오류 {r['errors']}건)")
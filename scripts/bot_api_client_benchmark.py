@@ -0,0 +1,136 @@
+"""
+봇 → API 호출 지연 시간 비교 스크립트
+
+봇 명령 하나가 API를 호출하는 방식을 두 가지로 재현하여 명령당 지연 시간(p50/p99)을 비교합니다.
+
+- per_request: 기존 방식. 호출마다 get_retry_client()로 클라이언트와 커넥션 풀을 새로 만듦
+- shared:      get_api_client()로 프로세스 공용 커넥션 풀을 재사용
+
+API 서버 대신 같은 프로세스에서 띄운 작은 FastAPI 앱에 요청하므로 실제 DB나 API 서버가 필요 없습니다.
+--url을 지정하면 실행 중인 API 서버의 경로(예: http://localhost:8000/health)에 요청합니다.
+
+사용 예:
+    python scripts/bot_api_client_benchmark.py --commands 2000 --concurrency 20
+    python scripts/bot_api_client_benchmark.py --url http://localhost:8000/health --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.common.utils.http_client import close_api_client, get_api_client, get_retry_client
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_commands(url: str, mode: str, commands: int, concurrency: int, calls_per_command: int) -> Dict:
+    """commands개의 명령을 concurrency개씩 동시에 실행하고, 명령당 지연 시간을 집계합니다."""
+    latencies_ms: List[float] = []
+    errors = 0
+    remaining = commands
+
+    async def command():
+        if mode == "shared":
+            async with get_api_client(auth_token="benchmark") as client:
+                for _ in range(calls_per_command):
+                    (await client.get(url)).raise_for_status()
+        else:
+            async with get_retry_client(auth_token="benchmark") as client:
+                for _ in range(calls_per_command):
+                    (await client.get(url)).raise_for_status()
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await command()
+            except Exception:
+                errors += 1
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    return {
+        "commands": len(latencies_ms),
+        "errors": errors,
+        "commands_per_sec": round(len(latencies_ms) / elapsed, 1),
+        "latency_p50_ms": round(_percentile(latencies_ms, 50), 2),
+        "latency_p99_ms": round(_percentile(latencies_ms, 99), 2),
+    }
+
+
+async def main(args) -> Dict:
+    server = server_task = None
+    url = args.url
+    if url is None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(build_app(), host="127.0.0.1", port=port, log_level="warning", access_log=False))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        url = f"http://127.0.0.1:{port}/ping"
+
+    report = {"url": url, "concurrency": args.concurrency, "calls_per_command": args.calls, "results": {}}
+    try:
+        for mode in ("per_request", "shared"):
+            await run_commands(url, mode, min(args.commands, 50), args.concurrency, args.calls)  # 예열
+            report["results"][mode] = await run_commands(url, mode, args.commands, args.concurrency, args.calls)
+    finally:
+        await close_api_client()
+        if server is not None:
+            server.should_exit = True
+            await server_task
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="봇 → API 호출 지연 시간 비교 (클라이언트 생성 방식별)")
+    parser.add_argument("--commands", type=int, default=2000, help="방식별 실행할 명령 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시에 처리할 명령 수")
+    parser.add_argument("--calls", type=int, default=2, help="명령 하나가 호출하는 API 수")
+    parser.add_argument("--url", default=None, help="요청할 URL (없으면 내장 테스트 서버 사용)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 60)
+        print(f"📊 봇 → API 명령 지연 시간 (동시성 {report['concurrency']}, 명령당 API {report['calls_per_command']}회)")
+        print("=" * 60)
+        for mode, r in report["results"].items():
+            print(f"   {mode:<11} {r['commands_per_sec']:>8} cmd/s  p50 {r['latency_p50_ms']}ms / p99 {r['latency_p99_ms']}ms  (오류 {r['errors']}건)")
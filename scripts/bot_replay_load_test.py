@@ -0,0 +1,479 @@
+"""
+봇 업데이트 재생 부하 테스트 (봇 한 프로세스가 감당할 수 있는 사용자 수 측정)
+
+src/bot/main.py의 build_application()으로 실제 핸들러가 모두 등록된 Application을 만들고,
+가상 사용자 N명이 /predict, /alert list, /symbols 페이지 이동, 자유 문장 메시지를 섞어 보내는 상황을 재생합니다.
+
+- 텔레그램 Bot API: fake_telegram.FakeTelegramRequest가 대신 응답 (--telegram-latency로 왕복 시간 흉내)
+- StockEye API: 같은 프로세스의 가짜 API(FastAPI 앱)를 httpx.ASGITransport로 연결 (--api-latency / --predict-latency)
+  --api-url을 지정하면 가짜 API 대신 실행 중인 API 서버로 보냅니다. (핸들러에 적힌 호스트와 관계없이 이 주소로 전달)
+
+가상 사용자는 실제 사용자처럼 봇의 처리가 끝난 뒤 다음 메시지를 보내며(--think-time만큼 쉬었다가),
+업데이트는 폴링 방식과 같이 Application.update_queue로 넣습니다.
+처리량(updates/s), 업데이트 지연(큐 투입 → 처리 완료), 핸들러별 지연 백분위수(p50/p95/p99)를 보고합니다.
+
+사용 예:
+    python scripts/bot_replay_load_test.py --users 100
+    python scripts/bot_replay_load_test.py --users 50 100 200 400 --slo-ms 1000
+    python scripts/bot_replay_load_test.py --users 200 --mix predict=5,free_text=5 --predict-latency 0.5 --json
+    python scripts/bot_replay_load_test.py --users 20 --api-url http://localhost:8000
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse
+from jose import jwt
+from telegram import Update
+from telegram.ext import Application, BaseHandler, ContextTypes, ConversationHandler
+
+from fake_telegram import FAKE_TOKEN, FakeTelegramRequest, make_callback_update, make_message_update
+from src.bot import main as bot_main
+from src.bot.search_cache import search_result_cache
+from src.bot.stock_name_matcher import stock_name_matcher
+from src.bot.update_processor import PerUserUpdateProcessor
+from src.common.utils import http_client
+from src.common.utils.cache import clear_all_caches
+
+# 사용자들이 주로 찾는 종목 (같은 종목에 요청이 몰리는 상황을 재현)
+HOT_STOCKS = [
+    ("005930", "삼성전자", "KOSPI"),
+    ("000660", "SK하이닉스", "KOSPI"),
+    ("373220", "LG에너지솔루션", "KOSPI"),
+    ("207940", "삼성바이오로직스", "KOSPI"),
+    ("005380", "현대차", "KOSPI"),
+    ("000270", "기아", "KOSPI"),
+    ("068270", "셀트리온", "KOSPI"),
+    ("035420", "NAVER", "KOSPI"),
+    ("035720", "카카오", "KOSPI"),
+    ("042660", "한화오션", "KOSPI"),
+    ("086520", "에코프로", "KOSDAQ"),
+    ("196170", "알테오젠", "KOSDAQ"),
+]
+SYMBOLS_PAGE_SIZE = 10
+DEFAULT_MIX = "predict=3,alert_list=2,symbols_paging=2,free_text=3"
+
+
+def build_stock_universe(size: int) -> List[Tuple[str, str, str]]:
+    """(종목 코드, 이름, 시장) 목록을 만듭니다. 자주 찾는 종목 + 나머지는 가상 종목, 코드 순으로 정렬"""
+    stocks = list(HOT_STOCKS)
+    hot_codes = {symbol for symbol, _, _ in HOT_STOCKS}
+    for n in itertools.count(1):
+        if len(stocks) >= size:
+            break
+        code = f"{100000 + n:06d}"
+        if code not in hot_codes:
+            stocks.append((code, f"가상종목{n:04d}", "KOSDAQ" if n % 3 else "KOSPI"))
+    return sorted(stocks)
+
+
+# =====================================================================================
+# 가짜 StockEye API
+# =====================================================================================
+
+def _issue_fake_token(telegram_id) -> str:
+    payload = {"sub": f"tg_{telegram_id}", "telegram_id": str(telegram_id), "exp": int(time.time()) + 3600}
+    return jwt.encode(payload, "replay-load-test", algorithm="HS256")
+
+
+def _telegram_id_from(request: Request) -> int:
+    token = request.headers.get("Authorization", "").replace("Bearer ", "")
+    try:
+        return int(jwt.get_unverified_claims(token).get("telegram_id", 0))
+    except Exception:
+        return 0
+
+
+def build_fake_api(stocks: List[Tuple[str, str, str]], api_latency: float, predict_latency: float, api_calls: Counter) -> FastAPI:
+    """
+    봇이 이 부하 테스트에서 호출하는 API만 흉내 내는 FastAPI 앱을 만듭니다.
+
+    모든 요청은 api_latency(예측은 predict_latency)만큼 기다린 뒤 응답하며, 경로별 호출 수를 api_calls에 셉니다.
+    """
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+    by_symbol = {symbol: (symbol, name, market) for symbol, name, market in stocks}
+    items = [{"symbol": symbol, "name": name, "market": market} for symbol, name, market in stocks]
+    etag = f'"{len(stocks)}-replay"'
+
+    @app.middleware("http")
+    async def simulate_latency(request: Request, call_next):
+        api_calls[f"{request.method} {request.url.path}"] += 1
+        await asyncio.sleep(predict_latency if request.url.path.endswith("/predict") else api_latency)
+        return await call_next(request)
+
+    @app.put("/api/v1/users/telegram_register")
+    async def telegram_register(payload: dict):
+        return {"telegram_id": payload.get("telegram_id"), "is_active": True}
+
+    @app.post("/api/v1/users/login")
+    async def login(payload: dict):
+        return {"access_token": _issue_fake_token(payload.get("username", "tg_0")[3:]), "token_type": "bearer"}
+
+    @app.post("/api/v1/auth/bot/token")
+    async def bot_token(payload: dict):
+        return {"access_token": _issue_fake_token(payload.get("telegram_id")), "token_type": "bearer"}
+
+    @app.get("/api/v1/symbols/names")
+    async def symbol_names(request: Request):
+        if request.headers.get("If-None-Match") == etag:
+            return JSONResponse(None, status_code=304, headers={"ETag": etag})
+        return JSONResponse({"items": [list(row) for row in stocks]}, headers={"ETag": etag})
+
+    @app.get("/api/v1/symbols/search")
+    async def search(query: str, limit: int = 10, offset: int = 0):
+        keyword = query.lower()
+        matched = [item for item in items if keyword in item["name"].lower() or item["symbol"].startswith(keyword)]
+        matched.sort(key=lambda item: (item["name"].lower() != keyword, len(item["name"])))
+        return {"items": matched[offset:offset + limit], "total_count": len(matched)}
+
+    @app.get("/api/v1/symbols/cursor")
+    async def symbols_cursor(limit: int = 10, cursor: Optional[str] = None, include_total: bool = False):
+        # 커서 형식: c{시작 위치}, 마지막 페이지는 "last"
+        if cursor == "last":
+            start = max(0, len(items) - (len(items) % limit or limit))
+        else:
+            start = int(cursor[1:]) if cursor else 0
+        end = start + limit
+        return {
+            "items": items[start:end],
+            "next_cursor": f"c{end}" if end < len(items) else None,
+            "prev_cursor": f"c{max(0, start - limit)}" if start > 0 else None,
+            "last_cursor": "last",
+            "total_count": len(items) if include_total else None,
+        }
+
+    @app.get("/api/v1/symbols/batch")
+    async def symbols_batch(codes: str = Query(...)):
+        code_list = list(dict.fromkeys(code for code in codes.split(",") if code))
+        return {
+            "items": [{"symbol": c, "name": by_symbol[c][1], "market": by_symbol[c][2]} for c in code_list if c in by_symbol],
+            "missing": [c for c in code_list if c not in by_symbol],
+        }
+
+    @app.get("/api/v1/price-alerts/")
+    async def price_alerts(request: Request):
+        user_id = _telegram_id_from(request)
+        first, second = random.Random(user_id).sample(stocks, 2)
+        return [
+            {"id": user_id * 10 + 1, "symbol": first[0], "stock_name": first[1], "target_price": 80000, "condition": "gte", "is_active": True},
+            # 이름이 없는 알림은 봇이 /symbols/batch로 이름을 조회
+            {"id": user_id * 10 + 2, "symbol": second[0], "change_percent": 5.0, "change_type": "up", "is_active": False},
+        ]
+
+    @app.get("/api/v1/disclosure-alerts/")
+    async def disclosure_alerts(request: Request):
+        user_id = _telegram_id_from(request)
+        stock = random.Random(-user_id).choice(stocks)
+        return [{"id": user_id * 10 + 3, "symbol": stock[0], "is_active": True}]
+
+    @app.post("/api/v1/predict")
+    async def predict(payload: dict):
+        symbol = payload.get("symbol")
+        if symbol not in by_symbol:
+            return JSONResponse({"detail": f"종목을 찾을 수 없습니다: {symbol}"}, status_code=404)
+        prediction = ["상승", "하락", "보합"][int(symbol) % 3]
+        return {"symbol": symbol, "prediction": prediction, "confidence": 60, "reason": "부하 테스트용 예측"}
+
+    return app
+
+
+class RewriteTransport(httpx.AsyncBaseTransport):
+    """요청의 호스트를 target_url로 바꿔 실제 API 서버로 보냅니다. (핸들러마다 API 주소가 달라도 한 서버로 모음)"""
+
+    def __init__(self, target_url: str):
+        self._target = httpx.URL(target_url)
+        self._transport = httpx.AsyncHTTPTransport(retries=3)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme=self._target.scheme, host=self._target.host, port=self._target.port)
+        request.headers["Host"] = self._target.netloc.decode("ascii")
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# =====================================================================================
+# 가상 사용자 시나리오
+# =====================================================================================
+
+def _scenario_steps(name: str, rng: random.Random) -> List[Tuple[str, str]]:
+    """시나리오 하나를 (종류, 내용) 목록으로 만듭니다. 종류는 message(텍스트) 또는 callback(버튼)"""
+    stock_name = rng.choice(HOT_STOCKS)[1]
+    if name == "predict":
+        return [("message", f"/predict {stock_name}")]
+    if name == "alert_list":
+        return [("message", "/alert list")]
+    if name == "symbols_paging":
+        # 첫 페이지를 본 뒤 "다음" 버튼을 두 번 누름 (가짜 API의 커서 형식)
+        return [
+            ("message", "/symbols"),
+            ("callback", f"symbols_cur:2:c{SYMBOLS_PAGE_SIZE}"),
+            ("callback", f"symbols_cur:3:c{SYMBOLS_PAGE_SIZE * 2}"),
+        ]
+    if name == "free_text":
+        return [("message", rng.choice([f"{stock_name} 얼마야", f"{stock_name} 예측해줘", f"{stock_name} 정보 알려줘"]))]
+    raise ValueError(f"알 수 없는 시나리오입니다: {name}")
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'predict=3,alert_list=2' 형식의 시나리오 비율을 읽습니다."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        _scenario_steps(name.strip(), random.Random(0))
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def build_user_plans(users: int, sessions: int, mix: Dict[str, float], seed: int) -> Dict[int, List[Tuple[str, List[Tuple[str, str]]]]]:
+    """사용자별로 진행할 시나리오 목록을 만듭니다. (같은 seed면 같은 목록)"""
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    plans = {}
+    for n in range(1, users + 1):
+        plans[2_000_000 + n] = [(name, _scenario_steps(name, rng)) for name in rng.choices(names, weights, k=sessions)]
+    return plans
+
+
+# =====================================================================================
+# 측정
+# =====================================================================================
+
+class ReplayApplication(Application):
+    """업데이트 처리가 끝나면 on_update_done을 호출하는 Application (가상 사용자가 응답을 기다리는 데 사용)"""
+
+    on_update_done: Optional[Callable[[object], None]] = None
+
+    async def process_update(self, update: object) -> None:
+        try:
+            await super().process_update(update)
+        finally:
+            if self.on_update_done:
+                self.on_update_done(update)
+
+
+class ReplayRecorder:
+    """업데이트, 시나리오, 핸들러별 지연 시간(ms)과 오류 수를 기록합니다."""
+
+    def __init__(self):
+        self.update_ms: List[float] = []
+        self.scenario_ms: Dict[str, List[float]] = defaultdict(list)
+        self.handler_ms: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    def instrument(self, application: Application):
+        """등록된 모든 핸들러(대화 핸들러 안의 핸들러 포함)의 콜백에 실행 시간 측정을 씌웁니다."""
+        def wrap(handler: BaseHandler):
+            if isinstance(handler, ConversationHandler):
+                for inner in handler.entry_points + handler.fallbacks + [h for hs in handler.states.values() for h in hs]:
+                    wrap(inner)
+                return
+            callback = handler.callback
+            name = getattr(callback, "__name__", type(handler).__name__)
+
+            @wraps(callback)
+            async def timed(update, context):
+                started = time.perf_counter()
+                try:
+                    return await callback(update, context)
+                finally:
+                    self.handler_ms[name].append((time.perf_counter() - started) * 1000)
+
+            handler.callback = timed
+
+        for handlers in application.handlers.values():
+            for handler in handlers:
+                wrap(handler)
+
+        async def on_error(update: object, context: ContextTypes.DEFAULT_TYPE):
+            self.errors[type(context.error).__name__] += 1
+
+        application.add_error_handler(on_error)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(values),
+        "p50_ms": round(_percentile(values, 50), 1),
+        "p95_ms": round(_percentile(values, 95), 1),
+        "p99_ms": round(_percentile(values, 99), 1),
+        "max_ms": round(max(values), 1) if values else 0.0,
+    }
+
+
+async def run_step(users: int, args, mix: Dict[str, float], stocks: List[Tuple[str, str, str]]) -> Dict:
+    """가상 사용자 users명으로 한 번 재생하고 결과를 반환합니다."""
+    # 이전 단계의 캐시(인증 토큰, 검색 결과, 종목명 인식기)가 결과에 섞이지 않도록 비움
+    clear_all_caches()
+    stock_name_matcher.invalidate()
+
+    fake_telegram = FakeTelegramRequest(latency=args.telegram_latency)
+    builder = (
+        Application.builder().application_class(ReplayApplication)
+        .token(FAKE_TOKEN).request(fake_telegram).get_updates_request(fake_telegram)
+    )
+    with patch.object(bot_main, "BOT_CONCURRENT_UPDATES", args.concurrency):
+        application = bot_main.build_application(builder)
+    recorder = ReplayRecorder()
+    recorder.instrument(application)
+
+    api_calls: Counter = Counter()
+    if args.api_url:
+        transport = RewriteTransport(args.api_url)
+    else:
+        transport = httpx.ASGITransport(app=build_fake_api(stocks, args.api_latency, args.predict_latency, api_calls))
+
+    def create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=http_client.API_BASE_URL, transport=transport, timeout=http_client.API_CLIENT_TIMEOUT)
+
+    waiters: Dict[int, asyncio.Future] = {}
+
+    def on_update_done(update: object):
+        waiter = waiters.pop(getattr(update, "update_id", None), None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(time.perf_counter())
+
+    application.on_update_done = on_update_done
+    plans = build_user_plans(users, args.sessions, mix, args.seed)
+    update_ids = itertools.count(1)
+
+    async def user_session(user_id: int, plan, rng: random.Random):
+        if args.ramp_up:
+            await asyncio.sleep(rng.uniform(0, args.ramp_up))
+        for scenario, steps in plan:
+            scenario_started = time.perf_counter()
+            for kind, content in steps:
+                update_id = next(update_ids)
+                data = make_message_update(update_id, user_id, content) if kind == "message" else make_callback_update(update_id, user_id, content)
+                waiter = waiters[update_id] = asyncio.get_running_loop().create_future()
+                sent_at = time.perf_counter()
+                await application.update_queue.put(Update.de_json(data, application.bot))
+                done_at = await waiter
+                recorder.update_ms.append((done_at - sent_at) * 1000)
+            recorder.scenario_ms[scenario].append((time.perf_counter() - scenario_started) * 1000)
+            if args.think_time:
+                await asyncio.sleep(rng.expovariate(1 / args.think_time))
+
+    with patch.object(http_client.shared_api_client, "_create_client", side_effect=create_client):
+        async with application:
+            await application.post_init(application)
+            await application.start()
+            try:
+                started = time.perf_counter()
+                await asyncio.gather(*[
+                    user_session(user_id, plan, random.Random(args.seed + user_id)) for user_id, plan in plans.items()
+                ])
+                elapsed = time.perf_counter() - started
+            finally:
+                await application.stop()
+        await application.post_shutdown(application)
+        await transport.aclose()
+
+    report = {
+        "users": users,
+        "updates": len(recorder.update_ms),
+        "scenarios": sum(len(v) for v in recorder.scenario_ms.values()),
+        "elapsed_sec": round(elapsed, 2),
+        "updates_per_sec": round(len(recorder.update_ms) / elapsed, 1),
+        "update_latency": _summary(recorder.update_ms),
+        "scenarios_latency": {name: _summary(values) for name, values in sorted(recorder.scenario_ms.items())},
+        "handlers": {name: _summary(values) for name, values in sorted(recorder.handler_ms.items())},
+        "errors": dict(recorder.errors),
+        "api_calls": dict(api_calls.most_common()),
+        "telegram_calls": dict(fake_telegram.calls.most_common()),
+        "single_flight": http_client.api_flight.get_stats(),
+        "search_cache": search_result_cache.get_stats(),
+    }
+    processor = application.update_processor
+    if isinstance(processor, PerUserUpdateProcessor):
+        report["processor"] = processor.get_stats()
+    return report
+
+
+async def main(args) -> Dict:
+    mix = parse_mix(args.mix)
+    stocks = build_stock_universe(args.symbols)
+    report = {
+        "concurrency": args.concurrency,
+        "sessions_per_user": args.sessions,
+        "mix": mix,
+        "api": args.api_url or {"api_latency_ms": args.api_latency * 1000, "predict_latency_ms": args.predict_latency * 1000},
+        "telegram_latency_ms": args.telegram_latency * 1000,
+        "slo_p99_ms": args.slo_ms,
+        "steps": [],
+    }
+    for users in args.users:
+        report["steps"].append(await run_step(users, args, mix, stocks))
+    # p99 지연이 목표 안에 든 가장 큰 사용자 수 (봇이 감당할 수 있는 사용자 수의 추정치)
+    within = [step["users"] for step in report["steps"] if step["update_latency"]["p99_ms"] <= args.slo_ms and not step["errors"]]
+    report["max_users_within_slo"] = max(within) if within else None
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="봇 업데이트 재생 부하 테스트")
+    parser.add_argument("--users", type=int, nargs="+", default=[100], help="가상 사용자 수 (여러 개를 주면 차례로 측정)")
+    parser.add_argument("--sessions", type=int, default=5, help="사용자별로 진행할 시나리오 수")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"시나리오 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=bot_main.BOT_CONCURRENT_UPDATES, help="동시에 처리할 최대 업데이트 수 (BOT_CONCURRENT_UPDATES)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="시나리오 사이 평균 대기 시간 (초, 0이면 쉬지 않음)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="사용자들이 이 시간(초) 동안 나누어 시작")
+    parser.add_argument("--api-latency", type=float, default=0.02, help="가짜 API 응답 시간 (초)")
+    parser.add_argument("--predict-latency", type=float, default=0.2, help="가짜 API의 /predict 응답 시간 (초)")
+    parser.add_argument("--telegram-latency", type=float, default=0.03, help="텔레그램 Bot API 응답 시간 (초)")
+    parser.add_argument("--api-url", help="가짜 API 대신 요청을 보낼 실행 중인 API 서버 주소 (예: http://localhost:8000)")
+    parser.add_argument("--symbols", type=int, default=2500, help="가짜 종목 마스터의 종목 수")
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="업데이트 지연 p99 목표 (ms)")
+    parser.add_argument("--seed", type=int, default=42, help="시나리오 생성 seed")
+    parser.add_argument("--log-level", default="WARNING", help="봇 로그 레벨")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # 봇 모듈이 INFO로 설정한 로그(요청마다 찍히는 httpx 로그 등)가 측정을 방해하지 않도록 낮춤
+    logging.getLogger().setLevel(args.log_level.upper())
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 78)
+        print(f"📊 봇 업데이트 재생 부하 테스트 (동시 처리 {report['concurrency']}, 사용자당 시나리오 {report['sessions_per_user']}개)")
+        print("=" * 78)
+        for step in report["steps"]:
+            latency = step["update_latency"]
+            print(f"\n👥 사용자 {step['users']}명: {step['updates_per_sec']} updates/s "
+                  f"(업데이트 {step['updates']}개 / {step['elapsed_sec']}초), "
+                  f"지연 p50 {latency['p50_ms']}ms / p95 {latency['p95_ms']}ms / p99 {latency['p99_ms']}ms")
+            print(f"   {'핸들러':<34}{'횟수':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+            for name, s in step["handlers"].items():
+                print(f"   {name:<34}{s['count']:>7}{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}")
+            flight = step["single_flight"]
+            print(f"   API 호출 {sum(step['api_calls'].values())}회, 텔레그램 호출 {sum(step['telegram_calls'].values())}회, "
+                  f"합친 API 요청 {flight['coalesced']}회, 오류 {sum(step['errors'].values())}회")
+        print(f"\n✅ p99 {report['slo_p99_ms']:.0f}ms 이내로 처리한 최대 사용자 수: {report['max_users_within_slo'] or '-'}")
@@ -0,0 +1,217 @@
+"""
+봇 웹훅 모드 업데이트 처리량 측정 스크립트
+
+많은 사용자가 동시에 메시지를 보내는 상황을 만들어, 업데이트 처리 방식별 처리량(updates/s)과
+업데이트 지연 시간(웹훅 수신 → 핸들러 완료, p50/p99), 그리고 대화(ConversationHandler) 순서가 지켜지는지 비교합니다.
+
+- sequential: 기존 방식. 업데이트를 하나씩 처리
+- unordered:  PTB 기본 동시 처리(SimpleUpdateProcessor). 같은 사용자의 업데이트도 순서 없이 처리
+- per_user:   PerUserUpdateProcessor. 사용자끼리는 동시에, 같은 사용자의 업데이트는 순서대로 처리
+
+사용자마다 2단계 대화(/flow → 답장)를 진행하고, 일부 사용자는 느린 /predict(API 대기)를 함께 보냅니다.
+업데이트는 실제 웹훅 서버(src/bot/webhook.py)로 보내며, 텔레그램 Bot API는 fake_telegram.FakeTelegramRequest가 대신 응답합니다.
+핸들러의 API 호출은 asyncio.sleep으로 흉내 내므로 API 서버나 DB가 필요 없습니다.
+
+사용 예:
+    python scripts/bot_webhook_load_test.py --users 200 --concurrency 32
+    python scripts/bot_webhook_load_test.py --users 500 --predict-latency 2 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import uvicorn
+from telegram import Update
+from telegram.ext import (
+    Application, CommandHandler, ContextTypes, ConversationHandler, MessageHandler, SimpleUpdateProcessor, filters
+)
+
+from fake_telegram import FAKE_TOKEN, FakeTelegramRequest, make_message_update
+from src.bot.update_processor import PerUserUpdateProcessor
+from src.bot.webhook import build_webhook_app
+
+WEBHOOK_PATH = "/telegram/webhook"
+FLOW_STEP = 0
+
+
+class LoadRecorder:
+    """업데이트별 완료 시각과 대화 진행 결과를 기록합니다."""
+
+    def __init__(self):
+        self.sent_at: Dict[int, float] = {}
+        self.done_at: Dict[int, float] = {}
+        self.flows_completed = 0
+        self.steps_lost = 0
+
+    def done(self, update: Update):
+        self.done_at[update.update_id] = time.perf_counter()
+
+
+def build_load_application(mode: str, fake: FakeTelegramRequest, recorder: LoadRecorder, args) -> Application:
+    builder = Application.builder().token(FAKE_TOKEN).request(fake).get_updates_request(fake)
+    if mode == "unordered":
+        builder = builder.concurrent_updates(SimpleUpdateProcessor(args.concurrency))
+    elif mode == "per_user":
+        builder = builder.concurrent_updates(PerUserUpdateProcessor(args.concurrency))
+    application = builder.build()
+
+    async def flow_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await asyncio.sleep(args.api_latency)  # 종목 검색 등 API 호출
+        await update.message.reply_text("어떤 알림을 추가할까요?")
+        recorder.done(update)
+        return FLOW_STEP
+
+    async def flow_step(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await asyncio.sleep(args.api_latency)  # 알림 등록 API 호출
+        await update.message.reply_text("알림을 추가했습니다.")
+        recorder.flows_completed += 1
+        recorder.done(update)
+        return ConversationHandler.END
+
+    async def predict(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await asyncio.sleep(args.predict_latency)  # 느린 예측 API 호출
+        await update.message.reply_text("[예측 결과] 상승")
+        recorder.done(update)
+
+    async def unhandled_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        # 대화 상태가 아직 없을 때 도착한 답장 (대화 순서가 깨진 경우)
+        recorder.steps_lost += 1
+        recorder.done(update)
+
+    application.add_handler(ConversationHandler(
+        entry_points=[CommandHandler("flow", flow_start)],
+        states={FLOW_STEP: [MessageHandler(filters.TEXT & ~filters.COMMAND, flow_step)]},
+        fallbacks=[],
+    ))
+    application.add_handler(CommandHandler("predict", predict))
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, unhandled_text))
+    return application
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def build_workload(users: int, predict_ratio: float, seed: int = 42) -> Dict[int, List[str]]:
+    """사용자별로 보낼 메시지 목록을 만듭니다. (대화 2단계 + 일부 사용자는 /predict 먼저)"""
+    rng = random.Random(seed)
+    workload = {}
+    for user_id in range(1, users + 1):
+        texts = ["/predict 005930"] if rng.random() < predict_ratio else []
+        texts += ["/flow", "삼성전자 80000원 이상"]
+        workload[1_000_000 + user_id] = texts
+    return workload
+
+
+async def run_phase(mode: str, workload: Dict[int, List[str]], args) -> Dict:
+    fake = FakeTelegramRequest(latency=args.telegram_latency)
+    recorder = LoadRecorder()
+    application = build_load_application(mode, fake, recorder, args)
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(
+        build_webhook_app(application, WEBHOOK_PATH), host="127.0.0.1", port=port, log_level="warning", access_log=False
+    ))
+
+    update_ids = iter(range(1, 10_000_000))
+
+    async def user_session(client: httpx.AsyncClient, user_id: int, texts: List[str]):
+        # 텔레그램처럼 한 사용자의 업데이트는 순서대로 전달 (앞 요청의 응답을 받은 뒤 다음 업데이트 전송)
+        for text in texts:
+            update_id = next(update_ids)
+            recorder.sent_at[update_id] = time.perf_counter()
+            response = await client.post(WEBHOOK_PATH, json=make_message_update(update_id, user_id, text))
+            response.raise_for_status()
+
+    async with application:
+        await application.start()
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        try:
+            limits = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+                started = time.perf_counter()
+                await asyncio.gather(*[user_session(client, user_id, texts) for user_id, texts in workload.items()])
+                await application.update_queue.join()
+                elapsed = time.perf_counter() - started
+        finally:
+            server.should_exit = True
+            await server_task
+            await application.stop()
+
+    latencies_ms = [(recorder.done_at[i] - recorder.sent_at[i]) * 1000 for i in recorder.done_at]
+    total_updates = len(recorder.sent_at)
+    report = {
+        "updates": total_updates,
+        "elapsed_sec": round(elapsed, 2),
+        "updates_per_sec": round(total_updates / elapsed, 1),
+        "latency_p50_ms": round(_percentile(latencies_ms, 50), 1),
+        "latency_p99_ms": round(_percentile(latencies_ms, 99), 1),
+        "flows_completed": recorder.flows_completed,
+        "flow_steps_lost": recorder.steps_lost,
+        "telegram_api_calls": sum(fake.calls.values()),
+    }
+    processor = application.update_processor
+    if isinstance(processor, PerUserUpdateProcessor):
+        report["processor"] = processor.get_stats()
+    return report
+
+
+async def main(args) -> Dict:
+    workload = build_workload(args.users, args.predict_ratio)
+    report = {
+        "users": args.users,
+        "concurrency": args.concurrency,
+        "api_latency_ms": args.api_latency * 1000,
+        "predict_latency_ms": args.predict_latency * 1000,
+        "predict_users": sum(1 for texts in workload.values() if texts[0].startswith("/predict")),
+        "results": {},
+    }
+    for mode in args.modes:
+        report["results"][mode] = await run_phase(mode, workload, args)
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="봇 웹훅 모드 업데이트 처리량 측정")
+    parser.add_argument("--users", type=int, default=200, help="동시에 메시지를 보내는 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시에 처리할 최대 업데이트 수 (BOT_CONCURRENT_UPDATES)")
+    parser.add_argument("--predict-ratio", type=float, default=0.1, help="/predict를 보내는 사용자 비율")
+    parser.add_argument("--predict-latency", type=float, default=1.0, help="/predict 처리 시간 (초)")
+    parser.add_argument("--api-latency", type=float, default=0.05, help="대화 단계별 API 호출 시간 (초)")
+    parser.add_argument("--telegram-latency", type=float, default=0.02, help="텔레그램 Bot API 응답 시간 (초)")
+    parser.add_argument("--modes", nargs="+", default=["sequential", "unordered", "per_user"],
+                        choices=["sequential", "unordered", "per_user"], help="비교할 처리 방식")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 78)
+        print(f"📊 봇 업데이트 처리량 (사용자 {report['users']}명, 동시 처리 {report['concurrency']}, "
+              f"/predict {report['predict_users']}명 × {report['predict_latency_ms']:.0f}ms)")
+        print("=" * 78)
+        for mode, r in report["results"].items():
+            print(f"   {mode:<10} {r['updates_per_sec']:>7} updates/s  p50 {r['latency_p50_ms']}ms / p99 {r['latency_p99_ms']}ms"
+                  f"  대화 완료 {r['flows_completed']}/{report['users']} (순서 깨짐 {r['flow_steps_lost']})")
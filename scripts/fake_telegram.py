@@ -0,0 +1,113 @@
+"""
+부하 테스트용 가짜 텔레그램 Bot API
+
+python-telegram-bot의 요청 객체(BaseRequest) 자리에 넣어, 실제 텔레그램 서버 없이 봇 Application을 실행할 수 있게 합니다.
+getMe / sendMessage / editMessageText 등 봇이 호출하는 메서드에 그럴듯한 응답을 돌려주고, 호출 횟수를 셉니다.
+
+사용 예:
+    fake = FakeTelegramRequest(latency=0.03)
+    application = Application.builder().token(FAKE_TOKEN).request(fake).get_updates_request(fake).build()
+"""
+import asyncio
+import itertools
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from telegram.request import BaseRequest, RequestData
+
+FAKE_TOKEN = "123456:FAKE-TOKEN-FOR-LOAD-TEST"
+BOT_USER = {"id": 123456, "is_bot": True, "first_name": "StockEye", "username": "stockeye_test_bot"}
+
+
+def make_message_update(update_id: int, user_id: int, text: str) -> Dict[str, Any]:
+    """사용자 user_id가 보낸 텍스트 메시지 업데이트(JSON)를 만듭니다. (/로 시작하면 명령으로 표시)"""
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private", "first_name": f"user{user_id}"},
+        "from": {"id": user_id, "is_bot": False, "first_name": f"user{user_id}"},
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+    return {"update_id": update_id, "message": message}
+
+
+def make_callback_update(update_id: int, user_id: int, data: str) -> Dict[str, Any]:
+    """사용자 user_id가 인라인 버튼(callback_data=data)을 누른 업데이트(JSON)를 만듭니다."""
+    user = {"id": user_id, "is_bot": False, "first_name": f"user{user_id}"}
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": user,
+            "chat_instance": str(user_id),
+            "data": data,
+            "message": {
+                "message_id": update_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private", "first_name": f"user{user_id}"},
+                "from": BOT_USER,
+                "text": "...",
+            },
+        },
+    }
+
+
+class FakeTelegramRequest(BaseRequest):
+    """
+    텔레그램 Bot API 대신 응답하는 요청 객체입니다.
+
+    Args:
+        latency (float): 메서드 호출마다 기다릴 시간(초). 실제 텔레그램 API 왕복 시간을 흉내 냄
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._message_ids = itertools.count(1)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def _result(self, method: str, params: Dict[str, Any]) -> Any:
+        if method == "getMe":
+            return BOT_USER
+        if method in ("sendMessage", "editMessageText", "sendPhoto", "sendDocument"):
+            chat_id = params.get("chat_id", 0)
+            return {
+                "message_id": params.get("message_id") or next(self._message_ids),
+                "date": int(time.time()),
+                "chat": {"id": int(chat_id) if str(chat_id).lstrip("-").isdigit() else 0, "type": "private"},
+                "from": BOT_USER,
+                "text": params.get("text", ""),
+            }
+        if method == "getUpdates":
+            return []
+        # answerCallbackQuery, setWebhook, deleteWebhook, sendChatAction 등
+        return True
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout=None,
+        write_timeout=None,
+        connect_timeout=None,
+        pool_timeout=None,
+    ) -> Tuple[int, bytes]:
+        api_method = url.rsplit("/", 1)[-1]
+        self.calls[api_method] += 1
+        if api_method == "getUpdates":
+            # 폴링은 웹훅 부하 테스트에서 쓰지 않으므로 오래 기다렸다가 빈 결과를 돌려줌
+            await asyncio.sleep(1)
+        elif self.latency:
+            await asyncio.sleep(self.latency)
+        params = request_data.parameters if request_data else {}
+        return 200, json.dumps({"ok": True, "result": self._result(api_method, params)}).encode("utf-8")
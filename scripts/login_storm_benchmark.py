@@ -0,0 +1,203 @@
+"""
+로그인 폭주 중 조회 API 지연 시간 측정 스크립트
+
+로그인(bcrypt 검증)이나 텔레그램 가입(bcrypt 해시) 요청을 계속 보내는 동안 조회 요청의 지연 시간(p50/p99)이 어떻게 바뀌는지 비교합니다.
+
+- baseline:       로그인 요청 없이 조회만
+- inline:         기존 방식. def 핸들러(스레드 풀)에서 bcrypt를 바로 계산
+- pooled:         async 핸들러에서 averify_password()로 프로세스 풀에 맡김
+- signup_inline:  def 핸들러(/users/telegram_register 기존 방식)에서 get_password_hash()로 풀의 결과를 기다림
+- signup_on_loop: async 핸들러의 run_sync() 안(/predict의 기존 사용자 자동 생성)에서 get_password_hash()로 기다림
+- signup_pooled:  async 핸들러에서 aget_password_hash()로 기다림 (acreate_user_from_telegram)
+
+조회 경로는 동기 의존성(get_db, get_current_active_user 등)처럼 스레드 풀에서 실행되는 짧은 작업(2ms)으로 흉내 냅니다.
+API 서버와 DB 없이 같은 프로세스에서 띄운 작은 FastAPI 앱으로 측정합니다.
+bcrypt 비용과 프로세스 수는 PASSWORD_BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS 환경 변수로 바꿀 수 있습니다.
+
+사용 예:
+    python scripts/login_storm_benchmark.py --logins 100 --duration 10
+    PASSWORD_HASH_WORKERS=4 python scripts/login_storm_benchmark.py --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, HTTPException
+
+from src.common.utils.password_utils import (
+    PasswordHasherBusyError, aget_password_hash, averify_password, get_password_hash, password_hasher, pwd_context
+)
+
+PASSWORD = "telegram_user_password"
+HASHED_PASSWORD = pwd_context.hash(PASSWORD)
+
+# (단계 이름, 조회와 함께 보낼 인증 요청 경로)
+PHASES = (
+    ("baseline", None),
+    ("inline", "/login/inline"),
+    ("pooled", "/login/pooled"),
+    ("signup_inline", "/signup/inline"),
+    ("signup_on_loop", "/signup/on_loop"),
+    ("signup_pooled", "/signup/pooled"),
+)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/symbols/{symbol}")
+    def get_symbol(symbol: str):
+        time.sleep(0.002)  # 동기 DB 조회 흉내
+        return {"symbol": symbol}
+
+    @app.post("/login/inline")
+    def login_inline():
+        if not pwd_context.verify(PASSWORD, HASHED_PASSWORD):
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.post("/login/pooled")
+    async def login_pooled():
+        try:
+            if not await averify_password(PASSWORD, HASHED_PASSWORD):
+                raise HTTPException(status_code=401)
+        except PasswordHasherBusyError:
+            raise HTTPException(status_code=503)
+        return {"ok": True}
+
+    @app.post("/signup/inline")
+    def signup_inline():
+        try:
+            get_password_hash(PASSWORD)
+        except PasswordHasherBusyError:
+            raise HTTPException(status_code=503)
+        return {"ok": True}
+
+    @app.post("/signup/on_loop")
+    async def signup_on_loop():
+        # AsyncSession.run_sync()에 넘긴 코드는 이벤트 루프 스레드에서 실행되므로 여기서 바로 호출하는 것과 같음
+        try:
+            get_password_hash(PASSWORD)
+        except PasswordHasherBusyError:
+            raise HTTPException(status_code=503)
+        return {"ok": True}
+
+    @app.post("/signup/pooled")
+    async def signup_pooled():
+        try:
+            await aget_password_hash(PASSWORD)
+        except PasswordHasherBusyError:
+            raise HTTPException(status_code=503)
+        return {"ok": True}
+
+    return app
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_phase(client: httpx.AsyncClient, login_path: str, logins: int, readers: int, duration: float) -> Dict:
+    """duration초 동안 로그인 요청 logins개와 조회 요청 readers개를 동시에 계속 보냅니다."""
+    deadline = time.perf_counter() + duration
+    read_latencies_ms: List[float] = []
+    login_counts = {"ok": 0, "rejected": 0, "errors": 0}
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get("/symbols/005930")
+            response.raise_for_status()
+            read_latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    async def login():
+        while time.perf_counter() < deadline:
+            try:
+                response = await client.post(login_path)
+                if response.status_code == 200:
+                    login_counts["ok"] += 1
+                elif response.status_code == 503:
+                    login_counts["rejected"] += 1
+                    await asyncio.sleep(0.05)
+                else:
+                    login_counts["errors"] += 1
+            except httpx.HTTPError:
+                login_counts["errors"] += 1
+
+    tasks = [reader() for _ in range(readers)]
+    if login_path:
+        tasks += [login() for _ in range(logins)]
+    await asyncio.gather(*tasks)
+    return {
+        "reads": len(read_latencies_ms),
+        "read_p50_ms": round(_percentile(read_latencies_ms, 50), 2),
+        "read_p99_ms": round(_percentile(read_latencies_ms, 99), 2),
+        "logins_per_sec": round(login_counts["ok"] / duration, 1),
+        "logins_rejected": login_counts["rejected"],
+        "login_errors": login_counts["errors"],
+    }
+
+
+async def main(args) -> Dict:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(build_app(), host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    # 프로세스 풀 예열 (첫 요청이 프로세스 시작 시간을 기다리지 않도록)
+    await averify_password(PASSWORD, HASHED_PASSWORD)
+
+    limits = httpx.Limits(max_connections=args.logins + args.readers, max_keepalive_connections=args.logins + args.readers)
+    report = {"logins": args.logins, "readers": args.readers, "duration_sec": args.duration,
+              "hasher": {"workers": password_hasher.workers, "max_pending": password_hasher.max_pending}, "results": {}}
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120) as client:
+            for name, path in PHASES:
+                report["results"][name] = await run_phase(client, path, args.logins, args.readers, args.duration)
+        report["hasher"].update(password_hasher.get_stats())
+    finally:
+        server.should_exit = True
+        await server_task
+        password_hasher.shutdown()
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 조회 API 지연 시간 측정")
+    parser.add_argument("--logins", type=int, default=100, help="동시에 로그인/가입 요청을 보내는 클라이언트 수")
+    parser.add_argument("--readers", type=int, default=10, help="동시에 조회 요청을 보내는 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10, help="단계별 측정 시간 (초)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 70)
+        print(f"📊 로그인 폭주 중 조회 지연 (로그인 {report['logins']} / 조회 {report['readers']} 동시, 단계별 {report['duration_sec']}초)")
+        print("=" * 70)
+        for name, r in report["results"].items():
+            print(f"   {name:<14} 조회 p50 {r['read_p50_ms']}ms / p99 {r['read_p99_ms']}ms ({r['reads']}건)"
+                  f"  로그인/가입 {r['logins_per_sec']}/s (거절 {r['logins_rejected']}, 오류 {r['login_errors']})")
+        h = report["hasher"]
+        print(f"   해시 풀: workers {h['workers']}, 최대 동시 {h['max_in_flight']}/{h['max_pending']}, 거절 {h['rejected']}")
@@ -0,0 +1,268 @@
+"""
+알림 전송 처리량 부하 테스트 스크립트
+
+실제 텔레그램 API 대신 로컬에서 가짜 Bot API 서버를 띄우고,
+실제 NotificationService(broadcast) 또는 워커 리스너(Redis 'notifications') 경로로
+대량의 알림을 흘려 보내 처리량(msg/s), 지연 시간(p50/p99), 유실 건수를 측정합니다.
+
+가짜 서버는 응답 지연, 429(retry_after), 임의의 5xx 오류를 흉내 냅니다.
+
+사용 예:
+    # NotificationService.broadcast 경로 (외부 의존성 없음)
+    python scripts/notification_load_test.py --count 5000 --concurrency 20
+
+    # 워커 리스너 경로 (Redis 필요)
+    REDIS_HOST=localhost python scripts/notification_load_test.py --mode listener --count 1000
+
+    # CI 등에서 결과를 기계적으로 비교할 때
+    python scripts/notification_load_test.py --count 2000 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import time
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+FAKE_TOKEN = "123456:LOADTEST"
+CHAT_ID_BASE = 1_000_000
+
+
+class FakeTelegramServer:
+    """
+    sendMessage만 지원하는 가짜 텔레그램 Bot API 서버입니다.
+
+    Args:
+        latency_ms (tuple): 응답 지연 범위 (최소, 최대) 밀리초
+        throttle_rate (float): 429 응답 비율 (0~1)
+        retry_after (int): 429 응답 시 안내할 retry_after (초)
+        error_rate (float): 5xx 응답 비율 (0~1)
+        seed (int, optional): 재현 가능한 결과를 위한 난수 시드
+    """
+
+    def __init__(self, latency_ms=(20, 80), throttle_rate=0.0, retry_after=1, error_rate=0.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        # chat_id -> 처음 성공 응답을 보낸 시각 (time.perf_counter 기준)
+        self.acked: Dict[int, float] = {}
+        self.duplicates = 0
+        self.all_acked = asyncio.Event()
+        self.expected = 0
+
+        self.app = FastAPI()
+        self.app.add_api_route("/bot{token}/{method}", self.handle, methods=["POST"])
+        self._server: Optional[uvicorn.Server] = None
+        self._task: Optional[asyncio.Task] = None
+        self.port: Optional[int] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/bot"
+
+    async def handle(self, token: str, method: str, request: Request):
+        self.requests += 1
+        body = (await request.body()).decode()
+        if request.headers.get("content-type", "").startswith("application/json"):
+            params = json.loads(body or "{}")
+        else:
+            params = {k: v[0] for k, v in parse_qs(body).items()}
+
+        await asyncio.sleep(self.random.uniform(*self.latency_ms) / 1000)
+
+        if method != "sendMessage":
+            return JSONResponse({"ok": False, "error_code": 404, "description": "Not Found"}, status_code=404)
+
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.throttled += 1
+            return JSONResponse({
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {self.retry_after}",
+                "parameters": {"retry_after": self.retry_after},
+            }, status_code=429)
+        if roll < self.throttle_rate + self.error_rate:
+            self.errors += 1
+            return JSONResponse({"ok": False, "error_code": 502, "description": "Bad Gateway"}, status_code=502)
+
+        chat_id = int(params["chat_id"])
+        if chat_id in self.acked:
+            self.duplicates += 1
+        else:
+            self.acked[chat_id] = time.perf_counter()
+            if self.expected and len(self.acked) >= self.expected:
+                self.all_acked.set()
+
+        return {
+            "ok": True,
+            "result": {
+                "message_id": self.requests,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "text": params.get("text", ""),
+            },
+        }
+
+    async def start(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=self.port, log_level="warning", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            await asyncio.sleep(0.01)
+
+    async def stop(self):
+        if self._server:
+            self._server.should_exit = True
+            await self._task
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_broadcast(server: FakeTelegramServer, count: int, concurrency: int, submitted: Dict[int, float]) -> Dict:
+    """NotificationService.broadcast 경로로 알림을 전송합니다."""
+    from src.common.services.notify_service import NotificationService
+
+    service = NotificationService(concurrency_limits={'telegram': concurrency})
+
+    async def recipients():
+        for i in range(count):
+            chat_id = CHAT_ID_BASE + i
+            submitted[chat_id] = time.perf_counter()
+            yield {'id': str(chat_id), 'channel': 'telegram'}
+
+    return await service.broadcast(recipients(), "부하 테스트 메시지")
+
+
+async def run_listener(server: FakeTelegramServer, count: int, submitted: Dict[int, float], timeout: float) -> Dict:
+    """Redis 'notifications' 채널에 게시하고 워커 리스너가 전송하도록 합니다."""
+    import redis.asyncio as redis
+    from src.worker.main import notification_listener, REDIS_HOST
+
+    listener_task = asyncio.create_task(notification_listener())
+    r = await redis.from_url(f"redis://{REDIS_HOST}", decode_responses=True)
+    try:
+        # 리스너가 구독을 마칠 때까지 대기
+        while (await r.pubsub_numsub("notifications"))[0][1] == 0:
+            await asyncio.sleep(0.05)
+        for i in range(count):
+            chat_id = CHAT_ID_BASE + i
+            submitted[chat_id] = time.perf_counter()
+            await r.publish("notifications", json.dumps({"chat_id": chat_id, "text": "부하 테스트 메시지"}, ensure_ascii=False))
+        try:
+            await asyncio.wait_for(server.all_acked.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    finally:
+        listener_task.cancel()
+        await asyncio.gather(listener_task, return_exceptions=True)
+        await r.close()
+    return {}
+
+
+async def main(args) -> Dict:
+    server = FakeTelegramServer(
+        latency_ms=(args.latency_min_ms, args.latency_max_ms),
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    server.expected = args.count
+    await server.start()
+
+    # 가짜 서버로 요청이 가도록 환경 변수 설정 (채널은 전송 시점에 환경 변수를 읽음)
+    os.environ["TELEGRAM_BOT_TOKEN"] = FAKE_TOKEN
+    os.environ["TELEGRAM_API_BASE_URL"] = server.base_url
+
+    submitted: Dict[int, float] = {}
+    started = time.perf_counter()
+    try:
+        if args.mode == "broadcast":
+            result = await run_broadcast(server, args.count, args.concurrency, submitted)
+        else:
+            result = await run_listener(server, args.count, submitted, args.timeout)
+    finally:
+        elapsed = time.perf_counter() - started
+        await server.stop()
+
+    latencies_ms = [(acked - submitted[chat_id]) * 1000 for chat_id, acked in server.acked.items() if chat_id in submitted]
+    delivered = len(server.acked)
+    return {
+        "mode": args.mode,
+        "count": args.count,
+        "concurrency": args.concurrency if args.mode == "broadcast" else None,
+        "delivered": delivered,
+        "lost": args.count - delivered,
+        "loss_rate": round((args.count - delivered) / args.count, 4) if args.count else 0.0,
+        "duplicates": server.duplicates,
+        "elapsed_sec": round(elapsed, 3),
+        "messages_per_sec": round(delivered / elapsed, 1) if elapsed else 0.0,
+        "latency_p50_ms": round(_percentile(latencies_ms, 50), 1),
+        "latency_p99_ms": round(_percentile(latencies_ms, 99), 1),
+        "server_requests": server.requests,
+        "server_429": server.throttled,
+        "server_5xx": server.errors,
+        "service_result": result,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="알림 전송 처리량 부하 테스트")
+    parser.add_argument("--mode", choices=["broadcast", "listener"], default="broadcast", help="전송 경로")
+    parser.add_argument("--count", type=int, default=2000, help="전송할 알림 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="broadcast 시 텔레그램 동시 전송 수")
+    parser.add_argument("--latency-min-ms", type=float, default=20, help="가짜 서버 최소 응답 지연 (ms)")
+    parser.add_argument("--latency-max-ms", type=float, default=80, help="가짜 서버 최대 응답 지연 (ms)")
+    parser.add_argument("--throttle-rate", type=float, default=0.01, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 retry_after (초)")
+    parser.add_argument("--error-rate", type=float, default=0.005, help="5xx 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--timeout", type=float, default=300, help="listener 모드에서 전송 완료를 기다릴 최대 시간 (초)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        print("=" * 60)
+        print(f"📊 알림 부하 테스트 결과 ({report['mode']})")
+        print("=" * 60)
+        print(f"   전송 요청:   {report['count']}건 (동시 전송 수: {report['concurrency']})")
+        print(f"   전송 성공:   {report['delivered']}건 / 유실: {report['lost']}건 ({report['loss_rate'] * 100:.2f}%)")
+        print(f"   중복 수신:   {report['duplicates']}건")
+        print(f"   소요 시간:   {report['elapsed_sec']}초")
+        print(f"   처리량:      {report['messages_per_sec']} msg/s")
+        print(f"   지연 시간:   p50 {report['latency_p50_ms']}ms / p99 {report['latency_p99_ms']}ms")
+        print(f"   서버 응답:   요청 {report['server_requests']}건, 429 {report['server_429']}건, 5xx {report['server_5xx']}건")
+        if report['service_result']:
+            print(f"   서비스 결과: {report['service_result']}")
@@ -0,0 +1,105 @@
+"""
+일괄 예측(POST /predict/batch) 성능 측정 스크립트
+
+임의의 일별 시세를 가진 종목 N개를 만들어 다음을 비교합니다.
+- 종목별 분석: analyze_daily_prices()를 종목마다 호출 (pandas)
+- 일괄 분석: analyze_daily_prices_batch() 한 번 호출 (2-D NumPy)
+- 서비스 전체: PredictService._predict_stock_movements() (DB 조회 3회 + 일괄 분석, 캐시 미적중/적중)
+
+DB는 기본으로 SQLite 메모리 DB를 사용하며, --database-url로 실제 PostgreSQL을 지정할 수 있습니다.
+(지정한 DB에 BENCH로 시작하는 종목을 만들고 종료 시 삭제합니다.)
+
+사용 예:
+    python scripts/predict_batch_benchmark.py --symbols 500
+    python scripts/predict_batch_benchmark.py --symbols 500 --database-url postgresql://user:pw@localhost/stockeye
+"""
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.common.models.stock_master import StockMaster
+from src.common.models.daily_price import DailyPrice
+from src.common.utils.cache import clear_all_caches
+from src.common.utils.technical_analysis import ANALYSIS_WINDOW_DAYS, analyze_daily_prices, analyze_daily_prices_batch
+
+SYMBOL_PREFIX = "BENCH"
+
+
+def make_prices(rng: random.Random, days: int) -> list:
+    today = datetime.date.today()
+    close = rng.uniform(1000, 100000)
+    rows = []
+    for i in range(days):
+        close *= 1 + rng.uniform(-0.04, 0.04)
+        rows.append({"date": today - datetime.timedelta(days=days - 1 - i), "open": close, "high": close,
+                     "low": close, "close": close, "volume": rng.randint(1000, 100000)})
+    return rows
+
+
+def timed(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"p50_ms": round(statistics.median(samples), 2), "max_ms": round(max(samples), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 예측 성능 측정")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # 달력 기준 40일 중 영업일만 있는 것처럼 종목마다 길이를 조금씩 다르게 만듦
+    prices = {f"{SYMBOL_PREFIX}{i:04d}": make_prices(rng, rng.randint(24, ANALYSIS_WINDOW_DAYS)) for i in range(args.symbols)}
+
+    print(f"종목 수: {args.symbols}")
+    print("종목별 분석 :", timed(lambda: [analyze_daily_prices(data) for data in prices.values()], 1))
+    print("일괄 분석   :", timed(lambda: analyze_daily_prices_batch(prices), args.repeat))
+
+    from src.api.services.predict_service import PredictService
+
+    engine = create_engine(args.database_url)
+    StockMaster.__table__.create(engine, checkfirst=True)
+    DailyPrice.__table__.create(engine, checkfirst=True)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    try:
+        db.add_all([StockMaster(symbol=symbol, name=symbol, market="KOSPI") for symbol in prices])
+        # SQLite에서는 BigInteger 기본 키가 자동 증가하지 않으므로 id를 직접 지정
+        next_id = (db.query(DailyPrice.id).order_by(DailyPrice.id.desc()).limit(1).scalar() or 0) + 1
+        rows = [(symbol, row) for symbol, symbol_rows in prices.items() for row in symbol_rows]
+        db.add_all([DailyPrice(id=next_id + i, symbol=symbol, **row) for i, (symbol, row) in enumerate(rows)])
+        db.commit()
+
+        service = PredictService()
+        symbols = list(prices)
+
+        def cold():
+            clear_all_caches()
+            service._predict_stock_movements(db, symbols)
+
+        print("서비스(미적중):", timed(cold, args.repeat))
+        print("서비스(적중)  :", timed(lambda: service._predict_stock_movements(db, symbols), args.repeat))
+    finally:
+        db.rollback()
+        db.query(DailyPrice).filter(DailyPrice.symbol.like(f"{SYMBOL_PREFIX}%")).delete(synchronize_session=False)
+        db.query(StockMaster).filter(StockMaster.symbol.like(f"{SYMBOL_PREFIX}%")).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from alembic import context
 from src.common.database.db_connector import Base
 # Explicit imports for all models
 from src.common.models.daily_price import DailyPrice
+from src.common.models.daily_indicator import DailyIndicator
 from src.common.models.disclosure_alert import DisclosureAlert
 from src.common.models.disclosure import Disclosure
 from src.common.models.prediction_history import PredictionHistory
@@ -16,6 +17,7 @@ from src.common.models.stock_master import StockMaster
 from src.common.models.system_config import SystemConfig
 from src.common.models.user import User
 from src.common.models.watchlist import Watchlist
+from src.common.models.notification_outbox import NotificationOutbox
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
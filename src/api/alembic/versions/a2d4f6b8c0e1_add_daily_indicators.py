@@ -0,0 +1,43 @@
+"""Add daily_indicators table
+
+Revision ID: a2d4f6b8c0e1
+Revises: f1c3e5a7b9d2
+Create Date: 2026-10-19 14:02:37.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d4f6b8c0e1'
+down_revision: Union[str, Sequence[str], None] = 'f1c3e5a7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'daily_indicators',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('sma5', sa.Float(), nullable=True),
+        sa.Column('sma20', sa.Float(), nullable=True),
+        sa.Column('rsi14', sa.Float(), nullable=True),
+        sa.Column('macd', sa.Float(), nullable=False),
+        sa.Column('signal', sa.Float(), nullable=False),
+        sa.Column('ema12', sa.Float(), nullable=False),
+        sa.Column('ema26', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('symbol', 'date', name='uq_daily_indicators_symbol_date'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_indicators')
@@ -0,0 +1,28 @@
+"""Add token_version to User
+
+Revision ID: b5e7a9c1d3f4
+Revises: a2d4f6b8c0e1
+Create Date: 2026-10-19 16:21:08.493172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e7a9c1d3f4'
+down_revision: Union[str, Sequence[str], None] = 'a2d4f6b8c0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('app_users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('app_users', 'token_version')
@@ -0,0 +1,35 @@
+"""Add pg_trgm GIN indexes to stock_master
+
+Revision ID: e4a7b9c2d1f3
+Revises: d3f1a8c9e0b2
+Create Date: 2026-10-19 11:02:47.190322
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7b9c2d1f3'
+down_revision: Union[str, Sequence[str], None] = 'd3f1a8c9e0b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 종목 검색(ILIKE '%keyword%', similarity 정렬)에 사용하는 trigram 인덱스
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_stock_master_name_trgm', 'stock_master', ['name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_stock_master_symbol_trgm', 'stock_master', ['symbol'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'symbol': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stock_master_symbol_trgm', table_name='stock_master')
+    op.drop_index('ix_stock_master_name_trgm', table_name='stock_master')
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 제거하지 않음
@@ -0,0 +1,28 @@
+"""Add keyset pagination index to PredictionHistory
+
+Revision ID: f1c3e5a7b9d2
+Revises: e4a7b9c2d1f3
+Create Date: 2026-10-19 11:48:15.604218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c3e5a7b9d2'
+down_revision: Union[str, Sequence[str], None] = 'e4a7b9c2d1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_prediction_history_user_id_created_at_id', 'prediction_history', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_prediction_history_user_id_created_at_id', table_name='prediction_history')
@@ -0,0 +1,148 @@
+"""Partition daily_prices by year
+
+Revision ID: f8b2d4c6e0a1
+Revises: b5e7a9c1d3f4
+Create Date: 2026-10-19 18:21:05.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b2d4c6e0a1'
+down_revision: Union[str, Sequence[str], None] = 'b5e7a9c1d3f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, symbol, date, open, high, low, close, volume, created_at, updated_at"
+
+# 연도별 파티션 생성 함수 (src/common/models/daily_price.py의 ENSURE_PARTITIONS_FUNCTION_SQL과 같은 정의)
+# 기본 파티션(daily_prices_default)에 먼저 들어간 해당 연도 행은 새 파티션으로 옮긴 뒤 붙입니다.
+ENSURE_PARTITIONS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ensure_daily_prices_partitions(from_year integer, to_year integer)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    y integer;
+    part_name text;
+    created integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('daily_prices_partitions'));
+    FOR y IN from_year..to_year LOOP
+        part_name := format('daily_prices_y%s', y);
+        CONTINUE WHEN to_regclass(part_name) IS NOT NULL;
+        EXECUTE format('CREATE TABLE %I (LIKE daily_prices INCLUDING DEFAULTS)', part_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM daily_prices_default WHERE date >= %L AND date < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            make_date(y, 1, 1), make_date(y + 1, 1, 1), part_name);
+        EXECUTE format('ALTER TABLE daily_prices ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            part_name, make_date(y, 1, 1), make_date(y + 1, 1, 1));
+        created := created + 1;
+    END LOOP;
+    RETURN created;
+END;
+$$
+"""
+
+
+def _relkind(bind, name: str):
+    return bind.execute(sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"), {"name": name}).scalar()
+
+
+def _id_sequence(bind, table: str) -> str:
+    return bind.execute(sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if _relkind(bind, 'daily_prices') == 'p':
+        # create_all이 이미 파티션 테이블로 만든 경우 (새 DB)
+        op.execute(ENSURE_PARTITIONS_FUNCTION_SQL)
+        op.execute("SELECT ensure_daily_prices_partitions("
+                   "EXTRACT(YEAR FROM CURRENT_DATE)::int - 1, EXTRACT(YEAR FROM CURRENT_DATE)::int + 1)")
+        return
+
+    # 1. 기존 테이블을 옮겨 두고, 새 테이블과 이름이 겹치는 기본 키와 인덱스를 정리
+    #    (id 시퀀스는 기존 테이블과 함께 지워지지 않도록 소유 관계를 끊고 새 테이블에서 이어서 사용)
+    sequence = _id_sequence(bind, 'daily_prices')
+    op.execute("ALTER TABLE daily_prices RENAME TO daily_prices_old")
+    op.execute("ALTER TABLE daily_prices_old RENAME CONSTRAINT daily_prices_pkey TO daily_prices_old_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_daily_prices_symbol_date")
+    op.execute("DROP INDEX IF EXISTS ix_daily_prices_symbol")
+    op.execute("DROP INDEX IF EXISTS ix_daily_prices_date")
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+
+    # 2. date 기준 RANGE 파티션 테이블 (파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, date))
+    op.execute(f"""
+        CREATE TABLE daily_prices (
+            id BIGINT NOT NULL DEFAULT nextval('{sequence}'::regclass),
+            symbol VARCHAR(20) NOT NULL,
+            date DATE NOT NULL,
+            open FLOAT NOT NULL,
+            high FLOAT NOT NULL,
+            low FLOAT NOT NULL,
+            close FLOAT NOT NULL,
+            volume BIGINT NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT daily_prices_pkey PRIMARY KEY (id, date)
+        ) PARTITION BY RANGE (date)
+    """)
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY daily_prices.id")
+    op.execute("CREATE TABLE daily_prices_default PARTITION OF daily_prices DEFAULT")
+    op.execute(ENSURE_PARTITIONS_FUNCTION_SQL)
+
+    # 3. 기존 데이터가 있는 첫 해부터 내년까지 파티션을 만들고 데이터를 옮김
+    op.execute("""
+        SELECT ensure_daily_prices_partitions(
+            COALESCE((SELECT EXTRACT(YEAR FROM MIN(date))::int FROM daily_prices_old), EXTRACT(YEAR FROM CURRENT_DATE)::int - 1),
+            EXTRACT(YEAR FROM CURRENT_DATE)::int + 1
+        )
+    """)
+    op.execute(f"INSERT INTO daily_prices ({COLUMNS}) SELECT {COLUMNS} FROM daily_prices_old")
+    op.execute("DROP TABLE daily_prices_old")
+
+    # 4. 인덱스는 데이터를 옮긴 뒤 한 번에 만듦 (각 파티션에 같은 인덱스가 만들어짐)
+    #    종목별 조회는 모두 (symbol, date) 인덱스를 사용하므로 symbol, date 단독 인덱스는 다시 만들지 않음
+    op.create_index('ix_daily_prices_symbol_date', 'daily_prices', ['symbol', 'date'], unique=False)
+    op.execute("ANALYZE daily_prices")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    sequence = _id_sequence(bind, 'daily_prices')
+
+    op.execute("ALTER TABLE daily_prices RENAME TO daily_prices_partitioned")
+    op.execute("ALTER TABLE daily_prices_partitioned RENAME CONSTRAINT daily_prices_pkey TO daily_prices_partitioned_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_daily_prices_symbol_date")
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+
+    op.execute(f"""
+        CREATE TABLE daily_prices (
+            id BIGINT NOT NULL DEFAULT nextval('{sequence}'::regclass),
+            symbol VARCHAR(20) NOT NULL,
+            date DATE NOT NULL,
+            open FLOAT NOT NULL,
+            high FLOAT NOT NULL,
+            low FLOAT NOT NULL,
+            close FLOAT NOT NULL,
+            volume BIGINT NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            CONSTRAINT daily_prices_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY daily_prices.id")
+    op.execute(f"INSERT INTO daily_prices ({COLUMNS}) SELECT {COLUMNS} FROM daily_prices_partitioned")
+    op.execute("DROP TABLE daily_prices_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS ensure_daily_prices_partitions(integer, integer)")
+
+    op.create_index('ix_daily_prices_symbol', 'daily_prices', ['symbol'], unique=False)
+    op.create_index('ix_daily_prices_date', 'daily_prices', ['date'], unique=False)
+    op.create_index('ix_daily_prices_symbol_date', 'daily_prices', ['symbol', 'date'], unique=False)
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from src.common.models.user import User
 from src.common.database.db_connector import get_db
 from src.common.services.user_service import UserService
+from src.common.services.principal_cache_service import principal_cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -69,11 +70,25 @@ def get_current_active_user(credentials: HTTPAuthorizationCredentials = Depends(
     token = credentials.credentials
     payload = verify_token(token)
     user_id: int = payload.get("user_id")
+    # 토큰 버전 도입 전에 발급된 토큰은 버전 0으로 취급
+    token_version: int = payload.get("ver", 0)
+
+    # 캐시에는 활성 사용자만 저장되며, 사용자 정보가 바뀌면 무효화됩니다.
+    cached_user = principal_cache_service.get(user_id, token_version)
+    if cached_user is not None:
+        return cached_user
 
     user = user_service.get_user_by_id(db, user_id)
     logger.debug(f"get_current_active_user: user_id={user_id}, user={user}, is_active={user.is_active if user else 'N/A'}")
     if user is None or not user.is_active:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+    if (user.token_version or 0) != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    principal_cache_service.set(user)
     return user
 
 def get_current_active_admin_user(current_user: User = Depends(get_current_active_user)):
@@ -1,11 +1,14 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 # 라우터 임포트 수정 및 추가
 from src.api.routers import user, price_alert_router, disclosure_alert_router, predict, watchlist, simulated_trade, prediction_history, admin, stock_master, bot_router, auth
-from src.common.database.db_connector import Base, engine, SessionLocal
+from src.common.database.db_connector import Base, engine, SessionLocal, dispose_async_engine
 from src.common.models.stock_master import StockMaster
 from src.common.models.daily_price import DailyPrice # 추가
+from src.common.services.symbol_search_index import symbol_search_index
+from src.common.utils.password_utils import PasswordHasherBusyError, password_hasher
 import sys
 import os
 import logging
@@ -120,6 +123,23 @@ def on_startup():
         seed_test_data(db)
         db.close()
 
+    # 종목 검색 인덱스를 미리 구성하여 첫 검색 요청이 인덱스 구성 시간을 기다리지 않도록 함
+    db = SessionLocal()
+    try:
+        symbol_search_index.ensure_fresh(db)
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await dispose_async_engine()
+    password_hasher.shutdown()
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError):
+    """비밀번호 해시 작업이 몰려 대기열이 가득 찬 경우 잠시 후 다시 시도하도록 응답합니다."""
+    return JSONResponse(status_code=503, content={"detail": "Too many authentication requests. Please retry shortly."}, headers={"Retry-After": "1"})
+
 # --- Routers ---
 app.include_router(user.router, prefix="/api/v1")
 app.include_router(price_alert_router, prefix="/api/v1")
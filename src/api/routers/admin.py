@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from pydantic import BaseModel
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from src.common.database.db_connector import get_db, Base, engine
+from src.common.database.db_connector import get_db, Base, engine, get_pool_metrics
 from src.common.models.user import User
 from src.api.auth.jwt_handler import get_current_active_admin_user
 from src.common.models.simulated_trade import SimulatedTrade
@@ -14,6 +14,10 @@ from src.common.models.stock_master import StockMaster
 from src.common.services.stock_master_service import StockMasterService
 from src.common.services.market_data_service import MarketDataService
 from src.common.services.disclosure_service import DisclosureService
+from src.common.services.prediction_cache_service import prediction_cache_service
+from src.common.services.principal_cache_service import principal_cache_service
+from src.common.utils.password_utils import password_hasher
+from src.common.utils.single_flight import get_single_flight_stats
 from datetime import datetime
 import os
 import httpx
@@ -104,6 +108,31 @@ def admin_stats(db: Session = Depends(get_db), user: User = Depends(get_current_
         "prediction_count": prediction_count
     }
 
+@router.get("/cache_stats", tags=["admin"])
+def cache_stats(user: User = Depends(get_current_active_admin_user)):
+    """읽기 캐시의 적중/실패 통계를 반환합니다."""
+    return {
+        "price": MarketDataService().get_price_cache_stats(),
+        "symbol_index": StockMasterService().get_search_index_stats(),
+        "prediction": prediction_cache_service.get_stats(),
+        "principal": principal_cache_service.get_stats(),
+    }
+
+@router.get("/db_pool_stats", tags=["admin"])
+def db_pool_stats(user: User = Depends(get_current_active_admin_user)):
+    """API 프로세스의 DB 커넥션 풀 상태(사용 중 커넥션, 포화도, checkout 대기 시간)를 반환합니다."""
+    return get_pool_metrics()
+
+@router.get("/password_hasher_stats", tags=["admin"])
+def password_hasher_stats(user: User = Depends(get_current_active_admin_user)):
+    """비밀번호 해시 프로세스 풀의 대기열 깊이와 처리 시간을 반환합니다."""
+    return password_hasher.get_stats()
+
+@router.get("/single_flight_stats", tags=["admin"])
+def single_flight_stats(user: User = Depends(get_current_active_admin_user)):
+    """동시에 들어온 같은 요청을 한 번의 실행으로 합친 횟수(coalesced)를 종류별로 반환합니다."""
+    return get_single_flight_stats()
+
 @router.post("/update_master", tags=["admin"])
 async def update_master(
     db: Session = Depends(get_db), 
@@ -45,7 +45,7 @@ def get_token_for_bot(
     
     # JWT 토큰 생성
     access_token = create_access_token(
-        data={"sub": user.username, "user_id": user.id, "role": user.role}
+        data={"sub": user.username, "user_id": user.id, "role": user.role, "ver": user.token_version or 0}
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
@@ -73,7 +73,7 @@ def get_admin_token_for_bot(
         )
     
     access_token = create_access_token(
-        data={"sub": user.username, "user_id": user.id, "role": "admin"}
+        data={"sub": user.username, "user_id": user.id, "role": "admin", "ver": user.token_version or 0}
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
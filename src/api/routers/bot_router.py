@@ -35,7 +35,7 @@ async def toggle_disclosure_alert_for_bot(request: BotAlertRequest = Body(...),
     """(봇 전용) 특정 종목의 공시 알림 상태를 토글합니다."""
     user = user_service.get_user_by_telegram_id(db, request.telegram_user_id)
     if not user:
-        user = user_service.create_user_from_telegram(
+        user = await user_service.acreate_user_from_telegram(
             db,
             telegram_id=request.telegram_user_id,
             username=request.telegram_username or f"telegram_user_{request.telegram_user_id}",
@@ -81,7 +81,7 @@ async def set_price_alert_for_bot(request: BotPriceAlertRequest = Body(...), db:
     """(봇 전용) 특정 종목의 가격 알림을 설정합니다."""
     user = user_service.get_user_by_telegram_id(db, request.telegram_user_id)
     if not user:
-        user = user_service.create_user_from_telegram(
+        user = await user_service.acreate_user_from_telegram(
             db,
             telegram_id=request.telegram_user_id,
             username=request.telegram_username or f"telegram_user_{request.telegram_user_id}",
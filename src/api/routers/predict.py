@@ -2,10 +2,13 @@
 # (FastAPI 라우터의 tags만으로는 일부 환경에서 그룹화가 누락될 수 있음)
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.common.schemas.predict import StockPredictionRequest, StockPredictionResponse
+from src.common.schemas.predict import (
+    StockPredictionRequest, StockPredictionResponse, StockBatchPredictionRequest, StockBatchPredictionResponse
+)
 from src.common.models.prediction_history import PredictionHistory
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_async_db
 from datetime import datetime
 from typing import Callable
 from src.api.services.predict_service import PredictService
@@ -22,14 +25,65 @@ def get_predict_service() -> PredictService:
 def get_user_service() -> UserService:
     return UserService()
 
+async def _save_prediction_history(db: AsyncSession, user_service: UserService, telegram_id: int, symbol: str, prediction: str):
+    """
+    예측 이력을 저장합니다. (실패해도 예측 응답에는 영향을 주지 않음)
+
+    DB 작업만 run_sync()로 실행하고, 신규 사용자의 비밀번호 해시(bcrypt)는 이벤트 루프 밖에서 기다립니다.
+    """
+    try:
+        logger.debug(f"Attempting to save prediction history: telegram_id={telegram_id}, symbol={symbol}, prediction={prediction}")
+        user = await db.run_sync(user_service.get_user_by_telegram_id, telegram_id)
+        if not user:
+            logger.debug(f"User not found, creating new user: telegram_id={telegram_id}")
+            user = await user_service.acreate_user_from_telegram(
+                db,
+                telegram_id=telegram_id,
+                username=f"tg_{telegram_id}",
+                first_name="Telegram",
+                last_name="User",
+                password=str(uuid4())
+            )
+        logger.debug(f"User ID confirmed: user_id={user.id}")
+        await db.run_sync(_add_prediction_history, user.id, symbol, prediction)
+        logger.info(f"Prediction history saved successfully: user_id={user.id}, symbol={symbol}")
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Failed to save prediction history: {str(e)}", exc_info=True)
+
+def _add_prediction_history(db: Session, user_id: int, symbol: str, prediction: str):
+    prediction_history = PredictionHistory(
+        user_id=user_id,
+        symbol=symbol,
+        prediction=prediction,
+        created_at=datetime.utcnow()
+    )
+    db.add(prediction_history)
+    db.commit()
+
+@router.post("/predict/batch", response_model=StockBatchPredictionResponse, tags=["predict"])
+async def predict_stocks_batch(request: StockBatchPredictionRequest, db: AsyncSession = Depends(get_async_db), predict_service: PredictService = Depends(get_predict_service)):
+    """
+    여러 종목의 예측을 한 번에 반환합니다.
+
+    데이터가 부족한 종목은 오류 대신 "예측 불가" 결과로, 종목 마스터에 없는 종목은 not_found로 반환합니다.
+    일괄 조회에서는 예측 이력을 저장하지 않습니다.
+    """
+    try:
+        result = await predict_service.predict_stock_movements(db, request.symbols)
+        return StockBatchPredictionResponse(**result)
+    except Exception as e:
+        logger.error(f"Error during batch stock prediction ({len(request.symbols)} symbols): {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="An error occurred during prediction.")
+
 @router.post("/predict", response_model=StockPredictionResponse, tags=["predict"])
-async def predict_stock(request: StockPredictionRequest, db: Session = Depends(get_db), predict_service: PredictService = Depends(get_predict_service), user_service: UserService = Depends(get_user_service)): # Add user_service dependency
+async def predict_stock(request: StockPredictionRequest, db: AsyncSession = Depends(get_async_db), predict_service: PredictService = Depends(get_predict_service), user_service: UserService = Depends(get_user_service)): # Add user_service dependency
     try:
         logger.debug(f"Received request: symbol='{request.symbol}', telegram_id={request.telegram_id}")
         symbol = request.symbol
 
         # 예측 수행
-        result = await predict_service.predict_stock_movement(db, symbol)
+        result = await predict_service.predict_stock_movement_async(db, symbol)
         logger.debug(f"Prediction result: {result}")
 
         # Check for insufficient data and raise HTTPException
@@ -38,33 +92,7 @@ async def predict_stock(request: StockPredictionRequest, db: Session = Depends(g
 
         # 예측 이력 저장 (telegram_id가 있는 경우)
         if request.telegram_id and result["prediction"] not in ["N/A", "예측 불가"]:
-            try:
-                logger.debug(f"Attempting to save prediction history: telegram_id={request.telegram_id}, symbol={symbol}, prediction={result['prediction']}")
-                user = user_service.get_user_by_telegram_id(db, request.telegram_id)
-                if not user:
-                    logger.debug(f"User not found, creating new user: telegram_id={request.telegram_id}")
-                    user = user_service.create_user_from_telegram(
-                        db,
-                        telegram_id=request.telegram_id,
-                        username=f"tg_{request.telegram_id}",
-                        first_name="Telegram",
-                        last_name="User",
-                        password=str(uuid4())
-                    )
-                logger.debug(f"User ID confirmed: user_id={user.id}")
-
-                prediction_history = PredictionHistory(
-                    user_id=user.id,
-                    symbol=symbol,
-                    prediction=result["prediction"],
-                    created_at=datetime.utcnow()
-                )
-                db.add(prediction_history)
-                db.commit()
-                logger.info(f"Prediction history saved successfully: user_id={user.id}, symbol={symbol}")
-            except Exception as e:
-                db.rollback()
-                logger.error(f"Failed to save prediction history: {str(e)}", exc_info=True)
+            await _save_prediction_history(db, user_service, request.telegram_id, symbol, result["prediction"])
 
         return StockPredictionResponse(
             symbol=symbol,
@@ -1,6 +1,6 @@
 # 각 엔드포인트에 tags를 명시적으로 지정해야 Swagger UI에서 그룹화가 100% 보장됩니다.
 # (FastAPI 라우터의 tags만으로는 일부 환경에서 그룹화가 누락될 수 있음)
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.orm import Session
 from src.common.database.db_connector import get_db
 from src.common.models.prediction_history import PredictionHistory
@@ -10,6 +10,7 @@ from datetime import datetime
 import logging
 from src.common.services.user_service import UserService
 from src.common.models.user import User
+from src.common.utils.pagination import paginate_keyset, cached_count, last_page_size, LAST_PAGE_CURSOR
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,13 @@ class PredictionHistoryResponse(BaseModel):
     page: int
     page_size: int
 
+class PredictionHistoryCursorResponse(BaseModel):
+    history: List[PredictionHistoryRecord]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    last_cursor: str
+    total_count: Optional[int] = None
+
 @router.get("/history/{telegram_id}", response_model=PredictionHistoryResponse, tags=["prediction_history"])
 def get_prediction_history(
     telegram_id: int, # Changed parameter name
@@ -84,3 +92,58 @@ def get_prediction_history(
         page=page,
         page_size=page_size
     )
+
+
+@router.get("/history/{telegram_id}/cursor", response_model=PredictionHistoryCursorResponse, tags=["prediction_history"])
+def get_prediction_history_by_cursor(
+    telegram_id: int,
+    db: Session = Depends(get_db),
+    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor/prev_cursor/last_cursor (없으면 최신 페이지)"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부 (잠시 캐시됨)"),
+    symbol: Optional[str] = Query(None, description="종목코드 필터"),
+    prediction: Optional[str] = Query(None, description="예측 결과 필터")
+):
+    """사용자의 예측 이력 커서 기반 조회 (최신순). 페이지 깊이와 관계없이 일정한 시간이 걸립니다."""
+    logger.debug(f"get_prediction_history_by_cursor 호출: telegram_id={telegram_id}, page_size={page_size}, cursor={cursor}, symbol={symbol}, prediction={prediction}")
+
+    user = db.query(User).filter(User.telegram_id == telegram_id).first()
+    if not user:
+        logger.debug(f"Telegram ID {telegram_id}에 해당하는 사용자를 찾을 수 없습니다.")
+        return PredictionHistoryCursorResponse(history=[], last_cursor=LAST_PAGE_CURSOR, total_count=0 if include_total else None)
+
+    query = db.query(PredictionHistory).filter(PredictionHistory.user_id == user.id)
+    if symbol:
+        query = query.filter(PredictionHistory.symbol.like(f"%{symbol}%"))
+    if prediction:
+        query = query.filter(PredictionHistory.prediction == prediction)
+
+    total_count = None
+    if include_total:
+        total_count = cached_count(("prediction_history", user.id, symbol, prediction), query)
+
+    try:
+        page = paginate_keyset(
+            query,
+            [PredictionHistory.created_at, PredictionHistory.id],
+            lambda r: [r.created_at, r.id],
+            last_page_size(total_count, page_size) if cursor == LAST_PAGE_CURSOR and total_count else page_size,
+            cursor,
+            descending=True
+        )
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+
+    return PredictionHistoryCursorResponse(
+        history=[PredictionHistoryRecord(
+            id=r.id,
+            telegram_id=telegram_id,
+            symbol=r.symbol,
+            prediction=r.prediction,
+            created_at=r.created_at
+        ) for r in page["items"]],
+        next_cursor=page["next_cursor"],
+        prev_cursor=page["prev_cursor"],
+        last_cursor=LAST_PAGE_CURSOR,
+        total_count=total_count
+    )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 import logging
@@ -52,12 +53,13 @@ async def create_price_alert(
             summary="사용자의 모든 가격 알림 조회",
             description="현재 사용자가 설정한 모든 가격 알림 목록을 조회합니다.",
             response_description="가격 알림 목록.")
-def get_price_alerts(
-    db: Session = Depends(db_connector.get_db),
+async def get_price_alerts(
+    db: AsyncSession = Depends(db_connector.get_async_db),
     current_user: User = Depends(get_current_active_user),
     price_alert_service: PriceAlertService = Depends(get_price_alert_service)
 ):
-    alerts = price_alert_service.get_alerts(db, current_user.id)
+    # 종목 정보는 joinedload로 함께 읽으므로 응답 직렬화 시 추가 조회가 없음
+    alerts = await db.run_sync(price_alert_service.get_alerts, current_user.id)
     return alerts
 
 
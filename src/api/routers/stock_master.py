@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Header, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.common.models.stock_master import StockMaster
-from src.common.database.db_connector import get_db
-from typing import List
+from src.common.schemas.stock_master import MAX_BATCH_SYMBOLS
+from src.common.database.db_connector import get_db, get_async_db
+from typing import List, Optional
 from src.common.services.stock_master_service import StockMasterService
 from src.common.services.market_data_service import MarketDataService
+from src.common.utils.pagination import paginate_keyset, cached_count, last_page_size, LAST_PAGE_CURSOR
 import logging
 
 router = APIRouter(prefix="/symbols", tags=["symbols"])
@@ -16,8 +21,7 @@ def get_stock_master_service():
 def get_market_data_service():
     return MarketDataService()
 
-@router.get("/", response_model=dict)
-def get_all_symbols(limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0), db: Session = Depends(get_db)):
+def _get_symbols_page(db: Session, limit: int, offset: int) -> dict:
     total_count = db.query(StockMaster).count()
     rows = db.query(StockMaster).offset(offset).limit(limit).all()
     return {
@@ -25,26 +29,89 @@ def get_all_symbols(limit: int = Query(10, ge=1, le=100), offset: int = Query(0,
         "total_count": total_count
     }
 
+@router.get("/", response_model=dict)
+async def get_all_symbols(limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0), db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(_get_symbols_page, limit, offset)
+
+@router.get("/cursor", response_model=dict)
+def get_symbols_by_cursor(
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor/prev_cursor/last_cursor (없으면 첫 페이지)"),
+    include_total: bool = Query(False, description="전체 종목 수 포함 여부 (잠시 캐시됨)"),
+    db: Session = Depends(get_db)
+):
+    """종목 코드 순 커서 기반 목록 조회. 페이지 깊이와 관계없이 일정한 시간이 걸립니다."""
+    total_count = cached_count(("symbols",), db.query(StockMaster)) if include_total else None
+    page_limit = last_page_size(total_count, limit) if cursor == LAST_PAGE_CURSOR and total_count else limit
+    try:
+        page = paginate_keyset(db.query(StockMaster), [StockMaster.symbol], lambda r: [r.symbol], page_limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+    return {
+        "items": [{"symbol": r.symbol, "name": r.name, "market": r.market} for r in page["items"]],
+        "next_cursor": page["next_cursor"],
+        "prev_cursor": page["prev_cursor"],
+        "last_cursor": LAST_PAGE_CURSOR,
+        "total_count": total_count
+    }
+
 @router.get("/search", response_model=dict)
 def search_symbols(query: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0), db: Session = Depends(get_db), stock_master_service: StockMasterService = Depends(get_stock_master_service)):
-    # 기존의 직접 쿼리 대신 StockMasterService의 search_stocks 메서드 사용
-    stocks = stock_master_service.search_stocks(query, db, limit=limit, offset=offset)
-    total_count = db.query(StockMaster).filter(StockMaster.name.ilike(f"%{query}%") | StockMaster.symbol.ilike(f"%{query}%")).count()
+    # 프로세스 내 검색 인덱스로 정렬된 결과와 전체 건수를 함께 조회 (인덱스가 없으면 DB 검색)
+    return stock_master_service.search_stocks_with_total(query, db, limit=limit, offset=offset)
+
+def _get_symbol_names(db: Session, if_none_match: Optional[str]):
+    # 종목 수와 마지막 수정 시각으로 버전을 정하여, 바뀌지 않았으면 목록을 읽지 않음
+    count, last_updated = db.query(func.count(StockMaster.symbol), func.max(StockMaster.updated_at)).one()
+    etag = f'"{count}-{last_updated.timestamp() if last_updated else 0}"'
+    if if_none_match == etag:
+        return etag, None
+    rows = db.query(StockMaster.symbol, StockMaster.name, StockMaster.market).order_by(StockMaster.symbol).all()
+    return etag, [[r.symbol, r.name, r.market] for r in rows]
+
+@router.get("/names")
+async def get_symbol_names(if_none_match: Optional[str] = Header(None), db: AsyncSession = Depends(get_async_db)):
+    """
+    전체 종목의 코드/이름/시장 목록을 반환합니다. (봇의 종목명 인식용)
+
+    ETag를 함께 돌려주며, If-None-Match가 현재 버전과 같으면 304로 응답합니다.
+    """
+    etag, items = await db.run_sync(_get_symbol_names, if_none_match)
+    if items is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return JSONResponse({"items": items}, headers={"ETag": etag})
+
+def _get_symbols_batch(db: Session, codes: List[str], stock_master_service: StockMasterService) -> dict:
+    stocks = {s.symbol: s for s in stock_master_service.get_stocks_by_symbols(codes, db)}
     return {
-        "items": [{"symbol": r.symbol, "name": r.name, "market": r.market} for r in stocks],
-        "total_count": total_count
+        "items": [{"symbol": stocks[c].symbol, "name": stocks[c].name, "market": stocks[c].market} for c in codes if c in stocks],
+        "missing": [code for code in codes if code not in stocks]
     }
 
+@router.get("/batch", response_model=dict)
+async def get_symbols_batch(
+    codes: str = Query(..., min_length=1, description="쉼표로 구분한 종목 코드 목록 (예: 005930,000660)"),
+    db: AsyncSession = Depends(get_async_db),
+    stock_master_service: StockMasterService = Depends(get_stock_master_service)
+):
+    """여러 종목의 이름/시장을 한 번에 조회합니다. 찾지 못한 코드는 missing으로 돌려줍니다."""
+    code_list = list(dict.fromkeys(code.strip() for code in codes.split(",") if code.strip()))
+    if not code_list:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="종목 코드를 입력해주세요.")
+    if len(code_list) > MAX_BATCH_SYMBOLS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"한 번에 최대 {MAX_BATCH_SYMBOLS}개 종목까지 조회할 수 있습니다.")
+    return await db.run_sync(_get_symbols_batch, code_list, stock_master_service)
+
 @router.get("/{symbol_code}", response_model=dict) # New endpoint
-def get_symbol_by_code(symbol_code: str, db: Session = Depends(get_db), stock_master_service: StockMasterService = Depends(get_stock_master_service)):
-    stock = stock_master_service.get_stock_by_symbol(symbol_code, db)
+async def get_symbol_by_code(symbol_code: str, db: AsyncSession = Depends(get_async_db), stock_master_service: StockMasterService = Depends(get_stock_master_service)):
+    stock = await db.run_sync(lambda session: stock_master_service.get_stock_by_symbol(symbol_code, session))
     if stock is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="종목을 찾을 수 없습니다.")
     return {"symbol": stock.symbol, "name": stock.name, "market": stock.market}
 
 @router.get("/{symbol}/current_price_and_change", response_model=dict)
-def get_current_price_and_change_api(symbol: str, db: Session = Depends(get_db), market_data_service: MarketDataService = Depends(get_market_data_service)):
-    price_data = market_data_service.get_current_price_and_change(symbol, db)
+async def get_current_price_and_change_api(symbol: str, db: AsyncSession = Depends(get_async_db), market_data_service: MarketDataService = Depends(get_market_data_service)):
+    price_data = await market_data_service.get_current_price_and_change_async(symbol, db)
     if price_data is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stock price data not found")
     return price_data
\ No newline at end of file
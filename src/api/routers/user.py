@@ -2,10 +2,12 @@
 # (FastAPI 라우터의 tags만으로는 일부 환경에서 그룹화가 누락될 수 있음)
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session
-from src.common.database.db_connector import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.database.db_connector import get_db, get_async_db
 from src.common.schemas.user import UserCreate, UserRead, UserLogin, Token, UserUpdate, TelegramRegister
 from src.api.services.auth_service import AuthService
 from src.common.services.user_service import UserService # UserService 임포트
+from src.common.services.principal_cache_service import principal_cache_service
 from src.api.auth.jwt_handler import get_current_active_user
 from src.common.models.user import User
 from src.common.models.simulated_trade import SimulatedTrade
@@ -23,9 +25,9 @@ def get_user_service():
     return UserService()
 
 @router.post("/register", response_model=UserRead, tags=["users"])
-def register_user(user: UserCreate, db: Session = Depends(get_db), auth_service: AuthService = Depends(get_auth_service)):
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db), auth_service: AuthService = Depends(get_auth_service)):
     """사용자 등록"""
-    return auth_service.create_user(
+    return await auth_service.create_user_async(
         db=db,
         username=user.username,
         email=user.email,
@@ -34,9 +36,9 @@ def register_user(user: UserCreate, db: Session = Depends(get_db), auth_service:
     )
 
 @router.post("/login", response_model=Token, tags=["users"])
-def login_user(user_credentials: UserLogin, db: Session = Depends(get_db), auth_service: AuthService = Depends(get_auth_service)):
+async def login_user(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db), auth_service: AuthService = Depends(get_auth_service)):
     """사용자 로그인"""
-    return auth_service.login_user(
+    return await auth_service.login_user_async(
         db=db,
         username=user_credentials.username,
         password=user_credentials.password
@@ -78,22 +80,31 @@ def update_current_user(
     
     db.commit()
     db.refresh(user)
+    principal_cache_service.invalidate(user.id, user.token_version)
     return user
 
+def _set_user_active(db: Session, user: User, is_active: bool):
+    user.is_active = is_active
+    db.commit()
+    db.refresh(user)
+
 @router.put("/telegram_register", tags=["users"])
-def telegram_register(
+async def telegram_register(
     register_data: TelegramRegister,
-    db: Session = Depends(get_db),
-    auth_service: AuthService = Depends(get_auth_service),
+    db: AsyncSession = Depends(get_async_db),
     user_service: UserService = Depends(get_user_service) # UserService 의존성 추가
 ):
-    """텔레그램 알림 동의/해제 (telegram_id로만 처리, 인증 없음)"""
+    """
+    텔레그램 알림 동의/해제 (telegram_id로만 처리, 인증 없음)
+
+    신규 사용자의 비밀번호 해시(bcrypt)는 이벤트 루프와 스레드 풀을 점유하지 않고 기다립니다.
+    """
     # telegram_id를 int로 변환하여 사용
     telegram_id_int = int(register_data.telegram_id)
-    user = user_service.get_user_by_telegram_id(db, telegram_id_int) # UserService 사용
+    user = await db.run_sync(user_service.get_user_by_telegram_id, telegram_id_int) # UserService 사용
     if not user:
         # 신규 등록: 임시 사용자 생성 (실제 서비스에서는 인증 필요)
-        user = user_service.create_user_from_telegram(
+        user = await user_service.acreate_user_from_telegram(
             db,
             telegram_id=telegram_id_int,
             username=f"tg_{register_data.telegram_id}",
@@ -101,14 +112,11 @@ def telegram_register(
             last_name="User",
             password=TELEGRAM_USER_PASSWORD # Pass the hardcoded password
         )
-        user.is_active = register_data.is_active # is_active 설정
-        db.commit()
-        db.refresh(user)
+        await db.run_sync(_set_user_active, user, register_data.is_active) # is_active 설정
         return {"result": "registered", "is_active": register_data.is_active}
     else:
-        user.is_active = register_data.is_active
-        db.commit()
-        db.refresh(user)
+        await db.run_sync(_set_user_active, user, register_data.is_active)
+        principal_cache_service.invalidate(user.id, user.token_version)
         return {"result": "updated", "is_active": register_data.is_active}
 
 @router.get("/telegram/{telegram_id}", response_model=UserRead, tags=["users"])
@@ -1,7 +1,8 @@
 import logging
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.models.user import User
-from src.common.utils.password_utils import verify_password, get_password_hash # 변경된 임포트
+from src.common.utils.password_utils import verify_password, get_password_hash, averify_password, aget_password_hash # 변경된 임포트
 from src.api.auth.jwt_handler import create_access_token
 from fastapi import HTTPException, status
 from datetime import timedelta
@@ -26,6 +27,21 @@ class AuthService:
 
     def create_user(self, db: Session, username: str, email: str, password: str, role: str = "user"):
         """새로운 사용자를 생성합니다."""
+        self._ensure_not_registered(db, username, email)
+        hashed_password = get_password_hash(password)
+        return self._add_user(db, username, email, hashed_password, role)
+
+    async def create_user_async(self, db: AsyncSession, username: str, email: str, password: str, role: str = "user"):
+        """
+        새로운 사용자를 생성합니다. (비동기)
+
+        비밀번호 해시(bcrypt)를 프로세스 풀에서 기다리는 동안 이벤트 루프와 스레드 풀을 점유하지 않습니다.
+        """
+        await db.run_sync(self._ensure_not_registered, username, email)
+        hashed_password = await aget_password_hash(password)
+        return await db.run_sync(self._add_user, username, email, hashed_password, role)
+
+    def _ensure_not_registered(self, db: Session, username: str, email: str):
         # 1. 중복 확인
         existing_user = db.query(User).filter(
             (User.username == username) | (User.email == email)
@@ -36,8 +52,8 @@ class AuthService:
                 detail="Username or email already registered"
             )
 
+    def _add_user(self, db: Session, username: str, email: str, hashed_password: str, role: str):
         # 2. 새 사용자 생성
-        hashed_password = get_password_hash(password)
         logger.debug(f"[AuthService] Hashed password for {username}: {hashed_password}")
         db_user = User(
             username=username,
@@ -73,11 +89,28 @@ class AuthService:
                 detail="Incorrect username or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
+        return self._login_response(user)
+
+    async def login_user_async(self, db: AsyncSession, username: str, password: str):
+        """
+        사용자 로그인 (비동기)
+
+        비밀번호 검증(bcrypt)을 프로세스 풀에서 기다리는 동안 이벤트 루프와 스레드 풀을 점유하지 않습니다.
+        """
+        user = await db.run_sync(self.get_user_by_username, username)
+        if not user or not await averify_password(password, user.hashed_password):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect username or password",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return self._login_response(user)
+
+    def _login_response(self, user: User) -> dict:
         # 액세스 토큰 생성
         access_token_expires = timedelta(minutes=30)
         access_token = create_access_token(
-            data={"sub": user.username, "role": user.role, "user_id": user.id},
+            data={"sub": user.username, "role": user.role, "user_id": user.id, "ver": user.token_version or 0},
             expires_delta=access_token_expires
         )
         
@@ -1,15 +1,25 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-import pandas as pd
 from src.common.models.stock_master import StockMaster
 from src.common.models.daily_price import DailyPrice
+from src.common.services.prediction_cache_service import prediction_cache_service
+from src.common.utils.single_flight import SingleFlight
+from src.common.utils.technical_analysis import (
+    ANALYSIS_WINDOW_DAYS, analyze_daily_prices, build_prediction_result, build_prediction_results
+)
 import logging
 import asyncio
 
+import anyio
+
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
+# 같은 종목의 예측 요청이 동시에 몰리면 (공시, 시장 이벤트 등) 한 번만 계산하고 결과를 함께 사용
+predict_flight = SingleFlight("predict")
+
 class PredictService:
     def __init__(self):
         pass
@@ -41,86 +51,7 @@ class PredictService:
         """
         주어진 일별 시세 데이터를 기반으로 기술적 분석 지표를 계산하고 예측을 수행합니다.
         """
-        if not data or len(data) < 20: # 최소 20일치 데이터 필요 (SMA 20 계산 위함)
-            logger.warning(f"데이터 부족: {len(data)}일치 데이터로는 분석을 수행할 수 없습니다. 최소 20일치 데이터가 필요합니다.")
-            return None
-
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.set_index('date')
-        df = df.sort_index() # 날짜 오름차순 정렬
-
-        # 이동평균선 (Moving Average)
-        df['SMA5'] = df['close'].rolling(window=5).mean()
-        df['SMA20'] = df['close'].rolling(window=20).mean()
-
-        # RSI (Relative Strength Index)
-        delta = df['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        rs = avg_gain / avg_loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-
-        exp1 = df['close'].ewm(span=12, adjust=False).mean()
-        exp2 = df['close'].ewm(span=26, adjust=False).mean()
-        df['macd'] = exp1 - exp2
-        df['signal_line'] = df['macd'].ewm(span=9, adjust=False).mean()
-        df['macd_histogram'] = df['macd'] - df['signal_line']
-
-        latest_close = df['close'].iloc[-1]
-        latest_sma_5 = df['SMA5'].iloc[-1]
-        latest_sma_20 = df['SMA20'].iloc[-1]
-        latest_rsi = df['rsi'].iloc[-1]
-        latest_macd = df['macd'].iloc[-1]
-        latest_signal_line = df['signal_line'].iloc[-1]
-
-        reason_parts = []
-        buy_score = 0
-        sell_score = 0
-
-        if pd.notna(latest_sma_5) and pd.notna(latest_sma_20):
-            if latest_sma_5 > latest_sma_20:
-                reason_parts.append("단기 이동평균선이 장기 이동평균선 위에 있습니다 (골든 크로스).")
-                buy_score += 15
-            elif latest_sma_5 < latest_sma_20:
-                reason_parts.append("단기 이동평균선이 장기 이동평균선 아래에 있습니다 (데드 크로스).")
-                sell_score += 15
-
-        if pd.notna(latest_rsi):
-            if latest_rsi > 70:
-                reason_parts.append(f"RSI({int(latest_rsi)})가 과매수 구간입니다.")
-                sell_score += 25
-            elif latest_rsi < 30:
-                reason_parts.append(f"RSI({int(latest_rsi)})가 과매도 구간입니다.")
-                buy_score += 25
-
-        if pd.notna(latest_macd) and pd.notna(latest_signal_line):
-            if latest_macd > latest_signal_line:
-                reason_parts.append("MACD가 시그널 라인을 상향 돌파했습니다.")
-                buy_score += 20
-            elif latest_macd < latest_signal_line:
-                reason_parts.append("MACD가 시그널 라인을 하향 돌파했습니다.")
-                sell_score += 20
-
-        if buy_score > sell_score:
-            prediction = "buy"
-            confidence = min(100, 50 + (buy_score - sell_score))
-        elif sell_score > buy_score:
-            prediction = "sell"
-            confidence = min(100, 50 + (sell_score - buy_score))
-        else:
-            prediction = "hold"
-            confidence = 50
-
-        reason = " ".join(reason_parts) if reason_parts else "현재 데이터로는 명확한 예측 신호를 찾기 어렵습니다."
-        
-        return {
-            "prediction": prediction,
-            "confidence": confidence,
-            "reason": reason
-        }
+        return analyze_daily_prices(data)
 
     async def predict_stock_movement(self, db: Session, symbol: str, user_id: int = None):
         logger.debug(f"predict_stock_movement 호출: symbol={symbol}")
@@ -128,25 +59,96 @@ class PredictService:
         if not stock:
             logger.warning(f"종목을 찾을 수 없습니다: {symbol}")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"종목을 찾을 수 없습니다: {symbol}")
+        return self._predict_known_stock(db, symbol)
 
-        recent_data = self.get_recent_prices(db, symbol, days=40)
-        if len(recent_data) < 20:
-            logger.warning(f"예측 불가: 데이터 부족({len(recent_data)}일)")
-            return {
-                "prediction": "예측 불가",
-                "reason": f"분석에 필요한 데이터({len(recent_data)}일)가 부족합니다 (최소 20일 필요).",
-                "confidence": 0
-            }
+    async def predict_stock_movement_async(self, db: AsyncSession, symbol: str) -> dict:
+        """
+        비동기 DB 세션으로 predict_stock_movement()와 같은 예측을 수행합니다.
 
-        analysis_result = self.calculate_analysis_items(recent_data)
-        
-        if analysis_result is None:
-            logger.error("예측 불가: 데이터 분석 실패")
-            return {
-                "prediction": "예측 불가",
-                "reason": "데이터 분석 중 오류가 발생했습니다.",
-                "confidence": 0
-            }
-
-        logger.debug(f"predict_stock_movement 결과: {analysis_result['prediction']}")
-        return analysis_result
+        DB 조회는 run_sync()로 동기 쿼리 코드를 재사용하고, 예측 캐시(Redis) 조회/저장과 지표 계산은
+        스레드에서 실행하므로 이벤트 루프를 막지 않습니다. (run_sync 안의 코드는 이벤트 루프 스레드에서 실행됨)
+        같은 종목의 예측이 이미 진행 중이면 새로 계산하지 않고 그 결과를 함께 받습니다.
+        """
+        logger.debug(f"predict_stock_movement_async 호출: symbol={symbol}")
+        return await predict_flight.do(symbol, lambda: self._predict_stock_movement_async(db, symbol))
+
+    async def _predict_stock_movement_async(self, db: AsyncSession, symbol: str) -> dict:
+        latest_date = await db.run_sync(self._get_latest_price_date_of_known_stock, symbol)
+        if latest_date is not None:
+            cached = await prediction_cache_service.aget(symbol, latest_date)
+            if cached is not None:
+                logger.debug(f"predict_stock_movement 캐시 적중: symbol={symbol}, latest_date={latest_date}")
+                return cached
+
+        recent_data = await db.run_sync(self.get_recent_prices, symbol, ANALYSIS_WINDOW_DAYS)
+        result = await anyio.to_thread.run_sync(build_prediction_result, recent_data, self.calculate_analysis_items)
+
+        if latest_date is not None:
+            await prediction_cache_service.aset(symbol, latest_date, result)
+
+        logger.debug(f"predict_stock_movement 결과: {result['prediction']}")
+        return result
+
+    def _get_latest_price_date_of_known_stock(self, db: Session, symbol: str):
+        """종목이 있으면 최신 일봉 날짜를, 없으면 404를 발생시킵니다."""
+        stock = db.query(StockMaster).filter(StockMaster.symbol == symbol).first()
+        if not stock:
+            logger.warning(f"종목을 찾을 수 없습니다: {symbol}")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"종목을 찾을 수 없습니다: {symbol}")
+        return prediction_cache_service.get_latest_price_date(db, symbol)
+
+    def _predict_known_stock(self, db: Session, symbol: str) -> dict:
+        # 예측은 새 일봉이 들어올 때만 바뀌므로 (종목, 최신 일봉 날짜, 분석 로직 버전) 단위로 캐시
+        latest_date = prediction_cache_service.get_latest_price_date(db, symbol)
+        if latest_date is not None:
+            cached = prediction_cache_service.get(symbol, latest_date)
+            if cached is not None:
+                logger.debug(f"predict_stock_movement 캐시 적중: symbol={symbol}, latest_date={latest_date}")
+                return cached
+
+        recent_data = self.get_recent_prices(db, symbol, days=ANALYSIS_WINDOW_DAYS)
+        result = build_prediction_result(recent_data, self.calculate_analysis_items)
+
+        if latest_date is not None:
+            prediction_cache_service.set(symbol, latest_date, result)
+
+        logger.debug(f"predict_stock_movement 결과: {result['prediction']}")
+        return result
+
+    async def predict_stock_movements(self, db: AsyncSession, symbols: list[str]) -> dict:
+        """
+        여러 종목의 예측을 한 번에 수행합니다.
+
+        종목 확인, 최신 일봉 날짜, 캐시되지 않은 종목의 최근 시세를 각각 한 번의 쿼리로 조회하고,
+        지표는 build_prediction_results()로 모든 종목을 함께 계산합니다.
+        종목별 결과는 predict_stock_movement()와 같습니다.
+        캐시(Redis) 조회/저장과 지표 계산은 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+
+        Returns:
+            dict: {"results": [{"symbol", "prediction", "confidence", "reason"}], "not_found": [종목 코드]}
+        """
+        symbols = list(dict.fromkeys(symbols))
+        known, latest_dates = await db.run_sync(self._load_batch_targets, symbols)
+        targets = [symbol for symbol in symbols if symbol in known]
+
+        results = await prediction_cache_service.aget_many(latest_dates)
+
+        misses = [symbol for symbol in targets if symbol not in results]
+        if misses:
+            recent_prices = await db.run_sync(prediction_cache_service.load_recent_prices, misses, ANALYSIS_WINDOW_DAYS)
+            computed = await anyio.to_thread.run_sync(
+                build_prediction_results, {symbol: recent_prices.get(symbol, []) for symbol in misses}
+            )
+            await prediction_cache_service.aset_many(computed, latest_dates)
+            results.update(computed)
+
+        logger.debug(f"predict_stock_movements: 요청 {len(symbols)}개, 캐시 적중 {len(targets) - len(misses)}개, 계산 {len(misses)}개")
+        return {
+            "results": [{"symbol": symbol, **results[symbol]} for symbol in targets],
+            "not_found": [symbol for symbol in symbols if symbol not in known],
+        }
+
+    def _load_batch_targets(self, db: Session, symbols: list[str]):
+        """종목 마스터에 있는 종목과 그 최신 일봉 날짜를 조회합니다."""
+        known = {row.symbol for row in db.query(StockMaster.symbol).filter(StockMaster.symbol.in_(symbols)).all()}
+        return known, prediction_cache_service.get_latest_price_dates(db, [symbol for symbol in symbols if symbol in known])
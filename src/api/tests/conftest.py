@@ -2,13 +2,16 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 import os
 import psycopg2
 import importlib
 import pkgutil
 
 from src.api.main import app
-from src.common.database.db_connector import Base, get_db
+from src.common.database.db_connector import Base, get_db, get_async_db
+from src.common.utils.cache import clear_all_caches
 
 # --- DB 설정 ---
 DB_USER = os.getenv("DB_USER", "postgres")
@@ -26,6 +29,12 @@ def import_all_models():
 
 import_all_models()
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 프로세스 내 캐시가 공유되지 않도록 매 테스트 전에 비웁니다."""
+    clear_all_caches()
+    yield
+
 @pytest.fixture(scope="session")
 def db_engine():
     """세션 스코프 fixture: 테스트 DB를 생성/삭제하고 SQLAlchemy 엔진을 제공합니다."""
@@ -129,7 +138,22 @@ def test_stock_master_data(real_db: Session):
     return stocks
 
 @pytest.fixture(scope="function")
-def client(real_db):
+def override_get_async_db(db_engine):
+    """get_async_db 대체 의존성: async 라우트도 같은 테스트 DB를 사용하도록 합니다."""
+    # TestClient는 요청마다 이벤트 루프가 다를 수 있으므로 커넥션 풀을 사용하지 않음
+    async_engine = create_async_engine(
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{TEST_DB_NAME}", poolclass=NullPool
+    )
+    AsyncTestSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def _override_get_async_db():
+        async with AsyncTestSession() as session:
+            yield session
+
+    return _override_get_async_db
+
+@pytest.fixture(scope="function")
+def client(real_db, override_get_async_db):
     """TestClient fixture: get_db 의존성을 오버라이드합니다."""
     def override_get_db():
         try:
@@ -138,6 +162,7 @@ def client(real_db):
             real_db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
\ No newline at end of file
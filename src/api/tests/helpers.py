@@ -33,4 +33,17 @@ def get_auth_headers(user: User) -> dict[str, str]:
         data={"sub": user.username, "role": user.role, "user_id": user.id},
         expires_delta=access_token_expires
     )
-    return {"Authorization": f"Bearer {token}"}
\ No newline at end of file
+    return {"Authorization": f"Bearer {token}"}
+
+def make_async_session_mock(sync_session):
+    """
+    get_async_db 의존성 대체용 AsyncSession 모의 객체를 만듭니다.
+
+    run_sync(fn, *args)는 fn(sync_session, *args)를 호출하므로, 동기 세션 모의 객체에 대한 기존 검증을 그대로 사용할 수 있습니다.
+    """
+    from unittest.mock import AsyncMock, MagicMock
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async_session = MagicMock(spec=AsyncSession)
+    async_session.run_sync = AsyncMock(side_effect=lambda fn, *args, **kwargs: fn(sync_session, *args, **kwargs))
+    return async_session
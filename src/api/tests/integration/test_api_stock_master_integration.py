@@ -16,7 +16,7 @@ DB에 저장된 종목 마스터 정보를 조회하고 검색하는 기능을 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.common.models.stock_master import StockMaster
 from src.api.main import app
@@ -166,15 +166,15 @@ class TestStockMasterRouter:
         - **테스트 대상**: `GET /symbols/{symbol}/current_price_and_change`
         - **목적**: 특정 종목의 현재가 및 등락 정보를 성공적으로 조회하는지 확인합니다.
         - **시나리오**:
-            1. `StockService`의 `get_current_price_and_change` 메서드를 모의(Mock) 처리합니다.
+            1. `StockService`의 `get_current_price_and_change_async` 메서드를 모의(Mock) 처리합니다.
             2. API를 호출합니다.
             3. 200 OK 응답과 함께, 모의 처리된 가격 정보가 반환되는지 확인합니다.
-        - **Mock 대상**: `StockService.get_current_price_and_change` (의존성 주입 오버라이드)
+        - **Mock 대상**: `StockService.get_current_price_and_change_async` (의존성 주입 오버라이드)
         """
         # Given
         symbol = "005930"
         mock_price_data = {"current_price": 75000, "change": 1000, "change_rate": 1.35}
-        override_stock_service_dependencies.get_current_price_and_change.return_value = mock_price_data
+        override_stock_service_dependencies.get_current_price_and_change_async = AsyncMock(return_value=mock_price_data)
 
         # When
         response = client.get(f"/api/v1/symbols/{symbol}/current_price_and_change")
@@ -182,21 +182,22 @@ class TestStockMasterRouter:
         # Then
         assert response.status_code == 200
         assert response.json() == mock_price_data
-        override_stock_service_dependencies.get_current_price_and_change.assert_called_once_with(symbol, real_db)
+        override_stock_service_dependencies.get_current_price_and_change_async.assert_awaited_once()
+        assert override_stock_service_dependencies.get_current_price_and_change_async.await_args.args[0] == symbol
 
     def test_get_current_price_and_change_not_found(self, client: TestClient, override_stock_service_dependencies, real_db: Session):
         """
         - **테스트 대상**: `GET /symbols/{symbol}/current_price_and_change`
         - **목적**: 가격 정보가 없는 종목에 대해 404 에러를 정상적으로 반환하는지 확인합니다.
         - **시나리오**:
-            1. `StockService`의 `get_current_price_and_change`가 `None`을 반환하도록 모의 처리합니다.
+            1. `StockService`의 `get_current_price_and_change_async`가 `None`을 반환하도록 모의 처리합니다.
             2. API를 호출합니다.
             3. 404 Not Found 응답을 확인합니다.
-        - **Mock 대상**: `StockService.get_current_price_and_change` (의존성 주입 오버라이드)
+        - **Mock 대상**: `StockService.get_current_price_and_change_async` (의존성 주입 오버라이드)
         """
         # Given
         symbol = "NONEXISTENT"
-        override_stock_service_dependencies.get_current_price_and_change.return_value = None
+        override_stock_service_dependencies.get_current_price_and_change_async = AsyncMock(return_value=None)
 
         # When
         response = client.get(f"/api/v1/symbols/{symbol}/current_price_and_change")
@@ -2,7 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from src.api.main import app
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_db, get_async_db
 from src.common.models.user import User
 from src.common.models.price_alert import PriceAlert
 from src.common.models.stock_master import StockMaster
@@ -18,8 +18,9 @@ def db_session(real_db):
     yield real_db
 
 @pytest.fixture(scope="function", autouse=True)
-def override_get_db_dependency(db_session: Session):
+def override_get_db_dependency(db_session: Session, override_get_async_db):
     app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_async_db] = override_get_async_db
     yield
     app.dependency_overrides = {}
 
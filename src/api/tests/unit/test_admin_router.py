@@ -441,3 +441,21 @@ class TestAdminRouter:
             client.get("/admin/debug/auth_test")
         assert "Auth error" in str(exc_info.value)
         app.dependency_overrides = {}
+
+
+def test_db_pool_stats(mock_get_current_active_admin_user):
+    """DB 커넥션 풀 지표 엔드포인트가 get_pool_metrics 결과를 그대로 반환하는지 테스트합니다."""
+    metrics = {
+        "settings": {"pool_size": 5, "max_overflow": 10},
+        "sync": {"pool_class": "MeteredQueuePool", "checked_out": 2, "saturation": 0.133, "wait_p99_ms": 1.5},
+        "async": None,
+    }
+    app.dependency_overrides[get_current_active_admin_user] = lambda: mock_get_current_active_admin_user
+    try:
+        with patch('src.api.routers.admin.get_pool_metrics', return_value=metrics):
+            response = client.get("/admin/db_pool_stats")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == metrics
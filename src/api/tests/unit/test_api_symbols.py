@@ -6,9 +6,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.query import Query # Import Query for type hinting
 
 from src.api.routers.stock_master import router as stock_master_router, get_stock_master_service
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_db, get_async_db
+from src.api.tests.helpers import make_async_session_mock
 from src.common.models.stock_master import StockMaster
 from src.common.services.stock_master_service import StockMasterService
+from src.common.utils.pagination import encode_cursor
 
 # --- Test Setup ---
 
@@ -25,6 +27,7 @@ def mock_stock_master_service():
 @pytest.fixture
 def client(mock_db_session, mock_stock_master_service):
     app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
     app.dependency_overrides[get_stock_master_service] = lambda: mock_stock_master_service
     app.include_router(stock_master_router)
     with TestClient(app, raise_server_exceptions=False) as c:
@@ -92,16 +95,10 @@ async def test_get_all_symbols_pagination(client, mock_db_session):
 @pytest.mark.asyncio
 async def test_search_symbols_success(client, mock_db_session, mock_stock_master_service):
     # GIVEN
-    stock1 = MagicMock(spec=StockMaster)
-    stock1.symbol = "005930"
-    stock1.name = "삼성전자"
-    stock1.market = "KOSPI"
-    mock_stock_master_service.search_stocks.return_value = [stock1]
-    
-    mock_query_filter = MagicMock(spec=Query)
-    mock_db_session.query.return_value = mock_query_filter
-    mock_query_filter.filter.return_value = mock_query_filter # Allow chaining .filter()
-    mock_query_filter.filter.return_value.count.return_value = 1 # For total_count
+    mock_stock_master_service.search_stocks_with_total.return_value = {
+        "items": [{"symbol": "005930", "name": "삼성전자", "market": "KOSPI"}],
+        "total_count": 1
+    }
 
     # WHEN
     response = client.get("/symbols/search?query=삼성")
@@ -112,20 +109,13 @@ async def test_search_symbols_success(client, mock_db_session, mock_stock_master
     assert data["total_count"] == 1
     assert len(data["items"]) == 1
     assert data["items"][0]["symbol"] == "005930"
-    mock_stock_master_service.search_stocks.assert_called_once_with("삼성", mock_db_session, limit=10, offset=0) # Changed to keyword args
-    mock_db_session.query.assert_called_once_with(StockMaster)
-    mock_query_filter.filter.assert_called_once() # Check filter was called
-    mock_query_filter.filter.return_value.count.assert_called_once() # Check count was called
+    mock_stock_master_service.search_stocks_with_total.assert_called_once_with("삼성", mock_db_session, limit=10, offset=0)
+    mock_db_session.query.assert_not_called() # 건수도 서비스에서 함께 조회
 
 @pytest.mark.asyncio
 async def test_search_symbols_no_results(client, mock_db_session, mock_stock_master_service):
     # GIVEN
-    mock_stock_master_service.search_stocks.return_value = []
-    
-    mock_query_filter = MagicMock(spec=Query)
-    mock_db_session.query.return_value = mock_query_filter
-    mock_query_filter.filter.return_value = mock_query_filter # Allow chaining .filter()
-    mock_query_filter.filter.return_value.count.return_value = 0 # For total_count
+    mock_stock_master_service.search_stocks_with_total.return_value = {"items": [], "total_count": 0}
 
     # WHEN
     response = client.get("/symbols/search?query=없는종목")
@@ -135,10 +125,7 @@ async def test_search_symbols_no_results(client, mock_db_session, mock_stock_mas
     data = response.json()
     assert data["total_count"] == 0
     assert len(data["items"]) == 0
-    mock_stock_master_service.search_stocks.assert_called_once_with("없는종목", mock_db_session, limit=10, offset=0) # Changed to keyword args
-    mock_db_session.query.assert_called_once_with(StockMaster)
-    mock_query_filter.filter.assert_called_once() # Check filter was called
-    mock_query_filter.filter.return_value.count.assert_called_once() # Check count was called
+    mock_stock_master_service.search_stocks_with_total.assert_called_once_with("없는종목", mock_db_session, limit=10, offset=0)
 
 @pytest.mark.asyncio
 async def test_get_symbol_by_code_success(client, mock_stock_master_service):
@@ -194,13 +181,7 @@ async def test_get_all_symbols_service_exception(client, mock_db_session):
 @pytest.mark.asyncio
 async def test_search_symbols_service_exception(client, mock_db_session, mock_stock_master_service):
     # GIVEN
-    mock_stock_master_service.search_stocks.side_effect = Exception("Service error")
-    
-    # Mock the count part as well, as it's called before search_stocks in the router
-    mock_query_filter = MagicMock(spec=Query)
-    mock_db_session.query.return_value = mock_query_filter
-    mock_query_filter.filter.return_value = mock_query_filter
-    mock_query_filter.filter.return_value.count.return_value = 0 # Doesn't matter for this test
+    mock_stock_master_service.search_stocks_with_total.side_effect = Exception("Service error")
 
     # WHEN
     response = client.get("/symbols/search?query=삼성")
@@ -209,7 +190,7 @@ async def test_search_symbols_service_exception(client, mock_db_session, mock_st
     # THEN
     assert response.status_code == 500
     assert response.text == "Internal Server Error"
-    mock_stock_master_service.search_stocks.assert_called_once_with("삼성", mock_db_session, limit=10, offset=0) # Changed to keyword args
+    mock_stock_master_service.search_stocks_with_total.assert_called_once_with("삼성", mock_db_session, limit=10, offset=0)
 
 @pytest.mark.asyncio
 async def test_get_symbol_by_code_service_exception(client, mock_stock_master_service):
@@ -223,4 +204,83 @@ async def test_get_symbol_by_code_service_exception(client, mock_stock_master_se
     # THEN
     assert response.status_code == 500
     assert response.text == "Internal Server Error"
-    mock_stock_master_service.get_stock_by_symbol.assert_called_once()
\ No newline at end of file
+    mock_stock_master_service.get_stock_by_symbol.assert_called_once()
+@pytest.mark.asyncio
+async def test_get_symbols_by_cursor_invalid_cursor(client, mock_db_session):
+    # WHEN
+    response = client.get("/symbols/cursor?cursor=not-a-cursor!")
+
+    # THEN
+    assert response.status_code == 400
+    assert response.json()["detail"] == "잘못된 커서입니다."
+
+@pytest.mark.asyncio
+async def test_get_symbols_by_cursor_wrong_typed_cursor(client, mock_db_session):
+    # GIVEN: 종목 코드(문자열) 컬럼에 정수 키를 담은 커서
+    cursor = encode_cursor({"a": [1]})
+
+    # WHEN
+    response = client.get(f"/symbols/cursor?cursor={cursor}")
+
+    # THEN
+    assert response.status_code == 400
+    assert response.json()["detail"] == "잘못된 커서입니다."
+    mock_db_session.query.return_value.filter.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_symbols_batch_success(client, mock_stock_master_service):
+    # GIVEN
+    stocks = []
+    for symbol, name in (("000660", "SK하이닉스"), ("005930", "삼성전자")):
+        stock = MagicMock(spec=StockMaster)
+        stock.symbol = symbol
+        stock.name = name
+        stock.market = "KOSPI"
+        stocks.append(stock)
+    mock_stock_master_service.get_stocks_by_symbols.return_value = stocks
+
+    # WHEN
+    response = client.get("/symbols/batch?codes=005930, 000660,999999,005930")
+
+    # THEN
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["symbol"] for item in data["items"]] == ["005930", "000660"]
+    assert data["items"][0]["name"] == "삼성전자"
+    assert data["missing"] == ["999999"]
+    args = mock_stock_master_service.get_stocks_by_symbols.call_args.args
+    assert args[0] == ["005930", "000660", "999999"]
+
+@pytest.mark.asyncio
+async def test_get_symbols_batch_invalid_codes(client, mock_stock_master_service):
+    # WHEN
+    empty_response = client.get("/symbols/batch?codes=,")
+    too_many_response = client.get("/symbols/batch?codes=" + ",".join(f"{i:06d}" for i in range(201)))
+
+    # THEN
+    assert empty_response.status_code == 400
+    assert too_many_response.status_code == 400
+    mock_stock_master_service.get_stocks_by_symbols.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_symbol_names_etag(client, mock_db_session):
+    # GIVEN
+    from datetime import datetime
+    mock_query = MagicMock()
+    mock_db_session.query.return_value = mock_query
+    mock_query.one.return_value = (2, datetime(2024, 1, 1))
+    row = MagicMock(symbol="005930", market="KOSPI")
+    row.name = "삼성전자"
+    mock_query.order_by.return_value.all.return_value = [row]
+
+    # WHEN
+    response = client.get("/symbols/names")
+    etag = response.headers["ETag"]
+    not_modified = client.get("/symbols/names", headers={"If-None-Match": etag})
+
+    # THEN
+    assert response.status_code == 200
+    assert response.json() == {"items": [["005930", "삼성전자", "KOSPI"]]}
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    mock_query.order_by.return_value.all.assert_called_once()
@@ -3,7 +3,8 @@ from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, AsyncMock, patch
 from sqlalchemy.orm import Session
 from src.api.main import app
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_db, get_async_db
+from src.api.tests.helpers import make_async_session_mock
 from src.common.schemas.user import UserCreate, UserLogin, UserRead, UserUpdate, TelegramRegister, Token
 from src.common.models.user import User
 from src.api.routers.user import router, get_auth_service, get_user_service
@@ -69,9 +70,10 @@ def mock_admin_user():
 async def test_register_user_success(client, mock_db_session, mock_auth_service, mock_user):
     # GIVEN
     user_create = UserCreate(username="newuser", email="new@example.com", password="password123")
-    mock_auth_service.create_user.return_value = mock_user
+    mock_auth_service.create_user_async = AsyncMock(return_value=mock_user)
+    async_db = make_async_session_mock(mock_db_session)
 
-    app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: async_db
     app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
 
     # WHEN
@@ -80,8 +82,8 @@ async def test_register_user_success(client, mock_db_session, mock_auth_service,
     # THEN
     assert response.status_code == 200
     assert response.json()["username"] == mock_user.username
-    mock_auth_service.create_user.assert_called_once_with(
-        db=mock_db_session,
+    mock_auth_service.create_user_async.assert_awaited_once_with(
+        db=async_db,
         username=user_create.username,
         email=user_create.email,
         password=user_create.password,
@@ -94,13 +96,14 @@ async def test_register_user_success(client, mock_db_session, mock_auth_service,
 async def test_login_user_success(client, mock_db_session, mock_auth_service, mock_user):
     # GIVEN
     user_login = UserLogin(username="testuser", password="password123")
-    mock_auth_service.login_user.return_value = {
+    mock_auth_service.login_user_async = AsyncMock(return_value={
         "access_token": "fake_token",
         "token_type": "bearer",
         "user": UserRead.model_validate(mock_user)
-    }
+    })
+    async_db = make_async_session_mock(mock_db_session)
 
-    app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: async_db
     app.dependency_overrides[get_auth_service] = lambda: mock_auth_service
 
     # WHEN
@@ -109,8 +112,8 @@ async def test_login_user_success(client, mock_db_session, mock_auth_service, mo
     # THEN
     assert response.status_code == 200
     assert response.json()["access_token"] == "fake_token"
-    mock_auth_service.login_user.assert_called_once_with(
-        db=mock_db_session,
+    mock_auth_service.login_user_async.assert_awaited_once_with(
+        db=async_db,
         username=user_login.username,
         password=user_login.password
     )
@@ -144,9 +147,9 @@ async def test_telegram_register_new_user_success(client, mock_db_session, mock_
     register_data = TelegramRegister(telegram_id=str(telegram_id), is_active=True)
 
     mock_user_service.get_user_by_telegram_id.return_value = None # User not found
-    mock_user_service.create_user_from_telegram.return_value = MagicMock(spec=User, id=1, telegram_id=telegram_id, is_active=True)
+    mock_user_service.acreate_user_from_telegram = AsyncMock(return_value=MagicMock(spec=User, id=1, telegram_id=telegram_id, is_active=True))
 
-    app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
     app.dependency_overrides[get_user_service] = lambda: mock_user_service
 
     # WHEN
@@ -156,7 +159,7 @@ async def test_telegram_register_new_user_success(client, mock_db_session, mock_
     assert response.status_code == 200
     assert response.json() == {"result": "registered", "is_active": True}
     mock_user_service.get_user_by_telegram_id.assert_called_once_with(mock_db_session, telegram_id)
-    mock_user_service.create_user_from_telegram.assert_called_once()
+    mock_user_service.acreate_user_from_telegram.assert_awaited_once()
     mock_db_session.commit.assert_called_once()
 
 @pytest.mark.asyncio
@@ -168,7 +171,7 @@ async def test_telegram_register_existing_user_update_success(client, mock_db_se
     existing_user = MagicMock(spec=User, id=1, telegram_id=telegram_id, is_active=True)
     mock_user_service.get_user_by_telegram_id.return_value = existing_user # User found
 
-    app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
     app.dependency_overrides[get_user_service] = lambda: mock_user_service
 
     # WHEN
@@ -180,4 +183,4 @@ async def test_telegram_register_existing_user_update_success(client, mock_db_se
     mock_user_service.get_user_by_telegram_id.assert_called_once_with(mock_db_session, telegram_id)
     assert existing_user.is_active == False # Verify attribute updated
     mock_db_session.commit.assert_called_once()
-    mock_user_service.create_user_from_telegram.assert_not_called()
+    mock_user_service.acreate_user_from_telegram.assert_not_called()
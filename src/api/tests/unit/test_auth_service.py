@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError # Import IntegrityError
 
@@ -10,6 +10,7 @@ from src.api.services.auth_service import AuthService
 from src.common.models.user import User
 from src.common.schemas.user import UserCreate, UserLogin, UserRead
 from fastapi import HTTPException
+from src.api.tests.helpers import make_async_session_mock
 
 class TestAuthService:
     @pytest.fixture
@@ -117,6 +118,31 @@ class TestAuthService:
                 auth_service.login_user(mock_db_session, "testuser", "wrongpassword")
             assert exc_info.value.status_code == 401
 
+    @pytest.mark.asyncio
+    @patch('src.api.services.auth_service.averify_password', new_callable=AsyncMock, return_value=True)
+    @patch('src.api.services.auth_service.create_access_token', return_value="test_token")
+    async def test_login_user_async_success(self, mock_create_token, mock_averify, auth_service, mock_db_session, mock_user_model):
+        # Given
+        async_db = make_async_session_mock(mock_db_session)
+        with patch.object(auth_service, 'get_user_by_username', return_value=mock_user_model) as mock_get_user:
+            # When
+            result = await auth_service.login_user_async(async_db, "testuser", "password123")
+
+            # Then
+            mock_get_user.assert_called_once_with(mock_db_session, "testuser")
+            mock_averify.assert_awaited_once_with("password123", mock_user_model.hashed_password)
+            assert result["access_token"] == "test_token"
+            assert isinstance(result["user"], UserRead)
+
+    @pytest.mark.asyncio
+    @patch('src.api.services.auth_service.averify_password', new_callable=AsyncMock, return_value=False)
+    async def test_login_user_async_wrong_password(self, mock_averify, auth_service, mock_db_session, mock_user_model):
+        async_db = make_async_session_mock(mock_db_session)
+        with patch.object(auth_service, 'get_user_by_username', return_value=mock_user_model):
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_service.login_user_async(async_db, "testuser", "wrongpassword")
+        assert exc_info.value.status_code == 401
+
     def test_update_user_telegram_id_success(self, auth_service, mock_db_session, mock_user_model):
         # Given
         user_id = 1
@@ -108,3 +108,45 @@ def test_get_current_active_admin_user_not_admin():
     with pytest.raises(HTTPException) as exc_info:
         jwt_handler.get_current_active_admin_user(current_user=non_admin_user)
     assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+# 5. Cached Principal Tests
+
+def test_get_current_active_user_uses_cached_principal(mock_db_session, mock_user_service):
+    mock_user_service.get_user_by_id.return_value = User(id=1, username="cached", is_active=True, role="admin", token_version=0)
+    token = jwt_handler.create_access_token({"sub": "cached", "user_id": 1, "ver": 0})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    first = jwt_handler.get_current_active_user(credentials=credentials, db=mock_db_session, user_service=mock_user_service)
+    second = jwt_handler.get_current_active_user(credentials=credentials, db=mock_db_session, user_service=mock_user_service)
+
+    # 두 번째 요청은 DB를 조회하지 않음
+    mock_user_service.get_user_by_id.assert_called_once_with(mock_db_session, 1)
+    assert (second.id, second.username, second.role, second.is_active) == (first.id, first.username, first.role, first.is_active)
+    assert jwt_handler.get_current_active_admin_user(current_user=second) is second
+
+def test_get_current_active_user_rejects_old_token_version(mock_db_session, mock_user_service):
+    mock_user_service.get_user_by_id.return_value = User(id=1, username="promoted", is_active=True, role="admin", token_version=1)
+    token = jwt_handler.create_access_token({"sub": "promoted", "user_id": 1, "role": "user"})  # 버전 없는 이전 토큰
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        jwt_handler.get_current_active_user(credentials=credentials, db=mock_db_session, user_service=mock_user_service)
+
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+def test_get_current_active_user_after_invalidation(mock_db_session, mock_user_service):
+    from src.common.services.principal_cache_service import principal_cache_service
+
+    mock_user_service.get_user_by_id.return_value = User(id=1, username="user", is_active=True, token_version=0)
+    token = jwt_handler.create_access_token({"sub": "user", "user_id": 1, "ver": 0})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    jwt_handler.get_current_active_user(credentials=credentials, db=mock_db_session, user_service=mock_user_service)
+
+    # 비활성화 후 무효화되면 다음 요청은 DB에서 다시 확인
+    principal_cache_service.invalidate(1, 0)
+    mock_user_service.get_user_by_id.return_value = User(id=1, username="user", is_active=False, token_version=0)
+    with pytest.raises(HTTPException) as exc_info:
+        jwt_handler.get_current_active_user(credentials=credentials, db=mock_db_session, user_service=mock_user_service)
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert mock_user_service.get_user_by_id.call_count == 2
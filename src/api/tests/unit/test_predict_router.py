@@ -5,7 +5,8 @@ from fastapi import FastAPI, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from src.api.routers.predict import router as predict_router, get_predict_service, get_user_service
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_async_db
+from src.api.tests.helpers import make_async_session_mock
 from src.common.schemas.predict import StockPredictionRequest, StockPredictionResponse
 from src.common.models.prediction_history import PredictionHistory
 from src.common.models.user import User
@@ -20,6 +21,10 @@ app = FastAPI()
 def mock_db_session():
     return MagicMock(spec=Session)
 
+@pytest.fixture
+def mock_async_db(mock_db_session):
+    return make_async_session_mock(mock_db_session)
+
 @pytest.fixture
 def mock_predict_service():
     return MagicMock(spec=PredictService)
@@ -29,8 +34,8 @@ def mock_user_service():
     return MagicMock(spec=UserService)
 
 @pytest.fixture
-def client(mock_db_session, mock_predict_service, mock_user_service):
-    app.dependency_overrides[get_db] = lambda: mock_db_session
+def client(mock_async_db, mock_predict_service, mock_user_service):
+    app.dependency_overrides[get_async_db] = lambda: mock_async_db
     app.dependency_overrides[get_predict_service] = lambda: mock_predict_service
     app.dependency_overrides[get_user_service] = lambda: mock_user_service
     app.include_router(predict_router)
@@ -41,14 +46,14 @@ def client(mock_db_session, mock_predict_service, mock_user_service):
 # --- Test Cases ---
 
 @pytest.mark.asyncio
-async def test_predict_stock_success_with_history(client, mock_db_session, mock_predict_service, mock_user_service):
+async def test_predict_stock_success_with_history(client, mock_db_session, mock_async_db, mock_predict_service, mock_user_service):
     # GIVEN
     symbol = "005930"
     telegram_id = 12345
     request_data = {"symbol": symbol, "telegram_id": telegram_id}
     
     mock_prediction_result = {"prediction": "상승", "confidence": 0.8, "reason": "Good news"}
-    mock_predict_service.predict_stock_movement.return_value = mock_prediction_result
+    mock_predict_service.predict_stock_movement_async.return_value = mock_prediction_result
 
     mock_user = User(id=1, telegram_id=telegram_id, username="testuser")
     mock_user_service.get_user_by_telegram_id.return_value = mock_user
@@ -62,19 +67,19 @@ async def test_predict_stock_success_with_history(client, mock_db_session, mock_
     assert data["symbol"] == symbol
     assert data["prediction"] == "상승"
     assert data["confidence"] == 0.8 # Assert confidence as float
-    mock_predict_service.predict_stock_movement.assert_called_once_with(mock_db_session, symbol)
+    mock_predict_service.predict_stock_movement_async.assert_called_once_with(mock_async_db, symbol)
     mock_user_service.get_user_by_telegram_id.assert_called_once_with(mock_db_session, telegram_id)
     mock_db_session.add.assert_called_once()
     mock_db_session.commit.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_predict_stock_success_no_history_no_telegram_id(client, mock_db_session, mock_predict_service, mock_user_service):
+async def test_predict_stock_success_no_history_no_telegram_id(client, mock_db_session, mock_async_db, mock_predict_service, mock_user_service):
     # GIVEN
     symbol = "005930"
     request_data = {"symbol": symbol}
     
     mock_prediction_result = {"prediction": "상승", "confidence": 0.8, "reason": "Good news"}
-    mock_predict_service.predict_stock_movement.return_value = mock_prediction_result
+    mock_predict_service.predict_stock_movement_async.return_value = mock_prediction_result
 
     # WHEN
     response = client.post("/predict", json=request_data)
@@ -85,20 +90,20 @@ async def test_predict_stock_success_no_history_no_telegram_id(client, mock_db_s
     assert data["symbol"] == symbol
     assert data["prediction"] == "상승"
     assert data["confidence"] == 0.8 # Assert confidence as float
-    mock_predict_service.predict_stock_movement.assert_called_once_with(mock_db_session, symbol)
+    mock_predict_service.predict_stock_movement_async.assert_called_once_with(mock_async_db, symbol)
     mock_user_service.get_user_by_telegram_id.assert_not_called()
     mock_db_session.add.assert_not_called()
     mock_db_session.commit.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_predict_stock_success_no_history_prediction_na(client, mock_db_session, mock_predict_service, mock_user_service):
+async def test_predict_stock_success_no_history_prediction_na(client, mock_db_session, mock_async_db, mock_predict_service, mock_user_service):
     # GIVEN
     symbol = "005930"
     telegram_id = 12345
     request_data = {"symbol": symbol, "telegram_id": telegram_id}
     
     mock_prediction_result = {"prediction": "N/A", "confidence": 0.0, "reason": "No data"}
-    mock_predict_service.predict_stock_movement.return_value = mock_prediction_result
+    mock_predict_service.predict_stock_movement_async.return_value = mock_prediction_result
 
     # WHEN
     response = client.post("/predict", json=request_data)
@@ -109,18 +114,18 @@ async def test_predict_stock_success_no_history_prediction_na(client, mock_db_se
     assert data["symbol"] == symbol
     assert data["prediction"] == "N/A"
     assert data["confidence"] == 0.0 # Assert confidence as float
-    mock_predict_service.predict_stock_movement.assert_called_once_with(mock_db_session, symbol)
+    mock_predict_service.predict_stock_movement_async.assert_called_once_with(mock_async_db, symbol)
     mock_user_service.get_user_by_telegram_id.assert_not_called()
     mock_db_session.add.assert_not_called()
     mock_db_session.commit.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_predict_stock_predict_service_exception(client, mock_db_session, mock_predict_service):
+async def test_predict_stock_predict_service_exception(client, mock_db_session, mock_async_db, mock_predict_service):
     # GIVEN
     symbol = "005930"
     request_data = {"symbol": symbol}
     
-    mock_predict_service.predict_stock_movement.side_effect = Exception("Prediction error")
+    mock_predict_service.predict_stock_movement_async.side_effect = Exception("Prediction error")
 
     # WHEN
     response = client.post("/predict", json=request_data)
@@ -128,17 +133,17 @@ async def test_predict_stock_predict_service_exception(client, mock_db_session,
     # THEN
     assert response.status_code == 500
     assert response.json()["detail"] == "An error occurred during prediction."
-    mock_predict_service.predict_stock_movement.assert_called_once_with(mock_db_session, symbol)
+    mock_predict_service.predict_stock_movement_async.assert_called_once_with(mock_async_db, symbol)
 
 @pytest.mark.asyncio
-async def test_predict_stock_user_service_exception(client, mock_db_session, mock_predict_service, mock_user_service):
+async def test_predict_stock_user_service_exception(client, mock_db_session, mock_async_db, mock_predict_service, mock_user_service):
     # GIVEN
     symbol = "005930"
     telegram_id = 12345
     request_data = {"symbol": symbol, "telegram_id": telegram_id}
     
     mock_prediction_result = {"prediction": "상승", "confidence": 0.8, "reason": "Good news"}
-    mock_predict_service.predict_stock_movement.return_value = mock_prediction_result
+    mock_predict_service.predict_stock_movement_async.return_value = mock_prediction_result
 
     mock_user_service.get_user_by_telegram_id.side_effect = Exception("User service error")
 
@@ -151,24 +156,24 @@ async def test_predict_stock_user_service_exception(client, mock_db_session, moc
     assert data["symbol"] == symbol
     assert data["prediction"] == "상승"
     assert data["confidence"] == 0.8 # Assert confidence as float
-    mock_predict_service.predict_stock_movement.assert_called_once_with(mock_db_session, symbol)
+    mock_predict_service.predict_stock_movement_async.assert_called_once_with(mock_async_db, symbol)
     mock_user_service.get_user_by_telegram_id.assert_called_once_with(mock_db_session, telegram_id)
     mock_db_session.add.assert_not_called() # History should not be added
     mock_db_session.commit.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_predict_stock_new_user(client, mock_db_session, mock_predict_service, mock_user_service):
+async def test_predict_stock_new_user(client, mock_db_session, mock_async_db, mock_predict_service, mock_user_service):
     # GIVEN
     symbol = "005930"
     telegram_id = 12345
     request_data = {"symbol": symbol, "telegram_id": telegram_id}
     
     mock_prediction_result = {"prediction": "상승", "confidence": 0.8, "reason": "Good news"}
-    mock_predict_service.predict_stock_movement.return_value = mock_prediction_result
+    mock_predict_service.predict_stock_movement_async.return_value = mock_prediction_result
 
     mock_user_service.get_user_by_telegram_id.return_value = None
     mock_new_user = User(id=2, telegram_id=telegram_id, username=f"tg_{telegram_id}")
-    mock_user_service.create_user_from_telegram.return_value = mock_new_user
+    mock_user_service.acreate_user_from_telegram = AsyncMock(return_value=mock_new_user)
 
     # WHEN
     response = client.post("/predict", json=request_data)
@@ -176,7 +181,7 @@ async def test_predict_stock_new_user(client, mock_db_session, mock_predict_serv
     # THEN
     assert response.status_code == 200
     mock_user_service.get_user_by_telegram_id.assert_called_once_with(mock_db_session, telegram_id)
-    mock_user_service.create_user_from_telegram.assert_called_once()
+    mock_user_service.acreate_user_from_telegram.assert_awaited_once()
     mock_db_session.add.assert_called_once()
     mock_db_session.commit.assert_called_once()
     
@@ -188,3 +193,28 @@ async def test_predict_stock_new_user(client, mock_db_session, mock_predict_serv
     assert prediction_history_instance.user_id == mock_new_user.id
     assert prediction_history_instance.symbol == symbol
     assert prediction_history_instance.prediction == "상승"
+
+@pytest.mark.asyncio
+async def test_predict_stocks_batch(client, mock_db_session, mock_async_db, mock_predict_service):
+    # GIVEN
+    mock_predict_service.predict_stock_movements = AsyncMock(return_value={
+        "results": [{"symbol": "005930", "prediction": "buy", "confidence": 65, "reason": "Good news"}],
+        "not_found": ["999999"]
+    })
+
+    # WHEN
+    response = client.post("/predict/batch", json={"symbols": ["005930", "999999"]})
+
+    # THEN
+    assert response.status_code == 200
+    data = response.json()
+    assert data["results"][0]["symbol"] == "005930"
+    assert data["results"][0]["prediction"] == "buy"
+    assert data["not_found"] == ["999999"]
+    mock_predict_service.predict_stock_movements.assert_called_once_with(mock_async_db, ["005930", "999999"])
+    mock_db_session.add.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_predict_stocks_batch_rejects_too_many_symbols(client, mock_predict_service):
+    response = client.post("/predict/batch", json={"symbols": [f"{i:06d}" for i in range(501)]})
+    assert response.status_code == 422
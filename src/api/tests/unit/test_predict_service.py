@@ -7,6 +7,7 @@ from src.common.models.stock_master import StockMaster
 from src.common.models.daily_price import DailyPrice
 from src.common.models.prediction_history import PredictionHistory
 from fastapi import HTTPException, status # <-- 이 라인 추가
+from src.api.tests.helpers import make_async_session_mock
 
 @pytest.fixture
 def predict_service():
@@ -97,6 +98,55 @@ class TestPredictService:
         assert "confidence" in result
         assert result["confidence"] > 50 # 신뢰도 증가 확인
 
+    @patch('asyncio.to_thread')
+    @patch.object(PredictService, 'get_recent_prices')
+    @patch('src.api.services.predict_service.prediction_cache_service.get_latest_price_date')
+    @pytest.mark.asyncio
+    async def test_predict_stock_movement_uses_cache_for_same_latest_date(self, mock_get_latest_price_date, mock_get_recent_prices, mock_to_thread, predict_service, mock_db_session, mock_stock_master):
+        """최신 일봉 날짜가 같으면 시세를 다시 조회하지 않고 캐시된 예측을 반환하는지 테스트"""
+        mock_get_latest_price_date.return_value = date(2023, 1, 25)
+        mock_get_recent_prices.return_value = [
+            self.create_mock_daily_price(date(2023, 1, 1) + timedelta(days=i), 100 + i * 2) for i in range(25)
+        ]
+        mock_to_thread.return_value = mock_stock_master
+
+        first = await predict_service.predict_stock_movement(mock_db_session, "005930")
+        second = await predict_service.predict_stock_movement(mock_db_session, "005930")
+
+        assert first == second
+        mock_get_recent_prices.assert_called_once()
+
+        # 새 일봉이 들어오면 다시 계산
+        mock_get_latest_price_date.return_value = date(2023, 1, 26)
+        await predict_service.predict_stock_movement(mock_db_session, "005930")
+        assert mock_get_recent_prices.call_count == 2
+
+    @patch('src.api.services.predict_service.prediction_cache_service.load_recent_prices')
+    @patch('src.api.services.predict_service.prediction_cache_service.get_latest_price_dates')
+    @pytest.mark.asyncio
+    async def test_predict_stock_movements_matches_single_prediction(self, mock_get_latest_price_dates, mock_load_recent_prices, predict_service, mock_db_session):
+        """일괄 예측이 종목별 예측과 같은 결과를 내고, 캐시된 종목은 다시 계산하지 않는지 테스트"""
+        rising = [self.create_mock_daily_price(date(2023, 1, 1) + timedelta(days=i), 100 + i * 2) for i in range(25)]
+        short = rising[:5]
+        mock_db_session.query.return_value.filter.return_value.all.return_value = [
+            MagicMock(symbol="005930"), MagicMock(symbol="000660")
+        ]
+        mock_get_latest_price_dates.return_value = {"005930": date(2023, 1, 25), "000660": date(2023, 1, 5)}
+        mock_load_recent_prices.return_value = {"005930": rising, "000660": short}
+
+        async_db = make_async_session_mock(mock_db_session)
+        result = await predict_service.predict_stock_movements(async_db, ["005930", "999999", "000660", "005930"])
+
+        assert [item["symbol"] for item in result["results"]] == ["005930", "000660"]
+        assert result["results"][0] == {"symbol": "005930", **predict_service.calculate_analysis_items(rising)}
+        assert result["results"][1]["prediction"] == "예측 불가"
+        assert result["not_found"] == ["999999"]
+        mock_load_recent_prices.assert_called_once_with(mock_db_session, ["005930", "000660"], 40)
+
+        # 같은 최신 일봉 날짜로 다시 요청하면 시세를 조회하지 않음
+        await predict_service.predict_stock_movements(async_db, ["005930", "000660"])
+        mock_load_recent_prices.assert_called_once()
+
     def test_calculate_analysis_items_basic_down_trend(self, predict_service):
         """calculate_analysis_items: 기본적인 하락 추세 테스트"""
         # Given: 꾸준히 하락하는 25일치 데이터
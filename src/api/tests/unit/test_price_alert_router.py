@@ -0,0 +1,62 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock
+from fastapi import FastAPI
+from sqlalchemy.orm import Session
+import datetime
+
+from src.api.routers.price_alert_router import router as price_alert_router, get_price_alert_service
+from src.api.auth.jwt_handler import get_current_active_user
+from src.api.tests.helpers import make_async_session_mock
+from src.common.database.db_connector import get_db, get_async_db
+from src.common.models.price_alert import PriceAlert
+from src.common.models.stock_master import StockMaster
+from src.common.models.user import User
+from src.common.services.price_alert_service import PriceAlertService
+
+# --- Test Setup ---
+
+app = FastAPI()
+
+@pytest.fixture
+def mock_db_session():
+    return MagicMock(spec=Session)
+
+@pytest.fixture
+def mock_price_alert_service():
+    return MagicMock(spec=PriceAlertService)
+
+@pytest.fixture
+def client(mock_db_session, mock_price_alert_service):
+    app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
+    app.dependency_overrides[get_price_alert_service] = lambda: mock_price_alert_service
+    app.dependency_overrides[get_current_active_user] = lambda: User(id=1, username="testuser", role="user", is_active=True)
+    app.include_router(price_alert_router)
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+# --- Test Cases ---
+
+def test_get_price_alerts_uses_async_session(client, mock_db_session, mock_price_alert_service):
+    # GIVEN
+    now = datetime.datetime.now()
+    alert = PriceAlert(
+        id=10, user_id=1, symbol="005930", target_price=80000.0, condition="gte",
+        is_active=True, notify_on_disclosure=True, notification_interval_hours=24,
+        notification_count=0, created_at=now, updated_at=now
+    )
+    alert.stock = StockMaster(symbol="005930", name="삼성전자")
+    mock_price_alert_service.get_alerts.return_value = [alert]
+
+    # WHEN
+    response = client.get("/price-alerts/")
+
+    # THEN
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["id"] == 10
+    assert data[0]["stock_name"] == "삼성전자"
+    # 기존 동기 서비스가 run_sync로 전달된 동기 세션으로 호출됨
+    mock_price_alert_service.get_alerts.assert_called_once_with(mock_db_session, 1)
@@ -8,7 +8,8 @@ from sqlalchemy.orm import Session
 from src.api.routers import stock_master
 
 from src.api.routers.stock_master import router as stock_master_router, get_stock_master_service, get_market_data_service
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_db, get_async_db
+from src.api.tests.helpers import make_async_session_mock
 from src.common.models.stock_master import StockMaster
 from src.common.services.stock_master_service import StockMasterService
 from src.common.services.market_data_service import MarketDataService
@@ -33,6 +34,7 @@ def mock_market_data_service():
 @pytest.fixture
 def client(mock_db_session, mock_stock_master_service, mock_market_data_service):
     app.dependency_overrides[get_db] = lambda: mock_db_session
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
     app.dependency_overrides[get_stock_master_service] = lambda: mock_stock_master_service
     app.dependency_overrides[get_market_data_service] = lambda: mock_market_data_service
     app.include_router(stock_master_router)
@@ -63,10 +65,10 @@ def test_get_all_symbols_success(client, mock_db_session):
 def test_search_symbols_success(client, mock_stock_master_service, mock_db_session):
     # GIVEN
     query = "삼성"
-    mock_stocks = [StockMaster(symbol="005930", name="삼성전자", market="KOSPI")]
-    mock_stock_master_service.search_stocks.return_value = mock_stocks
-    # Mock the count query as well
-    mock_db_session.query.return_value.filter.return_value.count.return_value = 1
+    mock_stock_master_service.search_stocks_with_total.return_value = {
+        "items": [{"symbol": "005930", "name": "삼성전자", "market": "KOSPI"}],
+        "total_count": 1
+    }
 
     # WHEN
     response = client.get(f"/symbols/search?query={query}")
@@ -77,13 +79,12 @@ def test_search_symbols_success(client, mock_stock_master_service, mock_db_sessi
     assert data["total_count"] == 1
     assert len(data["items"]) == 1
     assert data["items"][0]["name"] == "삼성전자"
-    mock_stock_master_service.search_stocks.assert_called_once_with(query, mock_db_session, limit=10, offset=0)
+    mock_stock_master_service.search_stocks_with_total.assert_called_once_with(query, mock_db_session, limit=10, offset=0)
 
 def test_search_symbols_no_result(client, mock_stock_master_service, mock_db_session):
     # GIVEN
     query = "없는종목"
-    mock_stock_master_service.search_stocks.return_value = []
-    mock_db_session.query.return_value.filter.return_value.count.return_value = 0
+    mock_stock_master_service.search_stocks_with_total.return_value = {"items": [], "total_count": 0}
 
     # WHEN
     response = client.get(f"/symbols/search?query={query}")
@@ -98,7 +99,7 @@ def test_get_current_price_and_change_api_success(client, mock_market_data_servi
     # GIVEN
     symbol = "005930"
     price_data = {"current_price": 80000, "change": 1000, "change_percent": 1.26}
-    mock_market_data_service.get_current_price_and_change.return_value = price_data
+    mock_market_data_service.get_current_price_and_change_async.return_value = price_data
 
     # WHEN
     response = client.get(f"/symbols/{symbol}/current_price_and_change")
@@ -106,12 +107,12 @@ def test_get_current_price_and_change_api_success(client, mock_market_data_servi
     # THEN
     assert response.status_code == 200
     assert response.json() == price_data
-    mock_market_data_service.get_current_price_and_change.assert_called_once()
+    mock_market_data_service.get_current_price_and_change_async.assert_awaited_once()
 
 def test_get_current_price_and_change_api_not_found(client, mock_market_data_service):
     # GIVEN
     symbol = "999999"
-    mock_market_data_service.get_current_price_and_change.return_value = None
+    mock_market_data_service.get_current_price_and_change_async.return_value = None
 
     # WHEN
     response = client.get(f"/symbols/{symbol}/current_price_and_change")
@@ -1,13 +1,14 @@
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import FastAPI
 from sqlalchemy.orm import Session
 import datetime
 
 from src.api.routers.user import router as user_router, get_auth_service, get_user_service
 from src.api.auth.jwt_handler import get_current_active_user
-from src.common.database.db_connector import get_db
+from src.common.database.db_connector import get_db, get_async_db
+from src.api.tests.helpers import make_async_session_mock
 from src.common.models.user import User
 from src.api.services.auth_service import AuthService
 from src.common.services.user_service import UserService
@@ -59,7 +60,8 @@ def client(mock_db_session, mock_auth_service, mock_user_service, mock_current_u
 def test_register_user(client, mock_auth_service):
     now = datetime.datetime.now()
     user_data = UserCreate(username="newuser", email="new@test.com", password="newpass")
-    mock_auth_service.create_user.return_value = User(id=2, username="newuser", email="new@test.com", role="user", is_active=True, created_at=now, updated_at=now)
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(MagicMock(spec=Session))
+    mock_auth_service.create_user_async = AsyncMock(return_value=User(id=2, username="newuser", email="new@test.com", role="user", is_active=True, created_at=now, updated_at=now))
     response = client.post("/users/register", json=user_data.model_dump())
     assert response.status_code == 200
     assert response.json()["username"] == "newuser"
@@ -67,7 +69,8 @@ def test_register_user(client, mock_auth_service):
 def test_login_user(client, mock_auth_service, mock_current_user):
     login_data = {"username": "testuser", "password": "testpass"}
     # The login service returns a dict with the token and user model
-    mock_auth_service.login_user.return_value = {"access_token": "fake-token", "token_type": "bearer", "user": mock_current_user}
+    mock_auth_service.login_user_async = AsyncMock(return_value={"access_token": "fake-token", "token_type": "bearer", "user": mock_current_user})
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(MagicMock(spec=Session))
     response = client.post("/users/login", json=login_data) # Use json instead of data
     assert response.status_code == 200
     assert response.json()["access_token"] == "fake-token"
@@ -88,7 +91,8 @@ def test_update_current_user(client, mock_auth_service, mock_db_session, mock_cu
 def test_telegram_register_new_user(client, mock_user_service, mock_db_session):
     register_data = TelegramRegister(telegram_id="12345", is_active=True)
     mock_user_service.get_user_by_telegram_id.return_value = None
-    mock_user_service.create_user_from_telegram.return_value = User(id=2, telegram_id=12345, is_active=True)
+    mock_user_service.acreate_user_from_telegram = AsyncMock(return_value=User(id=2, telegram_id=12345, is_active=True))
+    app.dependency_overrides[get_async_db] = lambda: make_async_session_mock(mock_db_session)
     response = client.put("/users/telegram_register", json=register_data.model_dump())
     assert response.status_code == 200
     assert response.json()["result"] == "registered"
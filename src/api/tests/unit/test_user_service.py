@@ -1,8 +1,9 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.orm import Session
 from src.common.services.user_service import UserService
 from src.common.models.user import User
+from src.api.tests.helpers import make_async_session_mock
 
 @pytest.fixture
 def mock_db_session():
@@ -72,4 +73,22 @@ def test_create_user_from_telegram_user_role_no_admin_id(mock_getenv, user_servi
     assert user.role == "user"
     mock_db_session.add.assert_called_once_with(user)
     mock_db_session.commit.assert_called_once()
-    mock_db_session.refresh.assert_called_once_with(user)
\ No newline at end of file
+    mock_db_session.refresh.assert_called_once_with(user)
+
+@pytest.mark.asyncio
+@patch('os.getenv', return_value=None)
+@patch('src.common.services.user_service.get_password_hash')
+@patch('src.common.services.user_service.aget_password_hash', new_callable=AsyncMock, return_value="hashed")
+async def test_acreate_user_from_telegram_awaits_hash_outside_run_sync(mock_aget_password_hash, mock_get_password_hash, mock_getenv, user_service, mock_db_session):
+    """Test that the async variant awaits the password hash and only runs the DB write through run_sync."""
+    async_db = make_async_session_mock(mock_db_session)
+
+    user = await user_service.acreate_user_from_telegram(async_db, 123456789, "tg_123456789", "Telegram", "User", "dummy_password")
+
+    assert user.hashed_password == "hashed"
+    assert user.role == "user"
+    mock_aget_password_hash.assert_awaited_once_with("dummy_password")
+    mock_get_password_hash.assert_not_called()
+    async_db.run_sync.assert_awaited_once()
+    mock_db_session.add.assert_called_once_with(user)
+    mock_db_session.commit.assert_called_once()
@@ -1,8 +1,12 @@
 from functools import wraps
 import logging
+import time
+from typing import Optional
+from jose import JWTError, jwt
 from telegram import Update
 from telegram.ext import ContextTypes
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
+from src.common.utils.cache import MISSING, TTLCache
 import os
 
 logger = logging.getLogger(__name__)
@@ -11,10 +15,123 @@ API_HOST = os.getenv("API_HOST", "localhost")
 API_URL = f"http://{API_HOST}:8000"
 API_V1_URL = f"{API_URL}/api/v1"
 TELEGRAM_USER_PASSWORD = "telegram_user_password"
+BOT_SECRET_KEY = os.getenv("BOT_SECRET_KEY")
+
+# 토큰 만료 직전의 요청이 만료된 토큰으로 나가지 않도록 이만큼 일찍 새로 발급받습니다.
+TOKEN_REFRESH_MARGIN_SECONDS = float(os.getenv("BOT_TOKEN_REFRESH_MARGIN_SECONDS", "60"))
+
+# 등록을 확인한 사용자와 발급받은 토큰을 기억하여, 평상시 명령에서는 인증 API를 호출하지 않습니다.
+registered_users = TTLCache(
+    maxsize=int(os.getenv("BOT_AUTH_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.getenv("BOT_REGISTRATION_CACHE_TTL_SECONDS", "86400")),
+)
+# 토큰별 유지 시간은 토큰의 만료 시각(exp)으로 정합니다.
+auth_tokens = TTLCache(maxsize=int(os.getenv("BOT_AUTH_CACHE_MAXSIZE", "10000")), ttl=0)
+# API가 거부(401)한 토큰을 캐시에서 지울 수 있도록 토큰의 사용자를 기억합니다.
+token_owners = TTLCache(maxsize=int(os.getenv("BOT_AUTH_CACHE_MAXSIZE", "10000")), ttl=0)
+
+
+def _token_ttl(token: str) -> Optional[float]:
+    """토큰을 캐시에 둘 시간(초)을 반환합니다. 만료 시각을 알 수 없으면 None"""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return None
+    if exp is None:
+        return None
+    return exp - time.time() - TOKEN_REFRESH_MARGIN_SECONDS
+
+
+async def _register_user(client, user_id: int) -> bool:
+    # is_active=True로 항상 활성 상태를 보장
+    payload = {"telegram_id": str(user_id), "is_active": True}
+    response = await client.put(f"{API_V1_URL}/users/telegram_register", json=payload)
+    if response.status_code not in [200, 201]: # 200 OK or 201 Created
+        logger.warning(f"사용자 등록/확인 API 호출 실패: {response.status_code} - {response.text}")
+        return False
+    logger.debug(f"사용자 등록/확인 성공: telegram_id={user_id}")
+    return True
+
+
+async def _issue_token(client, user_id: int) -> Optional[str]:
+    """
+    사용자 토큰을 발급받습니다.
+
+    BOT_SECRET_KEY가 있으면 /auth/bot/token을 사용하여 서버의 비밀번호 검증(bcrypt)을 건너뜁니다.
+    """
+    if BOT_SECRET_KEY:
+        response = await client.post(
+            f"{API_V1_URL}/auth/bot/token",
+            headers={"X-Bot-Secret-Key": BOT_SECRET_KEY},
+            json={"telegram_id": user_id},
+        )
+    else:
+        login_payload = {"username": f"tg_{user_id}", "password": TELEGRAM_USER_PASSWORD}
+        response = await client.post(f"{API_V1_URL}/users/login", json=login_payload)
+
+    if response.status_code != 200:
+        logger.warning(f"사용자 {user_id} 토큰 발급 실패: {response.status_code} - {response.text}")
+        return None
+    logger.debug(f"사용자 {user_id} 토큰 발급 성공")
+    return response.json()['access_token']
+
+
+async def get_user_token(user_id: int) -> Optional[str]:
+    """
+    사용자의 API 토큰을 반환합니다.
+
+    캐시된 토큰이 있으면 API를 호출하지 않습니다. 없거나 만료가 가까우면 (처음 보는 사용자는 등록 후) 새로 발급받습니다.
+
+    Returns:
+        Optional[str]: JWT 액세스 토큰. 발급에 실패하면 None
+    """
+    token = auth_tokens.get(user_id)
+    if token is not MISSING:
+        return token
+
+    async with get_api_client() as client:
+        if registered_users.get(user_id) is MISSING:
+            if not await _register_user(client, user_id):
+                return None
+            registered_users.set(user_id, True)
+        token = await _issue_token(client, user_id)
+
+    if token is None:
+        # 사용자가 삭제되는 등 등록 상태가 바뀌었을 수 있으므로 다음에는 다시 등록을 확인
+        registered_users.delete(user_id)
+        return None
+    ttl = _token_ttl(token)
+    if ttl is not None and ttl > 0:
+        auth_tokens.set(user_id, token, ttl=ttl)
+        token_owners.set(token, user_id, ttl=ttl)
+    return token
+
+
+def discard_token(token: str):
+    """
+    API가 거부(401)한 토큰을 캐시에서 지웁니다. 다음 명령에서 새 토큰을 발급받습니다.
+
+    토큰 버전이 바뀌어 폐기된 토큰을 만료 시각까지 계속 쓰지 않도록, 공용 API 클라이언트의 on_unauthorized로 등록합니다.
+    """
+    user_id = token_owners.get(token)
+    if user_id is MISSING:
+        return
+    token_owners.delete(token)
+    if auth_tokens.get(user_id) == token:
+        auth_tokens.delete(user_id)
+        logger.info(f"사용자 {user_id}의 토큰이 거부되어 캐시에서 삭제했습니다.")
+
+
+def forget_user(user_id: int):
+    """사용자의 등록 확인 결과와 토큰을 잊습니다. (알림 해제 등 사용자 상태를 바꾼 뒤 호출)"""
+    registered_users.delete(user_id)
+    auth_tokens.delete(user_id)
+
 
 def ensure_user_registered(func):
     """
     핸들러 실행 전에 사용자가 DB에 등록되었는지 확인하고, 없으면 등록합니다.
+    발급받은 토큰은 context.user_data['auth_token']에 저장됩니다.
     """
     @wraps(func)
     async def wrapped(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
@@ -23,32 +140,13 @@ def ensure_user_registered(func):
 
         user_id = update.effective_user.id
         try:
-            async with get_retry_client() as client:
-                # is_active=True로 항상 활성 상태를 보장
-                payload = {"telegram_id": str(user_id), "is_active": True}
-                response = await client.put(f"{API_V1_URL}/users/telegram_register", json=payload)
-                
-                if response.status_code not in [200, 201]: # 200 OK or 201 Created
-                    logger.warning(f"사용자 등록/확인 API 호출 실패: {response.status_code} - {response.text}")
-                else:
-                    logger.debug(f"사용자 등록/확인 성공: telegram_id={user_id}")
-                    
-                    # 사용자 등록/확인 후 로그인하여 토큰 발급
-                    login_payload = {"username": f"tg_{user_id}", "password": TELEGRAM_USER_PASSWORD}
-                    print(f"DEBUG: Attempting client.post to {API_V1_URL}/users/login") # DEBUG PRINT
-                    login_response = await client.post(f"{API_V1_URL}/users/login", json=login_payload)
-                    
-                    if login_response.status_code == 200:
-                        token_data = login_response.json() # Await removed
-                        context.user_data['auth_token'] = token_data['access_token']
-                        logger.debug(f"사용자 {user_id} 토큰 발급 성공")
-                    else:
-                        logger.warning(f"사용자 {user_id} 토큰 발급 실패: {login_response.status_code} - {login_response.text}")
-
+            token = await get_user_token(user_id)
+            if token:
+                context.user_data['auth_token'] = token
         except Exception as e:
             logger.error(f"사용자 등록/확인 중 예외 발생:", exc_info=True)
-        
+
         # 원래 핸들러 함수 실행
         return await func(update, context, *args, **kwargs)
-    
-    return wrapped
\ No newline at end of file
+
+    return wrapped
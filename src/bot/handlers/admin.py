@@ -6,8 +6,10 @@ from typing import Optional
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import api_flight, get_api_client
 from src.bot.decorators import ensure_user_registered
+from src.bot.search_cache import search_result_cache
+from src.bot.stock_name_matcher import stock_name_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ async def get_auth_token(telegram_id: int) -> Optional[str]:
     data = {"telegram_id": telegram_id}
     
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(f"{API_V1_URL}/auth/bot/token", headers=headers, json=data)
             response.raise_for_status()
             token_data = response.json()
@@ -60,6 +62,7 @@ async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         [InlineKeyboardButton("📊 시스템 통계 조회", callback_data="admin:stats")],
         [InlineKeyboardButton("⏰ 스케줄러 상태 조회", callback_data="admin:show_schedules")],
         [InlineKeyboardButton("🔔 테스트 알림 발송", callback_data="admin:test_notify")],
+        [InlineKeyboardButton("🗂 봇 캐시 상태 조회", callback_data="admin:cache_stats")],
         [InlineKeyboardButton("💾 (초기 1회) 과거 시세 전체 갱신", callback_data="admin:update_prices_all")]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -87,6 +90,8 @@ async def admin_callback_handler(update: Update, context: ContextTypes.DEFAULT_T
     elif action == "admin:test_notify":
         await query.message.reply_text("🔔 테스트 알림을 발송합니다...")
         await test_notify_command(update, context)
+    elif action == "admin:cache_stats":
+        await admin_cache_stats(update, context)
     elif action == "admin:update_prices_all":
         await query.message.reply_text("💾 과거 시세 전체 갱신을 요청합니다. 시간이 다소 소요될 수 있습니다.")
         # Call the original function with default parameters for a full update
@@ -95,7 +100,7 @@ async def admin_callback_handler(update: Update, context: ContextTypes.DEFAULT_T
 @ensure_user_registered
 async def health_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.get(f"{API_URL}/health", timeout=10)
             response.raise_for_status()
             data = response.json()
@@ -113,7 +118,7 @@ async def admin_show_schedules(update: Update, context: ContextTypes.DEFAULT_TYP
 
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.get(f"{API_V1_URL}/admin/schedule/status", headers=headers, timeout=10)
             if response.status_code == 200:
                 result = response.json()
@@ -167,7 +172,7 @@ async def admin_trigger_job(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         await context.bot.send_message(chat_id=chat_id, text=f"⏳ 잡 실행 요청 접수: `{job_id}`. 작업이 완료되면 알림이 전송됩니다.", parse_mode='Markdown')
 
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(
                 f"{API_V1_URL}/admin/schedule/trigger/{job_id}", 
                 headers=headers, 
@@ -247,7 +252,7 @@ async def admin_update_historical_prices(update: Update, context: ContextTypes.D
         else:
             await context.bot.send_message(chat_id=chat_id, text=f"⏳ 과거 일별 시세 전체 갱신 요청 접수: {start_date_str} ~ {end_date_str}. 작업이 완료되면 알림이 전송됩니다.", parse_mode='Markdown')
 
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(
                 f"{API_V1_URL}/admin/update_historical_prices", 
                 headers=headers, 
@@ -288,7 +293,7 @@ async def trigger_job_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     try:
         await context.bot.send_message(chat_id=chat_id, text=f"⏳ 잡 실행 요청 접수: `{job_id}`. 작업이 완료되면 알림이 전송됩니다.", parse_mode='Markdown')
 
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(
                 f"{API_V1_URL}/admin/schedule/trigger/{job_id}",
                 headers=headers,
@@ -318,7 +323,7 @@ async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.get(f"{API_V1_URL}/admin/admin_stats", headers=headers, timeout=10)
             if response.status_code == 200:
                 stats = response.json()
@@ -329,6 +334,26 @@ async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.error(f"통계 조회 중 오류: {str(e)}")
         await context.bot.send_message(chat_id=update.effective_chat.id, text="통계 조회 중 오류가 발생했습니다.")
 
+@admin_only
+async def admin_cache_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """봇 프로세스의 검색 결과 캐시, 종목명 인식기, 중복 요청 합치기 상태를 보여줍니다. (API 호출 없음)"""
+    search = search_result_cache.get_stats()
+    matcher = stock_name_matcher.get_stats()
+    flight = api_flight.get_stats()
+    text = (
+        "🗂 **봇 캐시 상태**\n\n"
+        f"**[검색 결과 캐시]**\n"
+        f"- 페이지 수: {search['size']}/{search['maxsize']} (유지 {search['ttl']:.0f}초)\n"
+        f"- 적중률: {search['hit_rate'] * 100:.1f}% (적중 {search['hits']} / 미적중 {search['misses']})\n"
+        f"- 다음 페이지 미리 받기: {search['prefetches']}회 (실패 {search['prefetch_errors']})\n\n"
+        f"**[종목명 인식기]**\n"
+        f"- 종목 수: {matcher['size']} (마지막 구성 {matcher['last_built_at'] or '-'})\n"
+        f"- 인식: {matcher['matches']}/{matcher['lookups']}건\n\n"
+        f"**[API 중복 요청 합치기]**\n"
+        f"- 합친 요청: {flight['coalesced']}/{flight['calls']}건 ({flight['coalesced_rate'] * 100:.1f}%, 진행 중 {flight['in_flight']})"
+    )
+    await context.bot.send_message(chat_id=update.effective_chat.id, text=text, parse_mode='Markdown')
+
 @admin_only
 @ensure_user_registered
 async def test_notify_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -364,4 +389,7 @@ def get_test_notify_handler():
     return CommandHandler("test_notify", test_notify_command)
 
 def get_admin_update_historical_prices_handler():
-    return CommandHandler("update_historical_prices", admin_update_historical_prices)
\ No newline at end of file
+    return CommandHandler("update_historical_prices", admin_update_historical_prices)
+
+def get_admin_cache_stats_handler():
+    return CommandHandler("cache_stats", admin_cache_stats)
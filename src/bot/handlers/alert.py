@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import httpx
 from datetime import timedelta
@@ -11,7 +12,8 @@ from telegram.ext import (
     filters
 )
 
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
+from src.common.schemas.stock_master import MAX_BATCH_SYMBOLS
 from src.bot.decorators import ensure_user_registered
 
 API_URL = "http://stockeye-api:8000/api/v1"
@@ -25,58 +27,71 @@ logger = logging.getLogger(__name__)
 # =====================================================================================
 
 async def _api_get_price_alerts(auth_token: str) -> list:
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/price-alerts/")
         response.raise_for_status()
         return response.json()
 
 async def _api_get_disclosure_alerts(auth_token: str) -> list:
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/disclosure-alerts/")
         response.raise_for_status()
         return response.json()
 
 async def _api_search_stocks(query: str, auth_token: str = None) -> list:
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/symbols/search", params={"query": query})
         response.raise_for_status()
         return response.json()
 
+async def _api_get_symbol_names(symbols: list, auth_token: str = None) -> dict:
+    """여러 종목의 이름을 조회합니다. (종목 코드 -> 종목명) API 한도(MAX_BATCH_SYMBOLS)씩 나누어 동시에 요청합니다."""
+    chunks = [symbols[i:i + MAX_BATCH_SYMBOLS] for i in range(0, len(symbols), MAX_BATCH_SYMBOLS)]
+    async with get_api_client(auth_token=auth_token) as client:
+        responses = await asyncio.gather(
+            *(client.get(f"{API_URL}/symbols/batch", params={"codes": ",".join(chunk)}) for chunk in chunks)
+        )
+    names = {}
+    for response in responses:
+        response.raise_for_status()
+        names.update({item['symbol']: item['name'] for item in response.json()['items']})
+    return names
+
 async def _api_create_disclosure_alert(symbol: str, auth_token: str):
     payload = {"symbol": symbol, "is_active": True}
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.post(f"{API_URL}/disclosure-alerts/", json=payload)
         response.raise_for_status()
         return response.json()
 
 async def _api_create_price_alert(payload: dict, auth_token: str):
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.post(f"{API_URL}/price-alerts/", json=payload)
         response.raise_for_status()
         return response.json()
 
 async def _api_update_price_alert_status(alert_id: int, is_active: bool, auth_token: str):
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         endpoint = "pause" if not is_active else "resume"
         response = await client.put(f"{API_URL}/price-alerts/{alert_id}/{endpoint}")
         response.raise_for_status()
         return response.json()
 
 async def _api_delete_price_alert(alert_id: int, auth_token: str):
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.delete(f"{API_URL}/price-alerts/{alert_id}")
         response.raise_for_status()
         return None
 
 async def _api_update_disclosure_alert_status(alert_id: int, is_active: bool, auth_token: str):
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         endpoint = "pause" if not is_active else "resume"
         response = await client.put(f"{API_URL}/disclosure-alerts/{alert_id}/{endpoint}")
         response.raise_for_status()
         return response.json()
 
 async def _api_delete_disclosure_alert(alert_id: int, auth_token: str):
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.delete(f"{API_URL}/disclosure-alerts/{alert_id}")
         response.raise_for_status()
         return None
@@ -134,8 +149,11 @@ async def alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def list_alerts(update: Update, context: ContextTypes.DEFAULT_TYPE, message_id: int = None):
     auth_token = context.user_data.get('auth_token')
     try:
-        price_alerts = await _api_get_price_alerts(auth_token)
-        disclosure_alerts = await _api_get_disclosure_alerts(auth_token)
+        # 가격/공시 알림을 동시에 조회한 뒤, 이름이 없는 종목은 배치 요청으로 조회 (최대 2번 왕복)
+        price_alerts, disclosure_alerts = await asyncio.gather(
+            _api_get_price_alerts(auth_token),
+            _api_get_disclosure_alerts(auth_token),
+        )
 
         if not price_alerts and not disclosure_alerts:
             text = "등록된 알림이 없습니다."
@@ -159,12 +177,13 @@ async def list_alerts(update: Update, context: ContextTypes.DEFAULT_TYPE, messag
                 for alert in disclosure_alerts:
                     symbols_to_fetch.add(alert['symbol'])
 
-            for symbol in symbols_to_fetch:
-                stock_data = await _api_search_stocks(symbol, auth_token)
-                if stock_data and stock_data.get('items'):
-                    stock_names_map[symbol] = stock_data['items'][0]['name']
-                else:
-                    stock_names_map[symbol] = symbol
+            symbols_to_fetch -= stock_names_map.keys()
+            if symbols_to_fetch:
+                try:
+                    stock_names_map.update(await _api_get_symbol_names(sorted(symbols_to_fetch), auth_token))
+                except httpx.HTTPError as e:
+                    # 종목명 조회에 실패해도 알림 목록은 종목 코드로 보여줌
+                    logger.warning(f"종목명 일괄 조회 실패, 종목 코드로 표시합니다: {e}")
 
             if price_alerts:
                 message += "**[가격 알림]**\n"
@@ -2,7 +2,7 @@ import os
 import httpx
 from telegram import Update
 from telegram.ext import ContextTypes
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.debug(f"history_command called for user_id: {user_id}")
     try:
         logger.debug("Attempting to get retry client.")
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             logger.debug(f"Client obtained. Making GET request to {API_URL}/prediction/history/{user_id}")
             response = await client.get(f"{API_URL}/prediction/history/{user_id}", timeout=10)
             logger.debug(f"Received response. Status code: {response.status_code}")
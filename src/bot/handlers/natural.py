@@ -1,50 +1,52 @@
+import logging
 import re
 from telegram import Update
 from telegram.ext import ContextTypes
 import httpx
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
+from src.bot.stock_name_matcher import stock_name_matcher
+
+logger = logging.getLogger(__name__)
+
+async def _search_symbol_via_api(client, text: str):
+    """종목명 인식기를 사용할 수 없을 때 API 검색으로 종목 코드를 찾습니다. (메시지 전체 → 단어별)"""
+    queries = [text] + [word for word in re.findall(r'[가-힣A-Za-z0-9]+', text) if word != text]
+    for q in queries:
+        try:
+            response = await client.get(f"/api/v1/symbols/search", params={"query": q})
+            response.raise_for_status()
+            data = response.json().get("items", [])
+            if data:
+                return data[0]["symbol"]
+        except httpx.RequestError as e:
+            logger.warning(f"Error during symbol search for '{q}': {e}")
+    return None
 
 # 종목명/코드 추출 및 예측/상세 안내
 async def natural_message_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = update.message.text.strip()
     symbol = None
+    stock = None
 
     # 1. 6자리 숫자 종목코드 우선 추출
     code_match = re.search(r'\b\d{6}\b', text)
     if code_match:
         symbol = code_match.group(0)
-    
-    async with get_retry_client() as client:
-        # 2. 종목코드가 없으면 메시지 전체를 쿼리로 사용하여 종목명 검색 시도
-        if not symbol:
-            try:
-                response = await client.get(f"/api/v1/symbols/search", params={"query": text})
-                response.raise_for_status()
-                data = response.json().get("items", [])
-                print(f"Received data from API: {data}")
-                if data:
-                    symbol = data[0]["symbol"]
-            except httpx.RequestError as e:
-                print(f"Error during full text search: {e}") # 디버깅용
-                pass
 
-        # 3. 메시지 전체로도 못 찾았으면 단어별로 검색 시도
-        if not symbol:
-            words = re.findall(r'[가-힣A-Za-z0-9]+', text)
-            for word in words:
-                q = word.strip()
-                if not q: continue
-                try:
-                    response = await client.get(f"/api/v1/symbols/search", params={"query": q})
-                    response.raise_for_status()
-                    data = response.json().get("items", [])
-                    print(f"Received data from API: {data}")
-                    if data:
-                        symbol = data[0]["symbol"]
-                        break
-                except httpx.RequestError as e:
-                    print(f"Error during word-by-word search for '{q}': {e}") # 디버깅용
-                    pass
+    # 2. 종목코드가 없으면 로컬 종목명 인식기로 메시지에서 종목명/코드를 찾음 (API 호출 없음)
+    matcher_ready = await stock_name_matcher.ensure_fresh()
+    if matcher_ready:
+        if symbol:
+            stock = stock_name_matcher.get(symbol)
+        else:
+            stock = stock_name_matcher.find(text)
+            if stock:
+                symbol = stock["symbol"]
+
+    async with get_api_client() as client:
+        # 3. 인식기를 아직 사용할 수 없으면 (종목 목록을 받지 못한 경우) API 검색으로 대신함
+        if not symbol and not matcher_ready:
+            symbol = await _search_symbol_via_api(client, text)
 
         if not symbol:
             await update.message.reply_text("메시지에서 종목코드(6자리)나 종목명을 찾을 수 없습니다. 예: '삼성전자 얼마야', '005930 예측'")
@@ -54,7 +56,7 @@ async def natural_message_handler(update: Update, context: ContextTypes.DEFAULT_
         if "예측" in text or "predict" in text or "얼마" in text or "가격" in text:
             # 예측 결과 안내
             try:
-                response = await client.post(f"/api/v1/predict", json={"symbol": symbol, "telegram_id": update.effective_user.id})
+                response = await client.post(f"/api/v1/predict", json={"symbol": symbol, "telegram_id": update.effective_user.id}, coalesce=True)
                 response.raise_for_status()
                 data = response.json()
                 msg = f"[예측 결과] {symbol}: {data.get('prediction', 'N/A')}\n사유: {data.get('reason', '')}"
@@ -65,12 +67,15 @@ async def natural_message_handler(update: Update, context: ContextTypes.DEFAULT_
             except Exception as e:
                 await update.message.reply_text(f"예측 실패: {e}")
         else:
-            # 종목 상세 안내
+            # 종목 상세 안내 (인식기가 아는 종목이면 API를 호출하지 않음)
+            if stock:
+                await update.message.reply_text(f"[종목 상세]\n코드: {stock['symbol']}\n이름: {stock['name']}\n시장: {stock['market']}")
+                return
             try:
                 response = await client.get(f"/api/v1/symbols/search", params={"query": symbol})
                 response.raise_for_status()
                 data = response.json().get("items", [])
-                print(f"Received data from API: {data}")
+                logger.debug(f"Received data from API: {data}")
                 if not data:
                     await update.message.reply_text("해당 종목을 찾을 수 없습니다.")
                     return
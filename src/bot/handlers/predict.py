@@ -2,7 +2,7 @@ import httpx
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler, MessageHandler
 from telegram.ext import filters as Filters
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
 from src.common.database.db_connector import get_db
 from src.common.services.stock_master_service import StockMasterService
 import re
@@ -25,11 +25,12 @@ async def _execute_prediction(update: Update, context: ContextTypes.DEFAULT_TYPE
     logger.debug(f"_execute_prediction called for symbol: {symbol}, stock_name: {stock_name}")
 
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             api_host = os.getenv("API_HOST", "localhost")
             api_url = f"http://{api_host}:8000/api/v1"
             logger.debug(f"Calling API: {api_url}/predict with symbol={symbol}, telegram_id={user_id}")
-            response = await client.post(f"{api_url}/predict", json={"symbol": symbol, "telegram_id": user_id})
+            # 같은 사용자가 같은 종목 예측을 연달아 누르면 진행 중인 요청의 결과를 함께 사용
+            response = await client.post(f"{api_url}/predict", json={"symbol": symbol, "telegram_id": user_id}, coalesce=True)
             response.raise_for_status()
             data = response.json()
             logger.debug(f"API response data: {data}")
@@ -178,7 +179,7 @@ async def predict_callback_handler(update: Update, context: ContextTypes.DEFAULT
                 return
 
             headers = {"Authorization": f"Bearer {token}"}
-            async with get_retry_client() as client:
+            async with get_api_client() as client:
                 api_host = os.getenv("API_HOST", "localhost")
                 api_url = f"http://{api_host}:8000/api/v1"
                 response = await client.post(
@@ -1,14 +1,15 @@
 import httpx
 from telegram import Update
 from telegram.ext import ContextTypes
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
+from src.bot.decorators import forget_user
 
 async def register_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """텔레그램 ID를 시스템에 등록합니다."""
     telegram_id = str(update.effective_chat.id)
     print(f"Attempting to register user: {telegram_id}")
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             print("Client obtained. Making PUT request...")
             response = await client.put(
                 "/api/v1/users/telegram_register",
@@ -29,12 +30,14 @@ async def unregister_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """시스템에서 텔레그램 ID를 비활성화합니다."""
     telegram_id = str(update.effective_chat.id)
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.put(
                 "/api/v1/users/telegram_register",
                 json={"telegram_id": telegram_id, "is_active": False}
             )
             response.raise_for_status()
+            # 다음 명령에서 등록 상태를 다시 확인하도록 캐시된 등록 정보와 토큰을 지움
+            forget_user(update.effective_chat.id)
             await update.message.reply_text("알림을 비활성화했습니다. 더 이상 주가 알림을 받지 않습니다.")
     except httpx.HTTPStatusError as e:
         error_message = e.response.json().get("detail", f"HTTP 오류 {e.response.status_code}")
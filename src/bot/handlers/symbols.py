@@ -2,8 +2,9 @@ import os
 import logging
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
 from src.common.utils.callback_parser import parse_pagination_callback_data
+from src.bot.search_cache import search_result_cache
 import httpx
 
 API_HOST = os.getenv("API_HOST", "localhost")
@@ -16,25 +17,64 @@ logger = logging.getLogger(__name__)
 # Internal API Helper Functions (for easier testing)
 # =====================================================================================
 
-async def _api_get_symbols(limit: int, offset: int, auth_token: str = None) -> dict:
-    """Helper to call the get all symbols API."""
-    async with get_retry_client(auth_token=auth_token) as client:
+async def _fetch_symbols(limit: int, offset: int, auth_token: str = None) -> dict:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/symbols/?limit={limit}&offset={offset}", timeout=10)
         response.raise_for_status()
         # httpx.Response.json() is a sync method, not awaitable.
         return response.json()
 
-async def _api_search_symbols(query: str, limit: int, offset: int, auth_token: str = None) -> dict:
-    """Helper to call the search symbols API."""
-    async with get_retry_client(auth_token=auth_token) as client:
+async def _fetch_symbols_page(limit: int, cursor: str = None, include_total: bool = True, auth_token: str = None) -> dict:
+    params = {"limit": limit, "include_total": str(include_total).lower()}
+    if cursor:
+        params["cursor"] = cursor
+    async with get_api_client(auth_token=auth_token) as client:
+        response = await client.get(f"{API_URL}/symbols/cursor", params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+async def _fetch_search_symbols(query: str, limit: int, offset: int, auth_token: str = None) -> dict:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/symbols/search", params={"query": query, "limit": limit, "offset": offset}, timeout=10)
         response.raise_for_status()
         # httpx.Response.json() is a sync method, not awaitable.
         return response.json()
 
+# 아래 함수들은 결과 페이지를 search_result_cache에 잠시 기억하고, 다음 페이지를 미리 받아 둡니다.
+# (페이지 이동 버튼은 대부분 API 호출 없이 처리됨)
+
+async def _api_get_symbols(limit: int, offset: int, auth_token: str = None) -> dict:
+    """Helper to call the get all symbols API."""
+    data = await search_result_cache.get_or_fetch(
+        ("symbols", offset, limit), lambda: _fetch_symbols(limit, offset, auth_token))
+    if offset + limit < data.get('total_count', 0):
+        search_result_cache.prefetch(
+            ("symbols", offset + limit, limit), lambda: _fetch_symbols(limit, offset + limit, auth_token))
+    return data
+
+async def _api_get_symbols_page(limit: int, cursor: str = None, include_total: bool = True, auth_token: str = None) -> dict:
+    """Helper to call the cursor-based symbols API."""
+    data = await search_result_cache.get_or_fetch(
+        ("symbols_cursor", cursor, limit, include_total), lambda: _fetch_symbols_page(limit, cursor, include_total, auth_token))
+    next_cursor = data.get('next_cursor')
+    if next_cursor:
+        search_result_cache.prefetch(
+            ("symbols_cursor", next_cursor, limit, include_total),
+            lambda: _fetch_symbols_page(limit, next_cursor, include_total, auth_token))
+    return data
+
+async def _api_search_symbols(query: str, limit: int, offset: int, auth_token: str = None) -> dict:
+    """Helper to call the search symbols API."""
+    data = await search_result_cache.get_or_fetch(
+        ("search", query, offset, limit), lambda: _fetch_search_symbols(query, limit, offset, auth_token))
+    if offset + limit < data.get('total_count', 0):
+        search_result_cache.prefetch(
+            ("search", query, offset + limit, limit), lambda: _fetch_search_symbols(query, limit, offset + limit, auth_token))
+    return data
+
 async def _api_get_symbol_by_code(symbol_code: str, auth_token: str = None) -> dict:
     """Helper to call the get symbol by code API."""
-    async with get_retry_client(auth_token=auth_token) as client:
+    async with get_api_client(auth_token=auth_token) as client:
         response = await client.get(f"{API_URL}/symbols/{symbol_code}", timeout=10)
         response.raise_for_status()
         return response.json()
@@ -86,6 +126,42 @@ async def _get_symbols_message_and_keyboard(symbols_data: dict, offset: int):
     reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
     return msg, reply_markup
 
+async def _get_symbols_page_message_and_keyboard(page_data: dict, page: int):
+    """커서 기반 종목 목록 메시지와 키보드를 만듭니다. 페이지 버튼에는 API가 준 커서를 담습니다."""
+    items = page_data.get('items', [])
+    total_count = page_data.get('total_count') or 0
+
+    if not items:
+        return "등록된 종목이 없습니다.", None
+
+    stock_buttons = []
+    stock_list_text = ""
+    for item in items:
+        button_text = f"{item['symbol']} {item['name']}"
+        if item.get('market'):
+            button_text += f" ({item['market']})"
+        stock_buttons.append([InlineKeyboardButton(button_text, callback_data=f"symbol_info_{item['symbol']}")])
+        stock_list_text += f"- {button_text}\n"
+
+    total_pages = max(1, (total_count + PAGE_SIZE - 1) // PAGE_SIZE)
+
+    # callback_data 형식: symbols_cur:{이동할 페이지 번호}:{커서} (빈 커서는 첫 페이지)
+    pagination_buttons = []
+    if page_data.get('prev_cursor'):
+        pagination_buttons.append(InlineKeyboardButton("맨앞", callback_data="symbols_cur:1:"))
+        pagination_buttons.append(InlineKeyboardButton("이전", callback_data=f"symbols_cur:{page - 1}:{page_data['prev_cursor']}"))
+    if page_data.get('next_cursor'):
+        pagination_buttons.append(InlineKeyboardButton("다음", callback_data=f"symbols_cur:{page + 1}:{page_data['next_cursor']}"))
+        pagination_buttons.append(InlineKeyboardButton("맨뒤", callback_data=f"symbols_cur:{total_pages}:{page_data['last_cursor']}"))
+
+    msg = f"[종목 목록] (총 {total_count}개)\n페이지: {page}/{total_pages}\n\n{stock_list_text}\n원하는 종목을 선택하거나 페이지를 이동하세요."
+
+    keyboard = stock_buttons
+    if pagination_buttons:
+        keyboard.append(pagination_buttons)
+
+    return msg, InlineKeyboardMarkup(keyboard)
+
 async def _get_search_results_message_and_keyboard(search_data: dict, query_str: str, offset: int, pagination_callback_prefix: str = "symbols_search_page"):
     items = search_data.get('items', [])
     total_count = search_data.get('total_count', 0)
@@ -144,14 +220,11 @@ async def symbols_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await symbols_search_command(update, context)
         return
 
-    # Original logic for fetching all symbols if no arguments
-    user_id = update.effective_user.id # This is not used in this handler, but kept for consistency
-    current_offset = context.user_data.get('symbols_offset', 0)
-
+    # 인자가 없으면 커서 기반으로 종목 목록 첫 페이지를 조회
     try:
-        symbols_data = await _api_get_symbols(PAGE_SIZE, current_offset)
-        
-        msg, reply_markup = await _get_symbols_message_and_keyboard(symbols_data, current_offset)
+        page_data = await _api_get_symbols_page(PAGE_SIZE)
+
+        msg, reply_markup = await _get_symbols_page_message_and_keyboard(page_data, 1)
         await reply_target.reply_text(msg, reply_markup=reply_markup)
     except httpx.HTTPStatusError as e:
         logger.error(f"종목 목록 조회 실패: API 응답 코드 {e.response.status_code}, 응답 본문: {e.response.text}")
@@ -178,6 +251,30 @@ async def symbols_pagination_callback(update: Update, context: ContextTypes.DEFA
         logger.error(f"Unknown Error in symbols_pagination_callback: {e}", exc_info=True)
         await query.edit_message_text(f"페이지 이동 실패: 알 수 없는 오류가 발생했습니다.")
 
+async def symbols_cursor_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    await query.answer()
+
+    # callback_data 형식: symbols_cur:{page}:{cursor}
+    try:
+        _, page, cursor = query.data.split(":", 2)
+        page = int(page)
+    except ValueError:
+        logger.error(f"Error parsing cursor callback data: {query.data}")
+        await query.edit_message_text(text="오류: 잘못된 페이지네이션 데이터입니다.")
+        return
+
+    try:
+        page_data = await _api_get_symbols_page(PAGE_SIZE, cursor or None)
+
+        msg, reply_markup = await _get_symbols_page_message_and_keyboard(page_data, page)
+        await query.edit_message_text(msg, reply_markup=reply_markup)
+    except httpx.HTTPStatusError as e:
+        await query.edit_message_text(f"페이지 이동 실패: API 응답 코드 {e.response.status_code}")
+    except Exception as e:
+        logger.error(f"Unknown Error in symbols_cursor_callback: {e}", exc_info=True)
+        await query.edit_message_text(f"페이지 이동 실패: 알 수 없는 오류가 발생했습니다.")
+
 async def symbol_info_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
@@ -296,6 +393,8 @@ def get_symbols_handlers():
     return [
         CommandHandler("symbols", symbols_command),
         CommandHandler("symbol_info", symbol_info_command),
+        CallbackQueryHandler(symbols_cursor_callback, pattern="^symbols_cur:"),
+        # 커서 방식 이전에 전송된 메시지의 offset 기반 버튼용
         CallbackQueryHandler(symbols_pagination_callback, pattern="^symbols_page_"),
         CallbackQueryHandler(symbols_search_pagination_callback, pattern="^symbols_search_page_"),
         CallbackQueryHandler(symbol_info_callback, pattern="^symbol_info_"),
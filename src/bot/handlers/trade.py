@@ -2,7 +2,7 @@ import os
 import httpx
 from telegram import Update
 from telegram.ext import ContextTypes
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
 
 API_HOST = os.getenv("API_HOST", "localhost")
 API_URL = f"http://{API_HOST}:8000"
@@ -21,7 +21,7 @@ async def trade_simulate_command(update: Update, context: ContextTypes.DEFAULT_T
             "price": float(price),
             "quantity": int(quantity)
         }
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(f"{API_URL}/api/v1/simulated-trade/", json=payload, timeout=10)
             if response.status_code < 400:
                 data = await response.json()
@@ -34,7 +34,7 @@ async def trade_simulate_command(update: Update, context: ContextTypes.DEFAULT_T
 async def trade_history_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.get(f"{API_URL}/api/v1/simulated-trade/history/{user_id}", timeout=10)
             if response.status_code < 400:
                 data = await response.json()
@@ -2,7 +2,7 @@ import os
 import httpx
 from telegram import Update
 from telegram.ext import ContextTypes
-from src.common.utils.http_client import get_retry_client
+from src.common.utils.http_client import get_api_client
 
 API_HOST = os.getenv("API_HOST", "localhost")
 API_URL = f"http://{API_HOST}:8000"
@@ -14,7 +14,7 @@ async def watchlist_add_command(update: Update, context: ContextTypes.DEFAULT_TY
     symbol = context.args[0]
     user_id = update.effective_user.id
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.post(f"{API_URL}/api/v1/watchlist/", json={"user_id": user_id, "symbol": symbol}, timeout=10)
             if response.status_code < 400:
                 data = await response.json()
@@ -31,7 +31,7 @@ async def watchlist_remove_command(update: Update, context: ContextTypes.DEFAULT
     symbol = context.args[0]
     user_id = update.effective_user.id
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.delete(f"{API_URL}/api/v1/watchlist/{user_id}/{symbol}", timeout=10)
             if response.status_code < 400:
                 data = await response.json()
@@ -44,7 +44,7 @@ async def watchlist_remove_command(update: Update, context: ContextTypes.DEFAULT
 async def watchlist_get_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
     try:
-        async with get_retry_client() as client:
+        async with get_api_client() as client:
             response = await client.get(f"{API_URL}/api/v1/watchlist/{user_id}", timeout=10)
             if response.status_code < 400:
                 data = await response.json()
@@ -1,6 +1,14 @@
+import asyncio
 import logging
 import os
-from telegram.ext import Application, CommandHandler, ConversationHandler, MessageHandler, filters
+from typing import Optional
+from telegram.ext import Application, ApplicationBuilder, CommandHandler, ConversationHandler, MessageHandler, filters
+
+from src.common.utils.http_client import close_api_client, shared_api_client
+from src.bot.decorators import discard_token
+from src.bot.stock_name_matcher import stock_name_matcher
+from src.bot.update_processor import PerUserUpdateProcessor
+from src.bot.webhook import run_webhook
 
 from src.bot.handlers import (
     start,
@@ -25,14 +33,39 @@ logger = logging.getLogger(__name__)
 
 # 환경 변수
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-
-def main():
-    if not TELEGRAM_BOT_TOKEN:
-        logger.error("TELEGRAM_BOT_TOKEN이 설정되지 않았습니다.")
-        return
-
-    # Application 객체 생성
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+# polling: 텔레그램 서버에 업데이트를 요청 / webhook: 리버스 프록시 뒤의 로컬 HTTP 서버로 업데이트를 받음
+BOT_MODE = os.getenv("BOT_MODE", "polling").lower()
+# 동시에 처리할 최대 업데이트 수 (1이면 하나씩 처리). 같은 사용자의 업데이트는 항상 순서대로 처리됩니다.
+BOT_CONCURRENT_UPDATES = int(os.getenv("BOT_CONCURRENT_UPDATES", "32"))
+BOT_WEBHOOK_URL = os.getenv("BOT_WEBHOOK_URL")
+BOT_WEBHOOK_LISTEN = os.getenv("BOT_WEBHOOK_LISTEN", "0.0.0.0")
+BOT_WEBHOOK_PORT = int(os.getenv("BOT_WEBHOOK_PORT", "8081"))
+BOT_WEBHOOK_PATH = os.getenv("BOT_WEBHOOK_PATH", "/telegram/webhook")
+BOT_WEBHOOK_SECRET_TOKEN = os.getenv("BOT_WEBHOOK_SECRET_TOKEN")
+
+def build_application(builder: Optional[ApplicationBuilder] = None) -> Application:
+    """
+    핸들러를 모두 등록한 Application을 만듭니다.
+
+    Args:
+        builder (Optional[ApplicationBuilder]): 토큰/요청 객체 등을 미리 설정한 빌더 (없으면 TELEGRAM_BOT_TOKEN 사용)
+    """
+    if builder is None:
+        # 동시에 처리하는 업데이트들이 텔레그램 API 커넥션 하나를 기다리지 않도록 풀 크기를 맞춤 (기본값 1)
+        builder = Application.builder().token(TELEGRAM_BOT_TOKEN).connection_pool_size(max(BOT_CONCURRENT_UPDATES, 1))
+    if BOT_CONCURRENT_UPDATES > 1:
+        builder = builder.concurrent_updates(PerUserUpdateProcessor(BOT_CONCURRENT_UPDATES))
+
+    # Application 객체 생성 (시작 시 종목명 인식기를 준비하고, 종료 시 공용 API 커넥션 풀을 닫음)
+    application = (
+        builder
+        .post_init(stock_name_matcher.warm_up)
+        .post_shutdown(close_api_client)
+        .build()
+    )
+
+    # API가 거부(401)한 캐시 토큰은 만료 전이라도 버리고 다음 명령에서 새로 발급받음
+    shared_api_client.on_unauthorized = discard_token
 
     # 핸들러 등록
     # Special handler with high priority to catch worker completion messages
@@ -75,13 +108,37 @@ def main():
     application.add_handler(admin.get_admin_stats_handler())
     application.add_handler(admin.get_test_notify_handler())
     application.add_handler(admin.get_admin_update_historical_prices_handler())
+    application.add_handler(admin.get_admin_cache_stats_handler())
 
     # Natural language processing handler (in default group 0)
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, natural.natural_message_handler), group=0)
 
+    return application
+
+def main():
+    if not TELEGRAM_BOT_TOKEN:
+        logger.error("TELEGRAM_BOT_TOKEN이 설정되지 않았습니다.")
+        return
+
+    application = build_application()
+
     # 봇 시작
-    logger.info("Starting bot in polling mode...")
-    application.run_polling()
+    if BOT_MODE == "webhook":
+        if not BOT_WEBHOOK_URL:
+            logger.error("웹훅 모드에는 BOT_WEBHOOK_URL이 필요합니다.")
+            return
+        logger.info(f"Starting bot in webhook mode (concurrent updates: {BOT_CONCURRENT_UPDATES})...")
+        asyncio.run(run_webhook(
+            application,
+            BOT_WEBHOOK_URL,
+            listen=BOT_WEBHOOK_LISTEN,
+            port=BOT_WEBHOOK_PORT,
+            url_path=BOT_WEBHOOK_PATH,
+            secret_token=BOT_WEBHOOK_SECRET_TOKEN,
+        ))
+    else:
+        logger.info(f"Starting bot in polling mode (concurrent updates: {BOT_CONCURRENT_UPDATES})...")
+        application.run_polling()
 
 if __name__ == '__main__':
     main()
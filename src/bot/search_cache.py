@@ -0,0 +1,101 @@
+"""
+봇의 종목 검색/목록 결과 캐시입니다.
+
+페이지 이동 버튼을 누를 때마다 같은 검색을 API에 다시 요청하지 않도록, 결과 페이지를 (종류, 검색어, offset, limit) 키로
+잠시 기억합니다. 한 페이지를 보여줄 때 다음 페이지를 미리 받아 두므로 "다음" 버튼은 대부분 메모리에서 처리됩니다.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set
+
+from src.common.utils.cache import MISSING, TTLCache, register_cache
+from src.common.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+BOT_SEARCH_CACHE_MAXSIZE = int(os.getenv("BOT_SEARCH_CACHE_MAXSIZE", "1000"))
+BOT_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("BOT_SEARCH_CACHE_TTL_SECONDS", "300"))
+BOT_SEARCH_PREFETCH = os.getenv("BOT_SEARCH_PREFETCH", "true").lower() in ("1", "true", "yes")
+
+
+class SearchResultCache:
+    """
+    API 결과 페이지 캐시입니다. 같은 키의 요청이 동시에 들어오면 API 요청을 한 번만 보냅니다.
+
+    Args:
+        maxsize (int): 최대 페이지 수
+        ttl (float): 페이지 유지 시간(초)
+        prefetch (bool): 다음 페이지를 미리 받을지 여부
+    """
+
+    def __init__(self, maxsize: int = BOT_SEARCH_CACHE_MAXSIZE, ttl: float = BOT_SEARCH_CACHE_TTL_SECONDS,
+                 prefetch: bool = BOT_SEARCH_PREFETCH):
+        self.prefetch_enabled = prefetch
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._flight = SingleFlight("bot_search")
+        self._prefetch_tasks: Set[asyncio.Task] = set()
+        self._stats = {"hits": 0, "misses": 0, "prefetches": 0, "prefetch_errors": 0}
+        register_cache(self)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 결과를 반환하고, 없으면 fetch()로 받아 저장합니다.
+        같은 키를 받는 중이면 (미리 받기 포함) 그 결과를 기다립니다.
+        """
+        value = self._cache.get(key)
+        if value is not MISSING:
+            self._stats["hits"] += 1
+            return value
+        # 받는 중인 결과를 기다리는 경우는 API 요청이 늘지 않으므로 적중으로 셈
+        self._stats["hits" if self._flight.is_in_flight(key) else "misses"] += 1
+        return await self._fetch(key, fetch)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        async def fetch_and_store():
+            value = await fetch()
+            self._cache.set(key, value)
+            return value
+
+        return await self._flight.do(key, fetch_and_store)
+
+    def prefetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]):
+        """결과가 캐시에 없으면 뒤에서 미리 받아 둡니다. (실패해도 사용자 응답에는 영향 없음)"""
+        if not self.prefetch_enabled or self._cache.get(key) is not MISSING or self._flight.is_in_flight(key):
+            return
+
+        async def run():
+            try:
+                await self._fetch(key, fetch)
+            except Exception as e:
+                self._stats["prefetch_errors"] += 1
+                logger.debug(f"[SearchResultCache] 다음 페이지 미리 받기 실패 ({key}): {e}")
+
+        self._stats["prefetches"] += 1
+        task = asyncio.ensure_future(run())
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    def clear(self):
+        self._cache.clear()
+        self._flight.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 상태를 반환합니다.
+
+        Returns:
+            Dict: {"size", "maxsize", "ttl", "hits", "misses", "hit_rate", "prefetches", "prefetch_errors"}
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "ttl": self._cache.ttl,
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+search_result_cache = SearchResultCache()
@@ -0,0 +1,327 @@
+"""
+자연어 메시지에서 종목을 찾아내는 종목명 인식기입니다.
+
+전체 종목의 이름과 코드를 Aho-Corasick 오토마톤으로 만들어 두고, 메시지를 한 번 훑어 종목을 찾습니다.
+찾은 이름은 원래 메시지에서 단어 경계에 걸쳐 있는지 확인하여, 다른 단어의 일부(예: "전방위"의 "전방")는 버립니다.
+메시지마다 API를 호출하지 않으며, 종목 목록은 주기적으로 /symbols/names에서 받아 갱신합니다.
+(ETag를 사용하므로 종목 마스터가 바뀌지 않았으면 목록을 다시 받지 않습니다.)
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.common.utils.cache import register_cache
+from src.common.utils.http_client import get_api_client
+
+logger = logging.getLogger(__name__)
+
+API_HOST = os.getenv("API_HOST", "localhost")
+API_V1_URL = f"http://{API_HOST}:8000/api/v1"
+
+# 너무 짧은 이름은 일반 단어와 구분하기 어려우므로 인식하지 않음
+MIN_PATTERN_LENGTH = 2
+
+# 이 길이 이하의 한글 종목명은 일반 명사와 겹치는 경우가 많으므로 (예: 대상, 전방) 메시지의 첫 단어일 때만 인식
+SHORT_NAME_LENGTH = 2
+
+# 한글 종목명 바로 뒤에 붙여 써도 종목명으로 인식하는 조사와 말 (예: "삼성전자가", "삼성전자주가")
+NAME_SUFFIXES = frozenset({
+    "은", "는", "이", "가", "을", "를", "의", "도", "만", "에", "로", "으로", "와", "과", "랑", "이랑", "하고",
+    "에서", "까지", "부터", "보다", "처럼", "이나", "나", "요", "야", "이야", "주가", "주식",
+})
+
+_WHITESPACE = re.compile(r"\s+")
+_CODE = re.compile(r"\d{6}")
+_WORD_CHAR = re.compile(r"\w")
+
+
+def normalize(text: str) -> str:
+    """대소문자와 공백을 무시하고 비교하기 위해 정규화합니다."""
+    return _WHITESPACE.sub("", text).casefold()
+
+
+def _normalize_with_positions(text: str) -> Tuple[str, List[int]]:
+    """normalize()한 문자열과, 그 문자열의 각 글자가 원래 메시지에서 있던 위치를 반환합니다."""
+    chars, positions = [], []
+    for index, char in enumerate(text):
+        if char.isspace():
+            continue
+        folded = char.casefold()
+        chars.append(folded)
+        positions.extend([index] * len(folded))
+    return "".join(chars), positions
+
+
+def _char_class(char: str) -> Optional[str]:
+    """단어를 이루는 글자 종류 (한글, 영문, 숫자). 그 외 글자는 None"""
+    if "가" <= char <= "힣":
+        return "hangul"
+    if char.isascii() and char.isalpha():
+        return "latin"
+    if char.isdigit():
+        return "digit"
+    return None
+
+
+class AhoCorasick:
+    """
+    여러 패턴을 텍스트에서 한 번에 찾는 Aho-Corasick 오토마톤입니다.
+
+    Args:
+        patterns (Iterable[Tuple[str, Any]]): (패턴, 값) 목록. 같은 패턴이 여러 번 나오면 처음 값을 사용
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 노드에서 끝나는 패턴 (길이, 값)
+        self._output: List[Optional[Tuple[int, Any]]] = [None]
+        # 실패 링크를 따라갔을 때 처음 만나는, 패턴이 끝나는 노드 (-1이면 없음)
+        self._output_link: List[int] = [-1]
+        self.size = 0
+        for pattern, value in patterns:
+            self._add(pattern, value)
+        self._build_links()
+
+    def _add(self, pattern: str, value: Any):
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._output_link.append(-1)
+            node = next_node
+        if self._output[node] is None:
+            self._output[node] = (len(pattern), value)
+            self.size += 1
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                target = self._fail[child]
+                self._output_link[child] = target if self._output[target] is not None else self._output_link[target]
+                queue.append(child)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        텍스트에 나오는 모든 패턴을 찾습니다.
+
+        Returns:
+            Iterator[Tuple[int, int, Any]]: (시작 위치, 끝 위치(미포함), 값)
+        """
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            match_node = node if self._output[node] is not None else self._output_link[node]
+            while match_node > 0:
+                length, value = self._output[match_node]
+                yield index + 1 - length, index + 1, value
+                match_node = self._output_link[match_node]
+
+
+class StockNameMatcher:
+    """
+    메시지에서 종목명 또는 종목 코드를 찾습니다.
+
+    여러 종목이 나오면 가장 앞에 나온 것을, 같은 위치에서 시작하면 가장 긴 이름을 고릅니다.
+    (예: "삼성전자우 얼마야" → 삼성전자가 아닌 삼성전자우)
+    """
+
+    REFRESH_SECONDS = float(os.getenv("BOT_STOCK_MATCHER_REFRESH_SECONDS", "600"))
+    # 처음 목록을 받지 못했을 때 다시 시도하기까지 기다리는 시간 (그동안은 API 검색으로 대신함)
+    RETRY_SECONDS = 30
+
+    def __init__(self):
+        self._automaton: Optional[AhoCorasick] = None
+        self._stocks: Dict[str, Dict[str, str]] = {}
+        self._etag: Optional[str] = None
+        self._checked_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._stats = {"builds": 0, "not_modified": 0, "refresh_errors": 0, "lookups": 0, "matches": 0,
+                       "last_build_ms": 0.0, "last_built_at": None}
+        register_cache(self)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._automaton is not None
+
+    def build(self, rows: Iterable[Iterable[str]]) -> int:
+        """
+        (symbol, name, market) 목록으로 오토마톤을 새로 만듭니다.
+
+        Returns:
+            int: 인식할 수 있는 종목 수
+        """
+        started = time.perf_counter()
+        stocks = {}
+        patterns = []
+        for symbol, name, market in rows:
+            stocks[symbol] = {"symbol": symbol, "name": name, "market": market or ""}
+            patterns.append((symbol, symbol))
+            normalized_name = normalize(name or "")
+            if len(normalized_name) >= MIN_PATTERN_LENGTH:
+                patterns.append((normalized_name, symbol))
+        automaton = AhoCorasick(patterns)
+        self._automaton, self._stocks = automaton, stocks
+        self._stats["builds"] += 1
+        self._stats["last_build_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        self._stats["last_built_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        logger.info(f"[StockNameMatcher] {len(stocks)}개 종목으로 종목명 인식기 구성 ({self._stats['last_build_ms']}ms)")
+        return len(stocks)
+
+    async def refresh(self) -> bool:
+        """
+        API에서 종목 목록을 받아 오토마톤을 갱신합니다. 종목 마스터가 바뀌지 않았으면(304) 그대로 둡니다.
+
+        Returns:
+            bool: 갱신 후 인식기를 사용할 수 있는지 여부
+        """
+        self._checked_at = time.monotonic()
+        headers = {"If-None-Match": self._etag} if self._etag and self._automaton is not None else {}
+        try:
+            async with get_api_client() as client:
+                response = await client.get(f"{API_V1_URL}/symbols/names", headers=headers)
+            if response.status_code == 304:
+                self._stats["not_modified"] += 1
+            else:
+                response.raise_for_status()
+                self.build(response.json()["items"])
+                self._etag = response.headers.get("ETag")
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            logger.error(f"[StockNameMatcher] 종목 목록 갱신 실패: {e}")
+        return self.is_ready
+
+    async def _run_refresh(self) -> bool:
+        # 동시에 들어온 메시지들이 갱신 요청을 한 번만 보내도록 진행 중인 갱신을 공유
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self.refresh())
+        return await asyncio.shield(self._refresh_task)
+
+    async def ensure_fresh(self) -> bool:
+        """
+        인식기가 없으면 만들고, 갱신 주기가 지났으면 갱신합니다.
+        이미 인식기가 있으면 갱신은 뒤에서 진행하고 기존 인식기를 바로 사용합니다.
+
+        Returns:
+            bool: 인식기를 사용할 수 있는지 여부
+        """
+        if self._automaton is None:
+            refreshing = self._refresh_task is not None and not self._refresh_task.done()
+            if not refreshing and self._checked_at and time.monotonic() - self._checked_at < self.RETRY_SECONDS:
+                return False
+            return await self._run_refresh()
+        if time.monotonic() - self._checked_at >= self.REFRESH_SECONDS:
+            self._checked_at = time.monotonic()
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.ensure_future(self.refresh())
+        return True
+
+    async def warm_up(self, application=None):
+        """봇 시작 시 종목 목록을 미리 받아 둡니다. (Application.post_init 콜백)"""
+        await self.ensure_fresh()
+
+    def find(self, text: str) -> Optional[Dict[str, str]]:
+        """
+        메시지에서 종목을 찾습니다.
+
+        Args:
+            text (str): 사용자 메시지
+
+        Returns:
+            Optional[Dict[str, str]]: {"symbol", "name", "market"}. 찾지 못하면 None
+        """
+        automaton = self._automaton
+        if automaton is None:
+            return None
+        self._stats["lookups"] += 1
+        normalized, positions = _normalize_with_positions(text)
+        best = None
+        for start, end, symbol in automaton.iter_matches(normalized):
+            if best is not None and (start > best[0] or (start == best[0] and end <= best[1])):
+                continue
+            if self._is_standalone(text, positions[start], positions[end - 1] + 1, normalized[start:end] == symbol):
+                best = (start, end, symbol)
+        if best is None:
+            return None
+        self._stats["matches"] += 1
+        return dict(self._stocks[best[2]])
+
+    @staticmethod
+    def _is_standalone(text: str, start: int, end: int, is_code: bool) -> bool:
+        """
+        원래 메시지의 text[start:end]에서 찾은 이름/코드가 다른 단어의 일부가 아닌지 확인합니다.
+
+        - 코드: 공백 없이 붙어 있는 6자리 숫자이고, 앞뒤에 글자나 숫자가 붙어 있지 않아야 함 (natural.py의 6자리 코드 추출과 같은 기준)
+        - 이름: 앞뒤 글자가 이름의 첫/끝 글자와 같은 종류(한글, 영문, 숫자)이면 안 됨.
+          단, 한글 이름 뒤에는 조사 등(NAME_SUFFIXES)을 붙여 쓸 수 있음
+        - 짧은 한글 이름: 메시지의 첫 단어여야 함
+        """
+        before = text[start - 1] if start > 0 else ""
+        after = text[end] if end < len(text) else ""
+        if is_code:
+            return (_CODE.fullmatch(text, start, end) is not None
+                    and not _WORD_CHAR.match(before or " ") and not _WORD_CHAR.match(after or " "))
+
+        first_class, last_class = _char_class(text[start]), _char_class(text[end - 1])
+        if first_class and _char_class(before or " ") == first_class:
+            return False
+        if last_class and _char_class(after or " ") == last_class:
+            if last_class != "hangul":
+                return False
+            suffix_end = end
+            while suffix_end < len(text) and _char_class(text[suffix_end]) == "hangul":
+                suffix_end += 1
+            if text[end:suffix_end] not in NAME_SUFFIXES:
+                return False
+        name = normalize(text[start:end])
+        if len(name) <= SHORT_NAME_LENGTH and all(_char_class(char) == "hangul" for char in name):
+            return not text[:start].strip()
+        return True
+
+    def get(self, symbol: str) -> Optional[Dict[str, str]]:
+        """종목 코드로 종목 정보를 반환합니다. 모르는 코드면 None"""
+        stock = self._stocks.get(symbol)
+        return dict(stock) if stock else None
+
+    def invalidate(self):
+        """다음 ensure_fresh() 호출 시 곧바로 종목 목록 변경 여부를 확인하도록 합니다."""
+        self._checked_at = 0.0
+
+    def clear(self):
+        """인식기를 비웁니다. 다음 ensure_fresh() 호출 시 다시 만듭니다."""
+        self._automaton = None
+        self._stocks = {}
+        self._etag = None
+        self._checked_at = 0.0
+        self._refresh_task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "size": len(self._stocks),
+            "patterns": self._automaton.size if self._automaton else 0,
+            "ready": self.is_ready,
+        }
+
+
+# 싱글톤 인스턴스
+stock_name_matcher = StockNameMatcher()
@@ -0,0 +1,10 @@
+import pytest
+
+from src.common.utils.cache import clear_all_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 프로세스 내 캐시(등록 확인, 토큰 등)가 공유되지 않도록 매 테스트 전에 비웁니다."""
+    clear_all_caches()
+    yield
@@ -42,7 +42,7 @@ async def test_symbols_command_success_integration():
     context.args = []
 
     # Mock the internal API calls to control the response
-    with patch('src.bot.handlers.symbols._api_get_symbols', new_callable=AsyncMock) as mock_api_get_symbols:
+    with patch('src.bot.handlers.symbols._api_get_symbols_page', new_callable=AsyncMock) as mock_api_get_symbols:
         mock_api_get_symbols.return_value = {
             "items": [
                 {"symbol": "005930", "name": "삼성전자", "market": "KOSPI"},
@@ -53,7 +53,7 @@ async def test_symbols_command_success_integration():
 
         await symbols_command(update, context)
 
-        mock_api_get_symbols.assert_awaited_once_with(10, 0) # Assuming PAGE_SIZE is 10
+        mock_api_get_symbols.assert_awaited_once_with(10) # Assuming PAGE_SIZE is 10
         update.message.reply_text.assert_awaited_once()
         sent_text = update.message.reply_text.call_args[0][0]
         assert "[종목 목록]" in sent_text
@@ -76,7 +76,7 @@ async def test_symbols_command_no_symbols_found():
 
     mock_response_json = {"items": [], "total_count": 0}
 
-    with patch('src.bot.handlers.symbols._api_get_symbols', new_callable=AsyncMock) as mock_api_get_symbols:
+    with patch('src.bot.handlers.symbols._api_get_symbols_page', new_callable=AsyncMock) as mock_api_get_symbols:
         mock_api_get_symbols.return_value = mock_response_json
 
         await symbols_command(update, context)
@@ -99,7 +99,7 @@ async def test_symbols_command_api_error_integration():
     context.user_data = {}
     context.args = []
 
-    with patch('src.bot.handlers.symbols._api_get_symbols', new_callable=AsyncMock) as mock_api_get_symbols:
+    with patch('src.bot.handlers.symbols._api_get_symbols_page', new_callable=AsyncMock) as mock_api_get_symbols:
         mock_api_get_symbols.side_effect = httpx.HTTPStatusError(
             "Internal Server Error", request=httpx.Request("GET", API_URL),
             response=httpx.Response(500, request=httpx.Request("GET", API_URL))
@@ -107,5 +107,5 @@ async def test_symbols_command_api_error_integration():
 
         await symbols_command(update, context)
 
-        mock_api_get_symbols.assert_awaited_once_with(10, 0) # Assuming PAGE_SIZE is 10
+        mock_api_get_symbols.assert_awaited_once_with(10) # Assuming PAGE_SIZE is 10
         update.message.reply_text.assert_awaited_once_with("종목 목록 조회 실패: API 응답 코드 500")
@@ -1,10 +1,12 @@
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 
 from telegram import Update, Message
 from telegram.ext import ContextTypes
 
-from src.bot.handlers.alert import list_alerts, pause_alert, resume_alert
+from src.bot.handlers.alert import list_alerts, pause_alert, resume_alert, _api_get_symbol_names
+from src.common.schemas.stock_master import MAX_BATCH_SYMBOLS
 
 @pytest.fixture
 def mock_update_context():
@@ -27,43 +29,32 @@ def mock_update_context():
 @pytest.mark.asyncio
 @patch('src.bot.handlers.alert._api_get_price_alerts')
 @patch('src.bot.handlers.alert._api_get_disclosure_alerts')
-@patch('src.bot.handlers.alert._api_search_stocks')
-async def test_list_alerts_mixed_and_missing_name(mock_search_stocks, mock_get_disclosure_alerts, mock_get_price_alerts, mock_update_context):
+@patch('src.bot.handlers.alert._api_get_symbol_names')
+async def test_list_alerts_mixed_and_missing_name(mock_get_symbol_names, mock_get_disclosure_alerts, mock_get_price_alerts, mock_update_context):
     """
     Tests listing alerts with a mix of valid stock_names, missing stock_names (None),
-    and disclosure alerts to ensure all names are fetched and displayed correctly.
+    and disclosure alerts to ensure all missing names are fetched in one batch call.
     """
     update, context = mock_update_context
     
     mock_get_price_alerts.return_value = [
         # Case 1: stock_name is provided and valid
         {'id': 1, 'symbol': '005930', 'stock_name': '삼성전자', 'target_price': 80000, 'condition': 'gte', 'is_active': True},
-        # Case 2: stock_name is None, should be fetched via _api_search_stocks
+        # Case 2: stock_name is None, should be fetched via _api_get_symbol_names
         {'id': 2, 'symbol': '000660', 'stock_name': None, 'change_percent': 5, 'change_type': 'up', 'is_active': False}
     ]
     mock_get_disclosure_alerts.return_value = [
         # Case 3: Disclosure alert, name must be fetched
-        {'id': 3, 'symbol': '035720', 'is_active': True}
+        {'id': 3, 'symbol': '035720', 'is_active': True},
+        # Case 4: Disclosure alert for a symbol whose name is already known from a price alert
+        {'id': 4, 'symbol': '005930', 'is_active': True}
     ]
-
-    # Mock the search API to return names for symbols that need fetching
-    def search_side_effect(symbol, auth_token):
-        if symbol == '000660':
-            return {'items': [{'name': 'SK하이닉스'}]}
-        if symbol == '035720':
-            return {'items': [{'name': '카카오'}]}
-        return {'items': []}
-    
-    mock_search_stocks.side_effect = search_side_effect
+    mock_get_symbol_names.return_value = {'000660': 'SK하이닉스', '035720': '카카오'}
 
     await list_alerts(update, context)
 
-    # Verify that search was called only for the symbols that needed it
-    mock_search_stocks.assert_has_calls([
-        call('000660', 'test_token'),
-        call('035720', 'test_token')
-    ], any_order=True)
-    assert mock_search_stocks.call_count == 2
+    # Names are resolved with a single batch request, only for symbols without a name
+    mock_get_symbol_names.assert_awaited_once_with(['000660', '035720'], 'test_token')
 
     # Verify the final output message
     reply_text = update.effective_message.reply_text.call_args.kwargs['text']
@@ -72,6 +63,70 @@ async def test_list_alerts_mixed_and_missing_name(mock_search_stocks, mock_get_d
     assert "1. 삼성전자 (005930) - 80,000원 이상 (활성)" in reply_text
     assert "2. SK하이닉스 (000660) - 5% 상승 시 (비활성)" in reply_text
     assert "3. 카카오 (035720) (활성)" in reply_text
+    assert "4. 삼성전자 (005930) (활성)" in reply_text
+
+@pytest.mark.asyncio
+@patch('src.bot.handlers.alert._api_get_price_alerts')
+@patch('src.bot.handlers.alert._api_get_disclosure_alerts')
+@patch('src.bot.handlers.alert._api_get_symbol_names')
+async def test_list_alerts_unknown_symbol_and_no_lookup(mock_get_symbol_names, mock_get_disclosure_alerts, mock_get_price_alerts, mock_update_context):
+    """Symbols missing from the batch response fall back to the code; no lookup when every name is known."""
+    update, context = mock_update_context
+    mock_get_price_alerts.return_value = []
+    mock_get_disclosure_alerts.return_value = [{'id': 1, 'symbol': '999999', 'is_active': True}]
+    mock_get_symbol_names.return_value = {}
+
+    await list_alerts(update, context)
+
+    reply_text = update.effective_message.reply_text.call_args.kwargs['text']
+    assert "1. 999999 (999999) (활성)" in reply_text
+
+    mock_get_symbol_names.reset_mock()
+    mock_get_price_alerts.return_value = [
+        {'id': 1, 'symbol': '005930', 'stock_name': '삼성전자', 'target_price': 80000, 'condition': 'gte', 'is_active': True}
+    ]
+    mock_get_disclosure_alerts.return_value = []
+
+    await list_alerts(update, context)
+
+    mock_get_symbol_names.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_api_get_symbol_names_splits_requests_by_batch_limit():
+    """Name lookups above MAX_BATCH_SYMBOLS are split into several /symbols/batch requests."""
+    symbols = [f"{i:06d}" for i in range(MAX_BATCH_SYMBOLS * 2 + 1)]
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+
+    async def get(url, params):
+        codes = params["codes"].split(",")
+        response = MagicMock()
+        response.json.return_value = {"items": [{"symbol": code, "name": f"종목{code}"} for code in codes]}
+        return response
+
+    client.get.side_effect = get
+    with patch('src.bot.handlers.alert.get_api_client', return_value=client):
+        names = await _api_get_symbol_names(symbols, 'test_token')
+
+    assert [len(c.kwargs["params"]["codes"].split(",")) for c in client.get.await_args_list] == [MAX_BATCH_SYMBOLS, MAX_BATCH_SYMBOLS, 1]
+    assert names == {code: f"종목{code}" for code in symbols}
+
+@pytest.mark.asyncio
+@patch('src.bot.handlers.alert._api_get_price_alerts')
+@patch('src.bot.handlers.alert._api_get_disclosure_alerts')
+@patch('src.bot.handlers.alert._api_get_symbol_names')
+async def test_list_alerts_shows_codes_when_name_lookup_fails(mock_get_symbol_names, mock_get_disclosure_alerts, mock_get_price_alerts, mock_update_context):
+    """A failed name lookup still lists the alerts, using the symbol codes as names."""
+    update, context = mock_update_context
+    mock_get_price_alerts.return_value = []
+    mock_get_disclosure_alerts.return_value = [{'id': 1, 'symbol': '035720', 'is_active': True}]
+    mock_get_symbol_names.side_effect = httpx.HTTPStatusError("400", request=MagicMock(), response=MagicMock())
+
+    await list_alerts(update, context)
+
+    reply_text = update.effective_message.reply_text.call_args.kwargs['text']
+    assert "1. 035720 (035720) (활성)" in reply_text
+    assert context.user_data['alert_map'] == {'1': {'id': 1, 'type': 'disclosure', 'is_active': True}}
 
 @pytest.mark.asyncio
 @patch('src.bot.handlers.alert._api_update_price_alert_status')
@@ -10,6 +10,7 @@ from src.bot.handlers.admin import (
     admin_show_schedules,
     admin_trigger_job,
     admin_stats,
+    admin_cache_stats,
     admin_only,
     get_auth_token,
     trigger_job_callback,
@@ -260,7 +261,7 @@ async def test_admin_update_historical_prices_all_stocks_success(mock_http_post,
 @pytest.mark.asyncio
 @patch('src.bot.handlers.admin.ADMIN_ID', "12345")
 @patch('src.bot.handlers.admin.get_auth_token', new_callable=AsyncMock, return_value="fake_token")
-@patch('src.bot.decorators.get_retry_client') # Patch the get_retry_client function
+@patch('src.bot.decorators.get_api_client') # Patch the get_retry_client function
 @patch('src.bot.handlers.admin.API_V1_URL', "http://localhost:8000/api/v1") # Patch API_V1_URL
 async def test_admin_update_historical_prices_invalid_date_format(mock_get_retry_client, mock_get_auth_token, mock_update_context):
     update, context = mock_update_context
@@ -371,4 +372,20 @@ async def test_admin_update_historical_prices_missing_token(mock_http_post, mock
     context.bot.send_message.assert_any_await(
         chat_id=chat_id, text="❌ 인증 토큰 발급에 실패했습니다."
     )
-    mock_http_post.assert_not_awaited()
\ No newline at end of file
+    mock_http_post.assert_not_awaited()
+
+@pytest.mark.asyncio
+@patch('src.bot.handlers.admin.ADMIN_ID', "12345") # MOCK: ADMIN_ID 환경 변수
+async def test_admin_cache_stats(mock_update_context):
+    update, context = mock_update_context
+    # MOCK: 검색 결과 캐시 통계
+    with patch('src.bot.handlers.admin.search_result_cache.get_stats', return_value={
+        "size": 12, "maxsize": 1000, "ttl": 300.0, "hits": 30, "misses": 10, "hit_rate": 0.75,
+        "prefetches": 8, "prefetch_errors": 0,
+    }):
+        await admin_cache_stats(update, context)
+
+    context.bot.send_message.assert_awaited_once()
+    sent_text = context.bot.send_message.call_args[1]['text']
+    assert "페이지 수: 12/1000" in sent_text
+    assert "적중률: 75.0%" in sent_text
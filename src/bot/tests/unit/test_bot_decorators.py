@@ -0,0 +1,140 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from jose import jwt
+
+from src.bot import decorators
+from src.bot.decorators import discard_token, ensure_user_registered, forget_user
+
+
+def make_token(expires_in: float) -> str:
+    return jwt.encode({"sub": "tg_12345", "exp": int(time.time() + expires_in)}, "secret", algorithm="HS256")
+
+
+def make_response(status_code=200, json_data=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    response.text = ""
+    return response
+
+
+@pytest.fixture
+def mock_client():
+    # MOCK: 공용 API 클라이언트 (get_api_client가 반환하는 컨텍스트 매니저)
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = False
+    client.put.return_value = make_response(200)
+    with patch('src.bot.decorators.get_api_client', return_value=client):
+        yield client
+
+
+@pytest.fixture
+def update_context():
+    update = MagicMock()
+    update.effective_user.id = 12345
+    context = MagicMock()
+    context.user_data = {}
+    return update, context
+
+
+@ensure_user_registered
+async def handler(update, context):
+    return context.user_data.get('auth_token')
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', None)
+async def test_token_is_reused_until_refresh(mock_client, update_context):
+    """처음 한 번만 등록/로그인하고, 이후 명령은 캐시된 토큰을 사용하는지 테스트합니다."""
+    token = make_token(1800)
+    mock_client.post.return_value = make_response(200, {"access_token": token})
+    update, context = update_context
+
+    for _ in range(3):
+        assert await handler(update, context) == token
+
+    mock_client.put.assert_awaited_once()
+    mock_client.post.assert_awaited_once()
+    assert "users/login" in mock_client.post.await_args.args[0]
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', None)
+@patch('src.bot.decorators.TOKEN_REFRESH_MARGIN_SECONDS', 60)
+async def test_token_near_expiry_is_refreshed_without_registering_again(mock_client, update_context):
+    """만료가 가까운 토큰은 캐시하지 않고 다시 발급받되, 등록 확인은 반복하지 않는지 테스트합니다."""
+    expiring, fresh = make_token(30), make_token(1800)
+    mock_client.post.side_effect = [make_response(200, {"access_token": expiring}), make_response(200, {"access_token": fresh})]
+    update, context = update_context
+
+    assert await handler(update, context) == expiring
+    assert await handler(update, context) == fresh
+
+    mock_client.put.assert_awaited_once()
+    assert mock_client.post.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', "bot-secret")
+async def test_token_from_bot_secret_key_flow(mock_client, update_context):
+    """BOT_SECRET_KEY가 있으면 로그인 대신 /auth/bot/token으로 토큰을 발급받는지 테스트합니다."""
+    token = make_token(1800)
+    mock_client.post.return_value = make_response(200, {"access_token": token})
+    update, context = update_context
+
+    assert await handler(update, context) == token
+
+    url = mock_client.post.await_args.args[0]
+    assert url.endswith("/auth/bot/token")
+    assert mock_client.post.await_args.kwargs["headers"] == {"X-Bot-Secret-Key": "bot-secret"}
+    assert mock_client.post.await_args.kwargs["json"] == {"telegram_id": 12345}
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', None)
+async def test_forget_user_registers_again(mock_client, update_context):
+    """forget_user 이후에는 다시 등록을 확인하고 토큰을 발급받는지 테스트합니다."""
+    mock_client.post.return_value = make_response(200, {"access_token": make_token(1800)})
+    update, context = update_context
+
+    await handler(update, context)
+    forget_user(12345)
+    await handler(update, context)
+
+    assert mock_client.put.await_count == 2
+    assert mock_client.post.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', None)
+async def test_failed_token_is_not_cached(mock_client, update_context):
+    """토큰 발급에 실패하면 캐시하지 않고 다음 명령에서 다시 시도하는지 테스트합니다."""
+    mock_client.post.side_effect = [make_response(401), make_response(200, {"access_token": make_token(1800)})]
+    update, context = update_context
+
+    assert await handler(update, context) is None
+    assert await handler(update, context) is not None
+    assert mock_client.put.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch('src.bot.decorators.BOT_SECRET_KEY', None)
+async def test_rejected_token_is_discarded(mock_client, update_context):
+    """API가 401로 거부한 토큰은 만료 전이라도 버리고 다음 명령에서 새로 발급받는지 테스트합니다."""
+    old_token, new_token = make_token(1800), make_token(1799)
+    mock_client.post.side_effect = [
+        make_response(200, {"access_token": old_token}), make_response(200, {"access_token": new_token})
+    ]
+    update, context = update_context
+
+    assert await handler(update, context) == old_token
+    discard_token("unknown-token")  # 캐시에 없는 토큰은 무시
+    assert await handler(update, context) == old_token
+
+    discard_token(old_token)
+    assert await handler(update, context) == new_token
+    assert await handler(update, context) == new_token
+    mock_client.put.assert_awaited_once()
+    assert mock_client.post.await_count == 2
@@ -9,9 +9,9 @@ from src.bot.handlers.history import API_URL
 
 @pytest.fixture
 def mock_get_retry_client():
-    # MOCK: src.bot.handlers.history.get_retry_client
+    # MOCK: src.bot.handlers.history.get_api_client
     # get_retry_client 함수를 모의하여 실제 HTTP 요청을 보내지 않도록 합니다.
-    with patch('src.bot.handlers.history.get_retry_client') as mock_client:
+    with patch('src.bot.handlers.history.get_api_client') as mock_client:
         # AsyncMock: 비동기 컨텍스트 매니저인 get_retry_client의 반환값을 모의합니다.
         async_mock_client = AsyncMock()
         # AsyncMock: httpx.AsyncClient의 get/post 등 비동기 메서드를 모의합니다.
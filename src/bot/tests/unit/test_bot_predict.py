@@ -7,7 +7,7 @@ from src.bot.handlers.predict import predict_command
 import os
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.predict.get_retry_client')
+@patch('src.bot.handlers.predict.get_api_client')
 @patch('src.bot.handlers.predict.StockMasterService')
 @patch('src.bot.handlers.predict.get_db')
 @patch('src.bot.handlers.predict._api_search_symbols') # Mock _api_search_symbols
@@ -46,14 +46,15 @@ async def test_predict_command_with_stock_name(mock_api_search, mock_get_db, moc
     mock_api_search.assert_awaited_once_with("한화오션", 10, 0)
     mock_client.post.assert_awaited_once_with(
         f"http://{os.getenv('API_HOST', 'localhost')}:8000/api/v1/predict",
-        json={"symbol": "042600", "telegram_id": "12345"}
+        json={"symbol": "042600", "telegram_id": "12345"},
+        coalesce=True
     )
     update.message.reply_text.assert_awaited_once_with(
         "[예측 결과] 한화오션(042600): 상승\n사유: 실적 개선"
     )
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.predict.get_retry_client')
+@patch('src.bot.handlers.predict.get_api_client')
 @patch('src.bot.handlers.predict.StockMasterService')
 @patch('src.bot.handlers.predict.get_db')
 async def test_predict_command_success_with_symbol(mock_get_db, mock_stock_master_service, mock_get_retry_client):
@@ -95,7 +96,8 @@ async def test_predict_command_success_with_symbol(mock_get_db, mock_stock_maste
     mock_get_retry_client.assert_called_once()
     mock_client.post.assert_awaited_once_with(
         f"http://{os.getenv('API_HOST', 'localhost')}:8000/api/v1/predict",
-        json={"symbol": "005930", "telegram_id": "12345"}
+        json={"symbol": "005930", "telegram_id": "12345"},
+        coalesce=True
     )
     update.message.reply_text.assert_awaited_once_with(
         "[예측 결과] 삼성전자(005930): 상승\n사유: 기술적 지표 분석 결과"
@@ -119,7 +121,7 @@ async def test_predict_command_no_symbol():
     )
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.predict.get_retry_client')
+@patch('src.bot.handlers.predict.get_api_client')
 @patch('src.bot.handlers.predict.StockMasterService')
 @patch('src.bot.handlers.predict.get_db')
 async def test_predict_command_api_error(mock_get_db, mock_stock_master_service, mock_get_retry_client):
@@ -162,7 +164,7 @@ async def test_predict_command_api_error(mock_get_db, mock_stock_master_service,
     )
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.predict.get_retry_client')
+@patch('src.bot.handlers.predict.get_api_client')
 @patch('src.bot.handlers.predict.StockMasterService')
 @patch('src.bot.handlers.predict.get_db')
 async def test_predict_command_network_error(mock_get_db, mock_stock_master_service, mock_get_retry_client):
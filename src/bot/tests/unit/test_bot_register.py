@@ -6,7 +6,7 @@ from telegram.ext import ContextTypes
 from src.bot.handlers.register import register_command, unregister_command
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.register.get_retry_client') # MOCK: get_retry_client 함수
+@patch('src.bot.handlers.register.get_api_client') # MOCK: get_retry_client 함수
 async def test_register_command_success(mock_get_retry_client):
     """/register 명령어 성공 테스트"""
     # Given
@@ -48,7 +48,7 @@ async def test_register_command_success(mock_get_retry_client):
     update.message.reply_text.assert_awaited_once_with("알림 등록이 완료되었습니다. 이제부터 주가 알림을 받을 수 있습니다.")
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.register.get_retry_client') # MOCK: get_retry_client 함수
+@patch('src.bot.handlers.register.get_api_client') # MOCK: get_retry_client 함수
 async def test_unregister_command_success(mock_get_retry_client):
     """/unregister 명령어 성공 테스트"""
     # Given
@@ -90,7 +90,7 @@ async def test_unregister_command_success(mock_get_retry_client):
     update.message.reply_text.assert_awaited_once_with("알림을 비활성화했습니다. 더 이상 주가 알림을 받지 않습니다.")
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.register.get_retry_client') # MOCK: get_retry_client 함수
+@patch('src.bot.handlers.register.get_api_client') # MOCK: get_retry_client 함수
 async def test_register_command_api_error(mock_get_retry_client):
     """/register 명령어 API 오류 테스트"""
     # Given
@@ -8,6 +8,7 @@ from src.bot.handlers import symbols # Import the symbols module to access PAGE_
 from src.bot.handlers.symbols import (
     symbols_command,
     symbols_pagination_callback,
+    symbols_cursor_callback,
     symbols_search_command,
     symbols_search_pagination_callback,
     symbol_info_command,
@@ -37,7 +38,7 @@ def mock_update_context():
     return update, context
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.symbols._api_get_symbols') # MOCK: _api_get_symbols 함수
+@patch('src.bot.handlers.symbols._api_get_symbols_page') # MOCK: _api_get_symbols_page 함수
 async def test_symbols_command_success(mock_api_call, mock_update_context):
     """/symbols 명령어 성공 테스트 (인자 없음)."""
     update, context = mock_update_context
@@ -54,7 +55,7 @@ async def test_symbols_command_success(mock_api_call, mock_update_context):
     await symbols_command(update, context)
 
     # mock_api_call (AsyncMock)이 올바른 인자로 한 번 호출되었는지 확인합니다.
-    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE, 0)
+    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE)
     # update.message.reply_text (AsyncMock)가 한 번 호출되었는지 확인합니다.
     update.message.reply_text.assert_awaited_once()
     sent_text = update.message.reply_text.call_args[0][0]
@@ -62,7 +63,7 @@ async def test_symbols_command_success(mock_api_call, mock_update_context):
     assert "총 2개" in sent_text
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.symbols._api_get_symbols') # MOCK: _api_get_symbols 함수
+@patch('src.bot.handlers.symbols._api_get_symbols_page') # MOCK: _api_get_symbols_page 함수
 async def test_symbols_command_no_symbols(mock_api_call, mock_update_context):
     """종목이 반환되지 않을 때 /symbols 명령어 테스트."""
     update, context = mock_update_context
@@ -73,12 +74,12 @@ async def test_symbols_command_no_symbols(mock_api_call, mock_update_context):
     await symbols_command(update, context)
 
     # mock_api_call (AsyncMock)이 올바른 인자로 한 번 호출되었는지 확인합니다。
-    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE, 0)
+    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE)
     # update.message.reply_text (AsyncMock)가 올바른 인자로 한 번 호출되었는지 확인합니다。
     update.message.reply_text.assert_awaited_once_with("등록된 종목이 없습니다.", reply_markup=None)
 
 @pytest.mark.asyncio
-@patch('src.bot.handlers.symbols._api_get_symbols', side_effect=httpx.HTTPStatusError("Error", request=MagicMock(), response=MagicMock(status_code=500))) # MOCK: _api_get_symbols 함수
+@patch('src.bot.handlers.symbols._api_get_symbols_page', side_effect=httpx.HTTPStatusError("Error", request=MagicMock(), response=MagicMock(status_code=500))) # MOCK: _api_get_symbols_page 함수
 async def test_symbols_command_api_error(mock_api_call, mock_update_context):
     """API가 오류를 반환할 때 /symbols 명령어 테스트."""
     update, context = mock_update_context
@@ -87,7 +88,7 @@ async def test_symbols_command_api_error(mock_api_call, mock_update_context):
     await symbols_command(update, context)
 
     # mock_api_call (AsyncMock)이 올바른 인자로 한 번 호출되었는지 확인합니다。
-    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE, 0)
+    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE)
     # update.message.reply_text (AsyncMock)가 올바른 인자로 한 번 호출되었는지 확인합니다。
     update.message.reply_text.assert_awaited_once_with("종목 목록 조회 실패: API 응답 코드 500")
 
@@ -330,3 +331,41 @@ async def test_symbol_info_callback_calls_symbols_search_command(mock_symbols_se
     assert context.args == ["005930"]
     # update.callback_query.answer (AsyncMock)가 한 번 호출되었는지 확인합니다.
     update.callback_query.answer.assert_awaited_once()
+
+@pytest.mark.asyncio
+@patch('src.bot.handlers.symbols._api_get_symbols_page') # MOCK: _api_get_symbols_page 함수
+async def test_symbols_cursor_callback_success(mock_api_call, mock_update_context):
+    """커서 기반 페이지네이션 콜백 성공 테스트 (맨뒤 버튼)."""
+    update, context = mock_update_context
+    update.callback_query.data = "symbols_cur:3:LAST"
+    mock_api_call.return_value = {
+        "items": [{"symbol": "000021", "name": "종목21"}],
+        "next_cursor": None,
+        "prev_cursor": "PREV",
+        "last_cursor": "LAST",
+        "total_count": 21
+    }
+
+    await symbols_cursor_callback(update, context)
+
+    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE, "LAST")
+    sent_text = update.callback_query.edit_message_text.call_args[0][0]
+    assert "페이지: 3/3" in sent_text
+    reply_markup = update.callback_query.edit_message_text.call_args[1]["reply_markup"]
+    pagination_row = reply_markup.inline_keyboard[-1]
+    assert [b.callback_data for b in pagination_row] == ["symbols_cur:1:", "symbols_cur:2:PREV"]
+
+@pytest.mark.asyncio
+@patch('src.bot.handlers.symbols._api_get_symbols_page') # MOCK: _api_get_symbols_page 함수
+async def test_symbols_cursor_callback_first_page(mock_api_call, mock_update_context):
+    """빈 커서는 첫 페이지를 조회합니다."""
+    update, context = mock_update_context
+    update.callback_query.data = "symbols_cur:1:"
+    mock_api_call.return_value = {"items": [{"symbol": "000001", "name": "종목1"}], "next_cursor": "NEXT", "prev_cursor": None, "last_cursor": "LAST", "total_count": 21}
+
+    await symbols_cursor_callback(update, context)
+
+    mock_api_call.assert_awaited_once_with(symbols.PAGE_SIZE, None)
+    reply_markup = update.callback_query.edit_message_text.call_args[1]["reply_markup"]
+    assert [b.callback_data for b in reply_markup.inline_keyboard[-1]] == ["symbols_cur:2:NEXT", "symbols_cur:3:LAST"]
+
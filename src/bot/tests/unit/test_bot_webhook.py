@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from telegram import Bot, Update
+
+from src.bot.update_processor import PerUserUpdateProcessor
+from src.bot.webhook import build_webhook_app
+
+
+def make_update_json(update_id: int, user_id: int, text: str = "hi"):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id, "date": 0, "text": text,
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "user"},
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_per_user_processor_keeps_user_order_and_runs_users_concurrently():
+    """같은 사용자의 업데이트는 순서대로, 다른 사용자의 업데이트는 동시에 처리하는지 테스트합니다."""
+    bot = Bot("123:TEST")
+    processor = PerUserUpdateProcessor(max_concurrent_updates=2)
+    events = []
+
+    async def handle(name: str, delay: float):
+        events.append(("start", name))
+        await asyncio.sleep(delay)
+        events.append(("end", name))
+
+    updates = {
+        "a1": Update.de_json(make_update_json(1, 1), bot),
+        "a2": Update.de_json(make_update_json(2, 1), bot),
+        "b1": Update.de_json(make_update_json(3, 2), bot),
+    }
+    await asyncio.gather(
+        processor.process_update(updates["a1"], handle("a1", 0.05)),
+        processor.process_update(updates["a2"], handle("a2", 0)),
+        processor.process_update(updates["b1"], handle("b1", 0)),
+    )
+
+    # a2는 a1이 끝난 뒤에 시작하고, b1은 a1이 끝나기 전에 처리됨
+    assert events.index(("start", "a2")) > events.index(("end", "a1"))
+    assert events.index(("end", "b1")) < events.index(("end", "a1"))
+    stats = processor.get_stats()
+    assert stats["processed"] == 3
+    assert stats["max_running"] <= 2
+    # 처리가 끝난 사용자의 잠금은 남지 않음
+    assert processor._locks == {}
+
+
+@pytest.mark.asyncio
+async def test_per_user_processor_limits_running_updates():
+    processor = PerUserUpdateProcessor(max_concurrent_updates=3)
+    running = 0
+    peak = 0
+
+    async def handle():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    # 사용자 정보가 없는 업데이트는 순서 제한 없이 실행 슬롯만 사용
+    await asyncio.gather(*[processor.process_update(object(), handle()) for _ in range(10)])
+    assert peak == 3
+
+
+def test_webhook_app_enqueues_updates_and_checks_secret():
+    application = SimpleNamespace(bot=Bot("123:TEST"), update_queue=asyncio.Queue())
+    client = TestClient(build_webhook_app(application, "/telegram/webhook", secret_token="s3cret"))
+
+    rejected = client.post("/telegram/webhook", json=make_update_json(1, 7))
+    accepted = client.post("/telegram/webhook", json=make_update_json(2, 7),
+                           headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret"})
+    invalid = client.post("/telegram/webhook", content=b"not json",
+                          headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret"})
+
+    assert rejected.status_code == 403
+    assert accepted.status_code == 200
+    assert invalid.status_code == 400
+    assert application.update_queue.qsize() == 1
+    update = application.update_queue.get_nowait()
+    assert update.update_id == 2
+    assert update.effective_user.id == 7
+    assert client.get("/health").json() == {"status": "ok", "pending_updates": 0}
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.bot.handlers import symbols
+from src.bot.search_cache import SearchResultCache, search_result_cache
+
+
+def search_page(offset, total_count=25):
+    return {"items": [{"symbol": f"{offset:06d}", "name": f"종목{offset}"}], "total_count": total_count}
+
+
+@pytest.mark.asyncio
+async def test_page_flip_is_served_from_prefetched_page():
+    """첫 페이지를 보여줄 때 다음 페이지를 미리 받아, 다음 페이지 요청은 API를 호출하지 않는지 테스트합니다."""
+    before = search_result_cache.get_stats()
+    fetch = AsyncMock(side_effect=lambda query, limit, offset, auth_token=None: search_page(offset))
+    with patch('src.bot.handlers.symbols._fetch_search_symbols', fetch):
+        first = await symbols._api_search_symbols("삼성", 10, 0)
+        await asyncio.sleep(0)  # 미리 받기 작업 실행
+        second = await symbols._api_search_symbols("삼성", 10, 10)
+        again = await symbols._api_search_symbols("삼성", 10, 0)
+        await asyncio.sleep(0)
+
+    assert first == again == search_page(0)
+    assert second == search_page(10)
+    # 0, 10 (미리 받기), 20 (두 번째 페이지를 보여줄 때 미리 받기). 마지막 페이지 다음은 받지 않음
+    assert [c.args[2] for c in fetch.await_args_list] == [0, 10, 20]
+    stats = search_result_cache.get_stats()
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["hits"] - before["hits"] == 2
+    assert stats["prefetches"] - before["prefetches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch_and_errors_are_not_cached():
+    cache = SearchResultCache(maxsize=2, ttl=60, prefetch=False)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_fetch():
+        started.set()
+        await release.wait()
+        return {"items": []}
+
+    first = asyncio.ensure_future(cache.get_or_fetch(("search", "a", 0, 10), slow_fetch))
+    await started.wait()
+    second = asyncio.ensure_future(cache.get_or_fetch(("search", "a", 0, 10), AsyncMock()))
+    release.set()
+    assert await first == await second == {"items": []}
+
+    failing = AsyncMock(side_effect=RuntimeError("api down"))
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(("search", "b", 0, 10), failing)
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(("search", "b", 0, 10), failing)
+    assert failing.await_count == 2
+
+    # 최대 크기를 넘으면 오래된 페이지부터 제거
+    for key in range(3):
+        await cache.get_or_fetch(("symbols", key, 10), AsyncMock(return_value={}))
+    assert cache.get_stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_waiter_fetches_again_when_leading_fetch_is_cancelled():
+    """먼저 받던 요청(미리 받기 포함)이 취소되어도 기다리던 요청이 직접 받아 결과를 반환하는지 테스트합니다."""
+    cache = SearchResultCache(maxsize=2, ttl=60, prefetch=False)
+    started = asyncio.Event()
+
+    async def hanging_fetch():
+        started.set()
+        await asyncio.sleep(10)
+
+    leader = asyncio.ensure_future(cache.get_or_fetch(("search", "a", 0, 10), hanging_fetch))
+    await started.wait()
+    waiter = asyncio.ensure_future(cache.get_or_fetch(("search", "a", 0, 10), AsyncMock(return_value={"items": []})))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == {"items": []}
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await cache.get_or_fetch(("search", "a", 0, 10), AsyncMock()) == {"items": []}
@@ -0,0 +1,145 @@
+import random
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bot.handlers.natural import natural_message_handler
+from src.bot.stock_name_matcher import AhoCorasick, stock_name_matcher
+
+ROWS = [
+    ["005930", "삼성전자", "KOSPI"],
+    ["005935", "삼성전자우", "KOSPI"],
+    ["000660", "SK하이닉스", "KOSPI"],
+    ["035720", "카카오", "KOSPI"],
+    ["323410", "카카오뱅크", "KOSPI"],
+    ["030200", "KT", "KOSPI"],
+    ["999990", "A", "KOSDAQ"],
+    ["034730", "SK", "KOSPI"],
+    ["001680", "대상", "KOSPI"],
+    ["000950", "전방", "KOSPI"],
+    ["000020", "동화약품", "KOSPI"],
+]
+
+
+def make_response(status_code=200, json_data=None, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+@pytest.fixture
+def mock_client():
+    # MOCK: 공용 API 클라이언트 (get_api_client가 반환하는 컨텍스트 매니저)
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.__aexit__.return_value = False
+    with patch('src.bot.stock_name_matcher.get_api_client', return_value=client), \
+         patch('src.bot.handlers.natural.get_api_client', return_value=client):
+        yield client
+
+
+def test_aho_corasick_matches_brute_force():
+    """오토마톤이 찾은 매칭이 모든 위치를 직접 비교한 결과와 같은지 테스트합니다."""
+    rng = random.Random(0)
+    patterns = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(30)}
+    automaton = AhoCorasick((p, p) for p in patterns)
+    for _ in range(50):
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        expected = {(i, i + len(p), p) for p in patterns for i in range(len(text)) if text.startswith(p, i)}
+        assert set(automaton.iter_matches(text)) == expected
+
+
+def test_find_prefers_leftmost_longest_name():
+    stock_name_matcher.build(ROWS)
+
+    assert stock_name_matcher.find("삼성전자우 얼마야")["symbol"] == "005935"
+    assert stock_name_matcher.find("삼성 전자 예측해줘")["symbol"] == "005930"
+    assert stock_name_matcher.find("sk하이닉스랑 카카오뱅크")["symbol"] == "000660"
+    assert stock_name_matcher.find("카카오뱅크 어때")["name"] == "카카오뱅크"
+    assert stock_name_matcher.find("kt 가격")["symbol"] == "030200"
+    assert stock_name_matcher.find("323410") == {"symbol": "323410", "name": "카카오뱅크", "market": "KOSPI"}
+    # 한 글자 이름은 인식하지 않음
+    assert stock_name_matcher.find("A 얼마") is None
+    assert stock_name_matcher.find("오늘 날씨 어때") is None
+
+
+@pytest.mark.parametrize("text", [
+    "task 알려줘",          # SK: 영문 단어의 일부
+    "대상승 할까?",         # 대상: 한글 단어의 일부
+    "예측 대상 종목 알려줘",  # 대상: 첫 단어가 아닌 짧은 한글 이름 (일반 명사)
+    "전방위 규제",          # 전방: 한글 단어의 일부
+    "가격 10000020원",      # 000020: 더 긴 숫자의 일부
+    "000 020 얼마",         # 000020: 공백으로 나뉜 숫자
+])
+def test_find_ignores_names_inside_other_words(text):
+    stock_name_matcher.build(ROWS)
+
+    assert stock_name_matcher.find(text) is None
+
+
+def test_find_accepts_standalone_names_and_particles():
+    stock_name_matcher.build(ROWS)
+
+    assert stock_name_matcher.find("SK 주가 알려줘")["symbol"] == "034730"
+    assert stock_name_matcher.find("sk하이닉스 얼마야")["symbol"] == "000660"
+    assert stock_name_matcher.find("대상 예측해줘")["symbol"] == "001680"
+    assert stock_name_matcher.find("대상이 오를까?")["symbol"] == "001680"
+    assert stock_name_matcher.find("오늘 삼성전자가 얼마야")["symbol"] == "005930"
+    assert stock_name_matcher.find("삼성전자주가 알려줘")["symbol"] == "005930"
+    assert stock_name_matcher.find("000020 가격")["symbol"] == "000020"
+    assert stock_name_matcher.find("코드 000020, 알려줘")["symbol"] == "000020"
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_etag(mock_client):
+    """처음에는 전체 목록을 받고, 이후에는 If-None-Match로 변경 여부만 확인하는지 테스트합니다."""
+    builds = stock_name_matcher.get_stats()["builds"]
+    not_modified = stock_name_matcher.get_stats()["not_modified"]
+    mock_client.get.return_value = make_response(200, {"items": ROWS}, etag='"7-1"')
+    assert await stock_name_matcher.ensure_fresh() is True
+    assert stock_name_matcher.get_stats()["size"] == len(ROWS)
+
+    mock_client.get.return_value = make_response(304)
+    stock_name_matcher.invalidate()
+    assert await stock_name_matcher.refresh() is True
+
+    assert mock_client.get.await_args.kwargs["headers"] == {"If-None-Match": '"7-1"'}
+    stats = stock_name_matcher.get_stats()
+    assert stats["builds"] == builds + 1
+    assert stats["not_modified"] == not_modified + 1
+
+
+@pytest.mark.asyncio
+async def test_natural_handler_detail_without_api_calls(mock_client):
+    """인식기가 준비되어 있으면 종목 상세 안내에 API를 호출하지 않는지 테스트합니다."""
+    stock_name_matcher.build(ROWS)
+    stock_name_matcher._checked_at = float("inf")  # 갱신 주기가 지나지 않은 상태
+    update = MagicMock()
+    update.message.text = "카카오 정보 알려줘"
+    update.message.reply_text = AsyncMock()
+
+    await natural_message_handler(update, MagicMock())
+
+    mock_client.get.assert_not_called()
+    reply = update.message.reply_text.await_args.args[0]
+    assert "코드: 035720" in reply
+    assert "이름: 카카오" in reply
+
+
+@pytest.mark.asyncio
+async def test_natural_handler_falls_back_to_api_search(mock_client):
+    """종목 목록을 받지 못했으면 API 검색으로 종목을 찾는지 테스트합니다."""
+    failed = make_response(500)  # 종목 목록 조회 실패
+    failed.raise_for_status.side_effect = Exception("500")
+    found = make_response(200, {"items": [{"symbol": "005930", "name": "삼성전자", "market": "KOSPI"}]})
+    mock_client.get.side_effect = [failed, found, found]
+    update = MagicMock()
+    update.message.text = "삼성전자"
+    update.message.reply_text = AsyncMock()
+
+    await natural_message_handler(update, MagicMock())
+
+    assert mock_client.get.await_count == 3
+    assert "/symbols/search" in mock_client.get.await_args_list[1].args[0]
+    assert "이름: 삼성전자" in update.message.reply_text.await_args.args[0]
@@ -0,0 +1,91 @@
+"""
+여러 사용자의 업데이트를 동시에 처리하면서, 같은 사용자의 업데이트는 도착 순서대로 처리하는 업데이트 처리기입니다.
+
+기본 Application은 업데이트를 하나씩 처리하므로 한 사용자의 느린 /predict가 다른 모든 사용자를 기다리게 합니다.
+반대로 단순히 동시 처리만 켜면 같은 사용자의 연속된 메시지가 순서 없이 처리되어 ConversationHandler의 대화 상태가 꼬일 수 있습니다.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Dict, Hashable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """
+    사용자별 순서를 지키는 동시 업데이트 처리기입니다.
+
+    Args:
+        max_concurrent_updates (int): 동시에 실행할 최대 업데이트 수
+        max_pending_updates (int): 순서를 기다리는 업데이트를 포함한 최대 업데이트 수 (기본: max_concurrent_updates의 8배)
+    """
+
+    def __init__(self, max_concurrent_updates: int, max_pending_updates: Optional[int] = None):
+        # PTB의 세마포어는 같은 사용자의 앞선 업데이트를 기다리는 업데이트까지 셉니다.
+        # 한 사용자가 보낸 업데이트가 실행 슬롯을 모두 차지하지 않도록, 실행 슬롯은 사용자 순서를 받은 뒤에 따로 잡습니다.
+        super().__init__(max_pending_updates or max_concurrent_updates * 8)
+        self.max_running_updates = max_concurrent_updates
+        self._slots = asyncio.BoundedSemaphore(max_concurrent_updates)
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._pending: Dict[Hashable, int] = defaultdict(int)
+        self._stats = {"processed": 0, "running": 0, "max_running": 0, "waiting": 0, "max_waiting": 0}
+
+    @staticmethod
+    def ordering_key(update: Any) -> Optional[Hashable]:
+        """순서를 지켜야 하는 단위를 반환합니다. (사용자, 없으면 채팅. 둘 다 없으면 None)"""
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user:
+            return ("user", update.effective_user.id)
+        if update.effective_chat:
+            return ("chat", update.effective_chat.id)
+        return None
+
+    async def do_process_update(self, update: object, coroutine: "Awaitable[Any]") -> None:
+        key = self.ordering_key(update)
+        if key is None:
+            await self._run(coroutine)
+            return
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._pending[key] += 1
+        self._stats["waiting"] += 1
+        self._stats["max_waiting"] = max(self._stats["max_waiting"], self._stats["waiting"])
+        try:
+            try:
+                await lock.acquire()
+            finally:
+                self._stats["waiting"] -= 1
+            try:
+                await self._run(coroutine)
+            finally:
+                lock.release()
+        finally:
+            self._pending[key] -= 1
+            if self._pending[key] == 0:
+                # 기다리는 업데이트가 없는 사용자의 잠금은 정리하여 사용자 수만큼 쌓이지 않게 함
+                del self._pending[key]
+                del self._locks[key]
+
+    async def _run(self, coroutine: "Awaitable[Any]") -> None:
+        async with self._slots:
+            self._stats["running"] += 1
+            self._stats["max_running"] = max(self._stats["max_running"], self._stats["running"])
+            try:
+                await coroutine
+            finally:
+                self._stats["running"] -= 1
+                self._stats["processed"] += 1
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """처리 현황을 반환합니다. (processed, running, max_running, waiting, max_waiting, max_running_updates)"""
+        return {**self._stats, "max_running_updates": self.max_running_updates}
@@ -0,0 +1,87 @@
+"""
+웹훅 방식 봇 실행
+
+텔레그램이 리버스 프록시를 거쳐 보내는 업데이트를 로컬 HTTP 서버(FastAPI + uvicorn)로 받아 Application의 update_queue에 넣습니다.
+(python-telegram-bot의 run_webhook은 tornado가 필요하므로, 다른 서비스와 같은 FastAPI/uvicorn을 사용합니다.)
+"""
+import logging
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request, Response, status
+from telegram import Update
+from telegram.ext import Application
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def build_webhook_app(application: Application, url_path: str, secret_token: Optional[str] = None) -> FastAPI:
+    """
+    업데이트를 받는 FastAPI 앱을 만듭니다.
+
+    Args:
+        application (Application): 업데이트를 처리할 봇 Application
+        url_path (str): 텔레그램이 업데이트를 보낼 경로 (예: /telegram/webhook)
+        secret_token (Optional[str]): setWebhook에 등록한 비밀 토큰. 있으면 요청 헤더와 일치해야 받음
+    """
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+    @app.post(url_path)
+    async def telegram_webhook(request: Request):
+        if secret_token and request.headers.get(SECRET_TOKEN_HEADER) != secret_token:
+            return Response(status_code=status.HTTP_403_FORBIDDEN)
+        try:
+            update = Update.de_json(await request.json(), application.bot)
+        except Exception:
+            logger.warning("웹훅 요청 본문을 업데이트로 해석할 수 없습니다.", exc_info=True)
+            return Response(status_code=status.HTTP_400_BAD_REQUEST)
+        # 처리는 Application이 뒤에서 하므로 텔레그램에는 바로 응답 (느린 처리로 재전송되지 않도록)
+        await application.update_queue.put(update)
+        return Response(status_code=status.HTTP_200_OK)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "pending_updates": application.update_queue.qsize()}
+
+    return app
+
+
+async def run_webhook(
+    application: Application,
+    webhook_url: Optional[str],
+    listen: str = "0.0.0.0",
+    port: int = 8081,
+    url_path: str = "/telegram/webhook",
+    secret_token: Optional[str] = None,
+):
+    """
+    웹훅 서버를 실행합니다. (종료 신호를 받을 때까지)
+
+    webhook_url이 있으면 시작할 때 텔레그램에 "{webhook_url}{url_path}"를 웹훅으로 등록합니다.
+    Application.run_polling()과 같이 post_init / post_stop / post_shutdown 콜백을 호출합니다.
+    """
+    server = uvicorn.Server(uvicorn.Config(
+        build_webhook_app(application, url_path, secret_token),
+        host=listen, port=port, log_level="warning", access_log=False,
+    ))
+    async with application:
+        if application.post_init:
+            await application.post_init(application)
+        if webhook_url:
+            await application.bot.set_webhook(
+                url=f"{webhook_url.rstrip('/')}{url_path}",
+                secret_token=secret_token,
+                allowed_updates=Update.ALL_TYPES,
+            )
+        await application.start()
+        logger.info(f"Webhook server listening on {listen}:{port}{url_path}")
+        try:
+            await server.serve()
+        finally:
+            await application.stop()
+            if application.post_stop:
+                await application.post_stop(application)
+    if application.post_shutdown:
+        await application.post_shutdown(application)
@@ -14,6 +14,10 @@ class EmailConfig(BaseModel):
     smtp_use_tls: bool = Field(default_factory=lambda: os.getenv("SMTP_USE_TLS", "true").lower() == "true")
     sender_email: str = Field(default_factory=lambda: os.getenv("SENDER_EMAIL", "noreply@stockeye.com"))
     sender_name: str = Field(default_factory=lambda: os.getenv("SENDER_NAME", "StockEye"))
+    # SMTP 연결 풀 설정
+    smtp_pool_size: int = Field(default_factory=lambda: int(os.getenv("SMTP_POOL_SIZE", "4")))
+    smtp_pool_idle_timeout: float = Field(default_factory=lambda: float(os.getenv("SMTP_POOL_IDLE_TIMEOUT", "30")))
+    smtp_pool_max_messages: int = Field(default_factory=lambda: int(os.getenv("SMTP_POOL_MAX_MESSAGES", "100")))
     
     @property
     def is_configured(self) -> bool:
@@ -1,9 +1,14 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 import logging
 
+from src.common.database.pool_metrics import (
+    MeteredAsyncAdaptedQueuePool, MeteredNullPool, MeteredQueuePool, describe_pool
+)
+
 logger = logging.getLogger(__name__)
 
 # APP_ENV 환경 변수에 따라 적절한 .env 파일 로드
@@ -18,10 +23,88 @@ DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
 SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 logger.debug(f"데이터베이스 URL: {SQLALCHEMY_DATABASE_URL}")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# 커넥션 풀 설정 (API, 봇, 워커 작업 프로세스가 각자 풀을 만들므로 프로세스당 값입니다)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+# PgBouncer(transaction pooling) 앞에 둘 때 사용합니다.
+# - 풀링은 PgBouncer가 하므로 애플리케이션 쪽 풀을 두지 않습니다. (NullPool)
+# - 세션 단위 설정이 다른 클라이언트로 새지 않도록 statement_timeout을 트랜잭션마다 SET LOCAL로 적용합니다.
+# - asyncpg의 prepared statement 캐시를 끕니다.
+DB_PGBOUNCER_MODE = os.getenv("DB_PGBOUNCER_MODE", "false").lower() == "true"
+
+
+def get_pool_settings() -> dict:
+    """현재 커넥션 풀 설정을 반환합니다."""
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout_seconds": DB_POOL_TIMEOUT,
+        "pool_recycle_seconds": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "statement_timeout_ms": DB_STATEMENT_TIMEOUT_MS,
+        "pgbouncer_mode": DB_PGBOUNCER_MODE,
+    }
+
+
+def _engine_options(is_async: bool = False) -> dict:
+    """
+    create_engine/create_async_engine에 전달할 풀 관련 인자를 만듭니다.
+
+    Args:
+        is_async (bool): asyncpg 엔진용 여부
+
+    Returns:
+        dict: 엔진 생성 인자
+    """
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    connect_args = {}
+    if DB_PGBOUNCER_MODE:
+        options["poolclass"] = MeteredNullPool
+        if is_async:
+            connect_args["statement_cache_size"] = 0
+    else:
+        options.update({
+            "poolclass": MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool,
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+        })
+        if DB_STATEMENT_TIMEOUT_MS > 0:
+            if is_async:
+                connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+            else:
+                connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def _configure_engine(sync_engine):
+    """PgBouncer 모드에서 트랜잭션마다 statement_timeout을 적용합니다."""
+    if DB_PGBOUNCER_MODE and DB_STATEMENT_TIMEOUT_MS > 0:
+        statement = f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}"
+
+        @event.listens_for(sync_engine, "begin")
+        def _set_local_statement_timeout(conn):
+            conn.exec_driver_sql(statement)
+    return sync_engine
+
+
+engine = _configure_engine(create_engine(SQLALCHEMY_DATABASE_URL, **_engine_options()))
+
+# 워커 작업은 fork된 프로세스에서 실행되므로, 부모가 열어 둔 커넥션을 자식이 함께 쓰지 않도록
+# 자식 프로세스에서는 풀을 비우고 새로 연결합니다. (부모의 커넥션은 닫지 않음)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -33,4 +116,66 @@ def get_db():
         yield db
     finally:
         db.close()
-        logger.debug("DB 세션 종료.")
\ No newline at end of file
+        logger.debug("DB 세션 종료.")
+
+
+# 비동기 엔진은 API의 async 라우트에서만 사용합니다.
+# 워커 프로세스나 봇이 이 모듈을 import할 때 사용하지 않는 커넥션 풀이 만들어지지 않도록 처음 사용할 때 만듭니다.
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """asyncpg 기반 비동기 엔진을 반환합니다."""
+    global _async_engine
+    if _async_engine is None:
+        url = ASYNC_SQLALCHEMY_DATABASE_URL
+        if DB_PGBOUNCER_MODE:
+            url += "?prepared_statement_cache_size=0"
+        _async_engine = create_async_engine(url, **_engine_options(is_async=True))
+        _configure_engine(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db():
+    """
+    비동기 DB 세션 의존성입니다.
+
+    기존 동기 서비스 코드는 `await db.run_sync(fn, ...)`로 그대로 재사용할 수 있습니다.
+    (fn의 첫 번째 인자로 같은 커넥션을 쓰는 동기 Session이 전달되며, DB I/O는 이벤트 루프를 막지 않습니다.)
+    """
+    async with get_async_sessionmaker()() as db:
+        logger.debug("비동기 DB 세션 시작.")
+        yield db
+        logger.debug("비동기 DB 세션 종료.")
+
+
+async def dispose_async_engine():
+    """비동기 엔진의 커넥션 풀을 닫습니다. (애플리케이션 종료 시)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
+def get_pool_metrics() -> dict:
+    """
+    동기/비동기 엔진의 커넥션 풀 상태와 checkout 대기 시간 통계를 반환합니다.
+
+    비동기 엔진을 아직 사용하지 않았다면 "async"는 None입니다.
+    """
+    return {
+        "settings": get_pool_settings(),
+        "sync": describe_pool(engine.pool),
+        "async": describe_pool(_async_engine.pool) if _async_engine is not None else None,
+    }
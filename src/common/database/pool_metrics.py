@@ -0,0 +1,116 @@
+"""
+커넥션 풀 지표 수집용 풀 클래스입니다.
+
+SQLAlchemy 기본 풀에 커넥션 대기 시간 측정만 더한 것으로, 풀 동작 자체는 바꾸지 않습니다.
+- checkout 대기 시간: 풀에서 커넥션을 받기까지 걸린 시간 (새 커넥션 생성 시간 포함)
+- timeout 횟수: pool_timeout 안에 커넥션을 받지 못한 횟수
+- 사용 중 커넥션 수와 포화도(사용 중 / (pool_size + max_overflow))는 describe_pool()에서 계산합니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+# p50/p99 계산에 사용할 최근 대기 시간 표본 수
+WAIT_SAMPLE_SIZE = 1000
+
+
+def _percentile(ordered, pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class PoolMetrics:
+    """풀 하나의 checkout 대기 시간 통계입니다. (여러 스레드에서 호출됨)"""
+
+    def __init__(self, sample_size: int = WAIT_SAMPLE_SIZE):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+
+    def observe(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self._waits.append(seconds)
+            if seconds > self.max_wait:
+                self.max_wait = seconds
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            ordered = sorted(self._waits)
+            checkouts, timeouts, max_wait = self.checkouts, self.timeouts, self.max_wait
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+            "wait_p99_ms": round(_percentile(ordered, 99) * 1000, 2),
+            "wait_max_ms": round(max_wait * 1000, 2),
+        }
+
+
+class _MeteredPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.observe(time.perf_counter() - started)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    """동기 엔진용 QueuePool"""
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 QueuePool"""
+
+
+class MeteredNullPool(_MeteredPoolMixin, NullPool):
+    """PgBouncer 모드용 NullPool (대기 시간은 커넥션 생성 시간)"""
+
+
+def describe_pool(pool) -> Optional[Dict]:
+    """
+    풀의 현재 상태와 대기 시간 통계를 반환합니다.
+
+    Returns:
+        Dict: {"pool_class", "pool_size", "max_overflow", "checked_out", "checked_in", "overflow",
+               "saturation", "checkouts", "timeouts", "wait_p50_ms", "wait_p99_ms", "wait_max_ms"}
+    """
+    if pool is None:
+        return None
+    stats: Dict = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        size = pool.size()
+        max_overflow = pool._max_overflow
+        checked_out = pool.checkedout()
+        capacity = size + max_overflow if max_overflow >= 0 else None
+        stats.update({
+            "pool_size": size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.get_stats())
+    return stats
@@ -1,21 +1,25 @@
 from .user import User
 from .stock_master import StockMaster
 from .daily_price import DailyPrice
+from .daily_indicator import DailyIndicator
 from .disclosure import Disclosure
 from .prediction_history import PredictionHistory
 from .price_alert import PriceAlert
 from .simulated_trade import SimulatedTrade
 from .system_config import SystemConfig
 from .watchlist import Watchlist
+from .notification_outbox import NotificationOutbox
 
 __all__ = [
     "User",
     "StockMaster",
     "DailyPrice",
+    "DailyIndicator",
     "Disclosure",
     "PredictionHistory",
     "PriceAlert",
     "SimulatedTrade",
     "SystemConfig",
     "Watchlist",
+    "NotificationOutbox",
 ]
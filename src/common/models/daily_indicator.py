@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, DateTime, Float, BigInteger, Date, func, UniqueConstraint
+from src.common.database.db_connector import Base
+
+class DailyIndicator(Base):
+    """
+    일별 기술적 지표 (daily_prices 저장 시 함께 갱신).
+
+    ema12/ema26은 MACD를 다음 일봉부터 이어서 계산하기 위한 상태 값입니다.
+    지표 계산에 필요한 일봉 수가 모자란 날의 sma5/sma20/rsi14는 NULL입니다.
+    """
+    __tablename__ = 'daily_indicators'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    symbol = Column(String(20), nullable=False)
+    date = Column(Date, nullable=False)
+    sma5 = Column(Float, nullable=True)
+    sma20 = Column(Float, nullable=True)
+    rsi14 = Column(Float, nullable=True)
+    macd = Column(Float, nullable=False)
+    signal = Column(Float, nullable=False)
+    ema12 = Column(Float, nullable=False)
+    ema26 = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('symbol', 'date', name='uq_daily_indicators_symbol_date'),
+    )
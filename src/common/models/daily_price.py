@@ -1,11 +1,25 @@
-from sqlalchemy import Column, String, DateTime, Float, BigInteger, Date, func, Index
+import os
+from datetime import date, timedelta
+from sqlalchemy import Column, String, DateTime, Float, BigInteger, Date, func, Index, DDL, event, text
+from sqlalchemy.orm import Session
 from src.common.database.db_connector import Base
 
+# 최신 시세를 찾을 때 먼저 살펴볼 기간(일). 이 기간 안에 시세가 없는 종목만 전체 기간을 조회합니다.
+# (날짜 조건이 있어야 PostgreSQL이 최근 연도 파티션만 읽음)
+LATEST_PRICE_LOOKBACK_DAYS = int(os.getenv("LATEST_PRICE_LOOKBACK_DAYS", "31"))
+
+
 class DailyPrice(Base):
+    """
+    일별 시세.
+
+    PostgreSQL에서는 date 기준 연도별 RANGE 파티션 테이블입니다. (daily_prices_y2024, ..., 범위 밖의 행은 daily_prices_default)
+    파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, date)이며, id는 계속 시퀀스로 발급되어 단독으로도 고유합니다.
+    """
     __tablename__ = 'daily_prices'
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    symbol = Column(String(20), index=True, nullable=False)
-    date = Column(Date, index=True, nullable=False)
+    symbol = Column(String(20), nullable=False)
+    date = Column(Date, primary_key=True, nullable=False)
     open = Column(Float, nullable=False)
     high = Column(Float, nullable=False)
     low = Column(Float, nullable=False)
@@ -15,5 +29,70 @@ class DailyPrice(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
     __table_args__ = (
+        # 종목별 조회는 모두 이 인덱스를 사용하므로 symbol, date 단독 인덱스는 두지 않습니다.
         Index('ix_daily_prices_symbol_date', 'symbol', 'date'),
-    ) 
\ No newline at end of file
+        {'postgresql_partition_by': 'RANGE (date)'},
+    )
+
+
+# 연도별 파티션을 만드는 함수. 기본 파티션에 먼저 들어간 해당 연도 행은 새 파티션으로 옮깁니다.
+# 마이그레이션(f8b2d4c6e0a1)과 같은 정의이며, create_all로 테이블을 새로 만들 때도 함께 만듭니다.
+ENSURE_PARTITIONS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ensure_daily_prices_partitions(from_year integer, to_year integer)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    y integer;
+    part_name text;
+    created integer := 0;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('daily_prices_partitions'));
+    FOR y IN from_year..to_year LOOP
+        part_name := format('daily_prices_y%s', y);
+        CONTINUE WHEN to_regclass(part_name) IS NOT NULL;
+        EXECUTE format('CREATE TABLE %I (LIKE daily_prices INCLUDING DEFAULTS)', part_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM daily_prices_default WHERE date >= %L AND date < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            make_date(y, 1, 1), make_date(y + 1, 1, 1), part_name);
+        EXECUTE format('ALTER TABLE daily_prices ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            part_name, make_date(y, 1, 1), make_date(y + 1, 1, 1));
+        created := created + 1;
+    END LOOP;
+    RETURN created;
+END;
+$$
+"""
+
+for _ddl in (
+    DDL("CREATE TABLE daily_prices_default PARTITION OF daily_prices DEFAULT"),
+    DDL(ENSURE_PARTITIONS_FUNCTION_SQL.replace("%", "%%")),
+    DDL("SELECT ensure_daily_prices_partitions("
+        "EXTRACT(YEAR FROM CURRENT_DATE)::int - 1, EXTRACT(YEAR FROM CURRENT_DATE)::int + 1)"),
+):
+    event.listen(DailyPrice.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
+
+
+def ensure_daily_price_partitions(db: Session, from_year: int, to_year: int) -> int:
+    """
+    from_year ~ to_year 연도 파티션이 없으면 만듭니다. (PostgreSQL이 아니면 아무것도 하지 않음)
+
+    Args:
+        db (Session): DB 세션 (호출한 쪽에서 커밋)
+        from_year (int): 시작 연도
+        to_year (int): 끝 연도 (포함)
+
+    Returns:
+        int: 새로 만든 파티션 수
+    """
+    if db.bind.dialect.name != "postgresql":
+        return 0
+    return db.execute(
+        text("SELECT ensure_daily_prices_partitions(:from_year, :to_year)"),
+        {"from_year": from_year, "to_year": to_year},
+    ).scalar() or 0
+
+
+def latest_price_window_start(today: date = None) -> date:
+    """최신 시세를 찾을 때 사용할 날짜 하한을 반환합니다. (오늘 - LATEST_PRICE_LOOKBACK_DAYS)"""
+    return (today or date.today()) - timedelta(days=LATEST_PRICE_LOOKBACK_DAYS)
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, func, Index
+from src.common.database.db_connector import Base
+
+class NotificationOutbox(Base):
+    """
+    전송 대기 중인 알림 (Transactional Outbox).
+
+    알림 평가 코드는 상태 변경과 같은 트랜잭션에서 이 테이블에 행을 추가하고,
+    워커의 전송 루프가 행을 가져가 실제로 전송합니다.
+    """
+    __tablename__ = 'notification_outbox'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel = Column(String(20), nullable=False, default='telegram')
+    recipient = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    # 같은 알림이 두 번 적재되지 않도록 막는 키 (예: 'price_alert:12:3')
+    dedup_key = Column(String(255), nullable=False, unique=True)
+    status = Column(String(20), nullable=False, default='pending')  # 'pending', 'sending', 'sent', 'failed'
+    attempts = Column(Integer, nullable=False, default=0)
+    # 'pending': 다음 전송 시각, 'sending': 임대 만료 시각 (이후 다른 워커가 다시 가져감)
+    next_attempt_at = Column(DateTime, default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_notification_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
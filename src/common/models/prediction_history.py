@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, Float, DateTime, ForeignKey, func, Integer
+from sqlalchemy import Column, BigInteger, String, Float, DateTime, ForeignKey, func, Integer, Index
 import sqlalchemy as sa
 from src.common.database.db_connector import Base
 from datetime import datetime
@@ -10,4 +10,9 @@ class PredictionHistory(Base):
     symbol = Column(String(20), nullable=False)
     prediction = Column(String(20), nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False) 
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # 사용자별 최신순 커서 페이지네이션용 (user_id, created_at, id)
+        Index('ix_prediction_history_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
@@ -3,6 +3,8 @@ from src.common.database.db_connector import Base
 from sqlalchemy.sql import func
 
 class StockMaster(Base):
+    # name/symbol의 pg_trgm GIN 인덱스(ix_stock_master_*_trgm)는 pg_trgm 확장이 필요하므로
+    # create_all 대상이 아닌 Alembic 마이그레이션(e4a7b9c2d1f3)에서만 관리합니다.
     __tablename__ = 'stock_master'
     symbol = Column(String(20), primary_key=True)
     name = Column(String(100), nullable=False)
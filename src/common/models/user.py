@@ -21,6 +21,7 @@ class User(Base):
         role (String): 사용자 역할 (e.g., 'user', 'admin').
         is_active (Boolean): 계정 활성 상태.
         telegram_id (BigInteger): 텔레그램 사용자 ID.
+        token_version (Integer): 토큰 버전. 토큰의 'ver'와 다르면 거부되므로, 올리면 이전에 발급한 토큰이 모두 무효화됩니다.
         created_at (DateTime): 계정 생성 시간.
         updated_at (DateTime): 계정 정보 마지막 수정 시간.
         price_alerts (relationship): 사용자가 설정한 가격 알림 목록.
@@ -36,6 +37,7 @@ class User(Base):
     role = Column(String(20), default='user', nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     telegram_id = Column(BigInteger, unique=True, nullable=True)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     notification_preferences = Column(JSON, default={"telegram": True, "email": False}, nullable=False)
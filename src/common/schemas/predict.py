@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 
 class StockPredictionRequest(BaseModel):
     symbol: str
@@ -9,4 +9,14 @@ class StockPredictionResponse(BaseModel):
     symbol: str
     prediction: str
     confidence: float # Changed from int to float
-    reason: str
\ No newline at end of file
+    reason: str
+
+# 한 번에 예측할 수 있는 최대 종목 수
+MAX_BATCH_PREDICTION_SYMBOLS = 500
+
+class StockBatchPredictionRequest(BaseModel):
+    symbols: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_PREDICTION_SYMBOLS)
+
+class StockBatchPredictionResponse(BaseModel):
+    results: List[StockPredictionResponse]
+    not_found: List[str] = []
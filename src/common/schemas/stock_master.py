@@ -1,6 +1,9 @@
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
+# 종목 일괄 조회(/symbols/batch)에서 한 번에 조회할 수 있는 최대 종목 수
+MAX_BATCH_SYMBOLS = 200
+
 class StockMasterBase(BaseModel):
     symbol: str
     name: str
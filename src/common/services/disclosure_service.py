@@ -3,6 +3,7 @@ import logging
 from datetime import datetime, timedelta
 import re
 import os
+from typing import Any, Dict, Set
 
 from src.common.models.disclosure import Disclosure
 from src.common.models.price_alert import PriceAlert
@@ -12,6 +13,7 @@ from src.common.models.stock_master import StockMaster
 from src.common.utils.exceptions import DartApiError
 from src.common.utils.dart_utils import dart_get_disclosures
 from src.common.services.notify_service import send_telegram_message
+from src.common.services.notification_outbox_service import notification_outbox_service
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,44 @@ class DisclosureService:
     def __init__(self):
         self.last_checked_rcept_no = None
 
+    def _get_disclosure_subscribers(self, db: Session, stock_codes: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        종목코드 목록에 대한 공시 알림 구독자와 종목명을 한 번의 조인 쿼리로 조회합니다.
+
+        Args:
+            db (Session): DB 세션
+            stock_codes (Set[str]): 신규 공시가 있는 종목코드 목록
+
+        Returns:
+            Dict[str, Dict]: 종목코드별 구독 정보
+                예: {'005930': {'name': '삼성전자', 'subscribers': [{'user_id': 1, 'telegram_id': 123}]}}
+        """
+        if not stock_codes:
+            return {}
+
+        rows = db.query(
+            PriceAlert.symbol, User.id, User.telegram_id, StockMaster.name
+        ).join(
+            User, User.id == PriceAlert.user_id
+        ).outerjoin(
+            StockMaster, StockMaster.symbol == PriceAlert.symbol
+        ).filter(
+            PriceAlert.symbol.in_(stock_codes),
+            PriceAlert.notify_on_disclosure == True,
+            PriceAlert.is_active == True
+        ).all()
+
+        subscribers_by_code: Dict[str, Dict[str, Any]] = {}
+        seen = set()
+        for symbol, user_id, telegram_id, stock_name in rows:
+            entry = subscribers_by_code.setdefault(symbol, {'name': stock_name, 'subscribers': []})
+            # 한 사용자가 같은 종목에 알림을 여러 개 설정한 경우 한 번만 발송
+            if (symbol, user_id) in seen:
+                continue
+            seen.add((symbol, user_id))
+            entry['subscribers'].append({'user_id': user_id, 'telegram_id': telegram_id})
+        return subscribers_by_code
+
     async def check_and_notify_new_disclosures(self, db: Session):
         """
         DART에서 최신 공시를 확인하고, 구독자에게 알림을 보낸 후 관리자에게 요약 리포트를 보냅니다.
@@ -68,10 +108,14 @@ class DisclosureService:
 
             logger.info(f"{len(new_disclosures)}건의 신규 공시를 발견했습니다. DB에 저장 및 알림을 시작합니다.")
             
+            new_rcept_nos = [item.get('rcept_no') for item in new_disclosures]
+            existing_rcept_nos = {
+                r[0] for r in db.query(Disclosure.rcept_no).filter(Disclosure.rcept_no.in_(new_rcept_nos)).all()
+            }
+
             disclosures_to_add = []
             for item in new_disclosures:
-                existing = db.query(Disclosure).filter(Disclosure.rcept_no == item.get('rcept_no')).first()
-                if not existing:
+                if item.get('rcept_no') not in existing_rcept_nos:
                     disclosures_to_add.append(Disclosure(
                         stock_code=item.get('stock_code'),
                         corp_code=item.get('corp_code'),
@@ -87,51 +131,41 @@ class DisclosureService:
                 db.commit()
                 logger.info(f"신규 공시 {len(disclosures_to_add)}건을 DB에 추가했습니다.")
 
-            total_notified_users = 0
+            notifications = []
             if disclosures_to_add:
+                stock_codes = {d.stock_code for d in disclosures_to_add if d.stock_code}
+                subscribers_by_code = self._get_disclosure_subscribers(db, stock_codes)
+
                 for disclosure in reversed(disclosures_to_add):
                     if not disclosure.stock_code:
                         logger.info("상장되지 않은 기업 공시 알림 건너뛰기")
                         continue
 
-                    subscriptions = db.query(PriceAlert).filter(
-                        PriceAlert.symbol == disclosure.stock_code,
-                        PriceAlert.notify_on_disclosure == True,
-                        PriceAlert.is_active == True
-                    ).all()
-                    
-                    if not subscriptions:
+                    subscription = subscribers_by_code.get(disclosure.stock_code)
+                    if not subscription:
                         logger.info(f"종목 {disclosure.stock_code}에 대한 활성 공시 알림 구독자가 없습니다.")
                         continue
 
-                    user_ids = [sub.user_id for sub in subscriptions]
-                    users = db.query(User).filter(User.id.in_(user_ids)).all()
-                    stock_info = db.query(StockMaster).filter(StockMaster.symbol == disclosure.stock_code).first()
-                    stock_name_for_msg = stock_info.name if stock_info else disclosure.corp_code
-                    
-                    for user in users:
-                        if user.telegram_id:
-                            msg = (
-                                f"🔔 [{stock_name_for_msg}] 신규 공시\n\n"
-                                f"📑 {disclosure.title}\n"
-                                f"🕒 {disclosure.disclosed_at.strftime('%Y%m%d')}\n"
-                                f"🔗 {disclosure.url}"
-                            )
-                            await send_telegram_message(user.telegram_id, msg)
-                            total_notified_users += 1
+                    stock_name_for_msg = subscription['name'] or disclosure.corp_code
+                    msg = (
+                        f"🔔 [{stock_name_for_msg}] 신규 공시\n\n"
+                        f"📑 {disclosure.title}\n"
+                        f"🕒 {disclosure.disclosed_at.strftime('%Y%m%d')}\n"
+                        f"🔗 {disclosure.url}"
+                    )
+                    for subscriber in subscription['subscribers']:
+                        if subscriber['telegram_id']:
+                            notifications.append({
+                                'channel': 'telegram',
+                                'recipient': subscriber['telegram_id'],
+                                'message': msg,
+                                'dedup_key': f"disclosure:{disclosure.rcept_no}:{subscriber['user_id']}:telegram",
+                            })
                         else:
-                            logger.warning(f"사용자 {user.id}의 Telegram ID가 없어 알림")
-
-            admin_id = os.getenv("TELEGRAM_ADMIN_ID")
-            if admin_id:
-                summary_msg = (
-                    f"📈 공시 알림 요약 리포트\n\n"
-                    f"- 발견된 신규 공시: {len(new_disclosures)}건\n"
-                    f"- DB에 추가된 공시: {len(disclosures_to_add)}건\n"
-                    f"- 총 알림 발송 건수: {total_notified_users}건"
-                )
-                await send_telegram_message(int(admin_id), summary_msg)
+                            logger.warning(f"사용자 {subscriber['user_id']}의 Telegram ID가 없어 알림")
 
+            # 모든 알림을 한 번에 outbox에 적재하고, 기준 접수번호 갱신과 같은 트랜잭션으로 커밋
+            notification_outbox_service.enqueue_many(db, notifications)
             if disclosures_to_add:
                 newest_rcept_no = max(d.rcept_no for d in disclosures_to_add)
                 if last_checked_config:
@@ -141,6 +175,16 @@ class DisclosureService:
                 db.commit()
                 logger.info(f"마지막 확인 접수번호를 {newest_rcept_no}로 DB에 갱신합니다.")
 
+            admin_id = os.getenv("TELEGRAM_ADMIN_ID")
+            if admin_id:
+                summary_msg = (
+                    f"📈 공시 알림 요약 리포트\n\n"
+                    f"- 발견된 신규 공시: {len(new_disclosures)}건\n"
+                    f"- DB에 추가된 공시: {len(disclosures_to_add)}건\n"
+                    f"- 총 알림 발송 건수: {len(notifications)}건"
+                )
+                await send_telegram_message(int(admin_id), summary_msg)
+
         except Exception as e:
             db.rollback()
             logger.error(f"신규 공시 확인 및 알림 작업 중 예상치 못한 오류 발생: {e}", exc_info=True)
@@ -0,0 +1,164 @@
+import logging
+import os
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.common.models.daily_indicator import DailyIndicator
+from src.common.models.daily_price import DailyPrice
+from src.common.utils.technical_analysis import calculate_indicator_series
+
+logger = logging.getLogger(__name__)
+
+# SMA20 창을 채우기 위해 이어서 계산할 때 함께 읽는 직전 종가 수
+LOOKBACK_BARS = 19
+
+INDICATOR_COLUMNS = ("sma5", "sma20", "rsi14", "macd", "signal")
+
+
+class IndicatorService:
+    """
+    daily_indicators 테이블을 관리하는 서비스입니다.
+
+    - 시세 수집: update_indicators()로 새로 저장된 일봉의 지표만 이어서 계산합니다.
+      저장된 마지막 지표의 EMA 상태와 직전 19개 종가만 읽으므로 종목당 처리량이 이력 길이와 무관합니다.
+    - 과거 시세 보정: since를 지정하면 그 날짜부터 다시 계산합니다.
+    - 최초 적재: backfill()로 전체 이력을 다시 계산합니다. (python -m src.worker.backfill_indicators)
+    """
+
+    BACKFILL_CHUNK_SIZE = int(os.getenv("INDICATOR_BACKFILL_CHUNK_SIZE", "100"))
+
+    def _load_closes(self, db: Session, symbol: str, start: Optional[date] = None):
+        query = db.query(DailyPrice.date, DailyPrice.close).filter(DailyPrice.symbol == symbol)
+        if start is not None:
+            query = query.filter(DailyPrice.date >= start)
+        return query.order_by(DailyPrice.date.asc()).all()
+
+    def _write(self, db: Session, symbol: str, bars, rows: List[dict], start: Optional[date]) -> int:
+        delete_query = db.query(DailyIndicator).filter(DailyIndicator.symbol == symbol)
+        if start is not None:
+            delete_query = delete_query.filter(DailyIndicator.date >= start)
+        delete_query.delete(synchronize_session=False)
+        db.bulk_insert_mappings(DailyIndicator, [
+            {"symbol": symbol, "date": bar_date, **row} for (bar_date, _), row in zip(bars, rows)
+        ])
+        return len(rows)
+
+    def rebuild_symbol(self, db: Session, symbol: str) -> int:
+        """종목의 전체 이력으로 지표를 다시 계산합니다. (커밋하지 않음)"""
+        bars = self._load_closes(db, symbol)
+        rows = calculate_indicator_series([close for _, close in bars])
+        return self._write(db, symbol, bars, rows, None)
+
+    def update_symbol(self, db: Session, symbol: str, since: Optional[date] = None) -> int:
+        """
+        종목의 지표를 마지막으로 저장된 날짜 다음부터(since가 더 이르면 since부터) 이어서 계산합니다. (커밋하지 않음)
+
+        이어서 계산할 상태(직전 일봉의 지표)가 없거나 맞지 않으면 전체 이력으로 다시 계산합니다.
+
+        Returns:
+            int: 저장한 지표 행 수
+        """
+        last_date = db.query(func.max(DailyIndicator.date)).filter(DailyIndicator.symbol == symbol).scalar()
+        if last_date is None:
+            return self.rebuild_symbol(db, symbol)
+
+        start = last_date + timedelta(days=1)
+        if since is not None and since < start:
+            start = since
+
+        previous_bars = db.query(DailyPrice.date, DailyPrice.close).filter(
+            DailyPrice.symbol == symbol, DailyPrice.date < start
+        ).order_by(DailyPrice.date.desc()).limit(LOOKBACK_BARS).all()[::-1]
+        seed = db.query(DailyIndicator).filter(
+            DailyIndicator.symbol == symbol, DailyIndicator.date < start
+        ).order_by(DailyIndicator.date.desc()).first()
+        if not previous_bars or seed is None or seed.date != previous_bars[-1][0]:
+            return self.rebuild_symbol(db, symbol)
+
+        new_bars = self._load_closes(db, symbol, start)
+        if not new_bars:
+            return 0
+        rows = calculate_indicator_series(
+            [close for _, close in previous_bars + new_bars],
+            history=len(previous_bars),
+            ema_seed=(seed.ema12, seed.ema26, seed.signal),
+        )
+        return self._write(db, symbol, new_bars, rows, start)
+
+    def update_indicators(self, db: Session, symbols: Iterable[str], since: Optional[date] = None) -> int:
+        """
+        일봉이 저장된 종목의 지표를 갱신하고 커밋합니다.
+
+        지표 갱신 실패가 시세 수집 작업을 실패시키지 않도록 오류는 기록만 합니다.
+        실패한 종목은 다음 갱신 때 마지막 저장 지표부터 이어서 다시 계산됩니다.
+
+        Returns:
+            int: 저장한 지표 행 수
+        """
+        written = 0
+        for symbol in dict.fromkeys(symbols):
+            try:
+                written += self.update_symbol(db, symbol, since)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"[Indicator] '{symbol}' 지표 갱신 실패: {e}", exc_info=True)
+        logger.info(f"[Indicator] 지표 {written}건을 갱신했습니다.")
+        return written
+
+    def backfill(self, db: Session, symbols: Optional[List[str]] = None) -> Dict:
+        """
+        종목의 전체 이력으로 지표를 다시 계산합니다. (BACKFILL_CHUNK_SIZE 종목마다 커밋)
+
+        Args:
+            symbols (List[str], optional): 대상 종목. 없으면 일별 시세가 있는 모든 종목
+
+        Returns:
+            Dict: {"symbols": 처리한 종목 수, "rows": 저장한 지표 행 수, "errors": 실패한 종목 목록}
+        """
+        if symbols is None:
+            symbols = [row[0] for row in db.query(DailyPrice.symbol).distinct().order_by(DailyPrice.symbol).all()]
+
+        rows = 0
+        errors = []
+        for i in range(0, len(symbols), self.BACKFILL_CHUNK_SIZE):
+            chunk = symbols[i:i + self.BACKFILL_CHUNK_SIZE]
+            chunk_rows = 0
+            try:
+                for symbol in chunk:
+                    chunk_rows += self.rebuild_symbol(db, symbol)
+                db.commit()
+                rows += chunk_rows
+            except Exception as e:
+                db.rollback()
+                errors.extend(chunk)
+                logger.error(f"[Indicator] 지표 백필 실패 ({chunk[0]}~{chunk[-1]}): {e}", exc_info=True)
+            logger.info(f"[Indicator] 지표 백필 진행: {min(i + len(chunk), len(symbols))}/{len(symbols)}개 종목")
+        return {"symbols": len(symbols), "rows": rows, "errors": errors}
+
+    def get_latest_indicators(self, db: Session, symbols: List[str]) -> Dict[str, dict]:
+        """
+        여러 종목의 최신 지표를 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Dict[str, dict]: {symbol: {"date", "sma5", "sma20", "rsi14", "macd", "signal"}}
+        """
+        if not symbols:
+            return {}
+        latest = db.query(
+            DailyIndicator.symbol, func.max(DailyIndicator.date).label("date")
+        ).filter(DailyIndicator.symbol.in_(symbols)).group_by(DailyIndicator.symbol).subquery()
+        rows = db.query(DailyIndicator).join(
+            latest, (DailyIndicator.symbol == latest.c.symbol) & (DailyIndicator.date == latest.c.date)
+        ).all()
+        return {
+            row.symbol: {"date": row.date, **{column: getattr(row, column) for column in INDICATOR_COLUMNS}}
+            for row in rows
+        }
+
+
+# 싱글톤 인스턴스
+indicator_service = IndicatorService()
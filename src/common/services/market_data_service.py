@@ -1,13 +1,70 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.common.models.stock_master import StockMaster
-from src.common.models.daily_price import DailyPrice
+from src.common.models.daily_price import DailyPrice, latest_price_window_start
 import yfinance as yf
 import logging
+import os
 from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func
 import anyio # Import anyio
+from src.common.utils.cache import TieredCache, MISSING
+from src.common.utils.single_flight import SingleFlight
+from src.common.services.prediction_cache_service import prediction_cache_service
+from src.common.services.indicator_service import indicator_service
 
 logger = logging.getLogger(__name__)
 
+# 종목별 최근 종가 2개([현재가, 전일 종가])를 보관하는 읽기 캐시.
+# 시세 수집 작업이 새 시세를 저장하면 invalidate_price_cache()로 명시적으로 무효화합니다.
+# 무효화 전에 DB를 읽은 요청이 무효화 후에 저장하는 오래된 종가는 세대 번호로 걸러냅니다. (versioned)
+price_cache = TieredCache(
+    namespace="price:last_two_closes",
+    l1_maxsize=int(os.getenv("PRICE_CACHE_L1_MAXSIZE", "4096")),
+    l1_ttl=float(os.getenv("PRICE_CACHE_L1_TTL_SECONDS", "10")),
+    l2_ttl=float(os.getenv("PRICE_CACHE_TTL_SECONDS", "21600")),
+    versioned=True,
+)
+
+# 같은 종목의 현재가 조회가 동시에 몰리면 캐시가 비어 있어도 DB 조회는 한 번만 수행
+price_flight = SingleFlight("current_price")
+
+
+def _build_price_change(symbol: str, closes: List[float]) -> Dict[str, Optional[float]]:
+    """최근 종가 목록([현재가, 전일 종가])으로 현재가와 등락 정보를 계산합니다."""
+    current_price = None
+    previous_close = None
+
+    if closes:
+        current_price = closes[0]
+        logger.debug(f"현재가 발견: {symbol} - {current_price}")
+
+        if len(closes) > 1:
+            previous_close = closes[1]
+            logger.debug(f"전일 종가 발견: {symbol} - {previous_close}")
+        else:
+            logger.warning(f"전일 종가 없음: {symbol}. 등락률 계산 불가.")
+    else:
+        logger.warning(f"현재가 없음: {symbol}.")
+
+    change = None
+    change_rate = None
+
+    if current_price is not None and previous_close is not None:
+        change = current_price - previous_close
+        if previous_close != 0:
+            change_rate = (change / previous_close) * 100
+        else:
+            change_rate = 0.0
+
+    return {
+        "current_price": current_price,
+        "change": change,
+        "change_rate": change_rate
+    }
+
+
 class MarketDataService:
     """
     시장 데이터를 관리하는 서비스 클래스입니다.
@@ -15,41 +72,112 @@ class MarketDataService:
     """
     def get_current_price_and_change(self, symbol: str, db: Session):
         logger.debug(f"get_current_price_and_change 호출: symbol={symbol}")
-        
+
+        generations = {}
+        closes = price_cache.get(symbol, generations=generations)
+        if closes is MISSING:
+            closes = self._load_last_closes(db, symbol)
+            price_cache.set(symbol, closes, generations=generations)
+
+        return _build_price_change(symbol, closes)
+
+    @staticmethod
+    def _load_last_closes(db: Session, symbol: str) -> List[float]:
+        """종목의 최근 종가 2개([현재가, 전일 종가])를 DB에서 조회합니다."""
+        # 최근 기간으로 먼저 조회하여 최근 연도 파티션만 읽고, 종가가 2개 미만이면 (거래 정지 등) 전체 기간에서 조회
         prices = db.query(DailyPrice).filter(
-            DailyPrice.symbol == symbol
+            DailyPrice.symbol == symbol, DailyPrice.date >= latest_price_window_start()
         ).order_by(DailyPrice.date.desc()).limit(2).all()
-        
-        current_price = None
-        previous_close = None
-        
-        if prices:
-            current_price = prices[0].close
-            logger.debug(f"현재가 발견: {symbol} - {current_price}")
-            
-            if len(prices) > 1:
-                previous_close = prices[1].close
-                logger.debug(f"전일 종가 발견: {symbol} - {previous_close}")
-            else:
-                logger.warning(f"전일 종가 없음: {symbol}. 등락률 계산 불가.")
-        else:
-            logger.warning(f"현재가 없음: {symbol}.")
-            
-        change = None
-        change_rate = None
-
-        if current_price is not None and previous_close is not None:
-            change = current_price - previous_close
-            if previous_close != 0:
-                change_rate = (change / previous_close) * 100
-            else:
-                change_rate = 0.0
-        
-        return {
-            "current_price": current_price,
-            "change": change,
-            "change_rate": change_rate
-        }
+        if len(prices) < 2:
+            prices = db.query(DailyPrice).filter(
+                DailyPrice.symbol == symbol
+            ).order_by(DailyPrice.date.desc()).limit(2).all()
+        return [p.close for p in prices]
+
+    async def get_current_price_and_change_async(self, symbol: str, db: AsyncSession) -> Dict[str, Optional[float]]:
+        """
+        비동기 DB 세션으로 get_current_price_and_change()와 같은 조회를 수행합니다.
+
+        캐시(Redis) 조회/저장은 스레드에서, DB 조회는 AsyncSession.run_sync()로 실행하여 이벤트 루프를 막지 않습니다.
+        같은 종목의 조회가 이미 진행 중이면 DB를 다시 조회하지 않고 그 결과를 함께 받습니다.
+
+        Args:
+            symbol (str): 종목 코드
+            db (AsyncSession): 비동기 DB 세션
+
+        Returns:
+            Dict: {'current_price', 'change', 'change_rate'}
+        """
+        async def load() -> Dict[str, Optional[float]]:
+            generations = {}
+            closes = await price_cache.aget(symbol, generations=generations)
+            if closes is MISSING:
+                closes = await db.run_sync(self._load_last_closes, symbol)
+                await price_cache.aset(symbol, closes, generations=generations)
+            return _build_price_change(symbol, closes)
+
+        return await price_flight.do(symbol, load)
+
+    def get_current_prices_and_changes(self, symbols: List[str], db: Session) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        여러 종목의 현재가와 등락 정보를 한 번에 조회합니다.
+
+        캐시에 없는 종목만 모아 윈도우 함수 쿼리 한 번으로 최근 종가 2개씩을 가져옵니다.
+        최근 기간(LATEST_PRICE_LOOKBACK_DAYS)에서 종가가 2개 미만인 종목만 전체 기간에서 다시 조회합니다.
+
+        Args:
+            symbols (List[str]): 종목 코드 목록
+            db (Session): DB 세션
+
+        Returns:
+            Dict[str, Dict]: 종목 코드별 {'current_price', 'change', 'change_rate'}
+        """
+        symbols = list(dict.fromkeys(symbols))
+        generations = {}
+        closes_by_symbol = price_cache.get_many(symbols, generations=generations)
+        missing = [s for s in symbols if s not in closes_by_symbol]
+
+        if missing:
+            loaded = self._load_last_two_closes(db, missing, since=latest_price_window_start())
+            sparse = [s for s in missing if len(loaded[s]) < 2]
+            if sparse:
+                loaded.update(self._load_last_two_closes(db, sparse))
+            price_cache.set_many(loaded, generations=generations)
+            closes_by_symbol.update(loaded)
+
+        return {s: _build_price_change(s, closes_by_symbol[s]) for s in symbols}
+
+    @staticmethod
+    def _load_last_two_closes(db: Session, symbols: List[str], since=None) -> Dict[str, List[float]]:
+        """종목별 최근 종가 2개([현재가, 전일 종가])를 윈도우 함수 쿼리 한 번으로 조회합니다. (since가 있으면 그 날짜 이후만)"""
+        row_number = func.row_number().over(
+            partition_by=DailyPrice.symbol, order_by=DailyPrice.date.desc()
+        ).label("rn")
+        conditions = [DailyPrice.symbol.in_(symbols)]
+        if since is not None:
+            conditions.append(DailyPrice.date >= since)
+        ranked = db.query(DailyPrice.symbol, DailyPrice.close, row_number).filter(*conditions).subquery()
+        rows = db.query(ranked.c.symbol, ranked.c.close).filter(
+            ranked.c.rn <= 2
+        ).order_by(ranked.c.symbol, ranked.c.rn).all()
+
+        loaded = {s: [] for s in symbols}
+        for symbol, close in rows:
+            loaded[symbol].append(close)
+        return loaded
+
+    def invalidate_price_cache(self, symbols: Iterable[str]):
+        """새 시세가 저장된 종목의 현재가 캐시를 무효화합니다."""
+        price_cache.invalidate(symbols)
+
+    def refresh_price_cache(self, symbols: List[str], db: Session):
+        """지정한 종목의 현재가 캐시를 DB 기준으로 다시 채웁니다."""
+        price_cache.invalidate(symbols)
+        self.get_current_prices_and_changes(symbols, db)
+
+    def get_price_cache_stats(self) -> Dict:
+        """현재가 캐시 적중/실패 통계를 반환합니다."""
+        return price_cache.get_stats()
 
     def get_daily_prices(self, symbol: str, db: Session, days: int = 30):
         logger.debug(f"get_daily_prices 호출: symbol={symbol}, days={days}")
@@ -116,6 +244,11 @@ class MarketDataService:
                 if prices_to_add:
                     await anyio.to_thread.run_sync(lambda: db.bulk_save_objects(prices_to_add))
                     await anyio.to_thread.run_sync(lambda: db.commit())
+                    updated_symbols = list({p.symbol for p in prices_to_add})
+                    self.invalidate_price_cache(updated_symbols)
+                    await anyio.to_thread.run_sync(lambda: indicator_service.update_indicators(db, updated_symbols))
+                    # 새 일봉이 저장된 종목의 예측을 미리 계산하여 첫 /predict 요청도 캐시에서 처리
+                    await anyio.to_thread.run_sync(lambda: prediction_cache_service.prewarm(db, updated_symbols))
                     logger.info(f"배치 처리 완료: {len(prices_to_add)}개 일별시세 데이터 삽입.")
                 else:
                     await anyio.to_thread.run_sync(lambda: db.rollback())
@@ -18,3 +18,16 @@ class NotificationChannel(ABC):
             bool: 전송 성공 여부
         """
         pass
+
+    async def deliver(self, recipient: str, message: str, **kwargs) -> bool:
+        """
+        대량 발송(broadcast)용 전송 메서드입니다.
+
+        send()와 달리, 채널이 전송 속도 제한을 감지할 수 있으면
+        NotificationThrottledError를 발생시켜 호출자가 재시도 여부를 결정하도록 합니다.
+        기본 구현은 send()를 그대로 호출합니다.
+
+        Raises:
+            NotificationThrottledError: 채널이 속도 제한에 걸린 경우
+        """
+        return await self.send(recipient, message, **kwargs)
@@ -1,12 +1,13 @@
 """Email notification channel implementation with SMTP support."""
 import logging
-import aiosmtplib
+from typing import Dict, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from pathlib import Path
 
 from .channel import NotificationChannel
+from .smtp_pool import SMTPConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +18,69 @@ class EmailChannel(NotificationChannel):
     def __init__(self):
         # Setup Jinja2 template environment
         template_dir = Path(__file__).parent.parent.parent / "templates" / "email"
+        # auto_reload=False: 템플릿 조회 시마다 파일 변경 여부(stat)를 확인하지 않음
         self.env = Environment(
             loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(['html', 'xml'])
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False
         )
-        logger.info(f"EmailChannel initialized with template directory: {template_dir}")
-    
+        # 컴파일된 템플릿 캐시 (템플릿 이름 -> Template)
+        self._templates: Dict[str, Template] = {}
+        for template_name in self.env.list_templates(extensions=['html']):
+            self._templates[template_name] = self.env.get_template(template_name)
+        self._pool: Optional[SMTPConnectionPool] = None
+        logger.info(f"EmailChannel initialized with template directory: {template_dir} ({len(self._templates)} templates precompiled)")
+
+    def _get_template(self, template_name: str) -> Template:
+        """컴파일된 템플릿을 캐시에서 반환합니다. 캐시에 없으면 컴파일 후 저장합니다."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._templates[template_name] = template
+        return template
+
+    async def _get_pool(self, email_config) -> SMTPConnectionPool:
+        """현재 SMTP 설정에 맞는 연결 풀을 반환합니다. 설정이 바뀌면 이전 풀의 세션을 닫고 새로 만듭니다."""
+        # Determine TLS settings
+        use_tls = email_config.smtp_use_tls
+        start_tls = False
+
+        # Port 587 typically uses STARTTLS, not implicit TLS
+        if email_config.smtp_port == 587:
+            use_tls = False
+            start_tls = True
+
+        settings_key = (
+            email_config.smtp_host,
+            email_config.smtp_port,
+            email_config.smtp_username,
+            email_config.smtp_password,
+            use_tls,
+            start_tls,
+        )
+        pool = self._pool
+        if pool is None or pool.settings_key != settings_key:
+            old_pool = pool
+            pool = self._pool = SMTPConnectionPool(
+                hostname=email_config.smtp_host,
+                port=email_config.smtp_port,
+                username=email_config.smtp_username,
+                password=email_config.smtp_password,
+                use_tls=use_tls,
+                start_tls=start_tls,
+                pool_size=email_config.smtp_pool_size,
+                idle_timeout=email_config.smtp_pool_idle_timeout,
+                max_messages_per_connection=email_config.smtp_pool_max_messages,
+            )
+            if old_pool is not None:
+                await old_pool.close()
+        return pool
+
+    async def close(self):
+        """열려 있는 SMTP 세션을 모두 종료합니다."""
+        if self._pool:
+            await self._pool.close()
+
     async def send(self, recipient: str, message: str, **kwargs) -> bool:
         """
         이메일로 메시지를 전송합니다.
@@ -51,7 +109,7 @@ class EmailChannel(NotificationChannel):
             template_vars = kwargs.get("template_vars", {})
             
             # Render HTML email
-            template = self.env.get_template(template_name)
+            template = self._get_template(template_name)
             html_content = template.render(
                 subject=subject,
                 message=message,
@@ -68,25 +126,9 @@ class EmailChannel(NotificationChannel):
             msg.attach(MIMEText(message, 'plain'))
             msg.attach(MIMEText(html_content, 'html'))
             
-            # Determine TLS settings
-            use_tls = email_config.smtp_use_tls
-            start_tls = False
-            
-            # Port 587 typically uses STARTTLS, not implicit TLS
-            if email_config.smtp_port == 587:
-                use_tls = False
-                start_tls = True
-            
-            # Send via SMTP
-            await aiosmtplib.send(
-                msg,
-                hostname=email_config.smtp_host,
-                port=email_config.smtp_port,
-                username=email_config.smtp_username,
-                password=email_config.smtp_password,
-                use_tls=use_tls,
-                start_tls=start_tls,
-            )
+            # Send via pooled SMTP session (STARTTLS/login only on new sessions)
+            pool = await self._get_pool(email_config)
+            await pool.send_message(msg)
             
             logger.info(f"Email sent successfully to {recipient}")
             return True
@@ -0,0 +1,185 @@
+"""SMTP connection pool that reuses authenticated sessions across emails."""
+import asyncio
+import logging
+from collections import deque
+from email.message import Message
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊긴 세션에서 발생하는 예외. 새 세션으로 한 번 재시도할 가치가 있는 오류들입니다.
+_RECONNECTABLE_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    ConnectionError,
+)
+
+
+class SMTPConnectionPool:
+    """
+    인증이 완료된 SMTP 세션을 재사용하는 연결 풀입니다.
+
+    매 이메일마다 TCP 연결, STARTTLS, 로그인을 반복하지 않고,
+    하나의 세션으로 여러 메시지를 전송합니다.
+
+    Args:
+        hostname (str): SMTP 서버 호스트
+        port (int): SMTP 서버 포트
+        username (str): SMTP 사용자명
+        password (str): SMTP 비밀번호
+        use_tls (bool): 암묵적 TLS(SMTPS) 사용 여부
+        start_tls (bool): STARTTLS 사용 여부
+        pool_size (int): 동시에 열어둘 수 있는 최대 세션 수
+        idle_timeout (float): 유휴 세션을 폐기하기까지의 시간(초)
+        max_messages_per_connection (int): 한 세션으로 보낼 최대 메시지 수 (0이면 무제한)
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool = False,
+        start_tls: bool = False,
+        pool_size: int = 4,
+        idle_timeout: float = 30.0,
+        max_messages_per_connection: int = 100,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.pool_size = max(1, pool_size)
+        self.idle_timeout = idle_timeout
+        self.max_messages_per_connection = max_messages_per_connection
+
+        # (client, 마지막 사용 시각, 세션에서 보낸 메시지 수)
+        self._idle: Deque[Tuple[aiosmtplib.SMTP, float, int]] = deque()
+        self._in_use = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.connections_opened = 0
+        self.messages_sent = 0
+
+    @property
+    def settings_key(self) -> Tuple[Any, ...]:
+        """풀이 생성된 SMTP 설정. 설정이 바뀌면 풀을 다시 만들어야 합니다."""
+        return (self.hostname, self.port, self.username, self.password, self.use_tls, self.start_tls)
+
+    def _ensure_loop(self):
+        """
+        현재 이벤트 루프에 맞게 내부 상태를 준비합니다.
+
+        워커 프로세스는 작업마다 asyncio.run()으로 새 루프를 만들기 때문에,
+        이전 루프에서 열린 세션과 세마포어는 재사용할 수 없습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._idle:
+                logger.debug(f"Discarding {len(self._idle)} SMTP session(s) bound to a previous event loop.")
+            self._idle.clear()
+            self._in_use = 0
+            self._semaphore = asyncio.Semaphore(self.pool_size)
+            self._loop = loop
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """새 SMTP 세션을 열고 STARTTLS 및 로그인까지 완료합니다."""
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+        )
+        await client.connect()
+        self.connections_opened += 1
+        logger.debug(f"Opened SMTP session to {self.hostname}:{self.port} (total opened: {self.connections_opened})")
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP):
+        """세션을 정상 종료하고, 실패하면 강제로 닫습니다."""
+        try:
+            if client.is_connected:
+                await client.quit()
+        except Exception:
+            client.close()
+
+    async def _acquire(self) -> Tuple[aiosmtplib.SMTP, int]:
+        self._ensure_loop()
+        await self._semaphore.acquire()
+        try:
+            now = self._loop.time()
+            while self._idle:
+                client, last_used, sent_count = self._idle.pop()
+                if not client.is_connected or now - last_used > self.idle_timeout:
+                    await self._discard(client)
+                    continue
+                self._in_use += 1
+                return client, sent_count
+
+            client = await self._connect()
+            self._in_use += 1
+            return client, 0
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def _release(self, client: aiosmtplib.SMTP, sent_count: int, reusable: bool = True):
+        self._in_use -= 1
+        if reusable and client.is_connected:
+            self._idle.append((client, self._loop.time(), sent_count))
+        self._semaphore.release()
+
+    async def send_message(self, message: Message) -> None:
+        """
+        풀의 세션을 이용해 메시지를 전송합니다.
+
+        세션이 서버에 의해 끊긴 경우, 새 세션을 열어 한 번 재시도합니다.
+
+        Args:
+            message (Message): 전송할 이메일 메시지
+        """
+        client, sent_count = await self._acquire()
+        try:
+            try:
+                await client.send_message(message)
+            except _RECONNECTABLE_ERRORS as e:
+                logger.info(f"SMTP session dropped ({e}). Reconnecting and retrying once.")
+                await self._discard(client)
+                client, sent_count = await self._connect(), 0
+                await client.send_message(message)
+        except BaseException:
+            await self._discard(client)
+            self._release(client, sent_count, reusable=False)
+            raise
+
+        sent_count += 1
+        self.messages_sent += 1
+        if self.max_messages_per_connection and sent_count >= self.max_messages_per_connection:
+            await self._discard(client)
+            self._release(client, sent_count, reusable=False)
+        else:
+            self._release(client, sent_count)
+
+    async def close(self):
+        """유휴 세션을 모두 종료합니다."""
+        while self._idle:
+            client, _, _ = self._idle.pop()
+            await self._discard(client)
+
+    def get_stats(self) -> Dict[str, int]:
+        """풀 상태 통계를 반환합니다."""
+        return {
+            "pool_size": self.pool_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "connections_opened": self.connections_opened,
+            "messages_sent": self.messages_sent,
+        }
@@ -1,7 +1,10 @@
 import logging
 import os
+from datetime import timedelta
 from telegram import Bot
+from telegram.error import RetryAfter
 from .channel import NotificationChannel
+from src.common.utils.exceptions import NotificationThrottledError
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,19 @@ class TelegramChannel(NotificationChannel):
         Returns:
             bool: 전송 성공 여부
         """
+        try:
+            return await self.deliver(recipient, message, **kwargs)
+        except NotificationThrottledError as e:
+            logger.error(f"[텔레그램 알림 전송 실패] chat_id: {recipient}, error: {e}")
+            return False
+
+    async def deliver(self, recipient: str, message: str, **kwargs) -> bool:
+        """
+        텔레그램으로 메시지를 전송하되, 속도 제한(429)은 예외로 전달합니다.
+
+        Raises:
+            NotificationThrottledError: 텔레그램이 retry_after와 함께 요청을 거부한 경우
+        """
         token = os.getenv("TELEGRAM_BOT_TOKEN")
         if not token:
             logger.warning("TELEGRAM_BOT_TOKEN is not set. Skipping message sending.")
@@ -35,8 +51,9 @@ class TelegramChannel(NotificationChannel):
             logger.error(f"Invalid recipient for Telegram channel: {recipient}. Must be convertible to int.")
             return False
 
-        bot = Bot(token=token)
-        
+        # TELEGRAM_API_BASE_URL: 부하 테스트 등에서 가짜 Bot API 서버로 요청을 보낼 때 사용
+        bot = Bot(token=token, base_url=os.getenv("TELEGRAM_API_BASE_URL", "https://api.telegram.org/bot"))
+
         logger.debug(f"Attempting to send message to chat_id: {chat_id}, text: {message[:50]}...")
         try:
             sent_message = await bot.send_message(chat_id=chat_id, text=message)
@@ -46,6 +63,10 @@ class TelegramChannel(NotificationChannel):
             else:
                 logger.warning(f"Message sent to chat_id: {chat_id}, but no message object was returned.")
                 return False
+        except RetryAfter as e:
+            retry_after = e.retry_after.total_seconds() if isinstance(e.retry_after, timedelta) else float(e.retry_after)
+            logger.warning(f"Telegram rate limit hit for chat_id: {chat_id}. Retry after {retry_after}s.")
+            raise NotificationThrottledError(str(e), retry_after=retry_after) from e
         except Exception as e:
             logger.error(f"[텔레그램 알림 전송 실패] chat_id: {chat_id}, error: {e}", exc_info=True)
             return False
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import anyio
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from src.common.models.notification_outbox import NotificationOutbox
+from src.common.services.notify_service import notification_service
+from src.common.utils.exceptions import NotificationThrottledError
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationOutboxService:
+    """
+    notification_outbox 테이블을 이용한 알림 적재/전송 서비스입니다.
+
+    - 평가 코드: enqueue_many()로 상태 변경과 같은 트랜잭션 안에서 알림을 적재합니다. (commit은 호출자가 담당)
+    - 워커: deliver_pending()으로 대기 중인 알림을 SKIP LOCKED로 가져가 전송하고, 실패 시 지수 백오프로 재시도합니다.
+
+    전송 중에는 트랜잭션(행 잠금, 커넥션)을 유지하지 않습니다. 가져간 행은 'sending' 상태와 임대 만료 시각
+    (next_attempt_at)을 기록해 바로 커밋하고, 전송 후 결과를 짧은 두 번째 트랜잭션으로 기록합니다.
+    워커가 전송 중 종료되면 임대가 만료된 뒤 다른 워커가 다시 가져갑니다.
+    """
+
+    BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+    MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    BACKOFF_BASE_SECONDS = float(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", "30"))
+    BACKOFF_MAX_SECONDS = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", "3600"))
+    # 'sending' 상태로 가져간 배치의 임대 시간 (초). 이 시간 안에 결과가 기록되지 않으면 다시 전송 대상이 됩니다.
+    LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+
+    def enqueue_many(self, db: Session, notifications: List[Dict[str, Any]]) -> int:
+        """
+        알림 여러 건을 한 번의 INSERT로 적재합니다.
+
+        dedup_key가 이미 존재하는 알림은 무시되므로, 평가 작업이 중단 후 다시 실행되어도
+        같은 알림이 두 번 적재되지 않습니다.
+
+        Args:
+            db (Session): 평가 코드가 사용 중인 DB 세션
+            notifications (List[Dict]): {'recipient', 'message', 'dedup_key', 'channel'(선택)} 목록
+
+        Returns:
+            int: 적재 요청한 알림 수
+        """
+        if not notifications:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [{
+            'channel': n.get('channel', 'telegram'),
+            'recipient': str(n['recipient']),
+            'message': n['message'],
+            'dedup_key': n['dedup_key'],
+            'status': 'pending',
+            'attempts': 0,
+            'next_attempt_at': now,
+            'created_at': now,
+        } for n in notifications]
+
+        dialect = db.bind.dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            insert = pg_insert if dialect == 'postgresql' else sqlite_insert
+            db.execute(insert(NotificationOutbox).values(rows).on_conflict_do_nothing(index_elements=['dedup_key']))
+        else:
+            existing = {
+                key for (key,) in db.query(NotificationOutbox.dedup_key).filter(
+                    NotificationOutbox.dedup_key.in_([r['dedup_key'] for r in rows])
+                ).all()
+            }
+            db.add_all([NotificationOutbox(**r) for r in rows if r['dedup_key'] not in existing])
+
+        logger.debug(f"알림 {len(rows)}건을 outbox에 적재했습니다.")
+        return len(rows)
+
+    def claim_batch(self, db: Session, batch_size: int = None) -> List[NotificationOutbox]:
+        """
+        전송할 차례가 된 알림을 잠금과 함께 가져옵니다.
+
+        FOR UPDATE SKIP LOCKED를 사용하므로 여러 워커가 동시에 실행되어도
+        같은 행을 중복으로 가져가지 않습니다. 잠금은 호출자가 commit할 때 해제됩니다.
+        임대가 만료된 'sending' 행(전송 중 워커가 종료된 경우)도 함께 가져갑니다.
+        """
+        return db.query(NotificationOutbox).filter(
+            or_(NotificationOutbox.status == 'pending', NotificationOutbox.status == 'sending'),
+            NotificationOutbox.next_attempt_at <= datetime.utcnow()
+        ).order_by(NotificationOutbox.id).limit(batch_size or self.BATCH_SIZE).with_for_update(skip_locked=True).all()
+
+    def _lease_batch(self, db: Session, batch_size: int = None) -> List[Dict[str, Any]]:
+        """배치를 가져와 'sending'으로 표시하고 커밋한 뒤, 전송에 필요한 값만 반환합니다."""
+        try:
+            rows = self.claim_batch(db, batch_size)
+            lease_until = datetime.utcnow() + timedelta(seconds=self.LEASE_SECONDS)
+            for row in rows:
+                row.status = 'sending'
+                row.next_attempt_at = lease_until
+            leased = [{
+                'id': row.id, 'channel': row.channel, 'recipient': row.recipient,
+                'message': row.message, 'attempts': row.attempts,
+            } for row in rows]
+            db.commit()
+            return leased
+        except Exception:
+            db.rollback()
+            raise
+
+    def _record_results(self, db: Session, outcomes: List[Dict[str, Any]]):
+        """전송 결과를 한 번의 짧은 트랜잭션으로 기록합니다."""
+        try:
+            db.bulk_update_mappings(NotificationOutbox, outcomes)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), self.BACKOFF_MAX_SECONDS))
+
+    async def _send(self, item: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """단건을 전송하고 행에 기록할 결과를 반환합니다."""
+        channel = notification_service.channels.get(item['channel'])
+        attempts = item['attempts']
+        async with semaphore:
+            try:
+                if channel is None:
+                    raise ValueError(f"Unknown notification channel: {item['channel']}")
+                if not await channel.deliver(item['recipient'], item['message']):
+                    raise RuntimeError("channel returned False")
+            except NotificationThrottledError as e:
+                # 속도 제한은 시도 횟수에 포함하지 않고, 안내받은 시간 이후로 미룹니다.
+                return {'id': item['id'], 'status': 'pending',
+                        'next_attempt_at': datetime.utcnow() + timedelta(seconds=e.retry_after),
+                        'last_error': f"throttled: {e}"}
+            except Exception as e:
+                attempts += 1
+                if attempts >= self.MAX_ATTEMPTS:
+                    logger.error(f"[Outbox] 알림 {item['id']} 전송 최종 실패 ({attempts}회): {e}")
+                    return {'id': item['id'], 'status': 'failed', 'attempts': attempts, 'last_error': str(e)}
+                next_attempt_at = datetime.utcnow() + self._backoff(attempts)
+                logger.warning(f"[Outbox] 알림 {item['id']} 전송 실패 ({attempts}회), {next_attempt_at}에 재시도: {e}")
+                return {'id': item['id'], 'status': 'pending', 'attempts': attempts,
+                        'next_attempt_at': next_attempt_at, 'last_error': str(e)}
+
+        return {'id': item['id'], 'status': 'sent', 'attempts': attempts + 1,
+                'sent_at': datetime.utcnow(), 'last_error': None}
+
+    async def deliver_pending(self, db: Session, batch_size: int = None) -> Dict[str, int]:
+        """
+        대기 중인 알림을 한 배치 가져와 채널별 동시 전송 수 제한 안에서 전송합니다.
+
+        DB 작업(가져가기, 결과 기록)은 스레드에서 실행하여 이벤트 루프를 막지 않으며,
+        네트워크 전송 중에는 트랜잭션을 열어 두지 않습니다.
+
+        Returns:
+            Dict[str, int]: 배치 처리 결과 {'claimed', 'sent', 'retrying', 'failed'}
+        """
+        items = await anyio.to_thread.run_sync(self._lease_batch, db, batch_size)
+        result = {'claimed': len(items), 'sent': 0, 'retrying': 0, 'failed': 0}
+        if not items:
+            return result
+
+        semaphores = {
+            name: asyncio.Semaphore(max(1, notification_service.concurrency_limits.get(name, 1)))
+            for name in {item['channel'] for item in items}
+        }
+        outcomes = await asyncio.gather(*(self._send(item, semaphores[item['channel']]) for item in items))
+        for outcome in outcomes:
+            if outcome['status'] == 'sent':
+                result['sent'] += 1
+            elif outcome['status'] == 'failed':
+                result['failed'] += 1
+            else:
+                result['retrying'] += 1
+        await anyio.to_thread.run_sync(self._record_results, db, outcomes)
+
+        logger.info(f"[Outbox] 배치 처리 결과: {result}")
+        return result
+
+
+# 싱글톤 인스턴스
+notification_outbox_service = NotificationOutboxService()
@@ -1,21 +1,48 @@
+import asyncio
 import logging
 import os
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .notification.channel import NotificationChannel
 from .notification.telegram_channel import TelegramChannel
 from .notification.email_channel import EmailChannel
+from src.common.utils.exceptions import NotificationThrottledError
 
 logger = logging.getLogger(__name__)
 
+Recipients = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+
+async def _iterate_recipients(recipients: Recipients) -> AsyncIterator[Dict[str, Any]]:
+    """동기/비동기 iterable 모두를 비동기로 순회합니다."""
+    if hasattr(recipients, '__aiter__'):
+        async for recipient in recipients:
+            yield recipient
+    else:
+        for recipient in recipients:
+            yield recipient
+
+
 class NotificationService:
     """알림 서비스를 관리하는 클래스입니다."""
-    
-    def __init__(self):
+
+    # broadcast 시 채널별 기본 동시 전송 수
+    DEFAULT_CONCURRENCY_LIMITS: Dict[str, int] = {
+        'telegram': int(os.getenv("NOTIFY_TELEGRAM_CONCURRENCY", "20")),
+        'email': int(os.getenv("NOTIFY_EMAIL_CONCURRENCY", "4")),
+    }
+    # 채널별 대기열 크기. 모든 채널의 대기열이 이 크기 이상이면 수신자 스트림 읽기를 잠시 멈춥니다.
+    BROADCAST_BUFFER_SIZE = 1000
+    # 속도 제한(429) 발생 시 재시도 횟수와 최대 대기 시간(초)
+    MAX_THROTTLE_RETRIES = 1
+    MAX_THROTTLE_WAIT_SECONDS = 30.0
+
+    def __init__(self, concurrency_limits: Optional[Dict[str, int]] = None):
         self.channels: Dict[str, NotificationChannel] = {
             'telegram': TelegramChannel(),
             'email': EmailChannel(),
         }
+        self.concurrency_limits: Dict[str, int] = {**self.DEFAULT_CONCURRENCY_LIMITS, **(concurrency_limits or {})}
 
     async def send_message(self, recipient: str, message: str, channel_name: str = 'telegram', **kwargs) -> bool:
         """
@@ -37,39 +64,110 @@ class NotificationService:
             
         return await channel.send(recipient, message, **kwargs)
 
-    async def broadcast(self, recipients: List[Dict[str, Any]], message: str, **kwargs):
+    @staticmethod
+    def _iter_targets(recipient: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        """수신자 정보에서 (채널 이름, 채널별 수신자 ID) 목록을 추출합니다."""
+        # 설정 기반 다중 채널 발송
+        if 'targets' in recipient and 'preferences' in recipient:
+            preferences = recipient['preferences']
+            for channel_name, target_id in recipient['targets'].items():
+                # 설정이 True인 경우에만 발송
+                if preferences.get(channel_name, False):
+                    yield channel_name, target_id
+        # 기존 방식 지원 (단일 채널)
+        elif 'id' in recipient:
+            yield recipient.get('channel', 'telegram'), recipient['id']
+
+    async def _deliver(self, channel_name: str, recipient: str, message: str, **kwargs) -> str:
+        """
+        broadcast용 단건 전송. 결과를 'sent', 'failed', 'throttled' 중 하나로 반환합니다.
+        """
+        channel = self.channels.get(channel_name)
+        if not channel:
+            logger.error(f"Unknown notification channel: {channel_name}")
+            return 'failed'
+
+        attempt = 0
+        while True:
+            try:
+                return 'sent' if await channel.deliver(recipient, message, **kwargs) else 'failed'
+            except NotificationThrottledError as e:
+                if attempt >= self.MAX_THROTTLE_RETRIES:
+                    logger.warning(f"[{channel_name}] 속도 제한으로 전송 포기: recipient={recipient}")
+                    return 'throttled'
+                attempt += 1
+                # 이 대기는 해당 채널의 작업자 하나만 멈추며, 다른 채널에는 영향을 주지 않습니다.
+                await asyncio.sleep(min(e.retry_after, self.MAX_THROTTLE_WAIT_SECONDS))
+            except Exception as e:
+                logger.error(f"[{channel_name}] 전송 중 예외 발생: recipient={recipient}, error={e}", exc_info=True)
+                return 'failed'
+
+    async def _broadcast_worker(self, channel_name: str, queue: asyncio.Queue, space: asyncio.Event, message: str, stats: Dict[str, int], kwargs: Dict[str, Any]):
+        """채널 대기열에서 수신자를 꺼내 전송하고 결과를 집계합니다."""
+        while True:
+            recipient = await queue.get()
+            if queue.qsize() < self.BROADCAST_BUFFER_SIZE:
+                space.set()
+            try:
+                stats[await self._deliver(channel_name, recipient, message, **kwargs)] += 1
+            finally:
+                queue.task_done()
+
+    async def broadcast(self, recipients: Recipients, message: str, concurrency: Optional[Dict[str, int]] = None, **kwargs) -> Dict[str, Dict[str, int]]:
         """
-        여러 수신자에게 메시지를 전송합니다.
-        
+        여러 수신자에게 메시지를 채널별로 동시에 전송합니다.
+
+        채널마다 독립된 대기열과 작업자(동시 전송 수 제한)를 두므로,
+        느린 채널(예: 이메일)이 다른 채널(예: 텔레그램)의 전송을 지연시키지 않습니다.
+        수신자는 스트리밍으로 읽으며, 모든 채널의 대기열이 BROADCAST_BUFFER_SIZE 이상 쌓인 경우에만 읽기를 잠시 멈춥니다.
+        (느린 채널 하나의 대기열이 찼다고 읽기를 멈추면 빠른 채널도 함께 멈추므로,
+        그동안 느린 채널의 대기열은 크기 제한 없이 수신자 ID를 쌓아 둡니다.)
+
         Args:
-            recipients (List[Dict]): 수신자 정보 목록
+            recipients (Iterable[Dict] | AsyncIterable[Dict]): 수신자 정보 목록 또는 비동기 iterator
                 - 기존 방식: [{'id': '...', 'channel': '...'}, ...]
                 - 설정 기반: [{'targets': {'telegram': '...', 'email': '...'}, 'preferences': {'telegram': True, ...}}, ...]
             message (str): 메시지 내용
+            concurrency (Dict[str, int], optional): 이번 발송에만 적용할 채널별 동시 전송 수
+
+        Returns:
+            Dict[str, Dict[str, int]]: 채널별 전송 결과
+                예: {'telegram': {'sent': 10, 'failed': 1, 'throttled': 0}}
         """
-        for recipient in recipients:
-            # 설정 기반 다중 채널 발송
-            if 'targets' in recipient and 'preferences' in recipient:
-                targets = recipient['targets']
-                preferences = recipient['preferences']
-                
-                for channel_name, target_id in targets.items():
-                    # 설정이 True인 경우에만 발송
-                    if preferences.get(channel_name, False):
-                        await self.send_message(
-                            recipient=target_id,
-                            message=message,
-                            channel_name=channel_name,
-                            **kwargs
-                        )
-            # 기존 방식 지원 (단일 채널)
-            elif 'id' in recipient:
-                await self.send_message(
-                    recipient=recipient['id'], 
-                    message=message, 
-                    channel_name=recipient.get('channel', 'telegram'),
-                    **kwargs
-                )
+        limits = {**self.concurrency_limits, **(concurrency or {})}
+        results: Dict[str, Dict[str, int]] = {}
+        queues: Dict[str, asyncio.Queue] = {}
+        workers: List[asyncio.Task] = []
+        # 어느 채널이든 대기열에 여유가 생기면 설정됨
+        space = asyncio.Event()
+
+        def _get_queue(channel_name: str) -> asyncio.Queue:
+            if channel_name not in queues:
+                queues[channel_name] = asyncio.Queue()
+                results[channel_name] = {'sent': 0, 'failed': 0, 'throttled': 0}
+                for _ in range(max(1, limits.get(channel_name, 1))):
+                    workers.append(asyncio.create_task(
+                        self._broadcast_worker(channel_name, queues[channel_name], space, message, results[channel_name], kwargs)
+                    ))
+            return queues[channel_name]
+
+        try:
+            async for recipient in _iterate_recipients(recipients):
+                for channel_name, target_id in self._iter_targets(recipient):
+                    _get_queue(channel_name).put_nowait(target_id)
+                # 모든 채널이 밀려 있을 때만 읽기를 멈춤 (한 채널이라도 여유가 있으면 계속 읽음)
+                while queues and all(q.qsize() >= self.BROADCAST_BUFFER_SIZE for q in queues.values()):
+                    space.clear()
+                    await space.wait()
+            for queue in queues.values():
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(f"Broadcast 완료: {results}")
+        return results
 
 # 싱글톤 인스턴스
 notification_service = NotificationService()
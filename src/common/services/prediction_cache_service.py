@@ -0,0 +1,165 @@
+import logging
+import os
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.common.models.daily_price import DailyPrice, latest_price_window_start
+from src.common.utils.cache import TieredCache, MISSING
+from src.common.utils.technical_analysis import ANALYSIS_WINDOW_DAYS, MODEL_VERSION, build_prediction_results
+
+logger = logging.getLogger(__name__)
+
+# 예측 결과는 새 일봉이 들어올 때만 바뀌므로 (종목, 최신 일봉 날짜, 분석 로직 버전)을 키로 캐시합니다.
+# 새 일봉이 저장되면 키 자체가 바뀌므로 이전 결과는 자연히 사용되지 않습니다.
+prediction_cache = TieredCache(
+    namespace="prediction",
+    l1_maxsize=int(os.getenv("PREDICTION_CACHE_L1_MAXSIZE", "4096")),
+    l1_ttl=float(os.getenv("PREDICTION_CACHE_L1_TTL_SECONDS", "300")),
+    l2_ttl=float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "129600")),
+)
+
+
+class PredictionCacheService:
+    """
+    /predict 결과 캐시를 관리하는 서비스입니다.
+
+    - API: get()/set()으로 (종목, 최신 일봉 날짜, MODEL_VERSION) 단위로 결과를 재사용합니다.
+    - 워커: 시세 저장 후 prewarm()으로 갱신된 종목의 예측을 미리 계산해 둡니다.
+      과거 시세 보정처럼 최신 날짜는 그대로인데 데이터가 바뀐 경우에도 prewarm()이 값을 덮어씁니다.
+    """
+
+    PREWARM_CHUNK_SIZE = int(os.getenv("PREDICTION_PREWARM_CHUNK_SIZE", "200"))
+
+    @staticmethod
+    def cache_key(symbol: str, latest_date: date) -> str:
+        return f"{symbol}:{latest_date.isoformat()}:{MODEL_VERSION}"
+
+    def get_latest_price_date(self, db: Session, symbol: str) -> Optional[date]:
+        """종목의 최신 일봉 날짜를 조회합니다. (ix_daily_prices_symbol_date 인덱스만 사용, 최근 기간에 없으면 전체 기간)"""
+        latest = db.query(func.max(DailyPrice.date)).filter(
+            DailyPrice.symbol == symbol, DailyPrice.date >= latest_price_window_start()
+        ).scalar()
+        if latest is None:
+            latest = db.query(func.max(DailyPrice.date)).filter(DailyPrice.symbol == symbol).scalar()
+        return latest
+
+    def get_latest_price_dates(self, db: Session, symbols: List[str]) -> Dict[str, date]:
+        """여러 종목의 최신 일봉 날짜를 한 번의 쿼리로 조회합니다."""
+        if not symbols:
+            return {}
+        rows = db.query(DailyPrice.symbol, func.max(DailyPrice.date)).filter(
+            DailyPrice.symbol.in_(symbols), DailyPrice.date >= latest_price_window_start()
+        ).group_by(DailyPrice.symbol).all()
+        result = {symbol: latest for symbol, latest in rows}
+        missing = [s for s in symbols if s not in result]
+        if missing:
+            rows = db.query(DailyPrice.symbol, func.max(DailyPrice.date)).filter(
+                DailyPrice.symbol.in_(missing)
+            ).group_by(DailyPrice.symbol).all()
+            result.update({symbol: latest for symbol, latest in rows})
+        return result
+
+    def load_recent_prices(self, db: Session, symbols: List[str], days: int = ANALYSIS_WINDOW_DAYS) -> Dict[str, List[dict]]:
+        """
+        여러 종목의 최근 N일치 일별 시세를 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Dict[str, List[dict]]: 종목별 시세 목록 (오래된 날짜부터)
+        """
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        # ORM 객체 대신 컬럼만 조회하여 수만 행을 읽을 때의 객체 생성 비용을 줄임
+        rows = db.query(
+            DailyPrice.symbol, DailyPrice.date, DailyPrice.open, DailyPrice.high,
+            DailyPrice.low, DailyPrice.close, DailyPrice.volume
+        ).filter(
+            DailyPrice.symbol.in_(symbols),
+            DailyPrice.date >= start_date,
+            DailyPrice.date <= end_date
+        ).order_by(DailyPrice.symbol, DailyPrice.date.asc()).all()
+
+        grouped: Dict[str, List[dict]] = defaultdict(list)
+        for symbol, price_date, open_, high, low, close, volume in rows:
+            grouped[symbol].append({
+                "date": price_date,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume
+            })
+        return grouped
+
+    def get(self, symbol: str, latest_date: date) -> Optional[dict]:
+        value = prediction_cache.get(self.cache_key(symbol, latest_date))
+        return None if value is MISSING else value
+
+    def set(self, symbol: str, latest_date: date, result: dict):
+        prediction_cache.set(self.cache_key(symbol, latest_date), result)
+
+    async def aget(self, symbol: str, latest_date: date) -> Optional[dict]:
+        """get()의 비동기 버전 (Redis 조회 시 이벤트 루프를 막지 않음)"""
+        value = await prediction_cache.aget(self.cache_key(symbol, latest_date))
+        return None if value is MISSING else value
+
+    async def aset(self, symbol: str, latest_date: date, result: dict):
+        await prediction_cache.aset(self.cache_key(symbol, latest_date), result)
+
+    def get_many(self, latest_dates: Dict[str, date]) -> Dict[str, dict]:
+        """여러 종목의 캐시된 예측을 한 번에 조회합니다. (캐시에 없는 종목은 포함되지 않음)"""
+        keys = {self.cache_key(symbol, latest_date): symbol for symbol, latest_date in latest_dates.items()}
+        return {keys[key]: value for key, value in prediction_cache.get_many(keys).items()}
+
+    def set_many(self, results: Dict[str, dict], latest_dates: Dict[str, date]):
+        """여러 종목의 예측을 한 번에 저장합니다. (최신 일봉 날짜가 없는 종목은 저장하지 않음)"""
+        prediction_cache.set_many({
+            self.cache_key(symbol, latest_dates[symbol]): result
+            for symbol, result in results.items() if symbol in latest_dates
+        })
+
+    async def aget_many(self, latest_dates: Dict[str, date]) -> Dict[str, dict]:
+        """get_many()의 비동기 버전 (Redis 조회 시 이벤트 루프를 막지 않음)"""
+        keys = {self.cache_key(symbol, latest_date): symbol for symbol, latest_date in latest_dates.items()}
+        return {keys[key]: value for key, value in (await prediction_cache.aget_many(keys)).items()}
+
+    async def aset_many(self, results: Dict[str, dict], latest_dates: Dict[str, date]):
+        await prediction_cache.aset_many({
+            self.cache_key(symbol, latest_dates[symbol]): result
+            for symbol, result in results.items() if symbol in latest_dates
+        })
+
+    def prewarm(self, db: Session, symbols: Iterable[str]) -> int:
+        """
+        지정한 종목의 예측을 계산하여 캐시에 저장합니다.
+
+        캐시 갱신 실패가 시세 수집 작업을 실패시키지 않도록 오류는 기록만 합니다.
+
+        Returns:
+            int: 캐시에 저장한 종목 수
+        """
+        symbols = list(dict.fromkeys(symbols))
+        warmed = 0
+        for i in range(0, len(symbols), self.PREWARM_CHUNK_SIZE):
+            chunk = symbols[i:i + self.PREWARM_CHUNK_SIZE]
+            try:
+                latest_dates = self.get_latest_price_dates(db, chunk)
+                recent_prices = self.load_recent_prices(db, list(latest_dates))
+                results = build_prediction_results({symbol: recent_prices.get(symbol, []) for symbol in latest_dates})
+                self.set_many(results, latest_dates)
+                warmed += len(results)
+            except Exception as e:
+                logger.error(f"[PredictionCache] 예측 캐시 사전 계산 실패 ({len(chunk)}개 종목): {e}", exc_info=True)
+        logger.info(f"[PredictionCache] {warmed}개 종목의 예측 캐시를 갱신했습니다.")
+        return warmed
+
+    def get_stats(self) -> Dict:
+        """예측 캐시 적중/실패 통계를 반환합니다."""
+        return {**prediction_cache.get_stats(), "model_version": MODEL_VERSION}
+
+
+# 싱글톤 인스턴스
+prediction_cache_service = PredictionCacheService()
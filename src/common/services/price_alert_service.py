@@ -9,8 +9,8 @@ from src.common.models.price_alert import PriceAlert
 from src.common.models.stock_master import StockMaster
 from src.common.models.user import User
 from src.common.schemas.price_alert import PriceAlertCreate, PriceAlertUpdate
-from src.common.models.daily_price import DailyPrice
-from src.common.services.notify_service import send_telegram_message
+from src.common.models.daily_price import DailyPrice, latest_price_window_start
+from src.common.services.notification_outbox_service import notification_outbox_service
 from src.common.services.market_data_service import MarketDataService # Import here
 
 logger = logging.getLogger(__name__)
@@ -121,19 +121,33 @@ class PriceAlertService:
     def _get_latest_prices(self, db: Session, symbols: List[str]):
         """
         심볼 목록에 대한 최신 가격을 조회합니다.
+        최근 기간(LATEST_PRICE_LOOKBACK_DAYS)에서 먼저 찾고, 그 안에 시세가 없는 종목만 전체 기간에서 다시 찾습니다.
+        """
+        latest = self._query_latest_prices(db, symbols, since=latest_price_window_start())
+        found = {p.symbol for p in latest}
+        missing = [s for s in symbols if s not in found]
+        if missing:
+            latest += self._query_latest_prices(db, missing)
+        return latest
+
+    def _query_latest_prices(self, db: Session, symbols: List[str], since=None):
+        """
         PostgreSQL의 경우 DISTINCT ON을 사용하여 효율적으로 조회하고,
         SQLite(테스트 환경)의 경우 Python 레벨에서 필터링합니다.
         """
+        conditions = [DailyPrice.symbol.in_(symbols)]
+        if since is not None:
+            conditions.append(DailyPrice.date >= since)
         if db.bind.dialect.name == 'postgresql':
             return db.query(DailyPrice).filter(
-                DailyPrice.symbol.in_(symbols)
+                *conditions
             ).distinct(DailyPrice.symbol).order_by(
                 DailyPrice.symbol, DailyPrice.date.desc()
             ).all()
         else:
             # SQLite fallback
             prices = db.query(DailyPrice).filter(
-                DailyPrice.symbol.in_(symbols)
+                *conditions
             ).order_by(DailyPrice.date.desc()).all()
             
             latest = {}
@@ -157,6 +171,9 @@ class PriceAlertService:
             # 심볼별 가격 매핑
             price_map = {p.symbol: p for p in latest_prices}
 
+            # 발송할 알림은 outbox에 모아 두었다가 알림 이력 갱신과 같은 트랜잭션으로 커밋
+            notifications = []
+
             for alert in alerts:
                 # Check notification interval
                 if alert.last_notified_at and alert.notification_interval_hours:
@@ -196,8 +213,14 @@ class PriceAlertService:
                     # TODO: 변동률 체크도 Bulk 조회로 개선 필요
                     prev_price_obj = db.query(DailyPrice).filter(
                         DailyPrice.symbol == alert.symbol,
-                        DailyPrice.date < daily_price.date
+                        DailyPrice.date < daily_price.date,
+                        DailyPrice.date >= latest_price_window_start(daily_price.date)
                     ).order_by(DailyPrice.date.desc()).first()
+                    if prev_price_obj is None:
+                        prev_price_obj = db.query(DailyPrice).filter(
+                            DailyPrice.symbol == alert.symbol,
+                            DailyPrice.date < daily_price.date
+                        ).order_by(DailyPrice.date.desc()).first()
 
                     if prev_price_obj:
                         prev_close = prev_price_obj.close
@@ -211,14 +234,21 @@ class PriceAlertService:
                             message = f"[{alert.symbol}] {stock_name}\n변동률 도달: {alert.change_percent}% down\n현재 변동률: {change_rate:.2f}%\n현재가: {current_price}원"
 
                 if triggered:
-                    # Send notification
                     # User is already loaded via joinedload
                     if alert.user.telegram_id:
-                        await send_telegram_message(alert.user.telegram_id, message)
-                        
-                        alert.last_notified_at = datetime.utcnow()
                         alert.notification_count += 1
-                        db.commit()
+                        alert.last_notified_at = datetime.utcnow()
+                        notifications.append({
+                            'recipient': alert.user.telegram_id,
+                            'message': message,
+                            # 알림 회차를 키에 포함하여 재실행 시에도 같은 알림이 중복 적재되지 않도록 함
+                            'dedup_key': f"price_alert:{alert.id}:{alert.notification_count}",
+                        })
+
+            if notifications:
+                notification_outbox_service.enqueue_many(db, notifications)
+                db.commit()
+                logger.info(f"가격 알림 {len(notifications)}건을 outbox에 적재했습니다.")
         except Exception as e:
             logger.error(f"Error checking and notifying price alerts: {e}", exc_info=True)
 
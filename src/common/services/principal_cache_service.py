@@ -0,0 +1,61 @@
+import logging
+import os
+from typing import Dict, Optional
+
+from src.common.models.user import User
+from src.common.utils.cache import TieredCache, MISSING
+
+logger = logging.getLogger(__name__)
+
+# 인증에 필요한 사용자 정보(principal)를 (사용자 ID, 토큰 버전)을 키로 캐시합니다.
+# 다른 프로세스에서 무효화한 값은 L1 TTL이 지나면 반영되므로 L1 TTL은 짧게 유지합니다.
+principal_cache = TieredCache(
+    namespace="principal",
+    l1_maxsize=int(os.getenv("PRINCIPAL_CACHE_L1_MAXSIZE", "10000")),
+    l1_ttl=float(os.getenv("PRINCIPAL_CACHE_L1_TTL_SECONDS", "30")),
+    l2_ttl=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "300")),
+)
+
+PRINCIPAL_FIELDS = ("id", "username", "email", "role", "is_active", "telegram_id", "token_version")
+
+
+class PrincipalCacheService:
+    """
+    get_current_active_user가 사용하는 인증 사용자 캐시를 관리하는 서비스입니다.
+
+    - 캐시 적중 시 인증에 DB 조회가 필요 없습니다.
+    - 사용자 정보가 바뀌면 invalidate()로 해당 키를 지웁니다. (UserService.update_user 등)
+    - 토큰 버전이 올라가면 이전 토큰의 키는 더 이상 조회되지 않습니다.
+    """
+
+    @staticmethod
+    def cache_key(user_id: int, token_version: int) -> str:
+        return f"{user_id}:{token_version}"
+
+    @staticmethod
+    def to_principal(user: User) -> dict:
+        return {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+
+    def get(self, user_id: int, token_version: int) -> Optional[User]:
+        """
+        캐시된 사용자를 반환합니다.
+
+        Returns:
+            User | None: 세션에 연결되지 않은 User 객체 (인증 정보 필드만 채워짐)
+        """
+        principal = principal_cache.get(self.cache_key(user_id, token_version))
+        return None if principal is MISSING else User(**principal)
+
+    def set(self, user: User):
+        principal_cache.set(self.cache_key(user.id, user.token_version or 0), self.to_principal(user))
+
+    def invalidate(self, user_id: int, token_version: Optional[int]):
+        principal_cache.invalidate([self.cache_key(user_id, token_version or 0)])
+
+    def get_stats(self) -> Dict:
+        """인증 사용자 캐시 적중/실패 통계를 반환합니다."""
+        return principal_cache.get_stats()
+
+
+# 싱글톤 인스턴스
+principal_cache_service = PrincipalCacheService()
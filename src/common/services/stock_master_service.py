@@ -1,13 +1,22 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Query, Session
 from src.common.models.stock_master import StockMaster
 import logging
 from datetime import datetime
+from typing import List, Tuple
 
 from src.common.utils.exceptions import DartApiError
 from src.common.utils.dart_utils import dart_get_all_stocks
+from src.common.services.symbol_search_index import symbol_search_index
 
 logger = logging.getLogger(__name__)
 
+
+def _escape_like(keyword: str) -> str:
+    """LIKE 패턴에서 특수 문자(%, _)가 와일드카드로 해석되지 않도록 이스케이프합니다."""
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class StockMasterService:
     def get_stock_by_symbol(self, symbol: str, db: Session):
         logger.debug(f"get_stock_by_symbol 호출: symbol={symbol}")
@@ -18,6 +27,21 @@ class StockMasterService:
             logger.debug(f"종목 없음: {symbol}")
         return stock
 
+    def get_stocks_by_symbols(self, symbols: List[str], db: Session) -> List[StockMaster]:
+        """
+        여러 종목 코드를 한 번의 쿼리(IN)로 조회합니다.
+
+        Args:
+            symbols (List[str]): 종목 코드 목록 (중복은 한 번만 조회)
+
+        Returns:
+            List[StockMaster]: 찾은 종목 목록 (없는 코드는 빠짐, 순서는 보장하지 않음)
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return []
+        return db.query(StockMaster).filter(StockMaster.symbol.in_(unique_symbols)).all()
+
     def get_stock_by_name(self, name: str, db: Session):
         logger.debug(f"get_stock_by_name 호출: name={name}")
         stock = db.query(StockMaster).filter(StockMaster.name.like(f"%{name}%")).first()
@@ -28,12 +52,80 @@ class StockMasterService:
         return stock
 
     def search_stocks(self, keyword: str, db: Session, limit: int = 10, offset: int = 0):
+        if db.bind.dialect.name == 'postgresql':
+            stocks, _ = self._search_stocks_ranked(keyword, db, limit=limit, offset=offset)
+            return stocks
         stocks = db.query(StockMaster).filter(
-            (StockMaster.symbol.like(f"%{keyword}%")) | 
-            (StockMaster.name.like(f"%{keyword}%"))
+            self._search_filter(keyword)
         ).offset(offset).limit(limit).all()
         return stocks
 
+    @staticmethod
+    def _search_filter(keyword: str):
+        pattern = f"%{_escape_like(keyword)}%"
+        return or_(StockMaster.name.ilike(pattern, escape="\\"), StockMaster.symbol.ilike(pattern, escape="\\"))
+
+    def _build_ranked_search_query(self, keyword: str, db: Session) -> Query:
+        """
+        pg_trgm 기반 정렬 검색 쿼리를 만듭니다.
+
+        - 필터: 종목명/코드 ILIKE '%keyword%' (stock_master의 GIN trigram 인덱스 사용)
+        - 정렬: 코드 정확히 일치 → 이름 정확히 일치 → 유사도(similarity) 높은 순
+        - 전체 건수: COUNT(*) OVER()로 페이지와 같은 쿼리에서 함께 조회
+        """
+        exact_rank = case(
+            (StockMaster.symbol == keyword, 0),
+            (func.lower(StockMaster.name) == keyword.lower(), 1),
+            else_=2
+        )
+        similarity = func.greatest(func.similarity(StockMaster.name, keyword), func.similarity(StockMaster.symbol, keyword))
+        return db.query(StockMaster, func.count().over().label("total_count")).filter(
+            self._search_filter(keyword)
+        ).order_by(exact_rank, similarity.desc(), StockMaster.symbol)
+
+    def _search_stocks_ranked(self, keyword: str, db: Session, limit: int = 10, offset: int = 0) -> Tuple[List[StockMaster], int]:
+        """
+        PostgreSQL(pg_trgm)에서 정렬된 검색 결과 한 페이지와 전체 건수를 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Tuple[List[StockMaster], int]: (검색 결과, 전체 건수)
+        """
+        rows = self._build_ranked_search_query(keyword, db).offset(offset).limit(limit).all()
+        if rows:
+            return [stock for stock, _ in rows], rows[0].total_count
+        if offset == 0:
+            return [], 0
+        # 요청한 페이지가 결과 범위를 벗어나면 창 함수 값을 받을 행이 없으므로 건수만 따로 조회
+        total_count = db.query(func.count(StockMaster.symbol)).filter(self._search_filter(keyword)).scalar()
+        return [], total_count
+
+    def search_stocks_with_total(self, keyword: str, db: Session, limit: int = 10, offset: int = 0):
+        """
+        종목을 검색하고 전체 결과 수를 함께 반환합니다.
+
+        프로세스 내 검색 인덱스(symbol_search_index)를 사용할 수 있으면 DB 조회 없이 처리하고,
+        사용할 수 없으면 DB에서 검색합니다. (PostgreSQL은 pg_trgm 정렬 검색 한 번, 그 외는 같은 ILIKE 조건으로 페이지 + 건수 조회)
+
+        Returns:
+            Dict: {"items": [{"symbol", "name", "market"}], "total_count": 전체 결과 수}
+        """
+        if symbol_search_index.ensure_fresh(db):
+            return symbol_search_index.search(keyword, limit=limit, offset=offset)
+
+        if db.bind.dialect.name == 'postgresql':
+            stocks, total_count = self._search_stocks_ranked(keyword, db, limit=limit, offset=offset)
+        else:
+            stocks = self.search_stocks(keyword, db, limit=limit, offset=offset)
+            total_count = db.query(StockMaster).filter(self._search_filter(keyword)).count()
+        return {
+            "items": [{"symbol": s.symbol, "name": s.name, "market": s.market} for s in stocks],
+            "total_count": total_count
+        }
+
+    def get_search_index_stats(self):
+        """종목 검색 인덱스 상태를 반환합니다."""
+        return symbol_search_index.get_stats()
+
     @staticmethod
     def get_sample_stocks_for_test():
         logger.debug("get_sample_stocks_for_test 호출.")
@@ -90,6 +182,7 @@ class StockMasterService:
                     db.add(new_stock)
                 updated_count += 1
             db.commit()
+            symbol_search_index.invalidate()
             logger.info(f"종목마스터 갱신 완료. 총 {updated_count}개 종목 처리.")
             return {"success": True, "updated_count": updated_count}
         except Exception as e:
@@ -0,0 +1,279 @@
+"""
+종목 검색용 프로세스 내 인덱스입니다.
+
+- 종목 코드: 접두사 트라이 (예: '0059' → 005930)
+- 종목명: 정규화(소문자, 공백 제거)한 이름의 n-gram 역색인 (부분 문자열 검색)
+- 한글 초성: '삼성전자' → 'ㅅㅅㅈㅈ' 초성 문자열의 n-gram 역색인 (예: 'ㅅㅅ')
+
+인덱스는 불변 스냅샷으로 만들어 참조만 교체하므로, 재구성 중에도 검색은 이전 스냅샷으로 계속 처리됩니다.
+다른 프로세스(워커)에서 종목 마스터가 갱신되어도 주기적으로 (종목 수, 최종 수정 시각)을 확인하여 다시 만듭니다.
+"""
+import logging
+import os
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.common.models.stock_master import StockMaster
+from src.common.utils.cache import register_cache
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 2
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_JONGSEONG_COUNT = 21 * 28
+
+# 검색 결과 정렬 순위 (작을수록 먼저)
+RANK_EXACT_SYMBOL = 0
+RANK_EXACT_NAME = 1
+RANK_SYMBOL_PREFIX = 2
+RANK_NAME_PREFIX = 3
+RANK_NAME_CONTAINS = 4
+RANK_CHOSEONG = 5
+
+
+def normalize(text: Optional[str]) -> str:
+    """검색 비교용으로 문자열을 정규화합니다. (NFC, 소문자, 공백 제거)"""
+    if not text:
+        return ""
+    return "".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다. 한글이 아닌 문자는 그대로 둡니다. ('삼성SDI' → 'ㅅㅅsdi')"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_BASE) // _JUNGSEONG_JONGSEONG_COUNT])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """검색어가 초성(ㄱ~ㅎ)으로만 이루어져 있는지 확인합니다."""
+    return bool(text) and all(ch in _CHOSEONG_SET for ch in text)
+
+
+class _NgramIndex:
+    """부분 문자열 검색을 위한 n-gram 역색인입니다. 후보를 좁힌 뒤 실제 포함 여부로 검증합니다."""
+
+    def __init__(self, texts: Sequence[str], n: int = NGRAM_SIZE):
+        self.n = n
+        self.texts = texts
+        self.postings: Dict[str, Set[int]] = {}
+        for doc_id, text in enumerate(texts):
+            for gram in self._grams(text):
+                self.postings.setdefault(gram, set()).add(doc_id)
+
+    def _grams(self, text: str) -> Set[str]:
+        grams = set(text)  # 1글자 검색어용
+        grams.update(text[i:i + self.n] for i in range(len(text) - self.n + 1))
+        return grams
+
+    def search(self, query: str) -> Set[int]:
+        if not query:
+            return set()
+        if len(query) <= self.n:
+            return set(self.postings.get(query, ()))
+        postings = []
+        for i in range(len(query) - self.n + 1):
+            posting = self.postings.get(query[i:i + self.n])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {doc_id for doc_id in candidates if query in self.texts[doc_id]}
+
+
+class _SymbolTrie:
+    """종목 코드 접두사 트라이입니다. 각 노드에 하위 종목 id를 모두 보관하여 접두사 조회가 O(len(prefix))입니다."""
+
+    def __init__(self, symbols: Sequence[str]):
+        self.root: Dict[str, Any] = {"ids": []}
+        for doc_id in sorted(range(len(symbols)), key=lambda i: symbols[i]):
+            node = self.root
+            node["ids"].append(doc_id)
+            for ch in symbols[doc_id]:
+                node = node.setdefault(ch, {"ids": []})
+                node["ids"].append(doc_id)
+
+    def search(self, prefix: str) -> List[int]:
+        if not prefix:
+            return []
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node["ids"]
+
+
+class _Snapshot:
+    """한 시점의 종목 마스터로 만든 불변 인덱스입니다."""
+
+    def __init__(self, rows: Iterable[Tuple[str, str, Optional[str]]]):
+        self.items: List[Dict[str, Any]] = [
+            {"symbol": symbol, "name": name, "market": market} for symbol, name, market in rows
+        ]
+        self.symbols = [item["symbol"].lower() for item in self.items]
+        self.names = [normalize(item["name"]) for item in self.items]
+        self.symbol_trie = _SymbolTrie(self.symbols)
+        self.name_index = _NgramIndex(self.names)
+        self.choseong_index = _NgramIndex([to_choseong(name) for name in self.names])
+
+    def search(self, keyword: str) -> List[int]:
+        query = normalize(keyword)
+        if not query:
+            return []
+
+        ranks: Dict[int, int] = {}
+
+        def mark(doc_ids: Iterable[int], rank_of):
+            for doc_id in doc_ids:
+                rank = rank_of(doc_id)
+                if rank < ranks.get(doc_id, RANK_CHOSEONG + 1):
+                    ranks[doc_id] = rank
+
+        mark(self.symbol_trie.search(query),
+             lambda i: RANK_EXACT_SYMBOL if self.symbols[i] == query else RANK_SYMBOL_PREFIX)
+        mark(self.name_index.search(query),
+             lambda i: RANK_EXACT_NAME if self.names[i] == query
+             else RANK_NAME_PREFIX if self.names[i].startswith(query) else RANK_NAME_CONTAINS)
+        if is_choseong_query(query):
+            mark(self.choseong_index.search(query), lambda i: RANK_CHOSEONG)
+
+        return sorted(ranks, key=lambda i: (ranks[i], len(self.names[i]), self.symbols[i]))
+
+
+class SymbolSearchIndex:
+    """
+    /symbols/search에서 사용하는 종목 검색 인덱스입니다.
+
+    검색 대상은 종목 코드 접두사, 종목명 부분 문자열(대소문자/공백 무시), 한글 초성입니다.
+    결과는 정확히 일치 → 접두사 → 부분 일치 순으로 정렬되며, 전체 결과 수를 정확히 반환합니다.
+    """
+
+    ENABLED = os.getenv("SYMBOL_INDEX_ENABLED", "true").lower() in ("1", "true", "yes")
+    REFRESH_CHECK_SECONDS = float(os.getenv("SYMBOL_INDEX_REFRESH_CHECK_SECONDS", "60"))
+
+    def __init__(self):
+        self._snapshot: Optional[_Snapshot] = None
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._build_lock = threading.Lock()
+        self._stats = {"builds": 0, "searches": 0, "last_build_ms": 0.0, "last_built_at": None}
+        register_cache(self)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    @staticmethod
+    def _load_signature(db: Session) -> Tuple:
+        count, last_updated = db.query(func.count(StockMaster.symbol), func.max(StockMaster.updated_at)).one()
+        return count, last_updated
+
+    def build(self, db: Session) -> int:
+        """
+        DB의 종목 마스터 전체로 인덱스를 새로 만듭니다.
+
+        Returns:
+            int: 인덱스에 포함된 종목 수
+        """
+        with self._build_lock:
+            signature = self._load_signature(db)
+            rows = db.query(StockMaster.symbol, StockMaster.name, StockMaster.market).all()
+            return self._swap(rows, signature)
+
+    def build_from_rows(self, rows: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """(symbol, name, market) 목록으로 인덱스를 만듭니다. (테스트 및 DB 없이 초기화할 때 사용)"""
+        with self._build_lock:
+            return self._swap(rows, None)
+
+    def _swap(self, rows, signature) -> int:
+        started = time.perf_counter()
+        snapshot = _Snapshot(rows)
+        self._snapshot = snapshot
+        self._signature = signature
+        self._checked_at = time.monotonic()
+        self._stats["builds"] += 1
+        self._stats["last_build_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        self._stats["last_built_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        logger.info(f"[SymbolSearchIndex] {len(snapshot.items)}개 종목으로 인덱스 구성 ({self._stats['last_build_ms']}ms)")
+        return len(snapshot.items)
+
+    def clear(self):
+        """인덱스를 비웁니다. 다음 ensure_fresh() 호출 시 다시 만듭니다."""
+        with self._build_lock:
+            self._snapshot = None
+            self._signature = None
+            self._checked_at = 0.0
+
+    def invalidate(self):
+        """다음 ensure_fresh() 호출 시 곧바로 종목 마스터 변경 여부를 확인하도록 합니다."""
+        self._checked_at = 0.0
+
+    def ensure_fresh(self, db: Session) -> bool:
+        """
+        인덱스가 없으면 만들고, 확인 주기가 지났으면 종목 마스터 변경 여부를 확인하여 다시 만듭니다.
+
+        Returns:
+            bool: 검색에 사용할 수 있는 인덱스가 있는지 여부
+        """
+        if not self.ENABLED:
+            return False
+        try:
+            if self._snapshot is None:
+                self.build(db)
+            elif time.monotonic() - self._checked_at >= self.REFRESH_CHECK_SECONDS:
+                self._checked_at = time.monotonic()
+                if self._load_signature(db) != self._signature:
+                    self.build(db)
+        except Exception as e:
+            logger.error(f"[SymbolSearchIndex] 인덱스 갱신 실패: {e}", exc_info=True)
+        return self._snapshot is not None
+
+    def search(self, keyword: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+        """
+        종목을 검색합니다.
+
+        Args:
+            keyword (str): 종목 코드, 종목명 일부 또는 한글 초성
+            limit (int): 반환할 최대 개수
+            offset (int): 건너뛸 개수
+
+        Returns:
+            Dict: {"items": [{"symbol", "name", "market"}], "total_count": 전체 결과 수}
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("Symbol search index is not built")
+        self._stats["searches"] += 1
+        matched = snapshot.search(keyword)
+        return {
+            "items": [dict(snapshot.items[i]) for i in matched[offset:offset + limit]],
+            "total_count": len(matched),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "enabled": self.ENABLED,
+            "size": len(snapshot.items) if snapshot else 0,
+        }
+
+
+# 싱글톤 인스턴스
+symbol_search_index = SymbolSearchIndex()
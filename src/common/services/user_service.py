@@ -1,10 +1,13 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from src.common.models.user import User
 from src.common.schemas.user import UserCreate, UserUpdate
-from src.common.utils.password_utils import get_password_hash
+from src.common.utils.password_utils import get_password_hash, aget_password_hash
+from src.common.services.principal_cache_service import principal_cache_service
 import logging
 import os
+from typing import Union
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,24 @@ class UserService:
 
     def create_user_from_telegram(self, db: Session, telegram_id: int, username: str, first_name: str, last_name: str, password: str):
         logger.debug(f"create_user_from_telegram 호출: telegram_id={telegram_id}, username={username}")
-        
+        hashed_password = get_password_hash(password)
+        return self._add_telegram_user(db, telegram_id, username, first_name, last_name, hashed_password)
+
+    async def acreate_user_from_telegram(self, db: Union[AsyncSession, Session], telegram_id: int, username: str, first_name: str, last_name: str, password: str):
+        """
+        create_user_from_telegram()의 비동기 버전입니다.
+
+        비밀번호 해시(bcrypt)는 프로세스 풀에서 await로 기다리고, DB 저장만 run_sync()로 실행하므로
+        해시를 기다리는 동안 이벤트 루프와 스레드 풀을 점유하지 않습니다.
+        동기 Session을 사용하는 async 라우트에서는 저장을 바로 실행합니다.
+        """
+        logger.debug(f"acreate_user_from_telegram 호출: telegram_id={telegram_id}, username={username}")
+        hashed_password = await aget_password_hash(password)
+        if isinstance(db, AsyncSession):
+            return await db.run_sync(self._add_telegram_user, telegram_id, username, first_name, last_name, hashed_password)
+        return self._add_telegram_user(db, telegram_id, username, first_name, last_name, hashed_password)
+
+    def _add_telegram_user(self, db: Session, telegram_id: int, username: str, first_name: str, last_name: str, hashed_password: str):
         admin_telegram_id = os.getenv("TELEGRAM_ADMIN_ID")
         
         role = 'user'
@@ -57,8 +77,7 @@ class UserService:
             role = 'admin'
             
         full_name = f"{first_name} {last_name}".strip()
-        hashed_password = get_password_hash(password)
-        
+
         db_user = User(
             telegram_id=telegram_id,
             username=username,
@@ -91,6 +110,7 @@ class UserService:
         try:
             db.commit()
             db.refresh(db_user)
+            principal_cache_service.invalidate(db_user.id, db_user.token_version)
             logger.info(f"사용자 정보 수정 성공: user_id={user_id}")
             return db_user
         except SQLAlchemyError as e:
@@ -8,6 +8,7 @@ import sqlite3
 
 # Import the service and schemas
 from src.common.services.price_alert_service import PriceAlertService
+from src.common.utils.cache import clear_all_caches
 
 # ======================================================================================
 # [중요] SQLAlchemy/SQLite DATETIME 호환성 해결을 위한 커스텀 타입
@@ -53,6 +54,7 @@ class TestUser(TestBase):
     role = Column(String(20), default='user', nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     telegram_id = Column(BigInteger, unique=True, nullable=True)
+    token_version = Column(Integer, default=0, nullable=False)
     created_at = Column(SQLiteDateTime, default=datetime.datetime.utcnow, nullable=False)
     updated_at = Column(SQLiteDateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False)
     notification_preferences = Column(JSON, default={"telegram": True, "email": False}, nullable=False)
@@ -110,6 +112,27 @@ class TestDailyPrice(TestBase):
     created_at = Column(SQLiteDateTime, default=datetime.datetime.utcnow, nullable=False)
     updated_at = Column(SQLiteDateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False)
 
+@pytest.mark.skip(reason="Not a test class, used for SQLAlchemy model definition")
+class TestDailyIndicator(TestBase):
+    __tablename__ = 'daily_indicators'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(20), nullable=False)
+    date = Column(Date, nullable=False)
+    sma5 = Column(Float, nullable=True)
+    sma20 = Column(Float, nullable=True)
+    rsi14 = Column(Float, nullable=True)
+    macd = Column(Float, nullable=False)
+    signal = Column(Float, nullable=False)
+    ema12 = Column(Float, nullable=False)
+    ema26 = Column(Float, nullable=False)
+    updated_at = Column(SQLiteDateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, nullable=False)
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 프로세스 내 캐시가 공유되지 않도록 매 테스트 전에 비웁니다."""
+    clear_all_caches()
+    yield
+
 # Setup in-memory SQLite database for testing
 @pytest.fixture(scope='function')
 def db_session():
@@ -0,0 +1,194 @@
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.common.utils.cache import TTLCache, TieredCache, MISSING, clear_all_caches
+
+
+class FakeRedis:
+    """테스트용 최소 Redis 대체 객체 (mget/set/delete/incr/expire/pipeline만 지원)"""
+
+    def __init__(self):
+        self.store = {}
+
+    def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for k in keys:
+            self.store.pop(k, None)
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1).encode()
+        return int(self.store[key])
+
+    def expire(self, key, seconds):
+        return True
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+class TestTTLCache:
+    """TTLCache 테스트"""
+
+    def test_get_returns_missing_for_unknown_key(self):
+        cache = TTLCache()
+        assert cache.get("a") is MISSING
+        assert cache.get("a", None) is None
+
+    def test_entry_expires_after_ttl(self):
+        cache = TTLCache(ttl=10)
+        with patch('src.common.utils.cache.time.monotonic', return_value=100.0):
+            cache.set("a", 1)
+        with patch('src.common.utils.cache.time.monotonic', return_value=105.0):
+            assert cache.get("a") == 1
+        with patch('src.common.utils.cache.time.monotonic', return_value=111.0):
+            assert cache.get("a") is MISSING
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_clear_all_caches(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        clear_all_caches()
+        assert len(cache) == 0
+
+
+class TestTieredCache:
+    """TieredCache 테스트"""
+
+    def test_l1_only_when_redis_is_not_configured(self, monkeypatch):
+        cache = TieredCache("test", redis_client=None)
+        monkeypatch.setattr('src.common.utils.cache.get_redis_client', lambda: None)
+
+        assert cache.get("a") is MISSING
+        cache.set("a", [1, 2])
+        assert cache.get("a") == [1, 2]
+
+        stats = cache.get_stats()
+        assert stats['l1_hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['redis_enabled'] is False
+
+    def test_l2_hit_fills_l1(self):
+        redis_client = FakeRedis()
+        writer = TieredCache("test", redis_client=redis_client)
+        reader = TieredCache("test", redis_client=redis_client)  # 다른 프로세스를 흉내
+
+        writer.set("a", {"v": 1})
+        assert reader.get("a") == {"v": 1}
+        assert reader.get("a") == {"v": 1}
+
+        stats = reader.get_stats()
+        assert stats['l2_hits'] == 1
+        assert stats['l1_hits'] == 1
+
+    def test_get_many_uses_single_mget_for_l1_misses(self):
+        redis_client = FakeRedis()
+        cache = TieredCache("test", redis_client=redis_client)
+        cache.set_many({"a": 1, "b": 2})
+        cache.clear()  # L1만 비움
+        cache.l1.set("a", 1)
+
+        with patch.object(redis_client, 'mget', wraps=redis_client.mget) as spy_mget:
+            result = cache.get_many(["a", "b", "c"])
+
+        assert result == {"a": 1, "b": 2}
+        spy_mget.assert_called_once_with(["stockeye:test:b", "stockeye:test:c"])
+
+    def test_invalidate_removes_from_both_tiers(self):
+        redis_client = FakeRedis()
+        cache = TieredCache("test", redis_client=redis_client)
+        cache.set("a", 1)
+
+        cache.invalidate(["a"])
+
+        assert cache.get("a") is MISSING
+        assert redis_client.store == {}
+
+    def test_redis_errors_fall_back_to_miss(self):
+        redis_client = MagicMock()
+        redis_client.mget.side_effect = ConnectionError("redis down")
+        cache = TieredCache("test", redis_client=redis_client)
+
+        assert cache.get("a") is MISSING
+        assert cache.get_stats()['errors'] == 1
+
+    def test_versioned_cache_round_trips_through_redis(self):
+        redis_client = FakeRedis()
+        writer = TieredCache("test", redis_client=redis_client, versioned=True)
+        reader = TieredCache("test", redis_client=redis_client, versioned=True)  # 다른 프로세스를 흉내
+
+        generations = {}
+        assert writer.get("a", generations=generations) is MISSING
+        writer.set("a", [1, 2], generations=generations)
+
+        assert reader.get("a") == [1, 2]
+
+    def test_versioned_cache_ignores_value_loaded_before_invalidate(self):
+        """무효화 전에 DB를 읽은 요청이 무효화 후에 저장한 오래된 값은 조회되지 않음"""
+        redis_client = FakeRedis()
+        slow_reader = TieredCache("test", redis_client=redis_client, versioned=True)
+        writer = TieredCache("test", redis_client=redis_client, versioned=True)
+        other = TieredCache("test", redis_client=redis_client, versioned=True)
+
+        generations = {}
+        assert slow_reader.get("a", generations=generations) is MISSING  # 이 시점에 오래된 값을 DB에서 읽음
+        writer.invalidate(["a"])                                         # 새 시세 커밋 후 무효화
+        slow_reader.set("a", "stale", generations=generations)          # 뒤늦게 저장
+
+        assert other.get("a") is MISSING
+        # 같은 프로세스의 무효화는 L1 저장도 막음
+        slow_local = TieredCache("test", redis_client=None, versioned=True)
+        local_generations = {}
+        slow_local.get("a", generations=local_generations)
+        slow_local.invalidate(["a"])
+        slow_local.set("a", "stale", generations=local_generations)
+        assert slow_local.get("a") is MISSING
+
+        # 무효화 이후에 읽은 값은 정상적으로 저장됨
+        generations = {}
+        assert other.get("a", generations=generations) is MISSING
+        other.set("a", "fresh", generations=generations)
+        assert TieredCache("test", redis_client=redis_client, versioned=True).get("a") == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_redis_calls_in_worker_thread(self):
+        """aget()/aset()은 Redis 호출을 스레드에서 실행하고, L1 적중 시에는 스레드를 쓰지 않음"""
+        loop_thread = threading.get_ident()
+        redis_client = FakeRedis()
+        called_from = []
+        original_mget = redis_client.mget
+
+        def mget(keys):
+            called_from.append(threading.get_ident())
+            return original_mget(keys)
+
+        redis_client.mget = mget
+        cache = TieredCache("test", redis_client=redis_client, versioned=True)
+
+        generations = {}
+        assert await cache.aget("a", generations=generations) is MISSING
+        await cache.aset("a", [1, 2], generations=generations)
+        assert await cache.aget("a") == [1, 2]  # L1 적중
+
+        assert len(called_from) == 1
+        assert called_from[0] != loop_thread
+        assert await TieredCache("test", redis_client=redis_client, versioned=True).aget("a") == [1, 2]
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date, datetime, timedelta # Import timedelta
-from src.common.models.daily_price import DailyPrice
+from src.common.models.daily_price import DailyPrice, ensure_daily_price_partitions, latest_price_window_start, LATEST_PRICE_LOOKBACK_DAYS
 from sqlalchemy import create_engine, text # Import text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
@@ -163,3 +163,27 @@ def test_daily_price_model_update_timestamp(db_session):
     db_session.commit() # Commit in new session
 
     assert new_price.updated_at == new_timestamp # Assert against the manually set timestamp
+
+def test_daily_price_table_is_partitioned_by_date_on_postgresql():
+    """
+    Test that the PostgreSQL DDL creates a RANGE (date) partitioned table whose primary key includes the partition key.
+    """
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateTable
+
+    ddl = str(CreateTable(DailyPrice.__table__).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY RANGE (date)" in ddl
+    assert "PRIMARY KEY (id, date)" in ddl
+
+def test_ensure_daily_price_partitions_is_noop_on_sqlite(db_session):
+    """
+    Test that partition creation is skipped on databases other than PostgreSQL.
+    """
+    assert ensure_daily_price_partitions(db_session, 2024, 2026) == 0
+
+def test_latest_price_window_start():
+    """
+    Test that the latest-price lookup window starts LATEST_PRICE_LOOKBACK_DAYS before the given day.
+    """
+    assert latest_price_window_start(date(2025, 3, 1)) == date(2025, 3, 1) - timedelta(days=LATEST_PRICE_LOOKBACK_DAYS)
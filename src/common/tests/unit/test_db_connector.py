@@ -36,4 +36,118 @@ def test_get_db():
             next(db_generator)
         
         # mock_session.close (MagicMock)이 한 번 호출되었는지 확인합니다.
-        mock_session.close.assert_called_once()
\ No newline at end of file
+        mock_session.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_async_db():
+    """get_async_db 의존성이 비동기 세션을 제공하고 종료 시 닫는지 테스트합니다."""
+    from unittest.mock import AsyncMock
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.common.database.db_connector import get_async_db, ASYNC_SQLALCHEMY_DATABASE_URL
+
+    assert ASYNC_SQLALCHEMY_DATABASE_URL.startswith("postgresql+asyncpg://")
+
+    mock_session = MagicMock(spec=AsyncSession)
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=mock_session)
+    session_context.__aexit__ = AsyncMock(return_value=False)
+
+    with patch('src.common.database.db_connector.get_async_sessionmaker', return_value=MagicMock(return_value=session_context)):
+        db_generator = get_async_db()
+        assert await db_generator.__anext__() is mock_session
+
+        with pytest.raises(StopAsyncIteration):
+            await db_generator.__anext__()
+
+    session_context.__aexit__.assert_awaited_once()
+
+
+def test_engine_options_from_settings():
+    """풀 설정이 엔진 생성 인자로 전달되는지 테스트합니다."""
+    from src.common.database import db_connector
+    from src.common.database.pool_metrics import MeteredAsyncAdaptedQueuePool, MeteredQueuePool
+
+    with patch.multiple(db_connector, DB_POOL_SIZE=7, DB_MAX_OVERFLOW=3, DB_POOL_RECYCLE=600,
+                        DB_STATEMENT_TIMEOUT_MS=5000, DB_PGBOUNCER_MODE=False):
+        options = db_connector._engine_options()
+        async_options = db_connector._engine_options(is_async=True)
+
+    assert options["poolclass"] is MeteredQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["pool_recycle"] == 600
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert async_options["poolclass"] is MeteredAsyncAdaptedQueuePool
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+
+def test_engine_options_pgbouncer_mode():
+    """PgBouncer 모드에서는 애플리케이션 풀과 세션 단위 설정을 사용하지 않는지 테스트합니다."""
+    from src.common.database import db_connector
+    from src.common.database.pool_metrics import MeteredNullPool
+
+    with patch.multiple(db_connector, DB_STATEMENT_TIMEOUT_MS=5000, DB_PGBOUNCER_MODE=True):
+        options = db_connector._engine_options()
+        async_options = db_connector._engine_options(is_async=True)
+
+    assert options["poolclass"] is MeteredNullPool
+    assert "pool_size" not in options
+    assert "connect_args" not in options
+    assert async_options["connect_args"] == {"statement_cache_size": 0}
+
+
+def test_pool_metrics_track_checkout_and_saturation():
+    """풀 지표가 사용 중 커넥션 수, 포화도, 대기 시간, timeout 횟수를 기록하는지 테스트합니다."""
+    from sqlalchemy import create_engine, exc
+    from src.common.database.pool_metrics import MeteredQueuePool, describe_pool
+
+    engine = create_engine("sqlite:///:memory:", poolclass=MeteredQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.01)
+    first = engine.connect()
+    second = engine.connect()
+    stats = describe_pool(engine.pool)
+    assert stats["pool_class"] == "MeteredQueuePool"
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["saturation"] == 1.0
+    assert stats["checkouts"] == 2
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    assert describe_pool(engine.pool)["timeouts"] == 1
+
+    first.close()
+    second.close()
+    stats = describe_pool(engine.pool)
+    assert stats["checked_out"] == 0
+    assert stats["saturation"] == 0.0
+    assert stats["wait_max_ms"] >= 0
+    engine.dispose()
+
+
+def test_statement_timeout_set_local_in_pgbouncer_mode():
+    """PgBouncer 모드에서 트랜잭션 시작 시 SET LOCAL statement_timeout을 실행하는지 테스트합니다."""
+    from sqlalchemy import create_engine, event, text
+    from src.common.database import db_connector
+
+    engine = create_engine("sqlite:///:memory:")
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    # SQLite는 SET을 모르므로 실행 직전에 기록만 하고 무해한 문장으로 바꿈
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, params, context, many: ("SELECT 1", params), retval=True)
+
+    with patch.multiple(db_connector, DB_STATEMENT_TIMEOUT_MS=5000, DB_PGBOUNCER_MODE=True):
+        db_connector._configure_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 2"))
+
+    assert statements[0] == "SET LOCAL statement_timeout = 5000"
+
+
+def test_get_pool_metrics():
+    """get_pool_metrics가 설정과 동기 엔진 풀 상태를 반환하는지 테스트합니다."""
+    from src.common.database.db_connector import get_pool_metrics
+
+    metrics = get_pool_metrics()
+    assert metrics["settings"]["pool_size"] >= 1
+    assert metrics["sync"]["pool_class"] in ("MeteredQueuePool", "MeteredNullPool")
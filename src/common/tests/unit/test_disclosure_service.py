@@ -32,32 +32,28 @@ def test_parse_disclosure_type(report_nm, expected_type):
     assert _parse_disclosure_type(report_nm) == expected_type
 
 @pytest.mark.asyncio
+@patch('src.common.services.disclosure_service.notification_outbox_service')
 @patch('src.common.services.disclosure_service.dart_get_disclosures', new_callable=AsyncMock)
 @patch('src.common.services.disclosure_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_new_disclosures_success(mock_send_telegram_message, mock_dart_get_disclosures, disclosure_service):
-    """check_and_notify_new_disclosures: 새로운 공시를 성공적으로 확인하고 알림을 보내는 경우"""
+async def test_check_and_notify_new_disclosures_success(mock_send_telegram_message, mock_dart_get_disclosures, mock_outbox, disclosure_service):
+    """check_and_notify_new_disclosures: 새로운 공시를 성공적으로 확인하고 알림을 outbox에 적재하는 경우"""
     # Given
     mock_db_session = MagicMock()
-    
-    # Mock for db.query().filter().first() calls
-    # First call (SystemConfig): returns None (initial run)
-    # Second call (Disclosure): returns None (no existing disclosure)
-    # Third call (StockMaster): returns StockMaster
-    mock_db_session.query.return_value.filter.return_value.first.side_effect = [
-        None, # SystemConfig
-        None, # Disclosure
-        StockMaster(symbol='005930', name='삼성전자') # StockMaster
-    ]
+    mock_db_session.query.return_value.filter.return_value.first.return_value = None # SystemConfig (initial run)
+    mock_db_session.query.return_value.filter.return_value.all.return_value = [] # 이미 저장된 공시 없음
 
     dart_data = [
-        {'rcept_no': '20230101000001', 'report_nm': '사업보고서', 'rcept_dt': '20230101', 'corp_code': '123', 'stock_code': '005930'}
+        {'rcept_no': '20230101000001', 'report_nm': '사업보고서', 'rcept_dt': '20230101', 'corp_code': '123', 'stock_code': '005930'},
+        {'rcept_no': '20230101000002', 'report_nm': '주요사항보고서', 'rcept_dt': '20230101', 'corp_code': '456', 'stock_code': '000660'},
     ]
     mock_dart_get_disclosures.return_value = dart_data
 
-    # Mock for subscriptions and users
-    mock_db_session.query.return_value.filter.return_value.all.side_effect = [
-        [PriceAlert(user_id=1, symbol='005930', notify_on_disclosure=True, is_active=True)], # subscriptions
-        [User(id=1, telegram_id=123)] # users
+    # 구독자 조인 쿼리: (symbol, user_id, telegram_id, stock_name)
+    subscriber_query = mock_db_session.query.return_value.join.return_value.outerjoin.return_value.filter.return_value
+    subscriber_query.all.return_value = [
+        ('005930', 1, 123, '삼성전자'),
+        ('005930', 1, 123, '삼성전자'), # 같은 사용자의 중복 알림
+        ('000660', 2, 456, 'SK하이닉스'),
     ]
 
     # When
@@ -66,7 +62,14 @@ async def test_check_and_notify_new_disclosures_success(mock_send_telegram_messa
     # Then
     mock_db_session.bulk_save_objects.assert_called_once()
     mock_db_session.commit.assert_called()
-    mock_send_telegram_message.assert_called()
+    # 구독자 조회는 공시 수와 관계없이 한 번의 조인 쿼리로 수행됨
+    subscriber_query.all.assert_called_once()
+    # 모든 알림이 한 번에 outbox로 전달됨
+    mock_outbox.enqueue_many.assert_called_once()
+    notifications = mock_outbox.enqueue_many.call_args[0][1]
+    assert sorted((n['channel'], n['recipient']) for n in notifications) == [('telegram', 123), ('telegram', 456)]
+    assert any("[삼성전자] 신규 공시" in n['message'] for n in notifications)
+    assert len({n['dedup_key'] for n in notifications}) == 2
 
 @pytest.mark.asyncio
 @patch('src.common.services.disclosure_service.dart_get_disclosures', new_callable=AsyncMock)
@@ -334,9 +337,9 @@ async def test_check_and_notify_new_disclosures_no_telegram_id(mock_send_telegra
     ]
     mock_dart_get_disclosures.return_value = dart_data
 
-    mock_db_session.query.return_value.filter.return_value.all.side_effect = [
-        [PriceAlert(user_id=1, symbol='005930', notify_on_disclosure=True, is_active=True)], # subscriptions
-        [User(id=1, telegram_id=None)] # users (telegram_id is None)
+    mock_db_session.query.return_value.filter.return_value.all.return_value = [] # 이미 저장된 공시 없음
+    mock_db_session.query.return_value.join.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+        ('005930', 1, None, '삼성전자') # telegram_id is None
     ]
 
     # When
@@ -1,18 +1,33 @@
 """Unit tests for EmailChannel with SMTP functionality."""
+import asyncio
+import socket
+import aiosmtplib
 import pytest
+from email.mime.text import MIMEText
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 
 from src.common.services.notification.email_channel import EmailChannel
+from src.common.services.notification.smtp_pool import SMTPConnectionPool
+
+
+def _make_smtp_client():
+    """aiosmtplib.SMTP 인스턴스 Mock을 생성합니다."""
+    client = MagicMock()
+    client.is_connected = True
+    client.connect = AsyncMock()
+    client.send_message = AsyncMock()
+    client.quit = AsyncMock()
+    return client
 
 
 class TestEmailChannel:
     """EmailChannel 테스트"""
     
     @pytest.mark.asyncio
-    @patch('src.common.services.notification.email_channel.aiosmtplib.send')
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
     @patch('src.common.config.email_config.email_config')
-    async def test_send_email_success(self, mock_config, mock_smtp_send):
+    async def test_send_email_success(self, mock_config, mock_smtp_class):
         """이메일 전송 성공 테스트"""
         # GIVEN
         mock_config.is_configured = True
@@ -23,8 +38,11 @@ class TestEmailChannel:
         mock_config.smtp_use_tls = True
         mock_config.sender_email = "noreply@stockeye.com"
         mock_config.sender_name = "StockEye"
+        mock_config.smtp_pool_size = 2
+        mock_config.smtp_pool_idle_timeout = 30.0
+        mock_config.smtp_pool_max_messages = 100
         
-        mock_smtp_send.return_value = None  # Successful send
+        mock_smtp_class.return_value = _make_smtp_client()
         
         channel = EmailChannel()
         
@@ -37,10 +55,10 @@ class TestEmailChannel:
         
         # THEN
         assert result is True
-        mock_smtp_send.assert_called_once()
+        mock_smtp_class.assert_called_once()
         
         # Verify call arguments
-        call_args = mock_smtp_send.call_args
+        call_args = mock_smtp_class.call_args
         assert call_args.kwargs['hostname'] == "smtp.gmail.com"
         assert call_args.kwargs['port'] == 587
         assert call_args.kwargs['use_tls'] is False
@@ -65,9 +83,9 @@ class TestEmailChannel:
         assert result is False
     
     @pytest.mark.asyncio
-    @patch('src.common.services.notification.email_channel.aiosmtplib.send')
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
     @patch('src.common.config.email_config.email_config')
-    async def test_send_email_with_template(self, mock_config, mock_smtp_send):
+    async def test_send_email_with_template(self, mock_config, mock_smtp_class):
         """템플릿을 사용한 이메일 전송 테스트"""
         # GIVEN
         mock_config.is_configured = True
@@ -78,8 +96,11 @@ class TestEmailChannel:
         mock_config.smtp_use_tls = True
         mock_config.sender_email = "noreply@stockeye.com"
         mock_config.sender_name = "StockEye"
+        mock_config.smtp_pool_size = 2
+        mock_config.smtp_pool_idle_timeout = 30.0
+        mock_config.smtp_pool_max_messages = 100
         
-        mock_smtp_send.return_value = None
+        mock_smtp_class.return_value = _make_smtp_client()
         
         channel = EmailChannel()
         
@@ -99,12 +120,12 @@ class TestEmailChannel:
         
         # THEN
         assert result is True
-        mock_smtp_send.assert_called_once()
+        mock_smtp_class.assert_called_once()
     
     @pytest.mark.asyncio
-    @patch('src.common.services.notification.email_channel.aiosmtplib.send')
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
     @patch('src.common.config.email_config.email_config')
-    async def test_send_email_smtp_error(self, mock_config, mock_smtp_send):
+    async def test_send_email_smtp_error(self, mock_config, mock_smtp_class):
         """SMTP 에러 처리 테스트"""
         # GIVEN
         mock_config.is_configured = True
@@ -115,8 +136,13 @@ class TestEmailChannel:
         mock_config.smtp_use_tls = True
         mock_config.sender_email = "noreply@stockeye.com"
         mock_config.sender_name = "StockEye"
+        mock_config.smtp_pool_size = 2
+        mock_config.smtp_pool_idle_timeout = 30.0
+        mock_config.smtp_pool_max_messages = 100
         
-        mock_smtp_send.side_effect = Exception("SMTP connection failed")
+        smtp_client = _make_smtp_client()
+        smtp_client.send_message.side_effect = Exception("SMTP connection failed")
+        mock_smtp_class.return_value = smtp_client
         
         channel = EmailChannel()
         
@@ -128,4 +154,194 @@ class TestEmailChannel:
         
         # THEN
         assert result is False
-        mock_smtp_send.assert_called_once()
+        mock_smtp_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
+    @patch('src.common.config.email_config.email_config')
+    async def test_send_reuses_smtp_session(self, mock_config, mock_smtp_class):
+        """여러 이메일 전송 시 하나의 인증된 세션을 재사용하는지 테스트"""
+        # GIVEN
+        mock_config.is_configured = True
+        mock_config.smtp_host = "smtp.gmail.com"
+        mock_config.smtp_port = 587
+        mock_config.smtp_username = "test@example.com"
+        mock_config.smtp_password = "password"
+        mock_config.smtp_use_tls = True
+        mock_config.sender_email = "noreply@stockeye.com"
+        mock_config.sender_name = "StockEye"
+        mock_config.smtp_pool_size = 2
+        mock_config.smtp_pool_idle_timeout = 30.0
+        mock_config.smtp_pool_max_messages = 100
+
+        smtp_client = _make_smtp_client()
+        mock_smtp_class.return_value = smtp_client
+
+        channel = EmailChannel()
+
+        # WHEN
+        for i in range(3):
+            assert await channel.send(recipient=f"user{i}@example.com", message="Digest") is True
+
+        # THEN
+        mock_smtp_class.assert_called_once()
+        smtp_client.connect.assert_awaited_once()
+        assert smtp_client.send_message.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
+    @patch('src.common.config.email_config.email_config')
+    async def test_settings_change_closes_previous_pool(self, mock_config, mock_smtp_class):
+        """SMTP 설정이 바뀌면 이전 풀의 유휴 세션을 닫고 새 풀을 사용하는지 테스트"""
+        # GIVEN
+        mock_config.is_configured = True
+        mock_config.smtp_host = "smtp.gmail.com"
+        mock_config.smtp_port = 587
+        mock_config.smtp_username = "test@example.com"
+        mock_config.smtp_password = "password"
+        mock_config.smtp_use_tls = True
+        mock_config.sender_email = "noreply@stockeye.com"
+        mock_config.sender_name = "StockEye"
+        mock_config.smtp_pool_size = 2
+        mock_config.smtp_pool_idle_timeout = 30.0
+        mock_config.smtp_pool_max_messages = 100
+
+        old_client, new_client = _make_smtp_client(), _make_smtp_client()
+        mock_smtp_class.side_effect = [old_client, new_client]
+
+        channel = EmailChannel()
+        assert await channel.send(recipient="user@example.com", message="Digest") is True
+        old_pool = channel._pool
+
+        # WHEN
+        mock_config.smtp_password = "rotated"
+        assert await channel.send(recipient="user@example.com", message="Digest") is True
+
+        # THEN
+        assert channel._pool is not old_pool
+        old_client.quit.assert_awaited_once()
+        assert old_pool.get_stats()["idle"] == 0
+        new_client.send_message.assert_awaited_once()
+
+    def test_templates_are_precompiled(self):
+        """템플릿이 초기화 시 컴파일되어 캐시되는지 테스트"""
+        channel = EmailChannel()
+
+        assert "notification.html" in channel._templates
+        with patch.object(channel.env, 'get_template') as mock_get_template:
+            template = channel._get_template("notification.html")
+
+        mock_get_template.assert_not_called()
+        assert template is channel._templates["notification.html"]
+
+
+class TestSMTPConnectionPool:
+    """SMTPConnectionPool 테스트"""
+
+    def _make_pool(self, **kwargs):
+        params = dict(hostname="smtp.example.com", port=587, username="user", password="pw", start_tls=True)
+        params.update(kwargs)
+        return SMTPConnectionPool(**params)
+
+    @pytest.mark.asyncio
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
+    async def test_reconnects_when_session_dropped(self, mock_smtp_class):
+        """서버가 세션을 끊은 경우 새 세션으로 한 번 재시도하는지 테스트"""
+        # GIVEN
+        stale_client = _make_smtp_client()
+        stale_client.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("closed")
+        fresh_client = _make_smtp_client()
+        mock_smtp_class.side_effect = [stale_client, fresh_client]
+        pool = self._make_pool()
+
+        # WHEN
+        await pool.send_message(MIMEText("hello"))
+
+        # THEN
+        fresh_client.send_message.assert_awaited_once()
+        assert pool.get_stats()["connections_opened"] == 2
+        assert pool.get_stats()["idle"] == 1
+        assert pool.get_stats()["in_use"] == 0
+
+    @pytest.mark.asyncio
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
+    async def test_idle_session_expires(self, mock_smtp_class):
+        """idle_timeout이 지난 세션은 폐기하고 새로 연결하는지 테스트"""
+        # GIVEN
+        first_client, second_client = _make_smtp_client(), _make_smtp_client()
+        mock_smtp_class.side_effect = [first_client, second_client]
+        pool = self._make_pool(idle_timeout=0)
+
+        # WHEN
+        await pool.send_message(MIMEText("first"))
+        await asyncio.sleep(0.01)
+        await pool.send_message(MIMEText("second"))
+
+        # THEN
+        first_client.quit.assert_awaited_once()
+        second_client.send_message.assert_awaited_once()
+        assert pool.get_stats()["connections_opened"] == 2
+
+    @pytest.mark.asyncio
+    @patch('src.common.services.notification.smtp_pool.aiosmtplib.SMTP')
+    async def test_session_recycled_after_max_messages(self, mock_smtp_class):
+        """세션당 최대 메시지 수에 도달하면 세션을 닫는지 테스트"""
+        # GIVEN
+        first_client, second_client = _make_smtp_client(), _make_smtp_client()
+        mock_smtp_class.side_effect = [first_client, second_client]
+        pool = self._make_pool(max_messages_per_connection=2)
+
+        # WHEN
+        for _ in range(3):
+            await pool.send_message(MIMEText("body"))
+
+        # THEN
+        assert first_client.send_message.await_count == 2
+        first_client.quit.assert_awaited_once()
+        assert second_client.send_message.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_throughput_against_local_smtp_server(self):
+        """로컬 aiosmtpd 서버를 상대로 여러 메일을 보낼 때 세션 하나를 재사용하는지 확인"""
+        aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+        from aiosmtpd.smtp import AuthResult
+
+        class _CountingHandler:
+            def __init__(self):
+                self.messages = 0
+                self.sessions = set()
+
+            async def handle_DATA(self, server, session, envelope):
+                self.messages += 1
+                self.sessions.add(id(session))
+                return "250 OK"
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        handler = _CountingHandler()
+        controller = aiosmtpd_controller.Controller(
+            handler,
+            hostname="127.0.0.1",
+            port=port,
+            authenticator=lambda server, session, envelope, mechanism, auth_data: AuthResult(success=True),
+            auth_require_tls=False,
+        )
+        controller.start()
+        try:
+            pool = self._make_pool(hostname="127.0.0.1", port=port, start_tls=False, pool_size=2)
+            message_count = 50
+
+            for i in range(message_count):
+                msg = MIMEText(f"digest {i}")
+                msg['From'] = "noreply@stockeye.com"
+                msg['To'] = f"user{i}@example.com"
+                await pool.send_message(msg)
+            await pool.close()
+        finally:
+            controller.stop()
+
+        assert handler.messages == message_count
+        assert len(handler.sessions) == 1
+        assert pool.get_stats()["connections_opened"] == 1
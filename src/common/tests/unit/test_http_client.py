@@ -5,6 +5,7 @@
 # httpx.AsyncClient와 os.getenv를 모의(mock)하여, 클라이언트가
 # 올바른 설정(base_url, retries 등)으로 초기화되는지를 검증합니다.
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 import httpx
@@ -58,3 +59,95 @@ def test_get_retry_client_initialization(mock_getenv):
         )
         # get_retry_client()가 생성된 모의 클라이언트 인스턴스를 반환하는지 확인합니다.
         assert client == mock_async_client_instance
+
+
+@pytest.mark.asyncio
+async def test_get_api_client_reuses_pool_and_adds_auth_header():
+    """공용 API 클라이언트가 커넥션 풀을 재사용하고 요청마다 인증 헤더를 붙이는지 테스트합니다."""
+    from src.common.utils import http_client
+
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"ok": True})
+
+    shared = http_client.SharedApiClient()
+    with patch.object(shared, "_create_client", side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))) as create_client, \
+         patch.object(http_client, "shared_api_client", shared):
+        async with http_client.get_api_client(auth_token="token-a") as client:
+            await client.get("http://api/a")
+        async with http_client.get_api_client() as client:
+            response = await client.post("http://api/b", json={}, headers={"X-Test": "1"})
+        async with http_client.get_api_client(auth_token="token-b") as client:
+            await client.get("http://api/c")
+
+        assert response.json() == {"ok": True}
+        assert seen_headers == ["Bearer token-a", None, "Bearer token-b"]
+        create_client.assert_called_once()
+
+        inner = shared.get_client()
+        await http_client.close_api_client()
+        assert inner.is_closed
+        # 닫은 뒤에 다시 사용하면 새 클라이언트를 만듦
+        assert shared.get_client() is not inner
+        await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_api_client_coalesces_identical_concurrent_requests():
+    """같은 인증 토큰과 파라미터의 동시 GET과 coalesce=True인 POST는 한 번만 전송되는지 테스트합니다."""
+    from src.common.utils import http_client
+
+    sent = []
+
+    async def handler(request):
+        sent.append((request.method, str(request.url), request.headers.get("Authorization")))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"ok": True})
+
+    shared = http_client.SharedApiClient()
+    with patch.object(shared, "_create_client", side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))), \
+         patch.object(http_client, "shared_api_client", shared):
+        session_a = http_client.get_api_client(auth_token="token-a")
+        session_b = http_client.get_api_client(auth_token="token-b")
+        responses = await asyncio.gather(
+            *[session_a.get("http://api/symbols/search", params={"query": "삼성"}) for _ in range(3)],
+            session_b.get("http://api/symbols/search", params={"query": "삼성"}),
+            *[session_a.post("http://api/predict", json={"symbol": "005930"}, coalesce=True) for _ in range(2)],
+            *[session_a.post("http://api/trade", json={"symbol": "005930"}) for _ in range(2)],
+        )
+        await shared.aclose()
+
+    assert all(response.json() == {"ok": True} for response in responses)
+    # GET은 토큰별로 1번, coalesce=True인 POST는 1번, 일반 POST는 요청마다 전송
+    assert sorted(sent) == sorted([
+        ("GET", "http://api/symbols/search?query=%EC%82%BC%EC%84%B1", "Bearer token-a"),
+        ("GET", "http://api/symbols/search?query=%EC%82%BC%EC%84%B1", "Bearer token-b"),
+        ("POST", "http://api/predict", "Bearer token-a"),
+        ("POST", "http://api/trade", "Bearer token-a"),
+        ("POST", "http://api/trade", "Bearer token-a"),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_api_client_reports_rejected_token():
+    """인증 토큰이 401로 거부되면 on_unauthorized가 그 토큰으로 호출되는지 테스트합니다."""
+    from src.common.utils import http_client
+
+    def handler(request):
+        return httpx.Response(401 if request.headers.get("Authorization") == "Bearer revoked" else 200)
+
+    rejected = []
+    shared = http_client.SharedApiClient()
+    shared.on_unauthorized = rejected.append
+    with patch.object(shared, "_create_client", side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))), \
+         patch.object(http_client, "shared_api_client", shared):
+        async with http_client.get_api_client(auth_token="revoked") as client:
+            await client.get("http://api/alerts")
+            await client.delete("http://api/alerts/1")
+        async with http_client.get_api_client(auth_token="valid") as client:
+            await client.get("http://api/alerts")
+        await shared.aclose()
+
+    assert rejected == ["revoked", "revoked"]
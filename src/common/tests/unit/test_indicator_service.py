@@ -0,0 +1,122 @@
+"""
+IndicatorService 단위 테스트
+"""
+
+import datetime
+import random
+
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from src.common.services.indicator_service import IndicatorService
+from src.common.tests.unit.conftest import TestDailyPrice, TestDailyIndicator
+from src.common.utils.technical_analysis import calculate_indicator_series
+
+START = datetime.date(2026, 1, 1)
+
+
+@pytest.fixture
+def indicator_service():
+    return IndicatorService()
+
+
+def _closes(n, seed=1):
+    rng = random.Random(seed)
+    close, closes = 10000.0, []
+    for _ in range(n):
+        close *= 1 + rng.uniform(-0.04, 0.04)
+        closes.append(close)
+    return closes
+
+
+def _add_prices(db, symbol, closes, start=START):
+    db.add_all([
+        TestDailyPrice(symbol=symbol, date=start + datetime.timedelta(days=i),
+                       open=c, high=c, low=c, close=c, volume=1000)
+        for i, c in enumerate(closes)
+    ])
+    db.commit()
+
+
+def _stored(db, symbol):
+    rows = db.query(TestDailyIndicator).filter(TestDailyIndicator.symbol == symbol).order_by(TestDailyIndicator.date).all()
+    return [(r.date, r.sma5, r.sma20, r.rsi14, r.macd, r.signal) for r in rows]
+
+
+def _assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for a, b in zip(actual, expected):
+        assert a[0] == b[0]
+        assert a[1:] == pytest.approx(b[1:], nan_ok=True)
+
+
+def test_indicator_series_matches_pandas():
+    closes = _closes(60)
+    rows = calculate_indicator_series(closes)
+
+    series = pd.Series(closes)
+    macd = series.ewm(span=12, adjust=False).mean() - series.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+
+    assert rows[3]["sma5"] is None and rows[18]["sma20"] is None
+    assert rows[-1]["sma5"] == pytest.approx(series.iloc[-5:].mean())
+    assert rows[-1]["sma20"] == pytest.approx(series.iloc[-20:].mean())
+    assert [r["macd"] for r in rows] == pytest.approx(list(macd))
+    assert [r["signal"] for r in rows] == pytest.approx(list(signal))
+
+
+def test_incremental_update_equals_full_rebuild(indicator_service, db_session):
+    closes = _closes(50)
+    _add_prices(db_session, "005930", closes[:30])
+    assert indicator_service.update_indicators(db_session, ["005930"]) == 30
+
+    # 새 일봉이 들어오면 그 날짜들만 추가로 계산
+    _add_prices(db_session, "005930", closes[30:], start=START + datetime.timedelta(days=30))
+    assert indicator_service.update_indicators(db_session, ["005930"]) == 20
+    incremental = _stored(db_session, "005930")
+
+    indicator_service.backfill(db_session)
+    rebuilt = _stored(db_session, "005930")
+
+    assert len(rebuilt) == 50
+    _assert_same(incremental, rebuilt)
+
+
+def test_update_with_since_recomputes_corrected_prices(indicator_service, db_session):
+    closes = _closes(40)
+    _add_prices(db_session, "005930", closes)
+    indicator_service.update_indicators(db_session, ["005930"])
+
+    # 과거 시세 보정
+    corrected = db_session.query(TestDailyPrice).filter(TestDailyPrice.date == START + datetime.timedelta(days=35)).one()
+    corrected.close = corrected.close * 1.5
+    db_session.commit()
+
+    assert indicator_service.update_indicators(db_session, ["005930"]) == 0
+    assert indicator_service.update_indicators(db_session, ["005930"], since=START + datetime.timedelta(days=35)) == 5
+    updated = _stored(db_session, "005930")
+
+    indicator_service.backfill(db_session, ["005930"])
+    _assert_same(updated, _stored(db_session, "005930"))
+
+
+def test_get_latest_indicators(indicator_service, db_session):
+    _add_prices(db_session, "005930", _closes(25))
+    _add_prices(db_session, "000660", _closes(3, seed=2))
+    indicator_service.backfill(db_session)
+
+    latest = indicator_service.get_latest_indicators(db_session, ["005930", "000660", "999999"])
+
+    assert set(latest) == {"005930", "000660"}
+    assert latest["005930"]["date"] == START + datetime.timedelta(days=24)
+    assert latest["005930"]["sma20"] is not None
+    assert latest["000660"]["sma5"] is None
+
+
+def test_update_indicators_does_not_raise_on_db_error(indicator_service):
+    db = MagicMock()
+    db.query.side_effect = Exception("DB down")
+
+    assert indicator_service.update_indicators(db, ["005930"]) == 0
+    db.rollback.assert_called_once()
@@ -107,8 +107,9 @@ def test_get_daily_prices_no_data(market_data_service):
     mock_db_session.query.assert_called_once_with(DailyPrice)
 
 @pytest.mark.asyncio
+@patch('src.common.services.market_data_service.indicator_service')
 @patch('src.common.services.market_data_service.yf.download')
-async def test_update_daily_prices_success(mock_yf_download, market_data_service):
+async def test_update_daily_prices_success(mock_yf_download, mock_indicator_service, market_data_service):
     """
     update_daily_prices: yfinance에서 성공적으로 데이터를 가져와 DB에 저장하는 경우
     """
@@ -135,6 +136,7 @@ async def test_update_daily_prices_success(mock_yf_download, market_data_service
     mock_yf_download.assert_called_once_with('005930.KS', start=ANY, end=ANY)
     mock_db_session.bulk_save_objects.assert_called_once()
     mock_db_session.commit.assert_called_once()
+    mock_indicator_service.update_indicators.assert_called_once_with(mock_db_session, ['005930'])
 
 @pytest.mark.asyncio
 @patch('src.common.services.market_data_service.yf.download')
@@ -249,4 +251,135 @@ async def test_update_daily_prices_main_exception(market_data_service, caplog):
     assert result['success'] is False
     assert error_message in result['error']
     mock_db_session.rollback.assert_called_once()
-    assert "일별시세 갱신 작업 전체 실패" in caplog.text
\ No newline at end of file
+    assert "일별시세 갱신 작업 전체 실패" in caplog.text
+# ===== 현재가 캐시 테스트 =====
+
+def test_get_current_price_and_change_uses_cache(market_data_service):
+    """
+    get_current_price_and_change: 두 번째 조회는 DB를 거치지 않고 캐시에서 반환하는지 테스트
+    """
+    # Given
+    mock_db_session = MagicMock()
+    symbol = "005930"
+    query_all = mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all
+    query_all.return_value = [
+        DailyPrice(symbol=symbol, date=datetime.now().date(), close=75000),
+        DailyPrice(symbol=symbol, date=(datetime.now() - timedelta(days=1)).date(), close=70000)
+    ]
+    before = market_data_service.get_price_cache_stats()
+
+    # When
+    first = market_data_service.get_current_price_and_change(symbol, mock_db_session)
+    second = market_data_service.get_current_price_and_change(symbol, mock_db_session)
+
+    # Then
+    assert first == second
+    query_all.assert_called_once()
+    stats = market_data_service.get_price_cache_stats()
+    assert stats['l1_hits'] - before['l1_hits'] == 1
+    assert stats['misses'] - before['misses'] == 1
+
+@pytest.mark.asyncio
+async def test_get_current_price_and_change_async_coalesces_concurrent_calls(market_data_service):
+    """
+    get_current_price_and_change_async: 같은 종목의 동시 조회는 DB 조회(run_sync)를 한 번만 수행하는지 테스트
+    """
+    # Given
+    import asyncio
+    from src.common.services.market_data_service import price_flight
+    symbol = "005930"
+    sync_session = MagicMock()
+    sync_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [
+        DailyPrice(symbol=symbol, date=datetime.now().date(), close=75000),
+        DailyPrice(symbol=symbol, date=(datetime.now() - timedelta(days=1)).date(), close=70000)
+    ]
+
+    async def run_sync(fn, *args):
+        await asyncio.sleep(0.01)
+        return fn(sync_session, *args)
+
+    async_session = MagicMock()
+    async_session.run_sync = MagicMock(side_effect=run_sync)
+    before = price_flight.get_stats()
+
+    # When
+    results = await asyncio.gather(*[
+        market_data_service.get_current_price_and_change_async(symbol, async_session) for _ in range(5)
+    ])
+
+    # Then
+    assert all(result == {"current_price": 75000, "change": 5000, "change_rate": 5000 / 70000 * 100} for result in results)
+    async_session.run_sync.assert_called_once()
+    assert price_flight.get_stats()["coalesced"] - before["coalesced"] == 4
+
+def test_invalidate_price_cache_forces_reload(market_data_service):
+    """
+    invalidate_price_cache: 무효화 후에는 DB에서 새 시세를 다시 읽는지 테스트
+    """
+    # Given
+    mock_db_session = MagicMock()
+    symbol = "005930"
+    query_all = mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all
+    query_all.return_value = [DailyPrice(symbol=symbol, date=datetime.now().date(), close=75000)]
+    market_data_service.get_current_price_and_change(symbol, mock_db_session)
+
+    # When: 새 시세 저장 후 무효화
+    query_all.return_value = [
+        DailyPrice(symbol=symbol, date=(datetime.now() + timedelta(days=1)).date(), close=80000),
+        DailyPrice(symbol=symbol, date=datetime.now().date(), close=75000)
+    ]
+    market_data_service.invalidate_price_cache([symbol])
+    result = market_data_service.get_current_price_and_change(symbol, mock_db_session)
+
+    # Then
+    assert result["current_price"] == 80000
+    assert result["change"] == 5000
+    # 첫 조회는 최근 기간에 종가가 1개뿐이라 전체 기간으로 한 번 더 조회
+    assert query_all.call_count == 3
+
+def test_get_current_prices_and_changes_multi_get(market_data_service, db_session):
+    """
+    get_current_prices_and_changes: 여러 종목을 한 번에 조회하고, 캐시된 종목은 다시 조회하지 않는지 테스트
+    """
+    # Given
+    from src.common.tests.unit.conftest import TestDailyPrice
+    today = datetime.now().date()
+    db_session.add_all([
+        TestDailyPrice(symbol="005930", date=today, open=0, high=0, low=0, close=75000, volume=0),
+        TestDailyPrice(symbol="005930", date=today - timedelta(days=1), open=0, high=0, low=0, close=70000, volume=0),
+        TestDailyPrice(symbol="005930", date=today - timedelta(days=2), open=0, high=0, low=0, close=60000, volume=0),
+        TestDailyPrice(symbol="000660", date=today, open=0, high=0, low=0, close=120000, volume=0),
+    ])
+    db_session.commit()
+    market_data_service.get_current_price_and_change("000660", db_session)  # 000660은 캐시에 적재
+
+    # When
+    with patch.object(db_session, 'query', wraps=db_session.query) as spy_query:
+        result = market_data_service.get_current_prices_and_changes(["005930", "000660", "999999"], db_session)
+
+    # Then
+    assert result["005930"] == {"current_price": 75000, "change": 5000, "change_rate": (5000 / 70000) * 100}
+    assert result["000660"] == {"current_price": 120000, "change": None, "change_rate": None}
+    assert result["999999"] == {"current_price": None, "change": None, "change_rate": None}
+    # 캐시에 없는 종목만 윈도우 함수 쿼리(서브쿼리 포함 query() 2회)로 조회하고,
+    # 최근 기간에 종가가 2개 미만인 종목(999999)만 전체 기간에서 한 번 더 조회
+    assert spy_query.call_count == 4
+
+def test_get_current_prices_and_changes_falls_back_beyond_lookback(market_data_service, db_session):
+    """
+    get_current_prices_and_changes: 최근 기간(LATEST_PRICE_LOOKBACK_DAYS)에 시세가 없는 종목은 전체 기간에서 찾는지 테스트
+    """
+    # Given: 거래 정지 등으로 마지막 시세가 오래된 종목
+    from src.common.tests.unit.conftest import TestDailyPrice
+    old = datetime.now().date() - timedelta(days=400)
+    db_session.add_all([
+        TestDailyPrice(symbol="005930", date=old, open=0, high=0, low=0, close=75000, volume=0),
+        TestDailyPrice(symbol="005930", date=old - timedelta(days=1), open=0, high=0, low=0, close=70000, volume=0),
+    ])
+    db_session.commit()
+
+    # When
+    result = market_data_service.get_current_prices_and_changes(["005930"], db_session)
+
+    # Then
+    assert result["005930"] == {"current_price": 75000, "change": 5000, "change_rate": (5000 / 70000) * 100}
@@ -0,0 +1,190 @@
+"""
+NotificationOutboxService 단위 테스트
+
+SQLite 인메모리 DB에 notification_outbox 테이블만 생성하여 적재/전송/재시도 동작을 검증합니다.
+"""
+
+import datetime
+import pytest
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.common.models.notification_outbox import NotificationOutbox
+from src.common.services.notification_outbox_service import NotificationOutboxService
+from src.common.utils.exceptions import NotificationThrottledError
+
+
+@pytest.fixture
+def outbox_db():
+    # DB 작업이 스레드에서 실행되므로 모든 스레드가 같은 인메모리 DB를 사용하도록 설정
+    engine = create_engine('sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    NotificationOutbox.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def outbox_service():
+    return NotificationOutboxService()
+
+
+@pytest.fixture
+def mock_telegram_channel():
+    channel = AsyncMock()
+    channel.deliver.return_value = True
+    with patch.dict('src.common.services.notification_outbox_service.notification_service.channels', {'telegram': channel}):
+        yield channel
+
+
+def _notification(i, **kwargs):
+    return {'recipient': 1000 + i, 'message': f"msg {i}", 'dedup_key': f"test:{i}", **kwargs}
+
+
+class TestEnqueue:
+    """알림 적재 테스트"""
+
+    def test_enqueue_many_inserts_pending_rows(self, outbox_db, outbox_service):
+        outbox_service.enqueue_many(outbox_db, [_notification(i) for i in range(3)])
+        outbox_db.commit()
+
+        rows = outbox_db.query(NotificationOutbox).order_by(NotificationOutbox.id).all()
+        assert [r.recipient for r in rows] == ['1000', '1001', '1002']
+        assert all(r.status == 'pending' and r.channel == 'telegram' for r in rows)
+
+    def test_enqueue_many_skips_duplicate_dedup_key(self, outbox_db, outbox_service):
+        """평가 작업이 재실행되어도 같은 dedup_key는 한 번만 적재됨"""
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+        outbox_service.enqueue_many(outbox_db, [_notification(1), _notification(2)])
+        outbox_db.commit()
+
+        assert outbox_db.query(NotificationOutbox).count() == 2
+
+    def test_enqueue_is_rolled_back_with_caller_transaction(self, outbox_db, outbox_service):
+        """호출자의 트랜잭션이 롤백되면 적재된 알림도 함께 취소됨"""
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.rollback()
+
+        assert outbox_db.query(NotificationOutbox).count() == 0
+
+
+class TestDeliverPending:
+    """outbox 전송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_deliver_pending_marks_rows_sent(self, outbox_db, outbox_service, mock_telegram_channel):
+        outbox_service.enqueue_many(outbox_db, [_notification(i) for i in range(3)])
+        outbox_db.commit()
+
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert result == {'claimed': 3, 'sent': 3, 'retrying': 0, 'failed': 0}
+        assert mock_telegram_channel.deliver.await_count == 3
+        assert outbox_db.query(NotificationOutbox).filter(NotificationOutbox.status == 'sent').count() == 3
+
+        # 이미 전송된 알림은 다시 가져가지 않음
+        result = await outbox_service.deliver_pending(outbox_db)
+        assert result['claimed'] == 0
+
+    @pytest.mark.asyncio
+    async def test_deliver_pending_respects_batch_size(self, outbox_db, outbox_service, mock_telegram_channel):
+        outbox_service.enqueue_many(outbox_db, [_notification(i) for i in range(5)])
+        outbox_db.commit()
+
+        result = await outbox_service.deliver_pending(outbox_db, batch_size=2)
+
+        assert result['claimed'] == 2
+        assert outbox_db.query(NotificationOutbox).filter(NotificationOutbox.status == 'pending').count() == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried_with_backoff(self, outbox_db, outbox_service, mock_telegram_channel):
+        mock_telegram_channel.deliver.return_value = False
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+
+        before = datetime.datetime.utcnow()
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert result['retrying'] == 1
+        row = outbox_db.query(NotificationOutbox).one()
+        assert row.status == 'pending'
+        assert row.attempts == 1
+        assert row.next_attempt_at >= before + datetime.timedelta(seconds=outbox_service.BACKOFF_BASE_SECONDS)
+
+        # 재시도 시각 전에는 가져가지 않음
+        result = await outbox_service.deliver_pending(outbox_db)
+        assert result['claimed'] == 0
+
+    @pytest.mark.asyncio
+    async def test_delivery_gives_up_after_max_attempts(self, outbox_db, outbox_service, mock_telegram_channel):
+        mock_telegram_channel.deliver.side_effect = Exception("boom")
+        outbox_service.MAX_ATTEMPTS = 2
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+
+        await outbox_service.deliver_pending(outbox_db)
+        row = outbox_db.query(NotificationOutbox).one()
+        row.next_attempt_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+        outbox_db.commit()
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert result['failed'] == 1
+        row = outbox_db.query(NotificationOutbox).one()
+        assert row.status == 'failed'
+        assert row.last_error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_throttled_delivery_is_deferred_without_counting_attempt(self, outbox_db, outbox_service, mock_telegram_channel):
+        mock_telegram_channel.deliver.side_effect = NotificationThrottledError("429", retry_after=7)
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert result['retrying'] == 1
+        row = outbox_db.query(NotificationOutbox).one()
+        assert row.attempts == 0
+        assert row.status == 'pending'
+        assert row.next_attempt_at > datetime.datetime.utcnow() + datetime.timedelta(seconds=5)
+
+    @pytest.mark.asyncio
+    async def test_batch_is_leased_and_committed_before_sending(self, outbox_db, outbox_service, mock_telegram_channel):
+        """전송 중에는 트랜잭션을 열어 두지 않고, 행은 'sending' 상태로 임대되어 있음"""
+        observed = []
+
+        async def deliver(recipient, message):
+            observed.append((outbox_db.in_transaction(), outbox_db.query(NotificationOutbox.status).scalar()))
+            outbox_db.rollback()
+            return True
+
+        mock_telegram_channel.deliver.side_effect = deliver
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert observed == [(False, 'sending')]
+        assert result['sent'] == 1
+        assert outbox_db.query(NotificationOutbox).one().status == 'sent'
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_claimed_again(self, outbox_db, outbox_service, mock_telegram_channel):
+        """전송 중 워커가 종료되어 'sending'에 남은 행은 임대 만료 후 다시 전송됨"""
+        outbox_service.enqueue_many(outbox_db, [_notification(1)])
+        outbox_db.commit()
+        outbox_service._lease_batch(outbox_db)
+
+        # 임대 중에는 다른 워커가 가져가지 않음
+        assert (await outbox_service.deliver_pending(outbox_db))['claimed'] == 0
+
+        row = outbox_db.query(NotificationOutbox).one()
+        row.next_attempt_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+        outbox_db.commit()
+        result = await outbox_service.deliver_pending(outbox_db)
+
+        assert result == {'claimed': 1, 'sent': 1, 'retrying': 0, 'failed': 0}
+        assert outbox_db.query(NotificationOutbox).one().status == 'sent'
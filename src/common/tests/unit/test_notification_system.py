@@ -4,13 +4,16 @@
 이 파일은 NotificationService, TelegramChannel, EmailChannel을 테스트합니다.
 """
 
+import asyncio
 import pytest
+from telegram.error import RetryAfter
 from unittest.mock import AsyncMock, MagicMock, patch
 import os
 
 from src.common.services.notify_service import NotificationService, send_telegram_message
 from src.common.services.notification.telegram_channel import TelegramChannel
 from src.common.services.notification.email_channel import EmailChannel
+from src.common.utils.exceptions import NotificationThrottledError
 
 @pytest.fixture
 def mock_telegram_bot():
@@ -156,7 +159,163 @@ class TestNotificationService:
         mock_telegram_bot.send_message.assert_called_once_with(chat_id=12345, text="Broadcast Message")
         
         # 두 번째 사용자: 이메일만 발송
-        mock_email_channel.send.assert_called_once_with('user2@example.com', "Broadcast Message", subject="StockEye Notification") # subject는 기본값? send 호출 시 kwargs 확인 필요
+        mock_email_channel.deliver.assert_called_once_with('user2@example.com', "Broadcast Message", subject="StockEye Notification")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_returns_per_channel_results(self, notification_service):
+        """채널별 sent/failed/throttled 집계 테스트"""
+        mock_telegram = AsyncMock()
+        mock_telegram.deliver.side_effect = [True, False, NotificationThrottledError("429", retry_after=0)]
+        notification_service.channels['telegram'] = mock_telegram
+        notification_service.MAX_THROTTLE_RETRIES = 0
+
+        recipients = [{'id': str(i), 'channel': 'telegram'} for i in range(3)]
+        recipients.append({'id': '1', 'channel': 'sms'})
+
+        result = await notification_service.broadcast(recipients, "msg", concurrency={'telegram': 1})
+
+        assert result['telegram'] == {'sent': 1, 'failed': 1, 'throttled': 1}
+        assert result['sms'] == {'sent': 0, 'failed': 1, 'throttled': 0}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_retries_after_throttle(self, notification_service):
+        """속도 제한 후 재시도하여 성공하는 경우 테스트"""
+        mock_telegram = AsyncMock()
+        mock_telegram.deliver.side_effect = [NotificationThrottledError("429", retry_after=0.01), True]
+        notification_service.channels['telegram'] = mock_telegram
+
+        result = await notification_service.broadcast([{'id': '1'}], "msg")
+
+        assert result['telegram'] == {'sent': 1, 'failed': 0, 'throttled': 0}
+        assert mock_telegram.deliver.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_broadcast_respects_concurrency_limit(self, notification_service):
+        """채널별 동시 전송 수 제한 테스트"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_deliver(recipient, message, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        mock_telegram = AsyncMock()
+        mock_telegram.deliver.side_effect = slow_deliver
+        notification_service.channels['telegram'] = mock_telegram
+
+        recipients = [{'id': str(i)} for i in range(20)]
+        result = await notification_service.broadcast(recipients, "msg", concurrency={'telegram': 3})
+
+        assert result['telegram']['sent'] == 20
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_block_other_channel(self, notification_service):
+        """느린 이메일 채널이 텔레그램 전송을 지연시키지 않는지 테스트"""
+        email_release = asyncio.Event()
+        telegram_done = asyncio.Event()
+        telegram_count = 0
+
+        async def slow_email(recipient, message, **kwargs):
+            await email_release.wait()
+            return True
+
+        async def fast_telegram(recipient, message, **kwargs):
+            nonlocal telegram_count
+            telegram_count += 1
+            if telegram_count == 5:
+                telegram_done.set()
+            return True
+
+        notification_service.channels['email'] = AsyncMock(deliver=AsyncMock(side_effect=slow_email))
+        notification_service.channels['telegram'] = AsyncMock(deliver=AsyncMock(side_effect=fast_telegram))
+
+        recipients = []
+        for i in range(5):
+            recipients.append({
+                'targets': {'telegram': str(i), 'email': f'user{i}@example.com'},
+                'preferences': {'telegram': True, 'email': True},
+            })
+
+        task = asyncio.create_task(notification_service.broadcast(recipients, "msg", concurrency={'email': 1}))
+        # 이메일이 모두 막혀 있어도 텔레그램은 끝까지 전송되어야 함
+        await asyncio.wait_for(telegram_done.wait(), timeout=1)
+        email_release.set()
+        result = await task
+
+        assert result['telegram']['sent'] == 5
+        assert result['email']['sent'] == 5
+
+    @pytest.mark.asyncio
+    async def test_full_slow_channel_buffer_does_not_stall_other_channel(self, notification_service):
+        """느린 이메일 채널의 대기열이 가득 차도 텔레그램이 먼저 끝까지 전송되는지 테스트"""
+        notification_service.BROADCAST_BUFFER_SIZE = 2
+        email_release = asyncio.Event()
+        finished = []
+
+        async def slow_email(recipient, message, **kwargs):
+            await email_release.wait()
+            finished.append('email')
+            return True
+
+        async def fast_telegram(recipient, message, **kwargs):
+            await asyncio.sleep(0)
+            finished.append('telegram')
+            return True
+
+        notification_service.channels['email'] = AsyncMock(deliver=AsyncMock(side_effect=slow_email))
+        notification_service.channels['telegram'] = AsyncMock(deliver=AsyncMock(side_effect=fast_telegram))
+
+        recipients = [{
+            'targets': {'telegram': str(i), 'email': f'user{i}@example.com'},
+            'preferences': {'telegram': True, 'email': True},
+        } for i in range(20)]
+
+        task = asyncio.create_task(notification_service.broadcast(recipients, "msg", concurrency={'email': 1, 'telegram': 2}))
+        for _ in range(200):
+            if finished.count('telegram') == 20:
+                break
+            await asyncio.sleep(0)
+        email_release.set()
+        result = await task
+
+        # 이메일 대기열(크기 2)이 가득 찬 동안에도 텔레그램 20건이 모두 먼저 전송됨
+        assert finished[:20] == ['telegram'] * 20
+        assert result['telegram']['sent'] == 20
+        assert result['email']['sent'] == 20
+
+    @pytest.mark.asyncio
+    async def test_broadcast_accepts_async_iterator(self, notification_service):
+        """비동기 iterator로 수신자를 스트리밍하는 경우 테스트"""
+        mock_telegram = AsyncMock()
+        mock_telegram.deliver.return_value = True
+        notification_service.channels['telegram'] = mock_telegram
+
+        async def stream_recipients():
+            for i in range(10):
+                yield {'id': str(i), 'channel': 'telegram'}
+
+        result = await notification_service.broadcast(stream_recipients(), "msg")
+
+        assert result == {'telegram': {'sent': 10, 'failed': 0, 'throttled': 0}}
+
+    @pytest.mark.asyncio
+    async def test_telegram_retry_after_raises_throttled(self, mock_telegram_bot, monkeypatch):
+        """텔레그램 429(RetryAfter)가 NotificationThrottledError로 전달되는지 테스트"""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
+        mock_telegram_bot.send_message.side_effect = RetryAfter(3)
+        channel = TelegramChannel()
+
+        with pytest.raises(NotificationThrottledError) as exc_info:
+            await channel.deliver("12345", "Test")
+        assert exc_info.value.retry_after == 3
+
+        # send()는 기존처럼 False를 반환
+        assert await channel.send("12345", "Test") is False
 
 
 class TestBackwardCompatibility:
@@ -0,0 +1,114 @@
+"""
+커서 기반(keyset) 페이지네이션 유틸리티 단위 테스트
+"""
+
+import datetime
+import pytest
+from unittest.mock import MagicMock
+
+from src.common.models.prediction_history import PredictionHistory
+
+from src.common.tests.unit.conftest import TestStockMaster
+from src.common.utils.pagination import (
+    LAST_PAGE_CURSOR, cached_count, count_cache, decode_cursor, encode_cursor, last_page_size, paginate_keyset
+)
+
+
+@pytest.fixture
+def stocks(db_session):
+    db_session.add_all([TestStockMaster(symbol=f"{i:06d}", name=f"종목{i}", market="KOSPI") for i in range(1, 26)])
+    db_session.commit()
+    return db_session
+
+
+def _page(db, cursor=None, limit=10, descending=False):
+    page = paginate_keyset(db.query(TestStockMaster), [TestStockMaster.symbol], lambda r: [r.symbol], limit, cursor, descending=descending)
+    page["symbols"] = [r.symbol for r in page["items"]]
+    return page
+
+
+class TestCursor:
+    def test_roundtrip_keeps_datetime(self):
+        created_at = datetime.datetime(2026, 10, 19, 9, 30, 0, 123456)
+        assert decode_cursor(encode_cursor({"a": [created_at, 7]})) == {"a": [created_at, 7]}
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor({"x": 1}), "WzFd"])
+    def test_invalid_cursor_raises(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    @pytest.mark.parametrize("state", [
+        {"a": 5}, {"a": []}, {"b": "005930"}, {"a": ["005930", 1]}, {"a": [[1]]}, {"a": [{"$dt": 1}]},
+        {"a": [1]}, {"b": [True]}, {"a": [datetime.date(2026, 10, 19)]},
+    ])
+    def test_cursor_with_invalid_key_raises(self, stocks, state):
+        """정렬 키 값이 컬럼 수와 맞지 않는 커서는 쿼리 전에 ValueError로 거부됨"""
+        with pytest.raises(ValueError):
+            _page(stocks, cursor=encode_cursor(state))
+
+    @pytest.mark.parametrize("key", [["foo", 1], [datetime.datetime(2026, 10, 19), "1"], [datetime.datetime(2026, 10, 19), 1.5]])
+    def test_cursor_value_must_match_column_type(self, key):
+        """정렬 키 값의 타입이 컬럼과 다르면 DB에서 비교하기 전에 ValueError로 거부됨"""
+        query = MagicMock()
+        with pytest.raises(ValueError):
+            paginate_keyset(query, [PredictionHistory.created_at, PredictionHistory.id], lambda r: [r.created_at, r.id],
+                            10, encode_cursor({"a": key}), descending=True)
+        query.filter.assert_not_called()
+
+    def test_cursor_datetime_string_is_parsed(self):
+        query = MagicMock()
+        query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
+        paginate_keyset(query, [PredictionHistory.created_at, PredictionHistory.id], lambda r: [r.created_at, r.id],
+                        10, encode_cursor({"a": ["2026-10-19T09:30:00", 7]}), descending=True)
+        query.filter.assert_called_once()
+
+
+class TestPaginateKeyset:
+    def test_forward_pages(self, stocks):
+        first = _page(stocks)
+        assert first["symbols"][0] == "000001" and len(first["symbols"]) == 10
+        assert first["prev_cursor"] is None
+
+        second = _page(stocks, first["next_cursor"])
+        assert second["symbols"][0] == "000011"
+
+        third = _page(stocks, second["next_cursor"])
+        assert third["symbols"] == [f"{i:06d}" for i in range(21, 26)]
+        assert third["next_cursor"] is None
+
+    def test_backward_from_next_page(self, stocks):
+        second = _page(stocks, _page(stocks)["next_cursor"])
+        back = _page(stocks, second["prev_cursor"])
+        assert back["symbols"] == [f"{i:06d}" for i in range(1, 11)]
+        assert back["prev_cursor"] is None
+        assert back["next_cursor"] is not None
+
+    def test_last_page_aligned_with_offset_pages(self, stocks):
+        last = _page(stocks, LAST_PAGE_CURSOR, limit=last_page_size(25, 10))
+        assert last["symbols"] == [f"{i:06d}" for i in range(21, 26)]
+        assert last["next_cursor"] is None
+
+        before_last = _page(stocks, last["prev_cursor"])
+        assert before_last["symbols"] == [f"{i:06d}" for i in range(11, 21)]
+
+    def test_descending(self, stocks):
+        first = _page(stocks, descending=True)
+        assert first["symbols"][0] == "000025"
+        second = _page(stocks, first["next_cursor"], descending=True)
+        assert second["symbols"][0] == "000015"
+
+
+def test_last_page_size():
+    assert last_page_size(25, 10) == 5
+    assert last_page_size(30, 10) == 10
+    assert last_page_size(0, 10) == 10
+
+
+def test_cached_count_reuses_value(stocks):
+    assert cached_count(("stocks",), stocks.query(TestStockMaster)) == 25
+    stocks.add(TestStockMaster(symbol="999999", name="추가", market="KOSPI"))
+    stocks.commit()
+    assert cached_count(("stocks",), stocks.query(TestStockMaster)) == 25
+
+    count_cache.clear()
+    assert cached_count(("stocks",), stocks.query(TestStockMaster)) == 26
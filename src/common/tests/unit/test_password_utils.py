@@ -0,0 +1,98 @@
+# 이 파일은 src.common.utils.password_utils 모듈의 단위 테스트를 포함합니다.
+#
+# 프로세스 풀 생성은 느리므로 대부분의 테스트는 프로세스 풀 대신 스레드 풀을 넣어
+# 대기열 제한과 지표 집계만 검증하고, 실제 프로세스 풀은 한 번만 확인합니다.
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.common.utils.password_utils import (
+    PasswordHasher, PasswordHasherBusyError, pwd_context
+)
+
+
+def blocking(event: threading.Event):
+    event.wait(5)
+    return True
+
+
+def test_inline_mode_hashes_and_verifies():
+    """workers=0이면 호출한 스레드에서 바로 계산하는지 테스트합니다."""
+    hasher = PasswordHasher(workers=0, max_pending=1)
+    hashed = hasher.hash("secret")
+    assert hasher.verify("secret", hashed)
+    assert not hasher.verify("wrong", hashed)
+    assert hasher.get_stats()["completed"] == 0
+
+
+def test_queue_limit_rejects_and_reports_depth():
+    """대기 중인 작업이 max_pending을 넘으면 거절하고 대기열 깊이를 보고하는지 테스트합니다."""
+    hasher = PasswordHasher(workers=1, max_pending=2)
+    hasher._executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    try:
+        futures = [hasher._submit(blocking, release), hasher._submit(blocking, release)]
+        stats = hasher.get_stats()
+        assert stats["in_flight"] == 2
+        assert stats["queue_depth"] == 1
+
+        with pytest.raises(PasswordHasherBusyError):
+            hasher._submit(blocking, release)
+        assert hasher.get_stats()["rejected"] == 1
+    finally:
+        release.set()
+        for future in futures:
+            future.result()
+        hasher._executor.shutdown()
+
+    stats = hasher.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["completed"] == 2
+    assert stats["max_in_flight"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_api_uses_pool():
+    """비동기 API가 풀의 결과를 기다려 반환하는지 테스트합니다."""
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    hasher._executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        hashed = await hasher.ahash("secret")
+        results = await asyncio.gather(hasher.averify("secret", hashed), hasher.averify("wrong", hashed))
+    finally:
+        hasher._executor.shutdown()
+    assert results == [True, False]
+    assert hasher.get_stats()["completed"] == 3
+
+
+def test_process_pool_round_trip():
+    """실제 프로세스 풀에서 해시와 검증이 동작하는지 테스트합니다."""
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        hashed = hasher.hash("secret")
+        assert pwd_context.verify("secret", hashed)
+        assert hasher.verify("secret", hashed)
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_recovers_after_worker_dies():
+    """해시 워커가 죽어도 다음 요청이 새 프로세스 풀에서 처리되는지 테스트합니다."""
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        await hasher.ahash("secret")
+        broken = hasher._executor
+        for process in list(broken._processes.values()):
+            process.kill()
+            process.join()
+
+        hashed = await hasher.ahash("secret")
+        assert pwd_context.verify("secret", hashed)
+        assert hasher._executor is not broken
+        assert hasher.get_stats()["in_flight"] == 0
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,83 @@
+"""
+PredictionCacheService 단위 테스트
+"""
+
+import datetime
+import pytest
+from unittest.mock import MagicMock
+
+from src.common.services.prediction_cache_service import PredictionCacheService, prediction_cache
+from src.common.tests.unit.conftest import TestDailyPrice
+from src.common.utils.technical_analysis import MODEL_VERSION, build_prediction_result
+
+
+@pytest.fixture
+def cache_service():
+    return PredictionCacheService()
+
+
+def _add_prices(db, symbol, days, start_close=100, step=1):
+    today = datetime.date.today()
+    db.add_all([
+        TestDailyPrice(symbol=symbol, date=today - datetime.timedelta(days=days - 1 - i),
+                       open=start_close + i * step, high=start_close + i * step, low=start_close + i * step,
+                       close=start_close + i * step, volume=1000)
+        for i in range(days)
+    ])
+    db.commit()
+
+
+def test_cache_key_includes_latest_date_and_model_version(cache_service):
+    key = cache_service.cache_key("005930", datetime.date(2026, 10, 19))
+    assert key == f"005930:2026-10-19:{MODEL_VERSION}"
+
+
+def test_get_and_set(cache_service):
+    latest = datetime.date(2026, 10, 19)
+    assert cache_service.get("005930", latest) is None
+
+    cache_service.set("005930", latest, {"prediction": "buy", "confidence": 65, "reason": "r"})
+
+    assert cache_service.get("005930", latest)["prediction"] == "buy"
+    # 새 일봉이 들어오면 키가 달라져 이전 결과를 사용하지 않음
+    assert cache_service.get("005930", latest + datetime.timedelta(days=1)) is None
+
+
+def test_get_latest_price_dates(cache_service, db_session):
+    _add_prices(db_session, "005930", 3)
+    _add_prices(db_session, "000660", 2)
+
+    latest = cache_service.get_latest_price_dates(db_session, ["005930", "000660", "999999"])
+
+    assert latest == {"005930": datetime.date.today(), "000660": datetime.date.today()}
+
+
+def test_prewarm_stores_same_result_as_direct_calculation(cache_service, db_session):
+    _add_prices(db_session, "005930", 30)
+    _add_prices(db_session, "000660", 5)
+
+    sets_before = prediction_cache.get_stats()["sets"]
+    warmed = cache_service.prewarm(db_session, ["005930", "000660", "005930"])
+
+    assert warmed == 2
+    today = datetime.date.today()
+    recent = cache_service.load_recent_prices(db_session, ["005930"])["005930"]
+    assert cache_service.get("005930", today) == build_prediction_result(recent)
+    assert cache_service.get("000660", today)["prediction"] == "예측 불가"
+    assert prediction_cache.get_stats()["sets"] - sets_before == 2
+
+
+def test_prewarm_does_not_raise_on_db_error(cache_service):
+    db = MagicMock()
+    db.query.side_effect = Exception("DB down")
+
+    assert cache_service.prewarm(db, ["005930"]) == 0
+
+
+def test_get_many_and_set_many(cache_service):
+    today = datetime.date.today()
+    latest_dates = {"005930": today, "000660": today}
+
+    cache_service.set_many({"005930": {"prediction": "buy"}, "999999": {"prediction": "sell"}}, latest_dates)
+
+    assert cache_service.get_many(latest_dates) == {"005930": {"prediction": "buy"}}
@@ -16,14 +16,14 @@ def price_alert_service():
 
 # Test cases for check_and_notify_price_alerts
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_no_active_alerts(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_no_active_alerts(mock_outbox, db_session, price_alert_service):
     await price_alert_service.check_and_notify_price_alerts(db_session)
-    mock_send_telegram.assert_not_called()
+    mock_outbox.enqueue_many.assert_not_called()
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_target_price_above_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_target_price_above_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert, user, stock, and daily price
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -45,12 +45,13 @@ async def test_check_and_notify_price_alerts_target_price_above_triggered(mock_s
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_called_once()
-    call_args = mock_send_telegram.call_args[0]
-    assert call_args[0] == user.telegram_id
-    assert "Apple Inc." in call_args[1]
-    assert "150.0원 이상으로 상승" in call_args[1]
-    assert "현재가: 155.0원" in call_args[1]
+    mock_outbox.enqueue_many.assert_called_once()
+    notification = mock_outbox.enqueue_many.call_args[0][1][0]
+    assert notification['recipient'] == user.telegram_id
+    assert "Apple Inc." in notification['message']
+    assert "150.0원 이상으로 상승" in notification['message']
+    assert "현재가: 155.0원" in notification['message']
+    assert notification['dedup_key'] == f"price_alert:{alert.id}:1"
 
     # Check if notification time is updated
     db_session.refresh(alert)
@@ -58,8 +59,8 @@ async def test_check_and_notify_price_alerts_target_price_above_triggered(mock_s
 
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_target_price_below_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_target_price_below_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert, user, stock, and daily price
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="GOOG", name="Google Inc.")
@@ -81,20 +82,20 @@ async def test_check_and_notify_price_alerts_target_price_below_triggered(mock_s
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_called_once()
-    call_args = mock_send_telegram.call_args[0]
-    assert call_args[0] == user.telegram_id
-    assert "Google Inc." in call_args[1]
-    assert "2000.0원 이하로 하락" in call_args[1]
-    assert "현재가: 1980.0원" in call_args[1]
+    mock_outbox.enqueue_many.assert_called_once()
+    notification = mock_outbox.enqueue_many.call_args[0][1][0]
+    assert notification['recipient'] == user.telegram_id
+    assert "Google Inc." in notification['message']
+    assert "2000.0원 이하로 하락" in notification['message']
+    assert "현재가: 1980.0원" in notification['message']
 
     # Check if notification time is updated
     db_session.refresh(alert)
     assert alert.last_notified_at is not None
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_target_price_not_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_target_price_not_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert, user, stock, and daily price (condition not met)
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -115,13 +116,13 @@ async def test_check_and_notify_price_alerts_target_price_not_triggered(mock_sen
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_not_called()
+    mock_outbox.enqueue_many.assert_not_called()
     db_session.refresh(alert)
     assert alert.is_active is True # Should remain active
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_with_repeat_interval(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_with_repeat_interval(mock_outbox, db_session, price_alert_service):
     # Setup: active alert with repeat_interval, user, stock
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -143,13 +144,13 @@ async def test_check_and_notify_price_alerts_with_repeat_interval(mock_send_tele
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_called_once()
+    mock_outbox.enqueue_many.assert_called_once()
     db_session.refresh(alert)
     assert alert.is_active is True # Should remain active because of repeat_interval
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_no_current_price(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_no_current_price(mock_outbox, db_session, price_alert_service):
     # Setup: active alert, user, but no daily price for the symbol
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="NONEXISTENT", name="Nonexistent Inc.") # Add stock master for nonexistent symbol
@@ -165,13 +166,13 @@ async def test_check_and_notify_price_alerts_no_current_price(mock_send_telegram
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_not_called()
+    mock_outbox.enqueue_many.assert_not_called()
     db_session.refresh(alert)
     assert alert.is_active is True # Should remain active
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_change_percent_up_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_change_percent_up_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert for percentage increase, user, stock, and daily prices
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -197,16 +198,16 @@ async def test_check_and_notify_price_alerts_change_percent_up_triggered(mock_se
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_called_once()
-    call_args = mock_send_telegram.call_args[0]
-    assert call_args[0] == user.telegram_id
-    assert "변동률 도달" in call_args[1]
-    assert "5.0% up" in call_args[1]
-    assert "6.00%" in call_args[1]
+    mock_outbox.enqueue_many.assert_called_once()
+    notification = mock_outbox.enqueue_many.call_args[0][1][0]
+    assert notification['recipient'] == user.telegram_id
+    assert "변동률 도달" in notification['message']
+    assert "5.0% up" in notification['message']
+    assert "6.00%" in notification['message']
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_change_percent_down_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_change_percent_down_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert for percentage decrease
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -232,16 +233,16 @@ async def test_check_and_notify_price_alerts_change_percent_down_triggered(mock_
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_called_once()
-    call_args = mock_send_telegram.call_args[0]
-    assert call_args[0] == user.telegram_id
-    assert "변동률 도달" in call_args[1]
-    assert "-5.0% down" in call_args[1]
-    assert "-6.00%" in call_args[1]
+    mock_outbox.enqueue_many.assert_called_once()
+    notification = mock_outbox.enqueue_many.call_args[0][1][0]
+    assert notification['recipient'] == user.telegram_id
+    assert "변동률 도달" in notification['message']
+    assert "-5.0% down" in notification['message']
+    assert "-6.00%" in notification['message']
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_change_percent_not_triggered(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_change_percent_not_triggered(mock_outbox, db_session, price_alert_service):
     # Setup: active alert for percentage increase, but condition not met
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -267,13 +268,13 @@ async def test_check_and_notify_price_alerts_change_percent_not_triggered(mock_s
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_not_called()
+    mock_outbox.enqueue_many.assert_not_called()
     db_session.refresh(alert)
     assert alert.is_active is True # Should remain active
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
-async def test_check_and_notify_price_alerts_not_enough_price_data(mock_send_telegram, db_session, price_alert_service):
+@patch('src.common.services.price_alert_service.notification_outbox_service')
+async def test_check_and_notify_price_alerts_not_enough_price_data(mock_outbox, db_session, price_alert_service):
     # Setup: active alert for percentage change, but only one price point exists
     user = TestUser(id=1, username="testuser", email="test@example.com", hashed_password="hashedpassword", telegram_id=123)
     stock = TestStockMaster(symbol="AAPL", name="Apple Inc.")
@@ -296,14 +297,14 @@ async def test_check_and_notify_price_alerts_not_enough_price_data(mock_send_tel
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Assertions
-    mock_send_telegram.assert_not_called()
+    mock_outbox.enqueue_many.assert_not_called()
     db_session.refresh(alert)
     assert alert.is_active is True # Should remain active
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
+@patch('src.common.services.price_alert_service.notification_outbox_service')
 async def test_check_and_notify_price_alerts_skip_due_to_interval(
-    mock_send_telegram_message, price_alert_service, caplog, db_session
+    mock_outbox, price_alert_service, caplog, db_session
 ):
     """
     check_and_notify_price_alerts: 알림 주기에 따라 알림이 건너뛰어지는 경우를 테스트
@@ -341,15 +342,15 @@ async def test_check_and_notify_price_alerts_skip_due_to_interval(
         await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Then
-    mock_send_telegram_message.assert_not_awaited()
+    mock_outbox.enqueue_many.assert_not_called()
     assert f"알림 ID {alert.id}는 최근에 전송되었으므로 건너뜁니다." in caplog.text
     db_session.refresh(alert)
     assert alert.notification_count == 0 # Should not have increased
 
 @pytest.mark.asyncio
-@patch('src.common.services.price_alert_service.send_telegram_message', new_callable=AsyncMock)
+@patch('src.common.services.price_alert_service.notification_outbox_service')
 async def test_check_and_notify_price_alerts_not_skip_due_to_interval(
-    mock_send_telegram_message, price_alert_service, caplog, db_session
+    mock_outbox, price_alert_service, caplog, db_session
 ):
     """
     check_and_notify_price_alerts: 알림 주기가 지나 알림이 정상적으로 전송되는 경우를 테스트
@@ -386,7 +387,7 @@ async def test_check_and_notify_price_alerts_not_skip_due_to_interval(
     await price_alert_service.check_and_notify_price_alerts(db_session)
 
     # Then
-    mock_send_telegram_message.assert_awaited_once()
+    mock_outbox.enqueue_many.assert_called_once()
     db_session.refresh(alert)
     assert alert.notification_count == 2 # Should have increased
     assert alert.last_notified_at > old_notification_time
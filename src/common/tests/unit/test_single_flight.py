@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from src.common.utils.single_flight import SingleFlight, get_single_flight_stats
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """같은 키의 동시 호출은 한 번만 실행되고 모두 같은 결과를 받는지 테스트합니다."""
+    flight = SingleFlight("test_share")
+    executions = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal executions
+        executions += 1
+        await release.wait()
+        return {"prediction": "상승"}
+
+    tasks = [asyncio.create_task(flight.do("005930", compute)) for _ in range(5)]
+    other = asyncio.create_task(flight.do("000660", compute))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert await other == {"prediction": "상승"}
+    assert executions == 2
+    assert all(result is results[0] for result in results)
+    stats = flight.get_stats()
+    assert stats["calls"] == 6
+    assert stats["executions"] == 2
+    assert stats["coalesced"] == 4
+    assert stats["in_flight"] == 0
+    assert get_single_flight_stats()["test_share"]["coalesced"] == 4
+
+    # 실행이 끝난 뒤의 호출은 다시 실행
+    await flight.do("005930", compute)
+    assert executions == 3
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared_with_waiters():
+    """실행 중 발생한 예외를 기다리던 호출도 함께 받는지 테스트합니다."""
+    flight = SingleFlight("test_error")
+    release = asyncio.Event()
+
+    async def fail():
+        await release.wait()
+        raise ValueError("API 오류")
+
+    tasks = [asyncio.create_task(flight.do("key", fail)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.get_stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_runs_again_when_leader_is_cancelled():
+    """먼저 실행하던 호출이 취소되면 기다리던 호출이 직접 실행하는지 테스트합니다."""
+    flight = SingleFlight("test_cancel")
+    started = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.01 if len(calls) > 1 else 10)
+        return len(calls)
+
+    leader = asyncio.create_task(flight.do("key", compute))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert flight.get_stats()["in_flight"] == 0
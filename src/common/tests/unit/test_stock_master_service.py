@@ -50,6 +50,25 @@ def test_get_stock_by_symbol_not_found(stock_master_service):
     mock_db_session.query.assert_called_once_with(StockMaster)
     mock_db_session.query.return_value.filter.assert_called_once()
 
+def test_get_stocks_by_symbols(stock_master_service):
+    """
+    get_stocks_by_symbols: 중복을 제거한 종목 코드로 한 번만 조회하고, 빈 목록이면 DB를 조회하지 않는지 테스트
+    """
+    # Given
+    mock_db_session = MagicMock()
+    expected = [StockMaster(symbol="005930", name="삼성전자")]
+    mock_db_session.query.return_value.filter.return_value.all.return_value = expected
+
+    # When
+    result = stock_master_service.get_stocks_by_symbols(["005930", "005930", "000660"], mock_db_session)
+    empty_result = stock_master_service.get_stocks_by_symbols([], mock_db_session)
+
+    # Then
+    assert result == expected
+    assert empty_result == []
+    mock_db_session.query.assert_called_once_with(StockMaster)
+    mock_db_session.query.return_value.filter.assert_called_once()
+
 def test_get_stock_by_name_found(stock_master_service):
     """
     get_stock_by_name: DB에서 이름으로 종목을 성공적으로 찾았을 때, 해당 StockMaster 객체를 반환하는지 테스트
@@ -320,3 +339,66 @@ async def test_update_stock_master_dart_api_error_logging(mock_dart_get_all_stoc
     assert result["success"] is False
     assert result["error"] == error_message
     assert "DART API 연동 실패" in caplog.text
+
+def test_build_ranked_search_query_uses_trgm_and_window_count(stock_master_service):
+    """
+    _build_ranked_search_query: 정확히 일치 → 유사도 순으로 정렬하고, 전체 건수를 COUNT(*) OVER()로 함께 조회하는지 테스트
+    """
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.orm import Session
+
+    query = stock_master_service._build_ranked_search_query("삼성_", Session())
+    sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+    assert "count(*) OVER ()" in sql
+    assert "similarity(stock_master.name" in sql
+    assert "ILIKE" in sql and "ESCAPE" in sql
+    assert sql.index("CASE") < sql.index("greatest")
+
+def test_search_stocks_postgresql_returns_page_and_total_from_one_query(stock_master_service):
+    """
+    search_stocks_with_total: PostgreSQL에서 인덱스를 사용할 수 없으면 pg_trgm 쿼리 한 번으로 페이지와 전체 건수를 반환하는지 테스트
+    """
+    mock_db_session = MagicMock()
+    mock_db_session.bind.dialect.name = 'postgresql'
+    row = MagicMock()
+    row.__iter__.return_value = iter([StockMaster(symbol="005930", name="삼성전자", market="KOSPI"), 7])
+    row.total_count = 7
+
+    with patch.object(stock_master_service, '_build_ranked_search_query') as mock_build, \
+         patch('src.common.services.stock_master_service.symbol_search_index.ensure_fresh', return_value=False):
+        mock_build.return_value.offset.return_value.limit.return_value.all.return_value = [row]
+        result = stock_master_service.search_stocks_with_total("삼성", mock_db_session, limit=1)
+
+    assert result == {"items": [{"symbol": "005930", "name": "삼성전자", "market": "KOSPI"}], "total_count": 7}
+    mock_db_session.query.assert_not_called()
+
+
+@pytest.mark.parametrize("keyword, expected_symbols", [
+    ("samsung", ["005930"]),
+    ("_", ["900001"]),
+    ("%", []),
+])
+def test_search_stocks_with_total_sqlite_page_matches_count(stock_master_service, keyword, expected_symbols):
+    """
+    PostgreSQL이 아닌 DB에서도 페이지와 건수가 같은 조건(이스케이프된 ILIKE)으로 조회되는지 테스트
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine("sqlite:///:memory:")
+    StockMaster.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        StockMaster(symbol="005930", name="Samsung Electronics", market="KOSPI"),
+        StockMaster(symbol="900001", name="A_B Holdings", market="KOSDAQ"),
+        StockMaster(symbol="900002", name="AXB Holdings", market="KOSDAQ"),
+    ])
+    db.commit()
+
+    with patch("src.common.services.stock_master_service.symbol_search_index.ensure_fresh", return_value=False):
+        result = stock_master_service.search_stocks_with_total(keyword, db)
+    db.close()
+
+    assert [item["symbol"] for item in result["items"]] == expected_symbols
+    assert result["total_count"] == len(expected_symbols)
@@ -0,0 +1,146 @@
+"""
+SymbolSearchIndex 단위 테스트
+"""
+
+import datetime
+import pytest
+from unittest.mock import MagicMock
+
+from src.common.services.symbol_search_index import SymbolSearchIndex, normalize, to_choseong, is_choseong_query
+from src.common.services.stock_master_service import StockMasterService
+from src.common.tests.unit.conftest import TestStockMaster
+
+ROWS = [
+    ("005930", "삼성전자", "KOSPI"),
+    ("005935", "삼성전자우", "KOSPI"),
+    ("006400", "삼성SDI", "KOSPI"),
+    ("207940", "삼성바이오로직스", "KOSPI"),
+    ("000660", "SK하이닉스", "KOSPI"),
+    ("035720", "카카오", "KOSPI"),
+    ("323410", "카카오뱅크", "KOSPI"),
+    ("373220", "LG에너지솔루션", "KOSPI"),
+    ("051910", "LG화학", "KOSPI"),
+    ("900100", "전자 부품", "KOSDAQ"),
+]
+
+
+@pytest.fixture
+def index():
+    idx = SymbolSearchIndex()
+    idx.build_from_rows(ROWS)
+    return idx
+
+
+def _symbols(result):
+    return [item["symbol"] for item in result["items"]]
+
+
+class TestHelpers:
+    def test_normalize_ignores_case_and_spaces(self):
+        assert normalize(" Sk 하이닉스 ") == "sk하이닉스"
+
+    def test_to_choseong(self):
+        assert to_choseong("삼성sdi") == "ㅅㅅsdi"
+
+    def test_is_choseong_query(self):
+        assert is_choseong_query("ㅅㅅㅈㅈ")
+        assert not is_choseong_query("삼성")
+
+
+class TestSearch:
+    def test_exact_name_ranks_before_longer_names(self, index):
+        result = index.search("삼성전자")
+        assert _symbols(result) == ["005930", "005935"]
+        assert result["total_count"] == 2
+
+    def test_symbol_prefix(self, index):
+        result = index.search("0059")
+        assert _symbols(result) == ["005930", "005935"]
+
+    def test_exact_symbol_first(self, index):
+        assert _symbols(index.search("005930"))[0] == "005930"
+
+    def test_name_prefix_before_contains(self, index):
+        """'전자'로 시작하는 이름이 '전자'를 포함하는 이름보다 먼저"""
+        result = index.search("전자")
+        assert _symbols(result) == ["900100", "005930", "005935"]
+
+    def test_case_and_space_insensitive(self, index):
+        assert _symbols(index.search("sk 하이")) == ["000660"]
+        assert _symbols(index.search("전자부품")) == ["900100"]
+
+    def test_single_character_query(self, index):
+        assert set(_symbols(index.search("카"))) == {"035720", "323410"}
+
+    def test_choseong_query(self, index):
+        assert _symbols(index.search("ㅋㅋㅇ")) == ["035720", "323410"]
+
+    def test_pagination_keeps_exact_total(self, index):
+        first = index.search("삼성", limit=2, offset=0)
+        second = index.search("삼성", limit=2, offset=2)
+        assert first["total_count"] == second["total_count"] == 4
+        assert len(set(_symbols(first)) | set(_symbols(second))) == 4
+
+    def test_no_result(self, index):
+        assert index.search("없는종목") == {"items": [], "total_count": 0}
+
+    def test_search_before_build_raises(self):
+        with pytest.raises(RuntimeError):
+            SymbolSearchIndex().search("삼성")
+
+
+class TestRefresh:
+    def _add_stock(self, db, symbol, name, updated_at=None):
+        db.add(TestStockMaster(symbol=symbol, name=name, market="KOSPI",
+                               updated_at=updated_at or datetime.datetime.utcnow()))
+        db.commit()
+
+    def test_ensure_fresh_builds_from_db(self, db_session):
+        self._add_stock(db_session, "005930", "삼성전자")
+        idx = SymbolSearchIndex()
+
+        assert idx.ensure_fresh(db_session) is True
+        assert _symbols(idx.search("삼성")) == ["005930"]
+
+    def test_ensure_fresh_rebuilds_when_master_changes(self, db_session):
+        self._add_stock(db_session, "005930", "삼성전자")
+        idx = SymbolSearchIndex()
+        idx.ensure_fresh(db_session)
+
+        self._add_stock(db_session, "005935", "삼성전자우")
+        # 확인 주기 전에는 기존 인덱스 유지
+        idx.ensure_fresh(db_session)
+        assert idx.search("삼성")["total_count"] == 1
+
+        idx.invalidate()
+        idx.ensure_fresh(db_session)
+        assert idx.search("삼성")["total_count"] == 2
+        assert idx.get_stats()["builds"] == 2
+
+    def test_ensure_fresh_skips_rebuild_when_unchanged(self, db_session):
+        self._add_stock(db_session, "005930", "삼성전자")
+        idx = SymbolSearchIndex()
+        idx.ensure_fresh(db_session)
+
+        idx.invalidate()
+        idx.ensure_fresh(db_session)
+        assert idx.get_stats()["builds"] == 1
+
+    def test_ensure_fresh_returns_false_on_db_error(self):
+        db = MagicMock()
+        db.query.side_effect = Exception("DB down")
+        assert SymbolSearchIndex().ensure_fresh(db) is False
+
+
+class TestStockMasterServiceSearch:
+    def test_search_stocks_with_total_uses_index(self, db_session):
+        db_session.add_all([
+            TestStockMaster(symbol="005930", name="삼성전자", market="KOSPI"),
+            TestStockMaster(symbol="006400", name="삼성SDI", market="KOSPI"),
+        ])
+        db_session.commit()
+
+        result = StockMasterService().search_stocks_with_total("삼성", db_session, limit=1)
+
+        assert result["total_count"] == 2
+        assert result["items"] == [{"symbol": "005930", "name": "삼성전자", "market": "KOSPI"}]
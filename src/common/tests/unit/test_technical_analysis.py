@@ -0,0 +1,56 @@
+"""
+technical_analysis 단위 테스트
+"""
+
+import datetime
+import random
+
+import pytest
+
+from src.common.utils.technical_analysis import (
+    analyze_daily_prices, analyze_daily_prices_batch, build_prediction_result, build_prediction_results
+)
+
+
+def _random_prices(rng, days, start=datetime.date(2026, 1, 1)):
+    close = rng.uniform(1000, 100000)
+    rows = []
+    for i in range(days):
+        close *= 1 + rng.uniform(-0.04, 0.04)
+        rows.append({"date": start + datetime.timedelta(days=i), "open": close, "high": close,
+                     "low": close, "close": close, "volume": 1000})
+    rng.shuffle(rows)  # 입력 순서와 관계없이 날짜순으로 계산해야 함
+    return rows
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_matches_single_symbol_analysis(seed):
+    rng = random.Random(seed)
+    prices = {f"{i:06d}": _random_prices(rng, rng.choice([20, 21, 26, 33, 40])) for i in range(100)}
+
+    batch = analyze_daily_prices_batch(prices)
+
+    assert batch == {symbol: analyze_daily_prices(data) for symbol, data in prices.items()}
+
+
+def test_batch_handles_flat_prices_and_short_data():
+    flat = [{"date": datetime.date(2026, 1, 1) + datetime.timedelta(days=i), "close": 100.0} for i in range(25)]
+    rising = [{"date": datetime.date(2026, 1, 1) + datetime.timedelta(days=i), "close": 100.0 + i} for i in range(25)]
+    short = rising[:10]
+
+    batch = analyze_daily_prices_batch({"flat": flat, "rising": rising, "short": short, "empty": []})
+
+    assert batch["flat"] == analyze_daily_prices(flat)
+    assert batch["rising"] == analyze_daily_prices(rising)
+    assert batch["short"] is None
+    assert batch["empty"] is None
+
+
+def test_build_prediction_results_matches_build_prediction_result():
+    rng = random.Random(7)
+    prices = {"005930": _random_prices(rng, 30), "000660": _random_prices(rng, 5), "035720": []}
+
+    results = build_prediction_results(prices)
+
+    assert results == {symbol: build_prediction_result(data) for symbol, data in prices.items()}
+    assert results["000660"]["prediction"] == "예측 불가"
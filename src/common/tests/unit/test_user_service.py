@@ -60,3 +60,14 @@ def test_update_user_not_found(db_session, user_service):
     user_update = UserUpdate(notification_preferences={})
     result = user_service.update_user(db_session, 999, user_update)
     assert result is None
+
+def test_update_user_invalidates_cached_principal(db_session, user_service):
+    from src.common.services.principal_cache_service import principal_cache_service
+
+    created_user = user_service.create_user(db_session, UserCreate(username="cached", email="cached@example.com", password="password"))
+    principal_cache_service.set(created_user)
+    assert principal_cache_service.get(created_user.id, 0) is not None
+
+    user_service.update_user(db_session, created_user.id, UserUpdate(email="changed@example.com"))
+
+    assert principal_cache_service.get(created_user.id, 0) is None
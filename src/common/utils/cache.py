@@ -0,0 +1,354 @@
+"""
+프로세스 내 L1 캐시와 Redis L2 캐시를 조합한 읽기 캐시 유틸리티입니다.
+
+- TTLCache: 스레드 안전한 프로세스 내 LRU + TTL 캐시
+- TieredCache: L1(TTLCache) → L2(Redis) 순으로 조회하는 2단 캐시
+
+Redis는 선택 사항입니다. REDIS_HOST가 설정되지 않았거나 Redis 오류가 발생하면
+L1만으로 동작하며, 캐시 오류가 원래 요청을 실패시키지 않습니다.
+Redis 클라이언트는 동기식이므로, async 코드에서는 aget_many()/aset_many()를 사용합니다.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+# clear_all_caches()로 한 번에 비울 수 있도록 생성된 캐시를 추적합니다. (테스트 격리용)
+_registry: "weakref.WeakSet" = weakref.WeakSet()
+
+_redis_client = None
+_redis_client_initialized = False
+_redis_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    캐시용 동기 Redis 클라이언트를 반환합니다. REDIS_HOST가 없으면 None을 반환합니다.
+
+    Returns:
+        redis.Redis | None: 프로세스 공용 Redis 클라이언트
+    """
+    global _redis_client, _redis_client_initialized
+    if _redis_client_initialized:
+        return _redis_client
+    with _redis_lock:
+        if not _redis_client_initialized:
+            redis_host = os.getenv("REDIS_HOST")
+            if redis_host:
+                import redis
+                timeout = float(os.getenv("CACHE_REDIS_TIMEOUT_SECONDS", "0.2"))
+                _redis_client = redis.Redis.from_url(
+                    f"redis://{redis_host}", socket_timeout=timeout, socket_connect_timeout=timeout
+                )
+            _redis_client_initialized = True
+    return _redis_client
+
+
+def register_cache(cache):
+    """clear() 메서드를 가진 프로세스 내 캐시를 clear_all_caches() 대상에 등록합니다."""
+    _registry.add(cache)
+
+
+def clear_all_caches():
+    """생성된 모든 캐시의 L1을 비웁니다."""
+    for cache in list(_registry):
+        cache.clear()
+
+
+class TTLCache:
+    """
+    최대 크기와 만료 시간을 가진 프로세스 내 LRU 캐시입니다.
+
+    Args:
+        maxsize (int): 최대 항목 수. 초과하면 가장 오래 사용되지 않은 항목부터 제거
+        ttl (float): 항목 유지 시간(초)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        register_cache(self)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    L1(프로세스 내) → L2(Redis) 순서로 조회하는 읽기 캐시입니다.
+
+    여러 프로세스가 Redis를 공유하므로, 다른 프로세스에서 무효화한 값은
+    L1 TTL(짧게 유지)이 지나면 반영됩니다.
+
+    versioned=True이면 키마다 세대(generation) 번호를 두고 invalidate() 시 증가시킵니다.
+    get_many(keys, generations=...)로 DB 조회 전의 세대를 받아 두고 set_many(..., generations=...)로 저장하면,
+    그 사이 무효화된 키의 값(무효화 전에 읽은 오래된 값)은 L1에 저장되지 않고 Redis에서도 조회되지 않습니다.
+
+    Args:
+        namespace (str): Redis 키 접두사 (예: 'price' → 'stockeye:price:005930')
+        l1_maxsize (int): L1 최대 항목 수
+        l1_ttl (float): L1 유지 시간(초)
+        l2_ttl (float): Redis 유지 시간(초)
+        redis_client: Redis 클라이언트 (None이면 get_redis_client() 사용)
+        serializer / deserializer: Redis 저장 형식 변환 함수 (기본: JSON)
+        versioned (bool): 키별 세대 번호로 무효화 이후의 오래된 저장을 무시할지 여부
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        l1_maxsize: int = 4096,
+        l1_ttl: float = 10.0,
+        l2_ttl: float = 3600.0,
+        redis_client=None,
+        serializer: Callable[[Any], str] = json.dumps,
+        deserializer: Callable[[Any], Any] = json.loads,
+        versioned: bool = False,
+    ):
+        self.namespace = namespace
+        self.l1 = TTLCache(maxsize=l1_maxsize, ttl=l1_ttl)
+        self.l2_ttl = l2_ttl
+        self._redis_client = redis_client
+        self._serializer = serializer
+        self._deserializer = deserializer
+        self.versioned = versioned
+        # 프로세스 내 키별 세대 번호 (versioned=True일 때만 사용)
+        self._generations: Dict[Hashable, int] = {}
+        self._stats_lock = threading.Lock()
+        self._stats = {'l1_hits': 0, 'l2_hits': 0, 'misses': 0, 'sets': 0, 'invalidations': 0, 'errors': 0}
+
+    @property
+    def redis(self):
+        return self._redis_client if self._redis_client is not None else get_redis_client()
+
+    def _key(self, key: Hashable) -> str:
+        return f"stockeye:{self.namespace}:{key}"
+
+    def _generation_key(self, key: Hashable) -> str:
+        return f"stockeye:{self.namespace}:generation:{key}"
+
+    def _local_generation(self, key: Hashable) -> int:
+        with self._stats_lock:
+            return self._generations.get(key, 0)
+
+    def _count(self, name: str, n: int = 1):
+        if n:
+            with self._stats_lock:
+                self._stats[name] += n
+
+    def get(self, key: Hashable, default: Any = MISSING, generations: Optional[Dict[Hashable, Any]] = None) -> Any:
+        return self.get_many([key], generations=generations).get(key, default)
+
+    def get_many(self, keys: Iterable[Hashable], generations: Optional[Dict[Hashable, Any]] = None) -> Dict[Hashable, Any]:
+        """
+        여러 키를 한 번에 조회합니다. L1에 없는 키만 Redis MGET 한 번으로 조회합니다.
+
+        Args:
+            keys (Iterable[Hashable]): 조회할 키 목록
+            generations (Dict, optional): versioned 캐시에서 캐시에 없는 키의 현재 세대를 채워 받을 dict.
+                DB에서 값을 읽은 뒤 set_many(..., generations=generations)로 전달합니다.
+
+        Returns:
+            Dict: 캐시에 있는 키와 값 (없는 키는 포함되지 않음)
+        """
+        found: Dict[Hashable, Any] = {}
+        l1_missing: List[Hashable] = []
+        for key in dict.fromkeys(keys):
+            value = self.l1.get(key)
+            if value is MISSING:
+                l1_missing.append(key)
+            else:
+                found[key] = value
+        self._count('l1_hits', len(found))
+
+        # Redis 세대를 읽지 못하면 MISSING으로 두어 Redis에는 저장하지 않음
+        remote_generations: Dict[Hashable, Any] = {key: MISSING for key in l1_missing}
+        local_generations = {key: self._local_generation(key) for key in l1_missing} if self.versioned else {}
+        l2_hits = 0
+        if l1_missing and self.redis is not None:
+            try:
+                redis_keys = [self._key(k) for k in l1_missing]
+                if self.versioned:
+                    redis_keys += [self._generation_key(k) for k in l1_missing]
+                raw_values = self.redis.mget(redis_keys)
+                if self.versioned:
+                    remote_generations = {
+                        key: int(raw) if raw is not None else 0
+                        for key, raw in zip(l1_missing, raw_values[len(l1_missing):])
+                    }
+                for key, raw in zip(l1_missing, raw_values):
+                    if raw is None:
+                        continue
+                    value = self._deserializer(raw)
+                    if self.versioned:
+                        # 무효화 전에 읽은 값이 뒤늦게 저장된 경우 세대가 달라 무시
+                        if not isinstance(value, dict) or value.get("generation") != remote_generations[key]:
+                            continue
+                        value = value["value"]
+                    found[key] = value
+                    if not self.versioned or self._local_generation(key) == local_generations[key]:
+                        self.l1.set(key, value)
+                    l2_hits += 1
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[Cache:{self.namespace}] Redis 조회 실패, DB로 대체합니다: {e}")
+        self._count('l2_hits', l2_hits)
+        self._count('misses', len(l1_missing) - l2_hits)
+        if generations is not None and self.versioned:
+            for key in l1_missing:
+                if key not in found:
+                    generations[key] = (local_generations[key], remote_generations[key])
+        return found
+
+    def set(self, key: Hashable, value: Any, generations: Optional[Dict[Hashable, Any]] = None):
+        self.set_many({key: value}, generations=generations)
+
+    def set_many(self, items: Dict[Hashable, Any], generations: Optional[Dict[Hashable, Any]] = None):
+        """
+        여러 값을 L1과 Redis에 함께 저장합니다. (Redis는 파이프라인 한 번)
+
+        Args:
+            items (Dict): 저장할 키와 값
+            generations (Dict, optional): versioned 캐시에서 get_many()가 채운 세대.
+                그 뒤 무효화된 키는 L1에 저장하지 않고, Redis에는 조회 시점의 세대와 함께 저장하여
+                현재 세대와 다르면 조회되지 않도록 합니다. (versioned 캐시는 세대가 없으면 L1에만 저장)
+        """
+        if not items:
+            return
+        if self.versioned:
+            current = {}
+            for key, value in items.items():
+                local_generation, remote_generation = (generations or {}).get(
+                    key, (self._local_generation(key), MISSING)
+                )
+                if self._local_generation(key) == local_generation:
+                    current[key] = (value, remote_generation)
+            skipped = len(items) - len(current)
+            if skipped:
+                logger.debug(f"[Cache:{self.namespace}] 조회 중 무효화된 키 {skipped}개는 저장하지 않습니다.")
+            items = {key: value for key, (value, _) in current.items()}
+            l2_items = {
+                key: {"generation": generation, "value": value}
+                for key, (value, generation) in current.items() if generation is not MISSING
+            }
+        else:
+            l2_items = items
+
+        for key, value in items.items():
+            self.l1.set(key, value)
+        self._count('sets', len(items))
+        if l2_items and self.redis is not None:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, value in l2_items.items():
+                    pipe.set(self._key(key), self._serializer(value), ex=int(self.l2_ttl))
+                pipe.execute()
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[Cache:{self.namespace}] Redis 저장 실패: {e}")
+
+    async def aget_many(self, keys: Iterable[Hashable], generations: Optional[Dict[Hashable, Any]] = None) -> Dict[Hashable, Any]:
+        """
+        get_many()의 비동기 버전입니다.
+
+        모든 키가 L1에 있거나 Redis를 사용하지 않으면 바로 조회하고,
+        Redis 조회가 필요한 경우에만 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+        """
+        keys = list(dict.fromkeys(keys))
+        if self.redis is None or all(self.l1.get(key) is not MISSING for key in keys):
+            return self.get_many(keys, generations=generations)
+        return await anyio.to_thread.run_sync(functools.partial(self.get_many, keys, generations=generations))
+
+    async def aget(self, key: Hashable, default: Any = MISSING, generations: Optional[Dict[Hashable, Any]] = None) -> Any:
+        return (await self.aget_many([key], generations=generations)).get(key, default)
+
+    async def aset_many(self, items: Dict[Hashable, Any], generations: Optional[Dict[Hashable, Any]] = None):
+        """set_many()의 비동기 버전입니다. Redis를 사용하면 스레드에서 저장합니다."""
+        if self.redis is None:
+            self.set_many(items, generations=generations)
+            return
+        await anyio.to_thread.run_sync(functools.partial(self.set_many, items, generations=generations))
+
+    async def aset(self, key: Hashable, value: Any, generations: Optional[Dict[Hashable, Any]] = None):
+        await self.aset_many({key: value}, generations=generations)
+
+    def invalidate(self, keys: Iterable[Hashable]):
+        """지정한 키를 L1과 Redis에서 삭제합니다. (versioned이면 세대 번호도 증가)"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        for key in keys:
+            if self.versioned:
+                with self._stats_lock:
+                    self._generations[key] = self._generations.get(key, 0) + 1
+            self.l1.delete(key)
+        self._count('invalidations', len(keys))
+        if self.redis is not None:
+            try:
+                if self.versioned:
+                    pipe = self.redis.pipeline(transaction=False)
+                    for key in keys:
+                        pipe.incr(self._generation_key(key))
+                        # 세대 키는 값보다 오래 유지하여, 만료 후 0으로 돌아가 오래된 값과 다시 일치하지 않도록 함
+                        pipe.expire(self._generation_key(key), int(self.l2_ttl) * 2)
+                    pipe.delete(*[self._key(k) for k in keys])
+                    pipe.execute()
+                else:
+                    self.redis.delete(*[self._key(k) for k in keys])
+            except Exception as e:
+                self._count('errors')
+                logger.warning(f"[Cache:{self.namespace}] Redis 무효화 실패: {e}")
+
+    def clear(self):
+        """L1을 비웁니다. (Redis에 저장된 값은 유지)"""
+        self.l1.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['l1_hits'] + stats['l2_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['l1_hits'] + stats['l2_hits']) / lookups, 4) if lookups else 0.0
+        stats['l1_size'] = len(self.l1)
+        stats['redis_enabled'] = self.redis is not None
+        return stats
@@ -10,4 +10,11 @@ class UserAlreadyExistsException(Exception):
 
 class InvalidCredentialsException(Exception):
     """인증 정보가 유효하지 않을 때 발생하는 오류"""
-    pass
\ No newline at end of file
+    pass
+
+
+class NotificationThrottledError(Exception):
+    """알림 채널이 전송 속도 제한(429 등)으로 요청을 거부했을 때 발생하는 오류"""
+    def __init__(self, message: str, retry_after: float = 0.0):
+        self.retry_after = retry_after
+        super().__init__(message)
@@ -1,6 +1,11 @@
+import asyncio
+import json
 import httpx
 from httpx import AsyncClient
 import os
+from typing import Callable, Hashable, Optional
+
+from src.common.utils.single_flight import SingleFlight
 
 # API_HOST 환경 변수 로드
 API_HOST = os.getenv("API_HOST", "localhost")
@@ -16,4 +21,149 @@ def get_retry_client(auth_token: str = None) -> AsyncClient:
     headers = {}
     if auth_token:
         headers["Authorization"] = f"Bearer {auth_token}"
-    return AsyncClient(base_url=API_BASE_URL, transport=transport, timeout=10.0, headers=headers)
\ No newline at end of file
+    return AsyncClient(base_url=API_BASE_URL, transport=transport, timeout=10.0, headers=headers)
+
+# =====================================================================================
+# 프로세스 공용 API 클라이언트 (봇 → API)
+# =====================================================================================
+# get_retry_client()는 호출할 때마다 클라이언트와 커넥션 풀을 새로 만들기 때문에 매 요청이 TCP 연결부터 시작합니다.
+# 봇처럼 같은 API 서버로 계속 요청하는 프로세스는 get_api_client()로 하나의 커넥션 풀을 함께 씁니다.
+API_CLIENT_MAX_CONNECTIONS = int(os.getenv("API_CLIENT_MAX_CONNECTIONS", "100"))
+API_CLIENT_MAX_KEEPALIVE = int(os.getenv("API_CLIENT_MAX_KEEPALIVE", "20"))
+API_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("API_CLIENT_KEEPALIVE_EXPIRY_SECONDS", "30"))
+API_CLIENT_TIMEOUT = float(os.getenv("API_CLIENT_TIMEOUT_SECONDS", "10"))
+
+# 여러 사용자가 같은 종목을 동시에 조회하면 같은 API 요청이 한꺼번에 나가므로, 진행 중인 같은 요청의 응답을 함께 사용합니다.
+# GET은 기본으로 합치고, POST는 결과가 요청자와 무관한 경우에만 coalesce=True로 합칩니다.
+API_CLIENT_COALESCE = os.getenv("API_CLIENT_COALESCE", "true").lower() == "true"
+_COALESCE_KWARGS = {"params", "json", "headers"}
+api_flight = SingleFlight("api_client")
+
+
+class ApiSession:
+    """
+    공용 클라이언트에 요청별 인증 헤더를 더해 주는 얇은 래퍼입니다.
+
+    `async with get_api_client(auth_token) as client:` 형태로 기존 코드와 같이 사용하며,
+    블록을 벗어나도 공용 클라이언트(커넥션 풀)는 닫히지 않습니다.
+    인증 토큰으로 보낸 요청이 401을 받으면 on_unauthorized(토큰)를 호출합니다. (캐시된 토큰 폐기 등)
+    """
+
+    def __init__(self, client: AsyncClient, auth_token: str = None, on_unauthorized: Callable[[str], None] = None):
+        self._client = client
+        self._auth_token = auth_token
+        self._on_unauthorized = on_unauthorized
+        self._headers = {"Authorization": f"Bearer {auth_token}"} if auth_token else None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def _with_auth(self, kwargs: dict) -> dict:
+        if self._headers:
+            kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        return kwargs
+
+    def _check_unauthorized(self, response: httpx.Response) -> httpx.Response:
+        if response.status_code == 401 and self._auth_token and self._on_unauthorized:
+            self._on_unauthorized(self._auth_token)
+        return response
+
+    @staticmethod
+    def _coalesce_key(method: str, url, kwargs: dict) -> Optional[Hashable]:
+        """같은 요청을 구분하는 키를 반환합니다. (본문이 파일/바이트이거나 직렬화할 수 없으면 None)"""
+        if not API_CLIENT_COALESCE or not set(kwargs) <= _COALESCE_KWARGS:
+            return None
+        try:
+            body = json.dumps({k: kwargs[k] for k in sorted(kwargs)}, sort_keys=True, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        return (method, str(url), body)
+
+    async def _send(self, method: str, url, coalesce: bool, kwargs: dict) -> httpx.Response:
+        kwargs = self._with_auth(kwargs)
+        send = getattr(self._client, method.lower())
+        key = self._coalesce_key(method, url, kwargs) if coalesce else None
+        if key is None:
+            return self._check_unauthorized(await send(url, **kwargs))
+        # 응답 본문은 이미 읽힌 상태이므로 같은 Response 객체를 여러 호출자가 함께 읽어도 됨
+        return self._check_unauthorized(await api_flight.do(key, lambda: send(url, **kwargs)))
+
+    async def request(self, method: str, url, **kwargs) -> httpx.Response:
+        return self._check_unauthorized(await self._client.request(method, url, **self._with_auth(kwargs)))
+
+    async def get(self, url, coalesce: bool = True, **kwargs) -> httpx.Response:
+        """GET 요청. 인증 토큰, 파라미터까지 같은 요청이 진행 중이면 그 응답을 함께 받습니다."""
+        return await self._send("GET", url, coalesce, kwargs)
+
+    async def post(self, url, coalesce: bool = False, **kwargs) -> httpx.Response:
+        """POST 요청. coalesce=True이면 진행 중인 같은 요청(인증 토큰, 본문 포함)의 응답을 함께 받습니다."""
+        return await self._send("POST", url, coalesce, kwargs)
+
+    async def put(self, url, **kwargs) -> httpx.Response:
+        return self._check_unauthorized(await self._client.put(url, **self._with_auth(kwargs)))
+
+    async def patch(self, url, **kwargs) -> httpx.Response:
+        return self._check_unauthorized(await self._client.patch(url, **self._with_auth(kwargs)))
+
+    async def delete(self, url, **kwargs) -> httpx.Response:
+        return self._check_unauthorized(await self._client.delete(url, **self._with_auth(kwargs)))
+
+
+class SharedApiClient:
+    """
+    프로세스당 하나의 커넥션 풀을 유지하는 API 클라이언트입니다.
+
+    httpx 커넥션은 생성된 이벤트 루프에 묶이므로, 다른 이벤트 루프에서 호출되면 그 루프용 클라이언트를 새로 만듭니다.
+    (봇은 이벤트 루프가 하나이므로 실제로는 하나만 만들어집니다.)
+    on_unauthorized를 설정하면 인증 토큰이 401로 거부될 때 그 토큰으로 호출됩니다.
+    """
+
+    def __init__(self):
+        self._client: AsyncClient = None
+        self._loop = None
+        self.on_unauthorized: Optional[Callable[[str], None]] = None
+
+    def _create_client(self) -> AsyncClient:
+        limits = httpx.Limits(
+            max_connections=API_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=API_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=API_CLIENT_KEEPALIVE_EXPIRY,
+        )
+        transport = httpx.AsyncHTTPTransport(retries=3, limits=limits)
+        return AsyncClient(base_url=API_BASE_URL, transport=transport, timeout=API_CLIENT_TIMEOUT)
+
+    def get_client(self) -> AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def session(self, auth_token: str = None) -> ApiSession:
+        return ApiSession(self.get_client(), auth_token, self.on_unauthorized)
+
+    async def aclose(self):
+        """커넥션 풀을 닫습니다. (애플리케이션 종료 시)"""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+# 싱글톤 인스턴스
+shared_api_client = SharedApiClient()
+
+
+def get_api_client(auth_token: str = None) -> ApiSession:
+    """
+    공용 커넥션 풀을 사용하는 API 클라이언트를 반환합니다.
+    5xx 에러나 네트워크 에러 발생 시 최대 3번 재시도하며, 인증 토큰은 요청마다 Authorization 헤더로 붙입니다.
+    """
+    return shared_api_client.session(auth_token)
+
+
+async def close_api_client(*args):
+    """공용 API 클라이언트를 닫습니다. (Application.post_shutdown 콜백으로 사용 가능)"""
+    await shared_api_client.aclose()
@@ -0,0 +1,207 @@
+"""
+커서 기반(keyset) 페이지네이션 유틸리티입니다.
+
+OFFSET은 건너뛸 행을 모두 읽어야 하므로 뒤쪽 페이지일수록 느려집니다.
+keyset 방식은 "마지막으로 본 정렬 키 다음부터" 인덱스로 바로 찾아가므로 페이지 깊이와 관계없이 일정한 시간이 걸립니다.
+
+커서는 클라이언트가 내용을 해석하지 않는 불투명 문자열(URL-safe base64 JSON)입니다.
+- {"a": key}: key 다음 페이지
+- {"b": key}: key 이전 페이지
+- {"e": 1}:   마지막 페이지 (LAST_PAGE_CURSOR)
+"""
+import base64
+import binascii
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from src.common.utils.cache import MISSING, TTLCache
+
+# 전체 건수는 선택 사항이며, 같은 조건의 건수는 잠시 재사용합니다.
+count_cache = TTLCache(
+    maxsize=int(os.getenv("PAGINATION_COUNT_CACHE_MAXSIZE", "1024")),
+    ttl=float(os.getenv("PAGINATION_COUNT_CACHE_TTL_SECONDS", "60")),
+)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """커서 상태를 불투명 문자열로 변환합니다."""
+    payload = {k: [_encode_value(v) for v in value] if isinstance(value, (list, tuple)) else value for k, value in state.items()}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_length: Optional[int] = None) -> Dict[str, Any]:
+    """
+    불투명 커서 문자열을 커서 상태로 변환합니다.
+
+    Args:
+        cursor (str): 커서 문자열
+        key_length (int, optional): 정렬 키 컬럼 수. 지정하면 "a"/"b" 값이 이 길이의 키 목록인지 확인합니다.
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(payload, dict) or not payload.keys() <= {"a", "b", "e"}:
+        raise ValueError("Invalid cursor")
+    try:
+        state = {k: [_decode_value(v) for v in value] if isinstance(value, list) else value for k, value in payload.items()}
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    for k in ("a", "b"):
+        if k not in state:
+            continue
+        key = state[k]
+        # 정렬 키는 컬럼 수와 같은 길이의 스칼라 값 목록이어야 함
+        if not isinstance(key, list) or not key or (key_length is not None and len(key) != key_length):
+            raise ValueError("Invalid cursor")
+        if not all(isinstance(v, (str, int, float, date)) for v in key):
+            raise ValueError("Invalid cursor")
+    return state
+
+
+LAST_PAGE_CURSOR = encode_cursor({"e": 1})
+
+
+def _coerce_key_value(column, value: Any) -> Any:
+    """커서의 정렬 키 값을 컬럼 타입(column.type.python_type)에 맞게 변환합니다. 맞지 않으면 ValueError"""
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        python_type = None
+    if isinstance(value, bool):
+        raise ValueError("Invalid cursor")
+    if python_type is datetime:
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+    elif python_type is date:
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            return date.fromisoformat(value)
+    elif python_type is str:
+        if isinstance(value, str):
+            return value
+    elif python_type is int:
+        if isinstance(value, int):
+            return value
+    elif python_type in (float, Decimal):
+        if isinstance(value, (int, float)):
+            return Decimal(str(value)) if python_type is Decimal else float(value)
+    elif python_type is None or isinstance(value, python_type):
+        return value
+    raise ValueError("Invalid cursor")
+
+
+def _coerce_key(columns: Sequence, values: Sequence) -> list:
+    """커서의 정렬 키를 컬럼별로 검증/변환합니다. 타입이 다른 값으로 DB에서 비교 오류가 나지 않도록 쿼리 전에 거부합니다."""
+    return [_coerce_key_value(column, value) for column, value in zip(columns, values)]
+
+
+def _beyond(columns: Sequence, values: Sequence, descending: bool):
+    """정렬 순서상 values 뒤에 오는 행의 조건 (row value 비교를 OR/AND로 풀어 씀)"""
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal_prefix = [c == v for c, v in zip(columns[:i], values[:i])]
+        clauses.append(and_(*equal_prefix, column < value if descending else column > value))
+    return or_(*clauses)
+
+
+def paginate_keyset(
+    query: Query,
+    order_columns: Sequence,
+    key_of: Callable[[Any], Sequence],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Dict[str, Any]:
+    """
+    정렬 키(order_columns)를 기준으로 한 페이지를 조회합니다.
+
+    order_columns는 유일한 순서를 보장해야 합니다. (예: (created_at, id))
+
+    Args:
+        query (Query): 필터까지 적용된 쿼리 (order_by/offset/limit은 적용하지 않음)
+        order_columns (Sequence): 정렬 키 컬럼 목록
+        key_of (Callable): 결과 행에서 정렬 키 값 목록을 꺼내는 함수
+        limit (int): 페이지 크기
+        cursor (str, optional): 이전 응답의 next_cursor/prev_cursor 또는 LAST_PAGE_CURSOR
+        descending (bool): 내림차순 정렬 여부
+
+    Returns:
+        Dict: {"items": 행 목록, "next_cursor": str | None, "prev_cursor": str | None}
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않거나, 정렬 키 값의 타입이 컬럼과 맞지 않는 경우
+    """
+    state = decode_cursor(cursor, key_length=len(order_columns)) if cursor else {}
+    backward = "b" in state or "e" in state
+    if "a" in state:
+        query = query.filter(_beyond(order_columns, _coerce_key(order_columns, state["a"]), descending))
+    elif "b" in state:
+        query = query.filter(_beyond(order_columns, _coerce_key(order_columns, state["b"]), not descending))
+
+    scan_descending = descending != backward
+    rows = query.order_by(*[c.desc() if scan_descending else c.asc() for c in order_columns]).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+
+    has_next = "b" in state if backward else has_more
+    has_prev = has_more if backward else "a" in state
+    return {
+        "items": rows,
+        "next_cursor": encode_cursor({"a": list(key_of(rows[-1]))}) if rows and has_next else None,
+        "prev_cursor": encode_cursor({"b": list(key_of(rows[0]))}) if rows and has_prev else None,
+    }
+
+
+def last_page_size(total_count: int, limit: int) -> int:
+    """
+    마지막 페이지의 크기를 반환합니다.
+
+    LAST_PAGE_CURSOR 조회 시 이 크기를 사용하면, 마지막 페이지에서 이전 페이지로 이동할 때도
+    페이지 경계가 OFFSET 방식(1~limit, limit+1~2*limit, ...)과 같게 유지됩니다.
+    """
+    if total_count <= 0:
+        return limit
+    return total_count - (total_count - 1) // limit * limit
+
+
+def cached_count(key: Hashable, query: Query) -> int:
+    """같은 조건의 전체 건수를 count_cache TTL 동안 재사용합니다."""
+    total = count_cache.get(key)
+    if total is MISSING:
+        total = query.order_by(None).count()
+        count_cache.set(key, total)
+    return total
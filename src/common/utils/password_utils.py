@@ -1,9 +1,232 @@
+"""
+비밀번호 해시/검증 유틸리티입니다.
+
+bcrypt는 의도적으로 느린 연산(수십~수백 ms)이므로 요청 처리 스레드에서 바로 계산하면
+로그인이나 텔레그램 가입이 몰릴 때 API 스레드 풀이 모두 bcrypt에 묶여 다른 요청까지 지연됩니다.
+그래서 해시/검증은 크기가 정해진 프로세스 풀에서 계산합니다.
+
+- 동기 코드: verify_password() / get_password_hash() (결과를 기다림)
+- 비동기 코드: averify_password() / aget_password_hash() (기다리는 동안 이벤트 루프와 스레드 풀을 막지 않음)
+- 처리 대기 중인 작업이 PASSWORD_HASH_MAX_PENDING을 넘으면 PasswordHasherBusyError로 바로 거절합니다. (API는 503 응답)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# bcrypt 비용(2^rounds 반복). 이미 저장된 해시는 해시에 기록된 비용으로 검증되므로 새 해시에만 적용됩니다.
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+# 0이면 프로세스 풀 없이 호출한 스레드에서 바로 계산합니다.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+# 해시 프로세스의 nice 값. CPU가 부족할 때 요청 처리보다 bcrypt가 양보하도록 낮은 우선순위로 실행합니다.
+PASSWORD_HASH_NICE = int(os.getenv("PASSWORD_HASH_NICE", "10"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=PASSWORD_BCRYPT_ROUNDS)
+
+# p50/p99 계산에 사용할 최근 처리 시간 표본 수
+LATENCY_SAMPLE_SIZE = 1000
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """처리 대기 중인 해시 작업이 너무 많아 요청을 거절한 경우"""
+
+
+def _init_worker(niceness: int):
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def _percentile(ordered, pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 프로세스 풀에서 실행합니다.
+
+    Args:
+        workers (int): 프로세스 수 (0이면 프로세스 풀을 사용하지 않음)
+        max_pending (int): 실행 중 + 대기 중인 작업의 최대 수
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._max_pending_seen = 0
+        self._completed = 0
+        self._rejected = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # API 프로세스는 여러 스레드를 사용하므로 fork 대신 spawn으로 새 인터프리터를 띄움
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker, initargs=(PASSWORD_HASH_NICE,),
+            )
+            logger.info(f"[PasswordHasher] 비밀번호 해시 프로세스 풀 시작 (workers={self.workers})")
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """워커가 죽어 BrokenProcessPool 상태가 된 풀을 버려 다음 요청에서 새로 만들게 합니다."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        logger.warning("[PasswordHasher] 해시 워커가 비정상 종료되어 프로세스 풀을 다시 만듭니다.")
+        executor.shutdown(wait=False)
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError("Too many pending password hash requests")
+            self._pending += 1
+            self._max_pending_seen = max(self._max_pending_seen, self._pending)
+        submitted = time.perf_counter()
+        try:
+            # 이미 깨진 풀에 제출하면 submit()이 BrokenProcessPool을 던지므로 새 풀로 한 번 더 시도
+            for attempt in range(2):
+                with self._lock:
+                    executor = self._get_executor()
+                try:
+                    future = executor.submit(fn, *args)
+                    break
+                except BrokenProcessPool:
+                    self._discard_executor(executor)
+                    if attempt:
+                        raise
+        except Exception:
+            self._finish(submitted)
+            raise
+        future.add_done_callback(lambda f: self._on_done(executor, f, submitted))
+        return future
+
+    def _on_done(self, executor: ProcessPoolExecutor, future: Future, submitted: float):
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._discard_executor(executor)
+        self._finish(submitted)
+
+    def _run(self, fn, *args):
+        try:
+            return self._submit(fn, *args).result()
+        except BrokenProcessPool:
+            # 실행 중 워커가 죽은 작업은 새 풀에서 한 번만 재시도
+            return self._submit(fn, *args).result()
+
+    async def _arun(self, fn, *args):
+        try:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+        except BrokenProcessPool:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def _finish(self, submitted: float):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._latencies.append(time.perf_counter() - submitted)
+
+    def hash(self, password: str) -> str:
+        if self.workers <= 0:
+            return _hash(password)
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        if self.workers <= 0:
+            return _verify(plain_password, hashed_password)
+        return self._run(_verify, plain_password, hashed_password)
+
+    async def ahash(self, password: str) -> str:
+        if self.workers <= 0:
+            return await asyncio.to_thread(_hash, password)
+        return await self._arun(_hash, password)
+
+    async def averify(self, plain_password: str, hashed_password: str) -> bool:
+        if self.workers <= 0:
+            return await asyncio.to_thread(_verify, plain_password, hashed_password)
+        return await self._arun(_verify, plain_password, hashed_password)
+
+    def get_stats(self) -> Dict:
+        """
+        프로세스 풀 상태를 반환합니다.
+
+        Returns:
+            Dict: {"workers", "max_pending", "in_flight", "queue_depth", "max_in_flight", "completed",
+                   "rejected", "latency_p50_ms", "latency_p99_ms", "bcrypt_rounds"}
+        """
+        with self._lock:
+            ordered = sorted(self._latencies)
+            pending = self._pending
+            stats = {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": pending,
+                "queue_depth": max(0, pending - max(self.workers, 0)),
+                "max_in_flight": self._max_pending_seen,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+        stats.update({
+            "latency_p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+            "latency_p99_ms": round(_percentile(ordered, 99) * 1000, 2),
+            "bcrypt_rounds": PASSWORD_BCRYPT_ROUNDS,
+        })
+        return stats
+
+    def shutdown(self):
+        """프로세스 풀을 종료합니다. (애플리케이션 종료 시)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _reset_after_fork(self):
+        # fork된 자식 프로세스는 부모의 프로세스 풀을 사용할 수 없으므로 처음 사용할 때 새로 만듦
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+
+# 싱글톤 인스턴스
+password_hasher = PasswordHasher()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=password_hasher._reset_after_fork)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return password_hasher.verify(plain_password, hashed_password)
+
+def get_password_hash(password: str) -> str:
+    return password_hasher.hash(password)
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.averify(plain_password, hashed_password)
+
+async def aget_password_hash(password: str) -> str:
+    return await password_hasher.ahash(password)
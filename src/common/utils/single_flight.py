@@ -0,0 +1,100 @@
+"""
+같은 요청이 동시에 여러 번 들어올 때 한 번만 실행하고 결과를 함께 쓰는 single-flight 유틸리티입니다.
+
+공시나 시장 이벤트로 많은 사용자가 같은 종목을 동시에 조회하면, 캐시가 비어 있는 동안 같은 계산이 요청 수만큼 실행됩니다.
+SingleFlight.do()는 같은 키의 실행이 진행 중이면 새로 실행하지 않고 그 결과(또는 예외)를 기다립니다.
+결과를 저장하지는 않으므로 실행이 끝난 뒤 들어온 요청은 다시 실행합니다. (캐시와 함께 사용)
+"""
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# get_single_flight_stats()로 한 번에 조회할 수 있도록 생성된 SingleFlight를 추적합니다.
+_registry: "weakref.WeakSet" = weakref.WeakSet()
+
+
+class SingleFlight:
+    """
+    키별로 진행 중인 비동기 실행을 공유합니다.
+
+    Args:
+        name (str): 지표에 표시할 이름 (예: 'predict')
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0}
+        _registry.add(self)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key의 실행이 진행 중이면 그 결과를 기다리고, 없으면 fn()을 실행합니다.
+
+        Args:
+            key (Hashable): 같은 요청을 구분하는 키
+            fn (Callable[[], Awaitable[T]]): 실행할 비동기 함수
+
+        Returns:
+            T: fn()의 결과 (같은 키를 기다린 모든 호출이 같은 객체를 받음)
+        """
+        self._stats["calls"] += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            while future is not None:
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    if not future.cancelled():
+                        raise
+                # 먼저 실행하던 요청이 취소되었으면 (클라이언트 연결 종료 등) 다시 실행 여부를 정함
+                future = self._calls.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._stats["executions"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self._stats["errors"] += 1
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 남지 않도록 예외를 확인 처리
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        """key의 실행이 진행 중인지 반환합니다."""
+        return key in self._calls
+
+    def clear(self):
+        self._calls.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        실행 지표를 반환합니다.
+
+        Returns:
+            Dict: {"calls", "executions", "coalesced", "errors", "in_flight", "coalesced_rate"}
+        """
+        calls = self._stats["calls"]
+        return {
+            **self._stats,
+            "in_flight": len(self._calls),
+            "coalesced_rate": round(self._stats["coalesced"] / calls, 3) if calls else 0.0,
+        }
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """생성된 모든 SingleFlight의 지표를 이름별로 반환합니다."""
+    return {flight.name: flight.get_stats() for flight in list(_registry)}
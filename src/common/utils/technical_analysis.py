@@ -0,0 +1,285 @@
+"""
+일별 시세 기반 기술적 분석(SMA/RSI/MACD)과 매수/매도/관망 예측 로직입니다.
+
+API(/predict)와 워커(예측 캐시 사전 계산)가 같은 결과를 내도록 공통 모듈에 둡니다.
+분석 로직을 바꾸면 예측 캐시가 이전 결과를 재사용하지 않도록 MODEL_VERSION을 올려야 합니다.
+"""
+import logging
+import os
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 예측 캐시 키에 포함되는 분석 로직 버전
+MODEL_VERSION = os.getenv("PREDICTION_MODEL_VERSION", "ta-v1")
+
+# 분석에 사용하는 최근 시세 기간(일)과 최소 데이터 수
+ANALYSIS_WINDOW_DAYS = 40
+MIN_ANALYSIS_DAYS = 20
+
+
+def analyze_daily_prices(data: list[dict]) -> Optional[dict]:
+    """
+    주어진 일별 시세 데이터를 기반으로 기술적 분석 지표를 계산하고 예측을 수행합니다.
+
+    Args:
+        data (list[dict]): {"date", "open", "high", "low", "close", "volume"} 목록
+
+    Returns:
+        Optional[dict]: {"prediction", "confidence", "reason"} (데이터가 부족하면 None)
+    """
+    if not data or len(data) < MIN_ANALYSIS_DAYS: # 최소 20일치 데이터 필요 (SMA 20 계산 위함)
+        logger.warning(f"데이터 부족: {len(data)}일치 데이터로는 분석을 수행할 수 없습니다. 최소 20일치 데이터가 필요합니다.")
+        return None
+
+    df = pd.DataFrame(data)
+    df['date'] = pd.to_datetime(df['date'])
+    df = df.set_index('date')
+    df = df.sort_index() # 날짜 오름차순 정렬
+
+    # 이동평균선 (Moving Average)
+    df['SMA5'] = df['close'].rolling(window=5).mean()
+    df['SMA20'] = df['close'].rolling(window=20).mean()
+
+    # RSI (Relative Strength Index)
+    delta = df['close'].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.rolling(window=14).mean()
+    avg_loss = loss.rolling(window=14).mean()
+    rs = avg_gain / avg_loss
+    df['rsi'] = 100 - (100 / (1 + rs))
+
+    exp1 = df['close'].ewm(span=12, adjust=False).mean()
+    exp2 = df['close'].ewm(span=26, adjust=False).mean()
+    df['macd'] = exp1 - exp2
+    df['signal_line'] = df['macd'].ewm(span=9, adjust=False).mean()
+    df['macd_histogram'] = df['macd'] - df['signal_line']
+
+    return score_indicators(
+        df['SMA5'].iloc[-1],
+        df['SMA20'].iloc[-1],
+        df['rsi'].iloc[-1],
+        df['macd'].iloc[-1],
+        df['signal_line'].iloc[-1]
+    )
+
+
+def score_indicators(latest_sma_5, latest_sma_20, latest_rsi, latest_macd, latest_signal_line) -> dict:
+    """
+    최신 지표 값으로 매수/매도/관망 점수를 매겨 예측 결과를 만듭니다.
+
+    Returns:
+        dict: {"prediction", "confidence", "reason"}
+    """
+    reason_parts = []
+    buy_score = 0
+    sell_score = 0
+
+    if pd.notna(latest_sma_5) and pd.notna(latest_sma_20):
+        if latest_sma_5 > latest_sma_20:
+            reason_parts.append("단기 이동평균선이 장기 이동평균선 위에 있습니다 (골든 크로스).")
+            buy_score += 15
+        elif latest_sma_5 < latest_sma_20:
+            reason_parts.append("단기 이동평균선이 장기 이동평균선 아래에 있습니다 (데드 크로스).")
+            sell_score += 15
+
+    if pd.notna(latest_rsi):
+        if latest_rsi > 70:
+            reason_parts.append(f"RSI({int(latest_rsi)})가 과매수 구간입니다.")
+            sell_score += 25
+        elif latest_rsi < 30:
+            reason_parts.append(f"RSI({int(latest_rsi)})가 과매도 구간입니다.")
+            buy_score += 25
+
+    if pd.notna(latest_macd) and pd.notna(latest_signal_line):
+        if latest_macd > latest_signal_line:
+            reason_parts.append("MACD가 시그널 라인을 상향 돌파했습니다.")
+            buy_score += 20
+        elif latest_macd < latest_signal_line:
+            reason_parts.append("MACD가 시그널 라인을 하향 돌파했습니다.")
+            sell_score += 20
+
+    if buy_score > sell_score:
+        prediction = "buy"
+        confidence = min(100, 50 + (buy_score - sell_score))
+    elif sell_score > buy_score:
+        prediction = "sell"
+        confidence = min(100, 50 + (sell_score - buy_score))
+    else:
+        prediction = "hold"
+        confidence = 50
+
+    reason = " ".join(reason_parts) if reason_parts else "현재 데이터로는 명확한 예측 신호를 찾기 어렵습니다."
+
+    return {
+        "prediction": prediction,
+        "confidence": confidence,
+        "reason": reason
+    }
+
+
+def _ewm(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    2-D 배열(종목 × 날짜)의 각 행에 대해 ewm(span, adjust=False)을 계산합니다.
+
+    앞쪽 NaN(데이터가 짧은 종목의 패딩)은 건너뛰고 첫 유효 값부터 시작하므로 pandas 결과와 같습니다.
+    """
+    alpha = 2.0 / (span + 1)
+    result = np.full(values.shape, np.nan)
+    current = np.full(values.shape[0], np.nan)
+    for t in range(values.shape[1]):
+        x = values[:, t]
+        current = np.where(np.isnan(current), x, (1 - alpha) * current + alpha * x)
+        result[:, t] = current
+    return result
+
+
+def analyze_daily_prices_batch(prices_by_symbol: Dict[str, List[dict]]) -> Dict[str, Optional[dict]]:
+    """
+    여러 종목의 지표(SMA5/SMA20/RSI14/MACD)를 종목 × 날짜 2-D NumPy 배열로 한 번에 계산하고 예측합니다.
+
+    종목별로 analyze_daily_prices()를 호출한 것과 같은 결과를 반환합니다.
+
+    Args:
+        prices_by_symbol (Dict[str, List[dict]]): 종목별 일별 시세 목록
+
+    Returns:
+        Dict[str, Optional[dict]]: 종목별 예측 결과 (데이터가 부족하면 None)
+    """
+    results: Dict[str, Optional[dict]] = {}
+    closes_by_symbol = {}
+    for symbol, data in prices_by_symbol.items():
+        if not data or len(data) < MIN_ANALYSIS_DAYS:
+            results[symbol] = None
+        else:
+            closes_by_symbol[symbol] = [row['close'] for row in sorted(data, key=itemgetter('date'))]
+    if not closes_by_symbol:
+        return results
+
+    symbols = list(closes_by_symbol)
+    width = max(len(closes) for closes in closes_by_symbol.values())
+    # 날짜 끝을 맞춰 오른쪽 정렬하고, 짧은 종목의 앞쪽은 NaN으로 채움
+    closes = np.full((len(symbols), width), np.nan)
+    for i, symbol in enumerate(symbols):
+        row = closes_by_symbol[symbol]
+        closes[i, width - len(row):] = row
+
+    # 모든 종목이 20일 이상이므로 마지막 20개 값에는 패딩이 없음
+    sma_5 = closes[:, -5:].mean(axis=1)
+    sma_20 = closes[:, -20:].mean(axis=1)
+
+    delta = np.diff(closes[:, -15:], axis=1)
+    avg_gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+    avg_loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    macd = _ewm(closes, 12) - _ewm(closes, 26)
+    signal_line = _ewm(macd, 9)
+
+    for i, symbol in enumerate(symbols):
+        results[symbol] = score_indicators(sma_5[i], sma_20[i], rsi[i], macd[i, -1], signal_line[i, -1])
+    return results
+
+
+def build_prediction_result(data: list[dict], analyze: Callable[[list[dict]], Optional[dict]] = analyze_daily_prices) -> dict:
+    """
+    최근 시세로 /predict 응답과 같은 형식의 예측 결과를 만듭니다. (데이터 부족/분석 실패 포함)
+
+    Args:
+        data (list[dict]): 최근 일별 시세 (오래된 날짜부터)
+        analyze (Callable): 분석 함수 (기본: analyze_daily_prices)
+
+    Returns:
+        dict: {"prediction", "confidence", "reason"}
+    """
+    if len(data) < MIN_ANALYSIS_DAYS:
+        logger.warning(f"예측 불가: 데이터 부족({len(data)}일)")
+        return {
+            "prediction": "예측 불가",
+            "reason": f"분석에 필요한 데이터({len(data)}일)가 부족합니다 (최소 {MIN_ANALYSIS_DAYS}일 필요).",
+            "confidence": 0
+        }
+
+    analysis_result = analyze(data)
+    if analysis_result is None:
+        logger.error("예측 불가: 데이터 분석 실패")
+        return {
+            "prediction": "예측 불가",
+            "reason": "데이터 분석 중 오류가 발생했습니다.",
+            "confidence": 0
+        }
+    return analysis_result
+
+
+def build_prediction_results(prices_by_symbol: Dict[str, List[dict]]) -> Dict[str, dict]:
+    """
+    여러 종목의 예측 결과를 한 번에 만듭니다. (지표는 analyze_daily_prices_batch()로 함께 계산)
+
+    종목별 결과는 build_prediction_result()와 같습니다.
+    """
+    analyzed = analyze_daily_prices_batch(prices_by_symbol)
+    return {
+        symbol: build_prediction_result(data, lambda _, symbol=symbol: analyzed[symbol])
+        for symbol, data in prices_by_symbol.items()
+    }
+
+
+def _none_if_nan(value) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def calculate_indicator_series(closes: List[float], history: int = 0, ema_seed: Optional[tuple] = None) -> List[dict]:
+    """
+    일별 종가 목록으로 날짜별 지표(SMA5/SMA20/RSI14/MACD/시그널)를 계산합니다. (daily_indicators 저장용)
+
+    이동평균과 RSI는 analyze_daily_prices()와 같은 방식으로 계산합니다.
+    MACD는 전체 이력에 대한 ewm(adjust=False)이며, 이미 저장된 지표 뒤에 이어서 계산할 수 있도록
+    직전 일봉의 (ema12, ema26, signal)을 ema_seed로 받습니다.
+
+    Args:
+        closes (List[float]): 날짜 오름차순 종가 목록
+        history (int): closes 앞쪽에 포함된, 지표가 이미 저장된 종가 수 (이동평균/RSI 창 계산용)
+        ema_seed (tuple, optional): closes[history - 1] 일봉의 (ema12, ema26, signal). 없으면 첫 종가부터 시작
+
+    Returns:
+        List[dict]: closes[history:] 각각에 대한 {"sma5", "sma20", "rsi14", "macd", "signal", "ema12", "ema26"}
+    """
+    if history and ema_seed is None:
+        raise ValueError("ema_seed is required when history is given")
+
+    series = pd.Series(closes, dtype=float)
+    sma_5 = series.rolling(window=5).mean()
+    sma_20 = series.rolling(window=20).mean()
+    delta = series.diff()
+    avg_gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    avg_loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    alpha_12, alpha_26, alpha_9 = 2 / 13, 2 / 27, 2 / 10
+    ema_12, ema_26, signal = ema_seed if ema_seed is not None else (None, None, None)
+    rows = []
+    for i in range(history, len(closes)):
+        close = float(closes[i])
+        if ema_12 is None:
+            ema_12 = ema_26 = close
+            signal = 0.0
+        else:
+            ema_12 = (1 - alpha_12) * ema_12 + alpha_12 * close
+            ema_26 = (1 - alpha_26) * ema_26 + alpha_26 * close
+            signal = (1 - alpha_9) * signal + alpha_9 * (ema_12 - ema_26)
+        rows.append({
+            "sma5": _none_if_nan(sma_5.iloc[i]),
+            "sma20": _none_if_nan(sma_20.iloc[i]),
+            "rsi14": _none_if_nan(rsi.iloc[i]),
+            "macd": ema_12 - ema_26,
+            "signal": signal,
+            "ema12": ema_12,
+            "ema26": ema_26,
+        })
+    return rows
@@ -0,0 +1,38 @@
+"""
+daily_indicators 백필 명령입니다.
+
+일별 시세 전체 이력으로 기술적 지표를 다시 계산하여 저장합니다.
+테이블을 처음 만든 뒤 한 번 실행하면, 이후에는 시세 수집 작업이 새 일봉의 지표만 이어서 계산합니다.
+
+사용 예:
+    python -m src.worker.backfill_indicators
+    python -m src.worker.backfill_indicators --symbols 005930 000660
+"""
+import argparse
+import logging
+import sys
+
+from src.common.database.db_connector import SessionLocal
+from src.common.services.indicator_service import indicator_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="daily_indicators 백필")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 코드 (없으면 일별 시세가 있는 모든 종목)")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        result = indicator_service.backfill(db, args.symbols or None)
+    finally:
+        db.close()
+
+    logger.info(f"지표 백필 완료: 종목 {result['symbols']}개, 지표 {result['rows']}건, 실패 {len(result['errors'])}개")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
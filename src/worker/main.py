@@ -13,6 +13,8 @@ from typing import Optional
 from fastapi import FastAPI
 
 from src.common.services.notify_service import send_telegram_message
+from src.common.services.notification_outbox_service import notification_outbox_service
+from src.common.database.db_connector import get_db
 from src.worker.routers import scheduler as scheduler_router
 from src.worker.scheduler_instance import scheduler
 from src.worker import tasks
@@ -37,6 +39,7 @@ logger = logging.getLogger(__name__)
 # 환경 변수
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "5"))
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -47,6 +50,8 @@ async def lifespan(app: FastAPI):
     scheduler.add_job(update_daily_price_job, 'cron', hour=18, minute=0, id='update_daily_price_job', name='일별 시세 갱신')
     scheduler.add_job(check_disclosures_job, 'interval', minutes=240, id='check_disclosures_job', name='최신 공시 확인')
     scheduler.add_job(check_price_alerts_job, 'interval', minutes=1, id='check_price_alerts_job', name='가격 알림 확인')
+    # 매월 1일 + 시작 시 한 번 실행하여 다음 연도 파티션이 연초 전에 준비되도록 함
+    scheduler.add_job(ensure_price_partitions_job, 'cron', day=1, hour=6, minute=0, next_run_time=datetime.now(), id='ensure_price_partitions_job', name='일별 시세 파티션 생성')
     
     # Start scheduler
     scheduler.start()
@@ -54,12 +59,16 @@ async def lifespan(app: FastAPI):
 
     # Start notification listener
     redis_listener_task = asyncio.create_task(notification_listener())
+
+    # Start notification outbox dispatcher
+    outbox_dispatcher_task = asyncio.create_task(outbox_dispatcher())
     
     yield
     
     logger.info("Shutting down worker service...")
     scheduler.shutdown()
     redis_listener_task.cancel()
+    outbox_dispatcher_task.cancel()
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(scheduler_router.router, prefix="/api/v1")
@@ -99,6 +108,12 @@ async def check_price_alerts_job(chat_id: int = None):
     p = multiprocessing.Process(target=tasks.check_price_alerts_task, args=(chat_id,))
     p.start()
 
+async def ensure_price_partitions_job(chat_id: int = None):
+    """daily_prices 연도 파티션 생성 잡을 별도 프로세스로 실행합니다."""
+    logger.info(f"[Trigger] 'ensure_price_partitions_task' process for chat_id: {chat_id}")
+    p = multiprocessing.Process(target=tasks.ensure_price_partitions_task, args=(chat_id,))
+    p.start()
+
 async def notification_listener():
     """Redis 'notifications' 채널을 구독하고 메시지를 처리합니다."""
     logger.info("[Listener] Starting notification listener...")
@@ -140,6 +155,27 @@ async def notification_listener():
             await r.close()
             logger.info("[Listener] Redis connection closed.")
 
+async def outbox_dispatcher():
+    """notification_outbox에 적재된 알림을 배치 단위로 전송합니다."""
+    logger.info("[Outbox] Starting notification outbox dispatcher...")
+    while True:
+        try:
+            db_gen = get_db()
+            db = next(db_gen)
+            try:
+                result = await notification_outbox_service.deliver_pending(db)
+            finally:
+                next(db_gen, None)
+            # 배치가 가득 찼다면 남은 알림이 더 있을 수 있으므로 바로 다음 배치를 처리
+            if result['claimed'] < notification_outbox_service.BATCH_SIZE:
+                await asyncio.sleep(OUTBOX_POLL_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            logger.info("[Outbox] Notification outbox dispatcher cancelled.")
+            break
+        except Exception as e:
+            logger.error(f"[Outbox] Error delivering notifications: {e}", exc_info=True)
+            await asyncio.sleep(OUTBOX_POLL_INTERVAL_SECONDS)
+
 @app.get("/")
 def read_root():
     return {"message": "Worker service is running"}
@@ -13,9 +13,12 @@ from src.common.services.stock_master_service import StockMasterService
 from src.common.services.market_data_service import MarketDataService
 from src.common.services.disclosure_service import DisclosureService
 from src.common.services.price_alert_service import PriceAlertService
+from src.common.services.notification_outbox_service import notification_outbox_service
+from src.common.services.prediction_cache_service import prediction_cache_service
+from src.common.services.indicator_service import indicator_service
 from src.common.models.user import User
 from src.common.models.stock_master import StockMaster
-from src.common.models.daily_price import DailyPrice
+from src.common.models.daily_price import DailyPrice, ensure_daily_price_partitions
 
 
 # 로깅 설정
@@ -23,6 +26,8 @@ logger = logging.getLogger(__name__)
 
 # 환경 변수
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+# daily_prices 연도 파티션을 미리 만들어 둘 연도 수 (올해 + N년)
+DAILY_PRICE_PARTITION_YEARS_AHEAD = int(os.getenv("DAILY_PRICE_PARTITION_YEARS_AHEAD", "1"))
 
 def _publish_message(redis_client, chat_id, text):
     """메시지를 Redis에 게시합니다."""
@@ -170,6 +175,7 @@ def check_price_alerts_task(chat_id: int = None):
                 if current_price is None:
                     continue
 
+                notifications = []
                 for alert in alerts:
                     triggered = False
                     if alert.condition == 'gte' and current_price >= alert.target_price:
@@ -181,11 +187,19 @@ def check_price_alerts_task(chat_id: int = None):
                         user = db.query(User).filter(User.id == alert.user_id).first()
                         if user and user.telegram_id:
                             msg = f"🔔 가격 알림: {alert.symbol}\n현재가 {current_price}원이 목표가 {alert.target_price}({alert.condition})에 도달했습니다."
-                            _publish_message(redis_client, user.telegram_id, msg)
+                            alert.notification_count = (alert.notification_count or 0) + 1
+                            alert.last_notified_at = datetime.utcnow()
+                            notifications.append({
+                                'recipient': user.telegram_id,
+                                'message': msg,
+                                'dedup_key': f"price_alert:{alert.id}:{alert.notification_count}",
+                            })
                         
                         if alert.repeat_interval is None:
                             alert.is_active = False
                             db.add(alert)
+                # 알림 적재와 알림 상태 변경을 같은 트랜잭션으로 커밋 (전송은 outbox 전송 루프가 담당)
+                notification_outbox_service.enqueue_many(db, notifications)
                 db.commit()
             except Exception as e:
                 logger.error(f"가격 알림 확인 중 '{symbol}' 처리 오류: {e}", exc_info=True)
@@ -206,6 +220,37 @@ def check_price_alerts_task(chat_id: int = None):
         logger.info(f"[Process] {job_name} 종료.")
 
 
+def ensure_price_partitions_task(chat_id: int = None):
+    """[Process] daily_prices 연도 파티션 생성 작업 (올해 ~ 올해 + DAILY_PRICE_PARTITION_YEARS_AHEAD)"""
+    job_name = "일별시세 파티션 생성"
+    start_time = datetime.now()
+    logger.info(f"[Process] {job_name} 시작.")
+
+    db_gen = get_db()
+    db = next(db_gen)
+    redis_client = redis.from_url(f"redis://{REDIS_HOST}")
+    success = False
+    created = 0
+
+    try:
+        year = start_time.year
+        created = ensure_daily_price_partitions(db, year, year + DAILY_PRICE_PARTITION_YEARS_AHEAD)
+        db.commit()
+        success = True
+        logger.info(f"[Process] {job_name} 성공. (새 파티션 {created}개)")
+    except Exception as e:
+        logger.error(f"[Process] {job_name} 중 오류: {e}", exc_info=True)
+        db.rollback()
+    finally:
+        try:
+            next(db_gen, None)
+        except StopIteration:
+            pass
+        _publish_completion_message(redis_client, chat_id, job_name, success, start_time, f"- **새 파티션:** {created}개" if success else "")
+        redis_client.close()
+        logger.info(f"[Process] {job_name} 종료.")
+
+
 def run_historical_price_update_task(chat_id: int, start_date_str: str, end_date_str: str, stock_identifier: Optional[str] = None):
     """[Process] 과거 일별 시세 갱신 작업"""
     job_name = "과거 일별 시세 갱신"
@@ -220,13 +265,21 @@ def run_historical_price_update_task(chat_id: int, start_date_str: str, end_date
     start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
     end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
     
+    market_data_service = MarketDataService()
+    
     total_updated_count = 0
     total_created_count = 0
     total_error_stocks = []
     processed_stocks = 0
+    # 커밋 후 현재가 캐시를 무효화할 종목
+    touched_symbols = []
     success = False
     
     try:
+        # 과거 연도 시세가 기본 파티션에 쌓이지 않도록 기간에 해당하는 연도 파티션을 먼저 만듦
+        if ensure_daily_price_partitions(db, start_date.year, end_date.year):
+            db.commit()
+
         if stock_identifier:
             # 특정 종목만 갱신
             found_stocks = stock_master_service.search_stocks(keyword=stock_identifier, db=db, limit=1)
@@ -262,6 +315,7 @@ def run_historical_price_update_task(chat_id: int, start_date_str: str, end_date
                     db.add(stock)
                     continue
 
+                touched_symbols.append(stock.symbol)
                 for index, row in data.iterrows():
                     target_date = index.date()
                     
@@ -292,6 +346,11 @@ def run_historical_price_update_task(chat_id: int, start_date_str: str, end_date
                 
                 if (i + 1) % 100 == 0:
                     db.commit()
+                    market_data_service.invalidate_price_cache(touched_symbols)
+                    # 과거 일봉이 바뀌었을 수 있으므로 시작일부터 지표를 다시 계산
+                    indicator_service.update_indicators(db, touched_symbols, since=start_date.date())
+                    prediction_cache_service.prewarm(db, touched_symbols)
+                    touched_symbols = []
                     logger.info(f"{i+1}개 종목 처리 후 중간 커밋")
 
             except Exception as e:
@@ -308,6 +367,9 @@ def run_historical_price_update_task(chat_id: int, start_date_str: str, end_date
                 _publish_message(redis_client, chat_id, progress_msg)
 
         db.commit()
+        market_data_service.invalidate_price_cache(touched_symbols)
+        indicator_service.update_indicators(db, touched_symbols, since=start_date.date())
+        prediction_cache_service.prewarm(db, touched_symbols)
         success = True
     except Exception as e:
         logger.error(f"[Process] {job_name} 중 오류: {e}", exc_info=True)
@@ -28,6 +28,12 @@ async def test_check_price_alerts_job_triggers_process(mock_process):
     await main.check_price_alerts_job(chat_id=101)
     mock_process.assert_called_once_with(target=tasks.check_price_alerts_task, args=(101,))
 
+@pytest.mark.asyncio
+@patch('src.worker.main.multiprocessing.Process')
+async def test_ensure_price_partitions_job_triggers_process(mock_process):
+    await main.ensure_price_partitions_job(chat_id=131)
+    mock_process.assert_called_once_with(target=tasks.ensure_price_partitions_task, args=(131,))
+
 @pytest.mark.asyncio
 @patch('src.worker.main.multiprocessing.Process')
 async def test_run_historical_price_update_task_triggers_process(mock_process):
@@ -55,6 +55,25 @@ def test_update_daily_price_task(mock_asyncio_run, mock_redis_from_url, mock_mar
     assert mock_redis_client.publish.call_count == 1
     mock_redis_client.close.assert_called_once()
 
+# Test for ensure_price_partitions_task
+@patch('src.worker.tasks.get_db')
+@patch('src.worker.tasks.ensure_daily_price_partitions')
+@patch('src.worker.tasks.redis.from_url')
+def test_ensure_price_partitions_task(mock_redis_from_url, mock_ensure_partitions, mock_get_db):
+    mock_db = MagicMock()
+    mock_get_db.return_value = iter([mock_db])
+    mock_ensure_partitions.return_value = 1
+    mock_redis_client = MagicMock()
+    mock_redis_from_url.return_value = mock_redis_client
+
+    tasks.ensure_price_partitions_task(chat_id=12345)
+
+    year = datetime.now().year
+    mock_ensure_partitions.assert_called_once_with(mock_db, year, year + tasks.DAILY_PRICE_PARTITION_YEARS_AHEAD)
+    mock_db.commit.assert_called_once()
+    assert mock_redis_client.publish.call_count == 1
+    mock_redis_client.close.assert_called_once()
+
 # Test for check_disclosures_task
 @patch('src.worker.tasks.get_db')
 @patch('src.worker.tasks.DisclosureService')
@@ -78,11 +97,12 @@ def test_check_disclosures_task(mock_asyncio_run, mock_redis_from_url, mock_disc
     mock_redis_client.close.assert_called_once()
 
 # Test for check_price_alerts_task
+@patch('src.worker.tasks.notification_outbox_service')
 @patch('src.worker.tasks.get_db')
 @patch('src.worker.tasks.PriceAlertService')
 @patch('src.worker.tasks.MarketDataService')
 @patch('src.worker.tasks.redis.from_url')
-def test_check_price_alerts_task(mock_redis_from_url, mock_market_data_service_class, mock_price_alert_service_class, mock_get_db):
+def test_check_price_alerts_task(mock_redis_from_url, mock_market_data_service_class, mock_price_alert_service_class, mock_get_db, mock_outbox):
     # --- Mock Setup ---
     mock_db = MagicMock()
     mock_get_db.return_value = iter([mock_db])
@@ -126,8 +146,10 @@ def test_check_price_alerts_task(mock_redis_from_url, mock_market_data_service_c
     # --- Assertions ---
     assert mock_price_alert_service_instance.get_all_active_alerts.call_count == 1
     assert mock_market_data_service_instance.get_current_price_and_change.call_count == 2
-    # 2 alerts triggered + 1 completion message
-    assert mock_redis_client.publish.call_count == 3 
+    # 가격 알림은 outbox에 적재되고, Redis에는 완료 메시지만 게시됨
+    assert mock_redis_client.publish.call_count == 1
+    enqueued = [n for call in mock_outbox.enqueue_many.call_args_list for n in call[0][1]]
+    assert [n['recipient'] for n in enqueued] == ['tid_1', 'tid_2']
     mock_db.commit.assert_called()
 
 # Test for run_historical_price_update_task